@@ -0,0 +1,77 @@
+"""
+Accuracy and speed benchmark of the generalized (non-parabolic) Fermi-Dirac integral.
+
+generalized_fermi_dirac_integral is compared with an adaptive scipy quadrature of
+the defining integral for orders 1/2 and -1/2 at a few non-parabolicities. The eta
+points include the strongly degenerate range eta >= 800 (e.g. degenerate doping at
+cryogenic temperatures), where the occupancy must be formed without overflow.
+The benchmark reports:
+
+* the worst relative error against the quadrature, and
+* the time per point on an eta grid over [-50, 100].
+
+Usage:
+    python benchmarks/generalized_fermi_dirac.py [--points N] [--repeat N] [--tolerance TOL]
+
+Exits with status 1 if any value is not finite or misses the tolerance.
+"""
+import os
+import sys
+import math
+import time
+import argparse
+import numpy as np
+from scipy.integrate import quad
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from semicpy.math.functions import generalized_fermi_dirac_integral
+
+ORDERS = [0.5, -0.5]
+BETAS = [0.01, 0.1, 1.0]
+ETA_CHECK = np.array([-100.0, -5.0, 0.0, 5.0, 50.0, 700.0, 800.0, 2000.0])
+ETA_RANGE = (-50.0, 100.0)
+
+def reference(order: float, eta: float, beta: float)-> float:
+    """F_order(eta, beta) by adaptive quadrature, split at the Fermi edge"""
+    def integrand(x):
+        return (x ** order) * ((1 + (beta * x)) ** order) * (1 + (2 * beta * x)) * np.exp(-np.logaddexp(0.0, x - eta))
+    edge = max(eta, 0.0)
+    # geometric pieces below the edge keep the adaptive quadrature accurate for large eta
+    pieces = np.concatenate(([0.0], np.geomspace(1e-6, edge, 24))) if edge > 1e-6 else np.array([0.0, edge])
+    value = sum(quad(integrand, low, high, limit=500, epsabs=0.0, epsrel=1e-13)[0]
+                for low, high in zip(pieces[:-1], pieces[1:]))
+    value += quad(integrand, edge, edge + 60.0, limit=500, epsabs=0.0, epsrel=1e-13)[0]
+    return value / math.gamma(order + 1)
+
+def main(argv=None)-> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, default=10 ** 5,
+                        help='eta samples on [-50, 100] for the timing (default 1e5)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='timing repetitions, best time is kept (default 3)')
+    parser.add_argument('--tolerance', type=float, default=1e-13,
+                        help='allowed relative error against the quadrature (default 1e-13)')
+    args = parser.parse_args(argv)
+
+    eta = np.linspace(*ETA_RANGE, args.points)
+    print(f"{'':24s} {'max rel err':>12s} {'worst eta':>10s} {'ns/point':>10s}")
+    failed = False
+    for order in ORDERS:
+        for beta in BETAS:
+            value = generalized_fermi_dirac_integral(order, ETA_CHECK, beta)
+            expected = np.array([reference(order, point, beta) for point in ETA_CHECK])
+            error = np.abs(value / expected - 1)
+            worst = int(np.argmax(np.where(np.isfinite(error), error, np.inf)))
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                generalized_fermi_dirac_integral(order, eta, beta)
+                times.append(time.perf_counter() - start)
+            print(f"{f'F_{order:+g}, beta = {beta:g}':24s} {error[worst]:12.3e} {ETA_CHECK[worst]:10g} "
+                  f"{min(times) / len(eta) * 1e9:10.1f}")
+            if not (np.all(np.isfinite(value)) and error[worst] <= args.tolerance):
+                failed = True
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
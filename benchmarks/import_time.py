@@ -0,0 +1,91 @@
+"""
+Import-time benchmark for the numeric core of semicpy.
+
+Every module is imported in a fresh interpreter (as a short-lived batch worker
+would) and checked against two budgets:
+
+* none of the heavy optional dependencies (pint, pandas, plotly, seaborn, sympy,
+  matplotlib, scipy) may be imported as a side effect, and
+* the import may take at most BUDGET seconds on top of a bare `import numpy`.
+
+Usage:
+    python benchmarks/import_time.py [--budget SECONDS] [--repeat N]
+
+Exits with status 1 if any module exceeds a budget.
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+MODULES = ['semicpy.constants.constants',
+           'semicpy.constants.codata',
+           'semicpy.carriers.dist_functions',
+           'semicpy.carriers.density_states',
+           'semicpy.carriers.equilibrium_density',
+           'semicpy.carriers.carrier_transport',
+           'semicpy.diodes.diode',
+           'semicpy.bjt.bjt',
+           'semicpy.fets.jfet',
+           'semicpy.fets.mosfet',
+           'semicpy.materials.database',
+           'semicpy.materials.alloys',
+           'semicpy.math.solvers',
+           'semicpy.montecarlo',
+           'semicpy.plot.plots',
+           'semicpy.characterization.cv_measurements',
+           'semicpy.interfaces.schottky']
+
+HEAVY = ['pint', 'pandas', 'plotly', 'seaborn', 'sympy', 'matplotlib', 'scipy']
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(name for name in {heavy!r} if name in sys.modules)
+print(json.dumps({{'elapsed' : elapsed, 'heavy' : heavy}}))
+"""
+
+def probe(module: str, repeat: int=5)-> dict:
+    """Best-of-repeat import time of a module in fresh interpreters"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    results = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', _PROBE.format(module=module, heavy=HEAVY)],
+                             capture_output=True, text=True, env=env)
+        if out.returncode != 0:
+            return {'elapsed' : float('nan'), 'heavy' : [], 'error' : out.stderr.strip().splitlines()[-1]}
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {'elapsed' : min(r['elapsed'] for r in results), 'heavy' : results[0]['heavy'], 'error' : None}
+
+def main(argv=None)-> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget', type=float, default=0.15,
+                        help='allowed import time on top of numpy, s (default 0.15)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='fresh interpreters per module, best time is kept (default 5)')
+    args = parser.parse_args(argv)
+
+    baseline = probe('numpy', args.repeat)['elapsed']
+    print(f"{'numpy (baseline)':40s} {baseline * 1e3:8.1f} ms")
+    failed = False
+    for module in MODULES:
+        result = probe(module, args.repeat)
+        extra = result['elapsed'] - baseline
+        problems = []
+        if result['error']:
+            problems.append(result['error'])
+        if extra > args.budget:
+            problems.append(f"over budget by {(extra - args.budget) * 1e3:.1f} ms")
+        if result['heavy']:
+            problems.append("imports " + ", ".join(result['heavy']))
+        failed |= bool(problems)
+        status = "FAIL: " + "; ".join(problems) if problems else "ok"
+        print(f"{module:40s} {result['elapsed'] * 1e3:8.1f} ms  (+{extra * 1e3:6.1f} ms)  {status}")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Accuracy and speed benchmark of the inverse Fermi-Dirac integrals.
+
+For orders 1/2 and -1/2, eta is sampled on [-50, 100], mapped forward with
+fermi_dirac_integral and inverted again with inverse_fermi_dirac_integral for 0,
+1 and 2 Newton steps. The benchmark reports:
+
+* the worst error in eta,
+* the worst relative error of F(eta_inverse) against the input value, and
+* the time per point.
+
+The old 4th-order approximation ifdint_approx (order 1/2 only) is listed for comparison.
+
+Usage:
+    python benchmarks/inverse_fermi_dirac.py [--points N] [--repeat N] [--tolerance TOL]
+
+Exits with status 1 if the default two-step inverse misses the tolerance.
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from semicpy.math.functions import fermi_dirac_integral, inverse_fermi_dirac_integral, ifdint_approx
+
+ORDERS = [0.5, -0.5]
+ETA_RANGE = (-50.0, 100.0)
+
+def best_time(function, repeat: int)-> tuple:
+    """Result and best-of-repeat wall time of function()"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+def report(label: str, eta: np.ndarray, value: np.ndarray, order: float, eta_inverse: np.ndarray, elapsed: float)-> float:
+    with np.errstate(invalid='ignore'):
+        eta_error = np.nanmax(np.abs(eta_inverse - eta))
+        value_error = np.nanmax(np.abs(fermi_dirac_integral(order, eta_inverse) / value - 1))
+    print(f"{label:34s} {eta_error:12.3e} {value_error:12.3e} {elapsed / len(eta) * 1e9:10.1f}")
+    return value_error
+
+def main(argv=None)-> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, default=10 ** 6,
+                        help='eta samples on [-50, 100] (default 1e6)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='timing repetitions, best time is kept (default 3)')
+    parser.add_argument('--tolerance', type=float, default=1e-14,
+                        help='allowed relative error of F(eta_inverse) (default 1e-14)')
+    args = parser.parse_args(argv)
+
+    eta = np.linspace(*ETA_RANGE, args.points)
+    print(f"{'':34s} {'max |d eta|':>12s} {'max rel dF':>12s} {'ns/point':>10s}")
+    failed = False
+    for order in ORDERS:
+        value = fermi_dirac_integral(order, eta)
+        inverse_fermi_dirac_integral(order, value[:1])  # build the cached tables
+        for steps in (0, 1, 2):
+            eta_inverse, elapsed = best_time(lambda: inverse_fermi_dirac_integral(order, value, steps), args.repeat)
+            error = report(f"F_{order:+g} inverse, {steps} Newton steps", eta, value, order, eta_inverse, elapsed)
+            if steps == 2 and not error <= args.tolerance:
+                failed = True
+        _, elapsed = best_time(lambda: fermi_dirac_integral(order, eta), args.repeat)
+        print(f"{f'F_{order:+g} forward':34s} {'':12s} {'':12s} {elapsed / len(eta) * 1e9:10.1f}")
+        if order == 0.5:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                eta_inverse, elapsed = best_time(lambda: ifdint_approx(value), args.repeat)
+            report("ifdint_approx", eta, value, order, eta_inverse, elapsed)
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
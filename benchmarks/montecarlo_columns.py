@@ -0,0 +1,80 @@
+"""
+Column check of the Monte-Carlo runner.
+
+Every numeric constructor keyword of every device model is sampled in turn as a
+two-sample column (the default and a perturbed value), the device is built with
+build_device exactly as MonteCarlo.run does, and its registered current
+evaluator is run over a small bias array. A model whose constructor or current
+path only works on scalar parameters fails here instead of in a long run.
+
+Usage:
+    python benchmarks/montecarlo_columns.py
+
+Exits with status 1 if any parameter cannot be sampled.
+"""
+import os
+import sys
+import inspect
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from semicpy.montecarlo import build_device, default_evaluator
+from semicpy.bjt.bjt import BJT
+from semicpy.diodes.diode import Diode
+from semicpy.fets.jfet import JFET
+from semicpy.fets.mosfet import NMOS, PMOS
+
+BIASES = {Diode : {'vd' : np.array([0.3, 0.6])},
+          BJT : {'vbe' : np.array([0.6, 0.7]), 'vbc' : np.array([-1.0, -2.0])},
+          JFET : {'vgs' : np.array([-0.5, 0.0]), 'vds' : np.array([1.0, 2.0])},
+          NMOS : {'vgs' : np.array([1.0, 2.0]), 'vds' : np.array([1.0, 2.0])},
+          PMOS : {'vgs' : np.array([-1.0, -2.0]), 'vds' : np.array([-1.0, -2.0])}}
+
+# parameters that select a model rather than scale one take their allowed values
+CHOICES = {(Diode, 'e_g') : (1.11, 0.67)}
+
+# further parameter-dependent methods evaluated on the sampled device
+EXTRA = {BJT : lambda device, vbe, vbc: device.actual_base_parasitic_resistance(vbe, vbc)}
+
+def column(device_class, name: str, default: float)-> np.ndarray:
+    """Default and perturbed value of a parameter"""
+    if (device_class, name) in CHOICES:
+        return np.array(CHOICES[device_class, name], dtype=float)
+    if np.isinf(default):
+        return np.array([default, 1.0e3])
+    return np.array([default, 0.01 if default == 0 else 1.01 * default])
+
+def check(device_class)-> list:
+    """Parameters of a device class that fail when sampled, with their errors"""
+    failures = []
+    biases = BIASES[device_class]
+    evaluate = default_evaluator(device_class)
+    for name, parameter in inspect.signature(device_class.__init__).parameters.items():
+        default = parameter.default
+        if isinstance(default, bool) or not isinstance(default, (int, float)):
+            continue
+        try:
+            device = build_device(device_class, {}, {name : column(device_class, name, float(default))}, 1)
+            with np.errstate(all='ignore'):
+                results = list(evaluate(device, **biases).values())
+                if device_class in EXTRA:
+                    results.append(EXTRA[device_class](device, **biases))
+            for result in results:
+                np.broadcast_to(result, (2, 2))
+        except Exception as error:
+            failures.append((name, f"{type(error).__name__}: {error}"))
+    return failures
+
+def main()-> int:
+    failed = False
+    for device_class in BIASES:
+        failures = check(device_class)
+        failed |= bool(failures)
+        print(f"{device_class.__name__:8s} {'ok' if not failures else 'FAIL'}")
+        for name, error in failures:
+            print(f"    {name:12s} {error}")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
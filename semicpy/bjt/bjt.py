@@ -3,14 +3,88 @@ BJT Class Module
 Based on https://www.seas.upenn.edu/~jan/spice/PSpice_ReferenceguideOrCAD.pdf
 """
 from semicpy.constants.constants import value
+import functools
 import numpy as np
-from scipy.misc import derivative
+import numpy.typing as npt
+from semicpy.temperature_cache import TemperatureCache, temperature_dependent
+from semicpy.math.solvers import damped_newton, warm_start_sweep, continuation_sweep, pn_junction_limit, critical_voltage, NewtonResult, SolutionCache
 
 CHARGE = value('Elementary charge')
 BOLTZMANN = value('Boltzmann constant in J/K')
 
-class BJT:
+def _depletion_capacitance(voltage: npt.ArrayLike,
+                           cj: float,
+                           vj: float,
+                           mj: float,
+                           fc: float)-> npt.NDArray:
+    """Vectorized SPICE depletion capacitance of a pn-junction.
+
+    Parameters
+    ----------
+    voltage : npt.ArrayLike
+        junction voltage, V
+    cj : float
+        zero-bias junction capacitance, F
+    vj : float
+        junction potential, V
+    mj : float
+        grading factor
+    fc : float
+        forward-bias depletion capacitance coefficient
+
+    Returns
+    -------
+    npt.NDArray
+        junction capacitance at every voltage, F
+    """
+    voltage = np.asarray(voltage, dtype=float)
+    v_clamped = np.minimum(voltage, fc * vj)
+    reverse = cj * ((1 - (v_clamped / vj)) ** -mj)
+    forward = cj * ((1 - fc) ** -(1 + mj)) * (1 - (fc * (1 + mj)) + (mj * voltage / vj))
+
+    return np.where(voltage <= (fc * vj), reverse, forward)[()]
+
+def _depletion_charge(voltage: npt.ArrayLike,
+                      cj: float,
+                      vj: float,
+                      mj: float,
+                      fc: float)-> npt.NDArray:
+    """Vectorized SPICE depletion charge of a pn-junction, i.e. the integral of
+    _depletion_capacitance from 0 V to voltage.
+
+    Parameters
+    ----------
+    voltage : npt.ArrayLike
+        junction voltage, V
+    cj : float
+        zero-bias junction capacitance, F
+    vj : float
+        junction potential, V
+    mj : float
+        grading factor
+    fc : float
+        forward-bias depletion capacitance coefficient
+
+    Returns
+    -------
+    npt.NDArray
+        junction charge at every voltage, C
+    """
+    voltage = np.asarray(voltage, dtype=float)
+    v_fc = fc * vj
+    v_clamped = np.minimum(voltage, v_fc)
+    reverse = cj * vj * (1 - ((1 - (v_clamped / vj)) ** (1 - mj))) / (1 - mj)
+    q_fc = cj * vj * (1 - ((1 - fc) ** (1 - mj))) / (1 - mj)
+    forward = q_fc + (cj * ((1 - fc) ** -(1 + mj))) * (((1 - (fc * (1 + mj))) * (voltage - v_fc)) + ((mj / (2 * vj)) * ((voltage ** 2) - (v_fc ** 2))))
+
+    return np.where(voltage <= v_fc, reverse, forward)[()]
+
+class BJT(TemperatureCache):
     """BJT Class
+
+    Cached temperature-adjusted terms (see TemperatureCache): thermal voltage, betas,
+    saturation and leakage currents, base/emitter/collector resistances, epitaxial
+    region parameters, junction potentials and zero-bias capacitances.
     """
     def __init__(self,
                  temp: float=300,
@@ -229,18 +303,13 @@ class BJT:
         self.rb_half_current = irb
         self.sat_current = i_s
 
-        if isc > 1:
-            self.base_collector_leak_is = isc*i_s
-        elif 0 <= isc <= 1:
-            self.base_collector_leak_is = isc
-        else:
+        # ISC, ISE above 1 are multiples of IS, otherwise currents
+        if np.any(np.less(isc, 0)):
             raise ValueError("ISC value must be greater than or equal to 0!")
-        if ise > 1:
-            self.base_emitter_leak_is = ise*i_s
-        elif 0 <= ise <= 1:
-            self.base_emitter_leak_is = ise
-        else:
+        if np.any(np.less(ise, 0)):
             raise ValueError("ISE value must be greater than or equal to 0!")
+        self.base_collector_leak_is = np.where(np.greater(isc, 1), np.multiply(isc, i_s), isc)[()]
+        self.base_emitter_leak_is = np.where(np.greater(ise, 1), np.multiply(ise, i_s), ise)[()]
 
         self.substrate_pn_sat_current = iss
         self.transit_time_dependency_IC = itf
@@ -256,7 +325,7 @@ class BJT:
         self.substrate_emission_coeff = ns
         self.excess_phase = ptf
         self.epitaxial_reg_charge_factor = qco
-        self.qsat_flag = quasimod if rco == 0 else 1
+        self.qsat_flag = np.where(np.equal(rco, 0), quasimod, 1)[()]
         self.zero_bias_max_base_resistance = rb
         self.min_base_resistance = rbm
         self.collector_ohmic_resistance = rc
@@ -287,6 +356,7 @@ class BJT:
         self.transit_time_bias_dependence_coeff = xtf
         self.is_temperature_exp = xti
 
+    @temperature_dependent
     def thermal_voltage(self)-> float:
         """_summary_
 
@@ -348,6 +418,7 @@ class BJT:
 
         return self.area * ((ibe1 / kqb) - (ibc1 / kqb) - (ibc1 / br) - ibc2)
 
+    @temperature_dependent
     def forward_beta(self)-> float:
         """_summary_
 
@@ -359,6 +430,7 @@ class BJT:
         t_tnom = self.temperature / self.nominal_temperature
         return self.fwd_beta_hi_current * (t_tnom ** self.fwd_rev_beta_temp_coeff)
 
+    @temperature_dependent
     def reverse_beta(self)-> float:
         """_summary_
 
@@ -402,7 +474,25 @@ class BJT:
         """
         vt = self.thermal_voltage()
         return self.saturation_current() * (np.exp(voltage/(vt * self.fwd_current_emission_coeff)) - 1)
-        
+
+    def forward_diffusion_conductance(self,
+                                      voltage: float=0.0)-> float:
+        """Closed-form derivative of forward_diffusion_current with respect to vbe
+
+        Parameters
+        ----------
+        voltage : float, optional
+            intrinsic base-emitter voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dIbe1/dVbe, S
+        """
+        nf_vt = self.thermal_voltage() * self.fwd_current_emission_coeff
+        return self.saturation_current() * np.exp(voltage / nf_vt) / nf_vt
+
+    @temperature_dependent
     def saturation_current(self)-> float:
         """_summary_
 
@@ -433,7 +523,25 @@ class BJT:
         ise = self.base_emitter_leakage_current()
 
         return ise * (np.exp(voltage / (vt * self.base_emitter_leak_emission_coeff)) - 1)
+
+    def non_ideal_base_emitter_conductance(self,
+                                           voltage: float=0.0)-> float:
+        """Closed-form derivative of non_ideal_base_emitter_current with respect to vbe
+
+        Parameters
+        ----------
+        voltage : float, optional
+            intrinsic base-emitter voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dIbe2/dVbe, S
+        """
+        ne_vt = self.thermal_voltage() * self.base_emitter_leak_emission_coeff
+        return self.base_emitter_leakage_current() * np.exp(voltage / ne_vt) / ne_vt
     
+    @temperature_dependent
     def base_emitter_leakage_current(self)-> float:
         """_summary_
 
@@ -447,6 +555,7 @@ class BJT:
 
         return (self.base_emitter_leak_is / (t_tnom ** self.fwd_rev_beta_temp_coeff)) * np.exp((t_tnom - 1) * self.__eg(self.temperature) / (vt * self.base_emitter_leak_emission_coeff)) * (t_tnom ** (self.is_temperature_exp / self.base_emitter_leak_emission_coeff))
     
+    @temperature_dependent
     def base_collector_leakage_current(self)-> float:
         """_summary_
 
@@ -478,6 +587,23 @@ class BJT:
 
         return self.saturation_current() * (np.exp(voltage / (self.rev_current_emission_coeff * vt)) - 1)
 
+    def reverse_diffusion_conductance(self,
+                                      voltage: float=0.0)-> float:
+        """Closed-form derivative of reverse_diffusion_current with respect to vbc
+
+        Parameters
+        ----------
+        voltage : float, optional
+            intrinsic base-collector voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dIbc1/dVbc, S
+        """
+        nr_vt = self.rev_current_emission_coeff * self.thermal_voltage()
+        return self.saturation_current() * np.exp(voltage / nr_vt) / nr_vt
+
     def non_ideal_base_collector_current(self,
                                          voltage: float=0.0)-> float:
         """_summary_
@@ -496,6 +622,23 @@ class BJT:
 
         return self.base_collector_leakage_current() * (np.exp(voltage / (self.base_collector_leak_emission_coeff * vt)) - 1)
 
+    def non_ideal_base_collector_conductance(self,
+                                             voltage: float=0.0)-> float:
+        """Closed-form derivative of non_ideal_base_collector_current with respect to vbc
+
+        Parameters
+        ----------
+        voltage : float, optional
+            intrinsic base-collector voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dIbc2/dVbc, S
+        """
+        nc_vt = self.base_collector_leak_emission_coeff * self.thermal_voltage()
+        return self.base_collector_leakage_current() * np.exp(voltage / nc_vt) / nc_vt
+
     def base_charge_factor(self,
                            vbe: float=0.0,
                            vbc: float=0.0)-> float:
@@ -534,11 +677,12 @@ class BJT:
         float
             _description_
         """
-        vt = BOLTZMANN * self.temperature / CHARGE
+        vt = self.thermal_voltage()
         iss = self.substrate_saturation_current()
 
         return self.area * iss * (np.exp(vjs / (self.substrate_emission_coeff * vt)) - 1)
 
+    @temperature_dependent
     def substrate_saturation_current(self)-> float:
         """_summary_
 
@@ -569,14 +713,18 @@ class BJT:
         float
             _description_
         """
-        if self.rb_half_current == np.inf:
-            return (self.minimum_base_resistance() + ((self.maximum_base_resistance() - self.minimum_base_resistance()) / self.base_charge_factor(vbe,vbc))) / self.area
-        elif self.rb_half_current > 0:
-            x = (np.sqrt((1 + (144 / (np.pi ** 2))) * self.base_current(vbe,vbc) / (self.area * self.rb_half_current)) - 1) / ((24 / (np.pi ** 2)) * np.sqrt(self.base_current(vbe,vbc) / (self.area * self.rb_half_current)))
-            return (self.minimum_base_resistance() + 3 * (self.maximum_base_resistance() - self.minimum_base_resistance()) * ((np.tan(x) - x) / (x * (np.tan(x)) ** 2))) / self.area
-        else:
+        if np.any(np.less_equal(self.rb_half_current, 0)):
             raise Exception("IRB is less than 0!")
+        rbm = self.minimum_base_resistance()
+        rb = self.maximum_base_resistance()
+        # IRB = inf selects the base charge model, a finite IRB the current crowding model
+        charge_model = (rbm + ((rb - rbm) / self.base_charge_factor(vbe,vbc))) / self.area
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = (np.sqrt((1 + (144 / (np.pi ** 2))) * self.base_current(vbe,vbc) / (self.area * self.rb_half_current)) - 1) / ((24 / (np.pi ** 2)) * np.sqrt(self.base_current(vbe,vbc) / (self.area * self.rb_half_current)))
+            crowding_model = (rbm + 3 * (rb - rbm) * ((np.tan(x) - x) / (x * (np.tan(x)) ** 2))) / self.area
+        return np.where(np.isinf(self.rb_half_current), charge_model, crowding_model)[()]
 
+    @temperature_dependent
     def minimum_base_resistance(self)-> float:
         """_summary_
 
@@ -588,6 +736,7 @@ class BJT:
         t_tnom = self.temperature - self.nominal_temperature
         return self.min_base_resistance * (1 + (self.rbm_temp_coeff_lin * t_tnom) + (self.rbm_temp_coeff_quad * (t_tnom ** 2)))
         
+    @temperature_dependent
     def maximum_base_resistance(self)-> float:
         """_summary_
 
@@ -599,6 +748,7 @@ class BJT:
         t_tnom = self.temperature - self.nominal_temperature
         return self.zero_bias_max_base_resistance * (1 + (self.rb_temp_coeff_lin* t_tnom) + (self.rb_temp_coeff_quad * (t_tnom ** 2)))
 
+    @temperature_dependent
     def collector_resistance(self)-> float:
         """_summary_
 
@@ -610,6 +760,7 @@ class BJT:
         t_tnom = self.temperature - self.nominal_temperature
         return self.collector_ohmic_resistance * (1 + (self.rc_temp_coeff_lin * t_tnom) + (self.rc_temp_coeff_quad * (t_tnom ** 2)))
     
+    @temperature_dependent
     def emitter_resistance(self)-> float:
         """_summary_
 
@@ -621,6 +772,7 @@ class BJT:
         t_tnom = self.temperature - self.nominal_temperature
         return self.emitter_ohmic_resistance * (1 + (self.re_temp_coeff_lin * t_tnom) + (self.re_temp_coeff_quad * (t_tnom ** 2)))
 
+    @temperature_dependent
     def base_emitter_potential(self)-> float:
         """_summary_
 
@@ -634,6 +786,7 @@ class BJT:
         
         return (self.base_emitter_pot * t_tnom) - (3 * vt * np.log(t_tnom)) - (self.__eg(self.nominal_temperature) * t_tnom) + self.__eg(self.temperature)
 
+    @temperature_dependent
     def base_collector_potential(self)-> float:
         """_summary_
 
@@ -647,6 +800,7 @@ class BJT:
 
         return (self.base_collector_pot * t_tnom) - (3 * vt * np.log(t_tnom)) - (self.__eg(self.nominal_temperature) * t_tnom) + self.__eg(self.temperature)
 
+    @temperature_dependent
     def substrate_potential(self)-> float:
         """_summary_
 
@@ -660,6 +814,7 @@ class BJT:
 
         return (self.substrate_pot * t_tnom) - (3 * vt * np.log(t_tnom)) - (self.__eg(self.nominal_temperature) * t_tnom) + self.__eg(self.temperature) 
 
+    @temperature_dependent
     def temp_dep_base_emitter_capacitance(self)-> float:
         """_summary_
 
@@ -673,6 +828,7 @@ class BJT:
 
         return self.base_emitter_pn_cap * (1 + (mje * (4e-4 * t_tnom + (1 - (self.base_emitter_potential() / self.base_emitter_pot)))))
     
+    @temperature_dependent
     def temp_dep_base_collector_capacitance(self)-> float:
         """_summary_
 
@@ -686,6 +842,7 @@ class BJT:
 
         return self.base_collector_pn_cap * (1 + (mjc * (4e-4 * t_tnom + (1 - (self.base_collector_potential() / self.base_collector_pot)))))
 
+    @temperature_dependent
     def temp_dep_substrate_capacitance(self)-> float:
         """_summary_
 
@@ -733,6 +890,22 @@ class BJT:
             _description_
         """
         return self.forward_diffusion_current(vbe) + self.non_ideal_base_emitter_current(vbe)
+
+    def base_emitter_conductance(self,
+                                 vbe: float=0.0)-> float:
+        """Closed-form derivative of base_emitter_current with respect to vbe
+
+        Parameters
+        ----------
+        vbe : float, optional
+            intrinsic base-emitter voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dIbe/dVbe, S
+        """
+        return self.forward_diffusion_conductance(vbe) + self.non_ideal_base_emitter_conductance(vbe)
     
     def base_collector_current(self,
                                vbc: float=0.0)-> float:
@@ -750,6 +923,22 @@ class BJT:
         """
         return self.reverse_diffusion_current(vbc) + self.non_ideal_base_collector_current(vbc)
 
+    def base_collector_conductance(self,
+                                   vbc: float=0.0)-> float:
+        """Closed-form derivative of base_collector_current with respect to vbc
+
+        Parameters
+        ----------
+        vbc : float, optional
+            intrinsic base-collector voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dIbc/dVbc, S
+        """
+        return self.reverse_diffusion_conductance(vbc) + self.non_ideal_base_collector_conductance(vbc)
+
     def transit_time_capacitance_be(self,
                                  vbc: float=0.0,
                                  vbe: float=0.0)-> float:
@@ -768,32 +957,46 @@ class BJT:
             _description_
         """
         vbc_comp = np.exp(vbc / (1.44 * self.transit_time_dependency_Vbc))
-        sq_term = np.square(self.forward_diffusion_current(vbe) / (self.forward_diffusion_current(vbe) + (self.area * self.transit_time_dependency_IC)))
+        ibe1 = self.forward_diffusion_current(vbe)
+        ibe1_itf = ibe1 + (self.area * self.transit_time_dependency_IC)
+        sq_term = np.square(np.divide(ibe1, ibe1_itf, out=np.zeros_like(ibe1_itf, dtype=float), where=(ibe1_itf != 0)))
         tf = self.ideal_fwd_transit_time * (1 + (self.transit_time_bias_dependence_coeff * sq_term * vbc_comp))
         
-        return tf * self.dc_conductance(self.base_emitter_current,vbe)
+        return tf * self.base_emitter_conductance(vbe)
 
     def dc_conductance(self,
                        func,
                        voltage: float=0.0,
                        dV: float=1.0e-6)-> float:
-        """_summary_
+        """Small-signal conductance dI/dV of one of the model's current components.
+
+        Current methods of this model are differentiated in closed form. Any other
+        callable falls back to a central difference with step dV.
 
         Parameters
         ----------
-        func : _type_
-            _description_
+        func : callable
+            current as a function of a single voltage, e.g. self.base_emitter_current
         voltage : float, optional
-            _description_, by default 0.0
+            voltage at which the conductance is evaluated, by default 0.0 V
         dV : float, optional
-            _description_, by default 1.0e-6
+            central difference step for callables without a closed form, by default 1.0e-6 V
 
         Returns
         -------
         float
-            _description_
+            conductance, S
         """
-        return derivative(func, voltage, dx=dV) 
+        analytic = {"forward_diffusion_current" : self.forward_diffusion_conductance,
+                    "reverse_diffusion_current" : self.reverse_diffusion_conductance,
+                    "non_ideal_base_emitter_current" : self.non_ideal_base_emitter_conductance,
+                    "non_ideal_base_collector_current" : self.non_ideal_base_collector_conductance,
+                    "base_emitter_current" : self.base_emitter_conductance,
+                    "base_collector_current" : self.base_collector_conductance}
+        if getattr(func, '__self__', None) is self and func.__name__ in analytic:
+            return analytic[func.__name__](voltage)
+
+        return (func(voltage + dV) - func(voltage - dV)) / (2 * dV)
     
     def base_emitter_junction_capacitance(self,
                                           vbe: float=0.0)-> float:
@@ -814,10 +1017,7 @@ class BJT:
         mje = self.base_emitter_grading_factor
         cje = self.temp_dep_base_emitter_capacitance()
 
-        if (fc * vje) >= vbe:
-            return cje * ((1 - (vbe / vje)) ** -mje)
-        else:
-            return cje * ((1 - fc) ** -(1 + mje)) * (1 - (fc * (1 + mje)) + (mje * vbe / vje))
+        return _depletion_capacitance(vbe, cje, vje, mje, fc)
     
     def base_collector_capacitance(self,
                                    vbc: float=0.0)-> float:
@@ -833,10 +1033,12 @@ class BJT:
         float
             _description_
         """
-        if (0.0 < self.frac_cjc_internal_rb2 < 1.0):
-            return self.transit_time_capacitance_bc(vbc) + (self.area * self.frac_cjc_internal_rb2 * self.base_collector_junction_capacitance(vbc))
-        else:
-            return self.transit_time_capacitance_bc(vbc) + (self.area * self.frac_cjc_internal_rb * self.base_collector_junction_capacitance(vbc))
+        return self.transit_time_capacitance_bc(vbc) + (self.area * self._internal_cjc_fraction() * self.base_collector_junction_capacitance(vbc))
+
+    def _internal_cjc_fraction(self)-> float:
+        """XCJC2 where it lies in (0, 1), XCJC otherwise"""
+        xcjc2 = self.frac_cjc_internal_rb2
+        return np.where((np.greater(xcjc2, 0.0)) & (np.less(xcjc2, 1.0)), xcjc2, self.frac_cjc_internal_rb)[()]
 
     def transit_time_capacitance_bc(self,
                                     vbc)-> float:
@@ -852,7 +1054,7 @@ class BJT:
         float
             _description_
         """
-        return self.ideal_rev_transit_time * self.dc_conductance(self.base_collector_current,vbc)
+        return self.ideal_rev_transit_time * self.base_collector_conductance(vbc)
 
     def base_collector_junction_capacitance(self,
                                             vbc: float=0.0)-> float:
@@ -873,11 +1075,7 @@ class BJT:
         mjc = self.base_collector_grading_factor
         cjc = self.temp_dep_base_collector_capacitance()
 
-
-        if vbc < (fc * vjc):
-            return cjc * ((1 - (vbc / vjc)) ** -mjc)
-        else:
-            return cjc * ((1 - fc) ** -(1 + mjc)) * (1 - (fc * (1 + mjc)) + (mjc * vbc / vjc))
+        return _depletion_capacitance(vbc, cjc, vjc, mjc, fc)
 
     def extrinsic_base_collector_capacitance(self,
                                              vbx: float=0.0,
@@ -922,10 +1120,7 @@ class BJT:
         mjc = self.base_collector_grading_factor
         fc = self.fwd_bias_dep_cap_coeff
 
-        if vbx <= (fc * vjc):
-            return cjc * ((1 - (vbx / vjc)) ** -mjc)
-        else:
-            return cjc * ((1 - fc) ** -(1 + mjc)) * (1 - (fc * (1 + mjc)) + (mjc * vbx / vjc))
+        return _depletion_capacitance(vbx, cjc, vjc, mjc, fc)
     
     def substrate_junction_capacitance(self,
                                        vjs: float=0.0)-> float:
@@ -945,11 +1140,11 @@ class BJT:
         cjs = self.temp_dep_substrate_capacitance()
         mjs = self.substrate_grading_factor
 
-        if vjs <= 0:
-            return self.area * cjs * ((1 - (vjs / vj_s)) ** -mjs)
-        else:
-            return self.area * cjs * (1 + (mjs * vjs / vj_s))
+        reverse = self.area * cjs * ((1 - (np.minimum(vjs, 0.0) / vj_s)) ** -mjs)
+        forward = self.area * cjs * (1 + (mjs * vjs / vj_s))
+        return np.where(vjs <= 0, reverse, forward)[()]
     
+    @temperature_dependent
     def epitaxial_region_doping_factor(self)-> float:
         """_summary_
 
@@ -968,6 +1163,7 @@ class BJT:
 
         return gamma * (t_tnom ** 3) * np.exp((-q * vg / k) * ((1 / t) - (1 / tnom)))
     
+    @temperature_dependent
     def epitaxial_region_resistance(self)-> float:
         """_summary_
 
@@ -981,6 +1177,7 @@ class BJT:
 
         return rco * (t_tnom ** self.qsat_temp_coeff_hm)
 
+    @temperature_dependent
     def carrier_mobility_knee_voltage(self)-> float:
         """_summary_
 
@@ -1012,16 +1209,13 @@ class BJT:
         dict
             _description_
         """
-        if self.qsat_flag == 0:
-            vo = self.carrier_mob_knee_voltage
-            rco = self.epitaxial_reg_resistance
-            gamma = self.epitaxial_reg_doping_factor
-        else:
-            vo = self.carrier_mobility_knee_voltage()
-            rco = self.epitaxial_region_resistance()
-            gamma = self.epitaxial_region_doping_factor()
-        
-        if rco == 0:
+        # temperature-scaled parameters with the quasi-saturation model (QSAT flag set)
+        scaled = np.not_equal(self.qsat_flag, 0)
+        vo = np.where(scaled, self.carrier_mobility_knee_voltage(), self.carrier_mob_knee_voltage)[()]
+        rco = np.where(scaled, self.epitaxial_region_resistance(), self.epitaxial_reg_resistance)[()]
+        gamma = np.where(scaled, self.epitaxial_region_doping_factor(), self.epitaxial_reg_doping_factor)[()]
+
+        if np.any(np.equal(rco, 0)):
             raise Exception("RCO must be greater than 0 for Epitaxial Region Current and Charge!")
         else:
             vt = self.thermal_voltage()
@@ -1132,6 +1326,307 @@ class BJT:
         """
         return 2 * CHARGE * self.collector_current(vbe,vbc)
 
+    def bias_sweep(self,
+                   vbe: npt.ArrayLike=0.0,
+                   vbc: npt.ArrayLike=0.0,
+                   grid: bool=False)-> dict:
+        """Terminal currents, charges and capacitances over whole arrays of bias points.
+
+        Temperature-only terms (saturation currents, betas, junction potentials and
+        zero-bias capacitances) are evaluated once per sweep, and every bias-dependent
+        term is evaluated in a single vectorized pass. Results match base_current(),
+        collector_current(), base_emitter_capacitance() and base_collector_capacitance()
+        point by point.
+
+        Parameters
+        ----------
+        vbe : npt.ArrayLike, optional
+            intrinsic base-emitter voltages, by default 0.0 V
+        vbc : npt.ArrayLike, optional
+            intrinsic base-collector voltages, by default 0.0 V
+        grid : bool, optional
+            if True, vbe and vbc are 1-D axes evaluated on their meshgrid with shape
+            (len(vbe), len(vbc)), otherwise they are broadcast against each other,
+            by default False
+
+        Returns
+        -------
+        dict
+            arrays keyed by "Base Current", "Collector Current", "Emitter Current",
+            "Base Charge Factor", "Base-Emitter Charge", "Base-Collector Charge",
+            "Base-Emitter Capacitance" and "Base-Collector Capacitance".
+            The emitter current is -(Ib + Ic), all currents flowing into the device.
+        """
+        if grid:
+            vbe, vbc = np.meshgrid(np.ravel(vbe), np.ravel(vbc), indexing='ij')
+        vbe, vbc = np.broadcast_arrays(np.asarray(vbe, dtype=float), np.asarray(vbc, dtype=float))
+
+        # temperature-only terms, once per sweep
+        vt = self.thermal_voltage()
+        i_s = self.saturation_current()
+        ise = self.base_emitter_leakage_current()
+        isc = self.base_collector_leakage_current()
+        bf = self.forward_beta()
+        br = self.reverse_beta()
+        nf_vt = self.fwd_current_emission_coeff * vt
+        nr_vt = self.rev_current_emission_coeff * vt
+        ne_vt = self.base_emitter_leak_emission_coeff * vt
+        nc_vt = self.base_collector_leak_emission_coeff * vt
+        fc = self.fwd_bias_dep_cap_coeff
+        vje = self.base_emitter_potential()
+        vjc = self.base_collector_potential()
+        cje = self.temp_dep_base_emitter_capacitance()
+        cjc = self.temp_dep_base_collector_capacitance()
+        mje = self.base_emitter_grading_factor
+        mjc = self.base_collector_grading_factor
+        xcjc = self._internal_cjc_fraction()
+
+        # bias-dependent terms, one vectorized pass
+        exp_f = np.exp(vbe / nf_vt)
+        exp_r = np.exp(vbc / nr_vt)
+        exp_e = np.exp(vbe / ne_vt)
+        exp_c = np.exp(vbc / nc_vt)
+        ibe1 = i_s * (exp_f - 1)
+        ibe2 = ise * (exp_e - 1)
+        ibc1 = i_s * (exp_r - 1)
+        ibc2 = isc * (exp_c - 1)
+
+        kq1 = 1 / (1 - (vbc / self.fwd_early_voltage) - (vbe / self.rev_early_voltage))
+        kq2 = (ibe1 / self.fwd_beta_hi_current) + (ibc1 / self.rev_beta_hi_current)
+        kqb = kq1 * (1 + ((1 + (4 * kq2)) ** self.hi_current_ro_coeff)) / 2
+
+        ib = self.area * ((ibe1 / bf) + ibe2 + (ibc1 / br) + ibc2)
+        ic = self.area * ((ibe1 / kqb) - (ibc1 / kqb) - (ibc1 / br) - ibc2)
+
+        # transit-time terms
+        gbe = (i_s * exp_f / nf_vt) + (ise * exp_e / ne_vt)
+        gbc = (i_s * exp_r / nr_vt) + (isc * exp_c / nc_vt)
+        ibe1_itf = ibe1 + (self.area * self.transit_time_dependency_IC)
+        sq_term = np.square(np.divide(ibe1, ibe1_itf, out=np.zeros_like(ibe1), where=(ibe1_itf != 0)))
+        vbc_comp = np.exp(vbc / (1.44 * self.transit_time_dependency_Vbc))
+        tf = self.ideal_fwd_transit_time * (1 + (self.transit_time_bias_dependence_coeff * sq_term * vbc_comp))
+        tr = self.ideal_rev_transit_time
+
+        cbe = (tf * gbe) + (self.area * _depletion_capacitance(vbe, cje, vje, mje, fc))
+        cbc = (tr * gbc) + (self.area * xcjc * _depletion_capacitance(vbc, cjc, vjc, mjc, fc))
+        qbe = (tf * (ibe1 + ibe2)) + (self.area * _depletion_charge(vbe, cje, vje, mje, fc))
+        qbc = (tr * (ibc1 + ibc2)) + (self.area * xcjc * _depletion_charge(vbc, cjc, vjc, mjc, fc))
+
+        return {"Base Current" : ib,
+                "Collector Current" : ic,
+                "Emitter Current" : -(ib + ic),
+                "Base Charge Factor" : kqb,
+                "Base-Emitter Charge" : qbe,
+                "Base-Collector Charge" : qbc,
+                "Base-Emitter Capacitance" : cbe,
+                "Base-Collector Capacitance" : cbc}
+
+    def dc_conductances(self,
+                        vbe: npt.ArrayLike=0.0,
+                        vbc: npt.ArrayLike=0.0)-> tuple:
+        """Base and collector currents with their closed-form partial derivatives.
+
+        Parameters
+        ----------
+        vbe : npt.ArrayLike, optional
+            intrinsic base-emitter voltage, by default 0.0 V
+        vbc : npt.ArrayLike, optional
+            intrinsic base-collector voltage, by default 0.0 V
+
+        Returns
+        -------
+        tuple
+            (ib, ic, dib/dvbe, dib/dvbc, dic/dvbe, dic/dvbc), A and S
+        """
+        bf = self.forward_beta()
+        br = self.reverse_beta()
+        ibe1 = self.forward_diffusion_current(vbe)
+        ibc1 = self.reverse_diffusion_current(vbc)
+        ibe2 = self.non_ideal_base_emitter_current(vbe)
+        ibc2 = self.non_ideal_base_collector_current(vbc)
+        gbe1 = self.forward_diffusion_conductance(vbe)
+        gbc1 = self.reverse_diffusion_conductance(vbc)
+        gbe2 = self.non_ideal_base_emitter_conductance(vbe)
+        gbc2 = self.non_ideal_base_collector_conductance(vbc)
+
+        # base charge factor and its derivatives
+        nk = self.hi_current_ro_coeff
+        kq1 = 1 / (1 - (vbc / self.fwd_early_voltage) - (vbe / self.rev_early_voltage))
+        kq2 = (ibe1 / self.fwd_beta_hi_current) + (ibc1 / self.rev_beta_hi_current)
+        root = (1 + (4 * kq2)) ** nk
+        kqb = kq1 * (1 + root) / 2
+        droot_dkq2 = 4 * nk * root / (1 + (4 * kq2))
+        dkqb_dvbe = ((kq1 ** 2) * (1 + root) / (2 * self.rev_early_voltage)) + (kq1 * droot_dkq2 * gbe1 / (2 * self.fwd_beta_hi_current))
+        dkqb_dvbc = ((kq1 ** 2) * (1 + root) / (2 * self.fwd_early_voltage)) + (kq1 * droot_dkq2 * gbc1 / (2 * self.rev_beta_hi_current))
+
+        ict = (ibe1 - ibc1) / kqb
+        ib = self.area * ((ibe1 / bf) + ibe2 + (ibc1 / br) + ibc2)
+        ic = self.area * (ict - (ibc1 / br) - ibc2)
+        gpi = self.area * ((gbe1 / bf) + gbe2)
+        gmu = self.area * ((gbc1 / br) + gbc2)
+        gce = self.area * ((gbe1 - (ict * dkqb_dvbe)) / kqb)
+        gcc = self.area * (((-gbc1 - (ict * dkqb_dvbc)) / kqb) - (gbc1 / br) - gbc2)
+
+        return ib, ic, gpi, gmu, gce, gcc
+
+    def _solve_operating_point(self,
+                               vbe: npt.ArrayLike,
+                               vce: npt.ArrayLike,
+                               x0: np.ndarray=None,
+                               ftol: float=1.0e-9,
+                               max_iter: int=100)-> NewtonResult:
+        """Damped Newton solve for the intrinsic (vbe, vbc) behind the parasitic resistances.
+
+        With the emitter as reference, the residuals are
+            vbe + rb*ib + re*(ib + ic) - VBE
+            vbc + rb*ib - rc*ic - (VBE - VCE)
+        The bias-dependent base resistance is held at its current value when forming
+        the Jacobian, as SPICE does.
+        """
+        vbe, vce = np.broadcast_arrays(np.asarray(vbe, dtype=float), np.asarray(vce, dtype=float))
+        vbc = vbe - vce
+        rc = self.collector_resistance() / self.area
+        re = self.emitter_resistance() / self.area
+        vt = self.thermal_voltage()
+        nf_vt = self.fwd_current_emission_coeff * vt
+        nr_vt = self.rev_current_emission_coeff * vt
+        vbe_crit = critical_voltage(nf_vt, self.area * self.saturation_current())
+        vbc_crit = critical_voltage(nr_vt, self.area * self.saturation_current())
+
+        def system(x):
+            vbe_i, vbc_i = x[..., 0], x[..., 1]
+            ib, ic, gpi, gmu, gce, gcc = self.dc_conductances(vbe_i, vbc_i)
+            rb = self.actual_base_parasitic_resistance(vbe_i, vbc_i)
+            residual = np.stack([vbe_i + (rb * ib) + (re * (ib + ic)) - vbe,
+                                 vbc_i + (rb * ib) - (rc * ic) - vbc], axis=-1)
+            jacobian = np.stack([np.stack([1 + (rb * gpi) + (re * (gpi + gce)), (rb * gmu) + (re * (gmu + gcc))], axis=-1),
+                                 np.stack([(rb * gpi) - (rc * gce), 1 + (rb * gmu) - (rc * gcc)], axis=-1)], axis=-2)
+            return residual, jacobian
+
+        def limit(x_new, x_old):
+            return np.stack([pn_junction_limit(x_new[..., 0], x_old[..., 0], nf_vt, vbe_crit),
+                             pn_junction_limit(x_new[..., 1], x_old[..., 1], nr_vt, vbc_crit)], axis=-1)
+
+        if x0 is None:
+            x0 = np.stack([np.minimum(vbe, vbe_crit), np.minimum(vbc, vbc_crit)], axis=-1)
+        x0 = np.broadcast_to(x0, vbe.shape + (2,))
+
+        return damped_newton(system, x0, limit=limit, ftol=ftol, max_iter=max_iter)
+
+    def _operating_point_results(self,
+                                 result: NewtonResult)-> dict:
+        vbe_i, vbc_i = result.x[..., 0][()], result.x[..., 1][()]
+        ib, ic = self.base_current(vbe_i, vbc_i), self.collector_current(vbe_i, vbc_i)
+        return {"Base-Emitter Voltage" : vbe_i,
+                "Base-Collector Voltage" : vbc_i,
+                "Base Current" : ib,
+                "Collector Current" : ic,
+                "Emitter Current" : -(ib + ic),
+                "Converged" : result.converged[()],
+                "Iterations" : result.iterations[()]}
+
+    def operating_point(self,
+                        vbe: npt.ArrayLike=0.0,
+                        vce: npt.ArrayLike=0.0,
+                        x0: npt.ArrayLike=None,
+                        ftol: float=1.0e-9,
+                        max_iter: int=100)-> dict:
+        """DC operating point of the transistor including its base, collector and emitter
+        parasitic resistances.
+
+        All bias points are solved in one vectorized damped Newton solve with the analytic
+        Jacobian of the terminal currents and SPICE junction voltage limiting.
+
+        Parameters
+        ----------
+        vbe : npt.ArrayLike, optional
+            external base-emitter voltages, by default 0.0 V
+        vce : npt.ArrayLike, optional
+            external collector-emitter voltages, broadcast against vbe, by default 0.0 V
+        x0 : npt.ArrayLike, optional
+            initial guess of the intrinsic (vbe, vbc) pairs, shape (..., 2),
+            by default None (external voltages clipped to the critical voltages)
+        ftol : float, optional
+            residual tolerance, by default 1.0e-9 V
+        max_iter : int, optional
+            maximum number of Newton iterations, by default 100
+
+        Returns
+        -------
+        dict
+            arrays keyed by "Base-Emitter Voltage", "Base-Collector Voltage" (intrinsic),
+            "Base Current", "Collector Current", "Emitter Current", "Converged" and "Iterations"
+        """
+        return self._operating_point_results(self._solve_operating_point(vbe, vce, x0, ftol, max_iter))
+
+    def operating_point_sweep(self,
+                              vbe: npt.ArrayLike,
+                              vce: npt.ArrayLike,
+                              ftol: float=1.0e-9,
+                              max_iter: int=100)-> dict:
+        """DC operating points along a bias sweep, each step warm-started from the
+        solution of the previous one.
+
+        Parameters
+        ----------
+        vbe : npt.ArrayLike
+            external base-emitter voltages, swept along the first axis, V
+        vce : npt.ArrayLike
+            external collector-emitter voltages, broadcast against vbe, V
+        ftol : float, optional
+            residual tolerance, by default 1.0e-9 V
+        max_iter : int, optional
+            maximum number of Newton iterations per step, by default 100
+
+        Returns
+        -------
+        dict
+            same keys as operating_point(), stacked along the sweep axis
+        """
+        vbe, vce = np.broadcast_arrays(np.asarray(vbe, dtype=float), np.asarray(vce, dtype=float))
+        solve = functools.partial(self._solve_operating_point, ftol=ftol, max_iter=max_iter)
+        return self._operating_point_results(warm_start_sweep(solve, vbe, vce))
+
+    def operating_point_continuation(self,
+                                     vbe: npt.ArrayLike,
+                                     vce: npt.ArrayLike,
+                                     cache: SolutionCache=None,
+                                     max_step: float=None,
+                                     ftol: float=1.0e-9,
+                                     max_iter: int=100)-> dict:
+        """DC operating points along a bias path by adaptive continuation.
+
+        Each point starts from intrinsic junction voltages extrapolated from the last
+        two solutions. The step in (VBE, VCE) is halved wherever Newton fails to
+        converge. Solutions are reused from the cache when the same transistor is
+        swept again at the same temperature.
+
+        Parameters
+        ----------
+        vbe : npt.ArrayLike
+            1-D array of external base-emitter voltages, V
+        vce : npt.ArrayLike
+            external collector-emitter voltages, broadcast against vbe, V
+        cache : SolutionCache, optional
+            cache of converged operating points, by default None
+        max_step : float, optional
+            largest step in (VBE, VCE), by default None (unlimited)
+        ftol : float, optional
+            residual tolerance, by default 1.0e-9 V
+        max_iter : int, optional
+            maximum number of Newton iterations per step, by default 100
+
+        Returns
+        -------
+        dict
+            same keys as operating_point(), stacked along the sweep axis
+        """
+        bias = np.stack(np.broadcast_arrays(np.asarray(vbe, dtype=float), np.asarray(vce, dtype=float)), axis=-1)
+        solve = functools.partial(self._solve_operating_point, ftol=ftol, max_iter=max_iter)
+        return self._operating_point_results(continuation_sweep(lambda point, x0: solve(point[0], point[1], x0), bias,
+                                                                cache=cache, device=self, temperature=self.temperature,
+                                                                max_step=max_step))
+
 class NPN(BJT):
     """_summary_
 
@@ -16,8 +16,11 @@ TODO:
     ADD Magnetic Fields: Hall Effect
 """
 
-from semicpy.constants.constants import value
-from semicpy.math.functions import ifdint_approx
+from semicpy.constants import codata
+from semicpy.math.functions import inverse_fermi_dirac_integral
+
+BOLTZMANN = codata.BOLTZMANN_CONSTANT_IN_EV_PER_K
+CHARGE = codata.ELEMENTARY_CHARGE
 
 def mobility(tau=0,
              effective_mass=1):
@@ -36,7 +39,7 @@ def mobility(tau=0,
 
     '''
 
-    mu = value('Elementary charge') * tau / effective_mass
+    mu = CHARGE * tau / effective_mass
     return mu
 
 def particle_current_density_drift(spec=None, 
@@ -111,7 +114,7 @@ def diffusivity(temp=300,
     The electron or hole diffusivity.
 
     """
-    kb_t = value("Boltzmann constant in eV/K") * temp
+    kb_t = BOLTZMANN * temp
     d = kb_t * mu
     return d
 
@@ -190,7 +193,7 @@ def electrical_current_density(j_n=0,
     Electrical current density
 
     """
-    q = value("Elementary charge")
+    q = CHARGE
     current_density = q*(j_p - j_n)
     return current_density
 
@@ -220,9 +223,9 @@ def electron_quasi_fermi_level(band_edge_energy=0,
     None.
 
     """
-    kb_t = value('Boltzmann constant in eV/K') * temp
+    kb_t = BOLTZMANN * temp
     n_nc = density / density_of_states
-    fn = band_edge_energy - phi + (kb_t * ifdint_approx(n_nc))
+    fn = band_edge_energy - phi + (kb_t * inverse_fermi_dirac_integral(0.5, n_nc))
 
     return fn
 
@@ -252,8 +255,8 @@ def hole_quasi_fermi_level(band_edge_energy=0,
     None.
 
     """
-    kb_t = value('Boltzmann constant in eV/K') * temp
+    kb_t = BOLTZMANN * temp
     p_nv = density / density_of_states
-    fp = band_edge_energy - phi - (kb_t * ifdint_approx(p_nv))
+    fp = band_edge_energy - phi - (kb_t * inverse_fermi_dirac_integral(0.5, p_nv))
 
     return fp
@@ -0,0 +1,154 @@
+"""
+Equilibrium Fermi level of a doped semiconductor from charge neutrality
+
+    n(E_F) + N_A^-(E_F) = p(E_F) + N_D^+(E_F)
+
+with Fermi-Dirac statistics for the band carriers (n = N_C F_1/2, p = N_V F_1/2,
+so degeneracy is included) and incomplete ionization of the dopants
+(dist_functions.donor_distribution and acceptor_distribution). Every input
+broadcasts, so a whole table of (T, N_D, N_A) tuples is solved at once by a
+bracketed Newton iteration.
+
+Energies are measured from the valence band edge, E_V = 0 and E_C = bandgap.
+"""
+import numpy as np
+import numpy.typing as npt
+from semicpy.constants import codata
+from semicpy.carriers.dist_functions import donor_distribution, acceptor_distribution
+from semicpy.fundamentals import bandgap_temp, nc_temp, nv_temp
+from semicpy.math.functions import fermi_dirac_integral, inverse_fermi_dirac_integral
+from semicpy.math.solvers import bracketed_newton
+
+BOLTZMANN = codata.BOLTZMANN_CONSTANT_IN_EV_PER_K
+
+# below this reduced energy F_j(eta) = e^eta to double precision, so the band densities
+# are carried as logarithms and never underflow at low temperature
+_BOLTZMANN_LIMIT = -40.0
+
+def _log_band_density(eta):
+    """ln F_1/2(eta) and F_-1/2(eta) / F_1/2(eta)"""
+    degenerate = eta > _BOLTZMANN_LIMIT
+    eta_fd = np.where(degenerate, eta, 0.0)
+    f_half = fermi_dirac_integral(0.5, eta_fd)
+    log_density = np.where(degenerate, np.log(f_half), eta)
+    slope = np.where(degenerate, fermi_dirac_integral(-0.5, eta_fd) / f_half, 1.0)
+    return log_density, slope
+
+def _carrier_densities(fermi_energy, kb_t, bandgap, n_c, n_v, n_d, n_a, donor_level, acceptor_level, g_d, g_a)-> dict:
+    """Densities at the Fermi energy, and ln of the ratio of positive to negative charge
+    (zero at neutrality, nearly linear in E_F / kT) with its derivative"""
+    temp = kb_t / BOLTZMANN
+    ionized_donor_fraction = donor_distribution(g_d, fermi_energy, donor_level, temp)
+    ionized_acceptor_fraction = acceptor_distribution(g_a, fermi_energy, acceptor_level, temp)
+    log_n, slope_n = _log_band_density((fermi_energy - bandgap) / kb_t)
+    log_p, slope_p = _log_band_density(-fermi_energy / kb_t)
+    log_n += np.log(n_c)
+    log_p += np.log(n_v)
+    log_donors = np.log(n_d) - np.logaddexp(0.0, np.log(g_d) + ((fermi_energy - donor_level) / kb_t))
+    log_acceptors = np.log(n_a) - np.logaddexp(0.0, np.log(g_a) + ((acceptor_level - fermi_energy) / kb_t))
+    log_positive = np.logaddexp(log_p, log_donors)
+    log_negative = np.logaddexp(log_n, log_acceptors)
+    # d ln(charge) / dE_F as the density-weighted mean of the logarithmic slopes
+    positive_slope = -((np.exp(log_p - log_positive) * slope_p)
+                       + (np.exp(log_donors - log_positive) * (1 - ionized_donor_fraction))) / kb_t
+    negative_slope = ((np.exp(log_n - log_negative) * slope_n)
+                      + (np.exp(log_acceptors - log_negative) * (1 - ionized_acceptor_fraction))) / kb_t
+    return {"Electron Density" : np.exp(log_n),
+            "Hole Density" : np.exp(log_p),
+            "Ionized Donors" : n_d * ionized_donor_fraction,
+            "Ionized Acceptors" : n_a * ionized_acceptor_fraction,
+            "Log Charge Ratio" : log_positive - log_negative,
+            "Log Charge Ratio Slope" : positive_slope - negative_slope}
+
+def charge_neutrality(temp: npt.ArrayLike=300,
+                      n_d: npt.ArrayLike=0.0,
+                      n_a: npt.ArrayLike=0.0,
+                      bandgap: npt.ArrayLike=None,
+                      n_c: npt.ArrayLike=None,
+                      n_v: npt.ArrayLike=None,
+                      donor_ionization: npt.ArrayLike=0.045,
+                      acceptor_ionization: npt.ArrayLike=0.045,
+                      g_d: npt.ArrayLike=2.0,
+                      g_a: npt.ArrayLike=4.0,
+                      xtol: float=1.0e-12,
+                      max_iter: int=100)-> dict:
+    """Self-consistent equilibrium Fermi level and carrier densities
+
+    Parameters
+    ----------
+    temp : npt.ArrayLike, optional
+        temperature, K, by default 300
+    n_d : npt.ArrayLike, optional
+        donor concentration, cm^-3, by default 0.0
+    n_a : npt.ArrayLike, optional
+        acceptor concentration, cm^-3, by default 0.0
+    bandgap : npt.ArrayLike, optional
+        bandgap, eV, by default None (fundamentals.bandgap_temp, silicon)
+    n_c : npt.ArrayLike, optional
+        conduction band effective density of states, cm^-3, by default None
+        (fundamentals.nc_temp)
+    n_v : npt.ArrayLike, optional
+        valence band effective density of states, cm^-3, by default None
+        (fundamentals.nv_temp)
+    donor_ionization : npt.ArrayLike, optional
+        donor level below the conduction band edge, eV, by default 0.045 (P in Si)
+    acceptor_ionization : npt.ArrayLike, optional
+        acceptor level above the valence band edge, eV, by default 0.045 (B in Si)
+    g_d : npt.ArrayLike, optional
+        donor degeneracy factor, by default 2.0
+    g_a : npt.ArrayLike, optional
+        acceptor degeneracy factor, by default 4.0
+    xtol : float, optional
+        tolerance on the Fermi energy, eV, by default 1.0e-12
+    max_iter : int, optional
+        maximum number of iterations, by default 100
+
+    Returns
+    -------
+    dict
+        "Fermi Energy" (eV above E_V), "Electron Density", "Hole Density",
+        "Ionized Donors", "Ionized Acceptors" (cm^-3), "Converged" and "Iterations",
+        each of the broadcast shape of the inputs
+    """
+    temp = np.asarray(temp, dtype=float)
+    bandgap = bandgap_temp(temp) if bandgap is None else np.asarray(bandgap, dtype=float)
+    n_c = nc_temp(temp) if n_c is None else np.asarray(n_c, dtype=float)
+    n_v = nv_temp(temp) if n_v is None else np.asarray(n_v, dtype=float)
+    kb_t = BOLTZMANN * temp
+    parameters = np.broadcast_arrays(kb_t, bandgap, n_c, n_v,
+                                     np.asarray(n_d, dtype=float), np.asarray(n_a, dtype=float),
+                                     bandgap - np.asarray(donor_ionization, dtype=float),
+                                     np.asarray(acceptor_ionization, dtype=float),
+                                     np.asarray(g_d, dtype=float), np.asarray(g_a, dtype=float))
+    kb_t, bandgap, n_c, n_v, n_d, n_a, donor_level, acceptor_level = parameters[:8]
+
+    # brackets: at high the electrons alone outnumber all donors (and holes), at low the
+    # holes outnumber all acceptors
+    with np.errstate(divide='ignore'):
+        eta_n = np.maximum(inverse_fermi_dirac_integral(0.5, n_d / n_c), 0.0)
+        eta_p = np.maximum(inverse_fermi_dirac_integral(0.5, n_a / n_v), 0.0)
+    eta_n = np.where(np.isfinite(eta_n), eta_n, 0.0)
+    eta_p = np.where(np.isfinite(eta_p), eta_p, 0.0)
+    high = bandgap + (kb_t * (eta_n + 40))
+    low = -kb_t * (eta_p + 40)
+    # full-ionization Boltzmann estimate as the starting point
+    n_i = np.sqrt(n_c * n_v) * np.exp(-bandgap / (2 * kb_t))
+    net = (n_d - n_a) / 2
+
+    flat = [parameter.ravel() for parameter in parameters]
+
+    def net_charge(fermi_energy, index):
+        densities = _carrier_densities(fermi_energy, *(parameter[index] for parameter in flat))
+        return densities["Log Charge Ratio"], densities["Log Charge Ratio Slope"]
+
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        x0 = (bandgap / 2) + (kb_t * (np.arcsinh(net / n_i) + (np.log(n_v / n_c) / 2)))
+        result = bracketed_newton(net_charge, low, high, x0=x0, xtol=xtol, max_iter=max_iter)
+        densities = _carrier_densities(np.asarray(result.x), *parameters)
+    return {"Fermi Energy" : result.x,
+            "Electron Density" : densities["Electron Density"][()],
+            "Hole Density" : densities["Hole Density"][()],
+            "Ionized Donors" : densities["Ionized Donors"][()],
+            "Ionized Acceptors" : densities["Ionized Acceptors"][()],
+            "Converged" : result.converged,
+            "Iterations" : result.iterations}
@@ -1,10 +1,28 @@
 '''
 module docstring for density of states
+
+The carrier densities of states are array-native: energy, band edge and effective
+masses broadcast against each other (e.g. a column of masses against a row of
+10^6 energies), out= takes a float buffer of the broadcast shape to fill in place,
+and the energy above the band edge is clamped at zero, so the DOS is 0 below the
+edge instead of NaN.
 '''
-from numpy import exp,sqrt,pi
-from semicpy.constants.constants import value
+import numpy as np
+from numpy import exp,pi
+from semicpy.constants import codata
+from semicpy.carriers.dist_functions import _buffer
+
+BOLTZMANN = codata.BOLTZMANN_CONSTANT_IN_EV_PER_K
+HBAR = codata.REDUCED_PLANCK_CONSTANT_IN_EV_S
+
+def _excess_energy(energy, conduction_band_energy, out):
+    '''
+    max(energy-conduction_band_energy, 0) in out
+    '''
+    np.subtract(energy, conduction_band_energy, out=out)
+    return np.maximum(out, 0, out=out)
 
-def density_of_states(m_star=0,energy=0,conduction_band_energy=0):
+def density_of_states(m_star=0,energy=0,conduction_band_energy=0,out=None):
     '''
     Function to find the density of quantum states as a function of
     energy
@@ -16,35 +34,50 @@ def density_of_states(m_star=0,energy=0,conduction_band_energy=0):
     conduction_band_energy: Conduction band edge energy in a semiconductor.
                             This is the potential energy for electrons, including
                             the electrostatic potential.
-    D(E) = m_star*sqrt(2*m_star*(energy-conduction_band_energy))/(pi**2 * h_bar**3)
+
+    out: float array of the broadcast shape to write the result into
+
+    D(E) = m_star*sqrt(2*m_star*(energy-conduction_band_energy))/(pi**2 * h_bar**3),
+           0 below conduction_band_energy
     '''
-    h_bar = value('reduced Planck in eV s')
-    d_e = m_star*sqrt(2*m_star*(energy-conduction_band_energy)) / ((pi**2) * (h_bar**3))
+    h_bar = HBAR
+    out, allocated = _buffer(out, m_star, energy, conduction_band_energy)
+    _excess_energy(energy, conduction_band_energy, out)
+    np.multiply(out, np.multiply(2, m_star), out=out)
+    np.sqrt(out, out=out)
+    np.multiply(out, np.divide(m_star, (pi**2) * (h_bar**3)), out=out)
 
-    return d_e
+    return out[()] if allocated else out
 
-def density_of_states_abm(m1_star=0,m2_star=0,m3_star=0,energy=0,conduction_band_energy=0):
+def density_of_states_abm(m1_star=0,m2_star=0,m3_star=0,energy=0,conduction_band_energy=0,out=None):
     '''
     Function to find the density of quantum states as a function of
     energy for an anisotropic band minimum.
 
-    m_star: the effective mass of a carrier in an energy band.
+    m1_star, m2_star, m3_star: the effective masses along the principal
+                               axes of the band minimum.
 
     energy: Energy of a particle or system, or of a particular quantum state
 
     conduction_band_energy: Conduction band edge energy in a semiconductor.
                             This is the potential energy for electrons, including
                             the electrostatic potential.
-    D(E) = sqrt(2*m1_star*m2_star*m3_star*(energy-conduction_band_energy))/(pi**2 * h_bar**3)
-    '''
 
-    h_bar = value('reduced Planck in eV s')
+    out: float array of the broadcast shape to write the result into
 
-    d_e = sqrt(2*m1_star*m2_star*m3_star*(energy-conduction_band_energy)) / ((pi**2) * (h_bar**3))
+    D(E) = sqrt(2*m1_star*m2_star*m3_star*(energy-conduction_band_energy))/(pi**2 * h_bar**3),
+           0 below conduction_band_energy
+    '''
+    h_bar = HBAR
+    out, allocated = _buffer(out, m1_star, m2_star, m3_star, energy, conduction_band_energy)
+    _excess_energy(energy, conduction_band_energy, out)
+    np.multiply(out, np.multiply(2, np.multiply(np.multiply(m1_star, m2_star), m3_star)), out=out)
+    np.sqrt(out, out=out)
+    np.divide(out, (pi**2) * (h_bar**3), out=out)
 
-    return d_e
+    return out[()] if allocated else out
 
-def density_of_states_non_parabolic(m_star=0,energy=0,conduction_band_energy=0,alpha=0):
+def density_of_states_non_parabolic(m_star=0,energy=0,conduction_band_energy=0,alpha=0,out=None):
     '''
     Function to find the density of quantum states as a function of
     energy for a non-parabolic energy band.
@@ -59,34 +92,60 @@ def density_of_states_non_parabolic(m_star=0,energy=0,conduction_band_energy=0,a
 
     alpha: an arbitary constant
 
+    out: float array of the broadcast shape to write the result into
+
     D(E) = m_star*sqrt(2*m_star*(energy-conduction_band_energy)
            *[1+alpha*(energy-conduction_band_energy)])
-           *[1+2*alpha*(energy-conduction_band_energy)/(pi**2 * h_bar**3)
+           *[1+2*alpha*(energy-conduction_band_energy)/(pi**2 * h_bar**3),
+           0 below conduction_band_energy
     '''
-
-    h_bar = value('reduced Planck constant in eV s')
-    energy_sub = energy-conduction_band_energy
+    h_bar = HBAR
     pi_h_product = (pi**2) * (h_bar**3)
-    sqrt_product = sqrt(2*m_star*(energy_sub)*(1+alpha*(energy_sub)))
-
-    d_e = m_star*sqrt_product*(1+2*alpha*energy_sub) / pi_h_product
+    out, allocated = _buffer(out, m_star, energy, conduction_band_energy, alpha)
+    energy_sub = _excess_energy(energy, conduction_band_energy, out)
+    # (1+2*alpha*x)*sqrt(x*(1+alpha*x)) = sqrt(x*(1+alpha*x)*(1+2*alpha*x)**2) for x, alpha >= 0
+    alpha_sub = np.multiply(alpha, energy_sub, out=np.empty(out.shape))
+    np.multiply(energy_sub, 1 + alpha_sub, out=out)
+    np.multiply(out, np.square(1 + (2*alpha_sub), out=alpha_sub), out=out)
+    np.multiply(out, np.multiply(2, m_star), out=out)
+    np.sqrt(out, out=out)
+    np.multiply(out, np.divide(m_star, pi_h_product), out=out)
 
-    return d_e
+    return out[()] if allocated else out
 
-def density_of_states_two_d(m_star=0):
+def density_of_states_two_d(m_star=0,energy=None,subband_energies=None,out=None):
     '''
     Function to find the 2D density of quantum states.
 
     m_star: the effective mass of a carrier in an energy band.
 
+    energy: Energy of a particle or system, or of a particular quantum state,
+            needed with subband_energies
+
+    subband_energies: edges of the subbands, e.g. the confined levels of a
+                      quantum well. Without them the DOS of a single subband
+                      is returned.
+
+    out: float array of the broadcast shape to write the result into
+
     D_2d = m_star/(pi*h_bar**2)
+    D_2d(E) = m_star/(pi*h_bar**2) * (number of subband_energies <= energy)
     '''
-    h_bar = value('reduced Planck constant in eV s')
-    d_2d = m_star / (pi * (h_bar**2))
+    h_bar = HBAR
+    if subband_energies is None:
+        d_2d = np.divide(m_star, pi * (h_bar**2))
+        return d_2d[()]
+    if energy is None:
+        raise ValueError("energy is needed to sum over the subbands!")
+    out, allocated = _buffer(out, m_star, energy)
+    # the step function sum is the number of subband edges at or below each energy
+    edges = np.sort(np.ravel(subband_energies))
+    np.copyto(out, np.searchsorted(edges, energy, side='right'))
+    np.multiply(out, np.divide(m_star, pi * (h_bar**2)), out=out)
 
-    return d_2d
+    return out[()] if allocated else out
 
-def density_of_states_one_d(m_star=0,energy=0,conduction_band_energy=0):
+def density_of_states_one_d(m_star=0,energy=0,conduction_band_energy=0,out=None):
     '''
     Function to find the 1D density of quantum states.
 
@@ -98,12 +157,21 @@ def density_of_states_one_d(m_star=0,energy=0,conduction_band_energy=0):
                             This is the potential energy for electrons, including
                             the electrostatic potential.
 
-    D_1d = 1/(pi*h_bar) * sqrt(m_star/2(energy-conduction_band_energy))
+    out: float array of the broadcast shape to write the result into
+
+    D_1d = 1/(pi*h_bar) * sqrt(m_star/2(energy-conduction_band_energy)),
+           0 at and below conduction_band_energy (the integrable singularity
+           at the edge is left out)
     '''
-    h_bar = value('reduced Planck constant in eV s')
-    d_1d = (1 / (pi * h_bar)) * sqrt(m_star / (2*(energy-conduction_band_energy)))
+    h_bar = HBAR
+    out, allocated = _buffer(out, m_star, energy, conduction_band_energy)
+    energy_sub = _excess_energy(energy, conduction_band_energy, out)
+    np.divide(1, energy_sub, out=out, where=energy_sub > 0)
+    np.multiply(out, np.divide(m_star, 2), out=out)
+    np.sqrt(out, out=out)
+    np.divide(out, pi * h_bar, out=out)
 
-    return d_1d
+    return out[()] if allocated else out
 
 def density_of_states_photon(omega=0,speed_of_light=0,refractive_index=1):
     '''
@@ -149,8 +217,8 @@ def equilibrium_energy_density(omega=0,speed_of_light=1,temp=1):
     exponential = 1/(exp(h_bar*omega/(k_b * temps)) - 1)
     u_w = ((h_bar * omega**3) / ((pi**2)*(speed_of_light**3))) * exponential
     '''
-    h_bar = value('reduced Planck constant in eV s')
-    kb_t = value('Boltzmann constant in eV/K') * temp
+    h_bar = HBAR
+    kb_t = BOLTZMANN * temp
 
     exponential = 1/(exp(h_bar*omega/kb_t) - 1)
     u_w = ((h_bar * omega**3) / ((pi**2)*(speed_of_light**3))) * exponential
@@ -170,8 +238,8 @@ def intensity_thermal_radiation(omega=0,speed_of_light=1,temp=1):
     exponential = 1/(exp(h_bar*omega/(k_b * temps)) - 1)
     I_w = ((h_bar * omega**3) / ((4*pi**3)*(speed_of_light**2))) * exponential
     '''
-    h_bar = value('reduced Planck constant in eV s')
-    kb_t = value('Boltzmann constant in eV/K') * temp
+    h_bar = HBAR
+    kb_t = BOLTZMANN * temp
 
     exponential = 1/(exp(h_bar*omega/(kb_t)) - 1)
     i_w = ((h_bar * omega**3) / ((4*(pi**3))*(speed_of_light**2))) * exponential
@@ -1,9 +1,35 @@
 '''
 This module contains the distribution functions
+
+The occupation functions are NumPy ufunc-style: every argument broadcasts (e.g. an
+energy column against a row of temperatures), out= takes a float buffer of the
+broadcast shape to fill in place, and they are evaluated through the logistic
+function and expm1 so that no argument overflows or warns.
 '''
 
+import numpy as np
 from numpy import exp,sqrt,pi
-from semicpy.constants.constants import value
+from semicpy.constants import codata
+
+BOLTZMANN = codata.BOLTZMANN_CONSTANT_IN_EV_PER_K
+HBAR = codata.REDUCED_PLANCK_CONSTANT_IN_EV_S
+
+def _buffer(out, *arrays):
+    '''
+    Float output buffer of the broadcast shape of arrays, and whether
+    it was allocated here (then 0-d results are returned as scalars)
+    '''
+    if out is not None:
+        return out, False
+    return np.empty(np.broadcast_shapes(*(np.shape(array) for array in arrays))), True
+
+def _logistic(x, allocated):
+    '''
+    1/(1+exp(-x)) in place of x
+    '''
+    import scipy.special
+    scipy.special.expit(x, out=x)
+    return x[()] if allocated else x
 
 
 def maxwell_boltzmann(velocity=0,m_star=0,temp=1):
@@ -24,12 +50,12 @@ def maxwell_boltzmann(velocity=0,m_star=0,temp=1):
     f_mb(v) = sqrt(m_star/(2pi*kb*T))*exp(-m_star*v^2/2kb*T)
     '''
 
-    kb_t = value('Boltzmann constant in eV/K') * temp
+    kb_t = BOLTZMANN * temp
     f_mb = sqrt(m_star / (2*pi*kb_t)) * exp(-m_star*(velocity**2) / (2*kb_t))
 
     return f_mb
 
-def fermi_dirac(energy=0,fermi_energy=0,temp=1):
+def fermi_dirac(energy=0,fermi_energy=0,temp=300,out=None):
     '''
     Function to find the average number of electrons in state f
     using the Fermi-Dirac distribution function.
@@ -40,16 +66,19 @@ def fermi_dirac(energy=0,fermi_energy=0,temp=1):
 
     temp: temperature in Kelvin
 
+    out: float array of the broadcast shape to write the result into
+
     k_b: Boltzmann's constant in eV/K
 
     f_df(E) = 1/(1+exp((E-fermi_energy)/k*temp))
     '''
-    kb_t = value('Boltzmann constant in eV/K') * temp
-    f_fd = 1/(1+exp((energy-fermi_energy)/(kb_t)))
+    out, allocated = _buffer(out, energy, fermi_energy, temp)
+    np.subtract(fermi_energy, energy, out=out)
+    np.divide(out, np.multiply(BOLTZMANN, temp), out=out)
 
-    return f_fd
+    return _logistic(out, allocated)
 
-def bose_einstein(omega=0, temp=1):
+def bose_einstein(omega=0, temp=300, out=None):
     '''
     Function to find the average number of bosons in state f
     using the Bose-Einstein Distribution function.
@@ -62,16 +91,29 @@ def bose_einstein(omega=0, temp=1):
 
     temp: Temperature in Kelvin
 
-    f_be(hbar*w) = 1/(exp((h_bar*omeg_a)/(k_b*temp)) - 1)
-    '''
-    kb_t = value('Boltzmann constant in eV/K') * temp
-    h_bar = value('Reduced Planck constant in eV s')
-
-    f_be = 1/(exp((h_bar*omega)/kb_t) - 1)
+    out: float array of the broadcast shape to write the result into
 
-    return f_be
+    f_be(hbar*w) = 1/(exp((h_bar*omeg_a)/(k_b*temp)) - 1)
 
-def donor_distribution(g_d=0,fermi_energy=0,donor_energy=0,temp=1):
+    evaluated as exp(-x)/(1-exp(-x)) with x = |h_bar*omega/(k_b*temp)|,
+    and as -1 - f_be(-h_bar*w) for negative omega. f_be(0) is inf.
+    '''
+    out, allocated = _buffer(out, omega, temp)
+    np.multiply(HBAR, omega, out=out)
+    np.divide(out, np.multiply(BOLTZMANN, temp), out=out)
+    negative = out < 0
+    np.abs(out, out=out)
+    np.negative(out, out=out)
+    denominator = np.expm1(out)
+    np.exp(out, out=out)
+    with np.errstate(divide='ignore'):
+        np.divide(out, denominator, out=out)
+    np.negative(out, out=out)
+    np.subtract(-1, out, out=out, where=negative)
+
+    return out[()] if allocated else out
+
+def donor_distribution(g_d=0,fermi_energy=0,donor_energy=0,temp=300,out=None):
     '''
     Function to find the distribution of donor states in a
     semiconductor
@@ -87,15 +129,21 @@ def donor_distribution(g_d=0,fermi_energy=0,donor_energy=0,temp=1):
 
     temp: Temperature in Kelvin
 
+    out: float array of the broadcast shape to write the result into
+
     f(D+) = 1/(1+g_d*exp((fermi_energy-donor_energy)/(k_b*temp)))
+          = 1/(1+exp((fermi_energy-donor_energy)/(k_b*temp) + ln(g_d)))
     '''
 
-    kb_t = value('Boltzmann constant in eV/K') * temp
-    f_D = 1 / (1 + g_d*exp((fermi_energy-donor_energy)/kb_t))
+    out, allocated = _buffer(out, g_d, fermi_energy, donor_energy, temp)
+    np.subtract(donor_energy, fermi_energy, out=out)
+    np.divide(out, np.multiply(BOLTZMANN, temp), out=out)
+    with np.errstate(divide='ignore'):
+        np.subtract(out, np.log(g_d), out=out)
 
-    return f_D
+    return _logistic(out, allocated)
 
-def acceptor_distribution(g_a=0,fermi_energy=0,acceptor_energy=0,temp=1):
+def acceptor_distribution(g_a=0,fermi_energy=0,acceptor_energy=0,temp=300,out=None):
     '''
     Function to find the distribution of acceptor states in a
     semiconductor
@@ -111,10 +159,16 @@ def acceptor_distribution(g_a=0,fermi_energy=0,acceptor_energy=0,temp=1):
 
     temp: Temperature in Kelvin
 
+    out: float array of the broadcast shape to write the result into
+
     f(A-) = 1/(1+g_a*exp((acceptor_energy-fermi_energy)/(k_b*temp)))
+          = 1/(1+exp((acceptor_energy-fermi_energy)/(k_b*temp) + ln(g_a)))
     '''
 
-    kb_t = value('Boltzmann constant in eV/K') * temp
-    f_A = 1 / (1 + g_a*exp((acceptor_energy-fermi_energy)/kb_t))
+    out, allocated = _buffer(out, g_a, fermi_energy, acceptor_energy, temp)
+    np.subtract(fermi_energy, acceptor_energy, out=out)
+    np.divide(out, np.multiply(BOLTZMANN, temp), out=out)
+    with np.errstate(divide='ignore'):
+        np.subtract(out, np.log(g_a), out=out)
 
-    return f_A
+    return _logistic(out, allocated)
@@ -0,0 +1,694 @@
+"""
+One-dimensional Poisson and drift-diffusion device simulator.
+
+Steady state on a non-uniform mesh x_0 < x_1 < ... < x_N-1 (cm):
+
+    d/dx (eps dpsi/dx) = -q (p - n + N_D - N_A)
+    dJ_n/dx = q R,    dJ_p/dx = -q R
+
+with Boltzmann statistics, Shockley-Read-Hall recombination R and
+Scharfetter-Gummel electron and hole fluxes between neighbouring nodes, integrated
+over the box (control volume) around each node. Internally potentials are scaled
+by kT/q, densities by the largest net doping and lengths by the device length.
+
+Two iterations are available:
+
+* Gummel: Poisson with frozen quasi-Fermi potentials, then the electron and the
+  hole continuity equations, each a tridiagonal linear solve, repeated until the
+  potential settles. Robust from poor starting points, slow at high injection.
+* Newton: the fully coupled 3N x 3N system with its analytic Jacobian assembled in
+  band storage (jacobian() returns it as a scipy.sparse matrix) and solved by
+  LAPACK's banded solver. By default a few Gummel iterations are run first to get
+  into Newton's convergence region.
+
+sweep() steps through a series of bias points by adaptive continuation and can
+reuse the solutions kept in a math.solvers.SolutionCache. solve() without an
+initial solution reaches its bias point the same way, from the equilibrium
+solution. A Newton step that is not finite is replaced by a Gummel step.
+
+Both ends of the device are ohmic contacts. An optional interior contact fixes
+the quasi-Fermi level of the majority carrier at one node, the usual ideal base
+contact of a 1-D BJT cross-section.
+
+Example
+-------
+>>> x = refined_mesh(2e-4, [1e-4], 2e-7, 5e-6)
+>>> device = DriftDiffusion1D(x, np.where(x < 1e-4, -1e17, 1e16), Si())
+>>> device.solve(0.6)["Terminal Current Density"]
+"""
+import numpy as np
+import numpy.typing as npt
+from semicpy.constants import codata
+from semicpy.materials.temperature import TemperatureModel
+from semicpy.math.solvers import NewtonResult, SolutionCache, continuation_sweep
+
+BOLTZMANN = codata.BOLTZMANN_CONSTANT_IN_EV_PER_K
+CHARGE = codata.ELEMENTARY_CHARGE
+EPSILON_NOUGHT = codata.VACUUM_ELECTRIC_PERMITTIVITY / 100 # F/cm
+
+# largest potential change per Newton/Gummel step, in kT/q
+_MAX_POTENTIAL_STEP = 20.0
+# half bandwidth of the Jacobian with (psi, n, p) interleaved per node
+_BANDWIDTH = 5
+
+def bernoulli(x: npt.ArrayLike)-> np.ndarray:
+    """Bernoulli function B(x) = x / (e^x - 1) of the Scharfetter-Gummel fluxes"""
+    x = np.asarray(x, dtype=float)
+    small = np.abs(x) < 1.0e-6
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        value = x / np.expm1(x)
+    return np.where(small, 1 - (x / 2), value)
+
+def bernoulli_derivative(x: npt.ArrayLike)-> np.ndarray:
+    """Derivative B'(x) = B(x) (1 - B(x)) / x - B(x) of the Bernoulli function"""
+    x = np.asarray(x, dtype=float)
+    small = np.abs(x) < 1.0e-3
+    b = bernoulli(x)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        value = ((b * (1 - b)) / x) - b
+    return np.where(small, -0.5 + (x / 6) - (x ** 3 / 180), value)
+
+def refined_mesh(length: float,
+                 refine_at: npt.ArrayLike=(),
+                 min_spacing: float=None,
+                 max_spacing: float=None,
+                 growth: float=1.2)-> np.ndarray:
+    """Non-uniform mesh on [0, length], fine around the given points (junctions,
+    contacts) and growing geometrically away from them
+
+    Parameters
+    ----------
+    length : float
+        device length, cm
+    refine_at : npt.ArrayLike, optional
+        positions to refine around, cm, by default () (only the two ends)
+    min_spacing : float, optional
+        spacing at the refinement points, cm, by default length / 1e4
+    max_spacing : float, optional
+        largest spacing, cm, by default length / 50
+    growth : float, optional
+        ratio of neighbouring spacings, by default 1.2
+
+    Returns
+    -------
+    np.ndarray
+        node positions, cm
+    """
+    min_spacing = length / 1e4 if min_spacing is None else min_spacing
+    max_spacing = length / 50 if max_spacing is None else max_spacing
+    # the spacing grows linearly with the distance from the nearest refinement point,
+    # so successive spacings form a geometric series
+    anchors = np.unique(np.concatenate([[0.0, length], np.asarray(refine_at, dtype=float)]))
+    nodes = [0.0]
+    while nodes[-1] < length:
+        distance = np.min(np.abs(anchors - nodes[-1]))
+        spacing = min(max_spacing, min_spacing + (distance * (growth - 1)))
+        ahead = anchors[anchors > nodes[-1]][0]
+        # no sliver interval in front of an anchor
+        nodes.append(ahead if ahead - nodes[-1] < 1.5 * spacing else nodes[-1] + spacing)
+    return np.array(nodes)
+
+class DriftDiffusion1D:
+    """Steady-state 1-D Poisson/drift-diffusion model of a device cross-section
+
+    Parameters
+    ----------
+    mesh : npt.ArrayLike
+        increasing node positions, cm
+    doping : npt.ArrayLike
+        net doping N_D - N_A at the nodes, cm^-3
+    material : Semiconductor, optional
+        material giving the permittivity, mobilities and n_i (from its
+        TemperatureModel where available), by default None
+    temp : float, optional
+        temperature, K, by default None (the material's abstemp, else 300)
+    mu_n : npt.ArrayLike, optional
+        electron mobility, cm^2/Vs, scalar or per mesh interval, by default the
+        material's
+    mu_p : npt.ArrayLike, optional
+        hole mobility, cm^2/Vs, scalar or per mesh interval, by default the material's
+    tau_n : npt.ArrayLike, optional
+        SRH electron lifetime, s, by default 1e-7
+    tau_p : npt.ArrayLike, optional
+        SRH hole lifetime, s, by default 1e-7
+    n_i : float, optional
+        intrinsic carrier concentration, cm^-3, by default the material's
+    permittivity : float, optional
+        relative permittivity, by default the material's
+    contact : tuple, optional
+        (position in cm, 'p' or 'n') of an interior contact to the holes or the
+        electrons, e.g. the base of an npn transistor, by default None
+
+    Raises
+    ------
+    ValueError
+        if the mesh is not increasing, the doping does not match it, or a
+        parameter is missing
+    """
+    def __init__(self,
+                 mesh: npt.ArrayLike,
+                 doping: npt.ArrayLike,
+                 material=None,
+                 temp: float=None,
+                 mu_n: npt.ArrayLike=None,
+                 mu_p: npt.ArrayLike=None,
+                 tau_n: npt.ArrayLike=1.0e-7,
+                 tau_p: npt.ArrayLike=1.0e-7,
+                 n_i: float=None,
+                 permittivity: float=None,
+                 contact: tuple=None)-> None:
+        x = np.asarray(mesh, dtype=float)
+        doping = np.broadcast_to(np.asarray(doping, dtype=float), x.shape)
+        if x.ndim != 1 or x.size < 3 or not np.all(np.diff(x) > 0):
+            raise ValueError("mesh must be an increasing 1-D array of at least 3 nodes!")
+        if material is None and None in (mu_n, mu_p, n_i, permittivity):
+            raise ValueError("Without a material, mu_n, mu_p, n_i and permittivity are needed!")
+        if temp is None:
+            temp = 300.0 if material is None else material.abstemp
+        if n_i is None:
+            has_model = isinstance(material, TemperatureModel) and material.effective_dos_300 is not None
+            n_i = material.intrinsic_carrier_concentration(temp) if has_model else material.intrinsicCarrierConcentration
+        if permittivity is None:
+            permittivity = material.dielectricConstant
+            if isinstance(permittivity, dict):
+                permittivity = next(iter(permittivity.values()))
+            elif isinstance(permittivity, (list, tuple)):
+                permittivity = permittivity[0]
+        mu_n = material.electronDriftMobility if mu_n is None else mu_n
+        mu_p = material.holeDriftMobility if mu_p is None else mu_p
+
+        self.mesh = x
+        self.doping = doping
+        self.temp = temp
+        self.thermal_voltage = BOLTZMANN * temp
+        self.n_i = float(n_i)
+        self.permittivity = float(permittivity)
+
+        # scales: potential kT/q, density C0, length L, diffusivity D0, time L^2/D0
+        vt = self.thermal_voltage
+        self._density = max(np.max(np.abs(doping)), self.n_i)
+        self._length = x[-1] - x[0]
+        d_n = np.broadcast_to(np.asarray(mu_n, dtype=float) * vt, (x.size - 1,))
+        d_p = np.broadcast_to(np.asarray(mu_p, dtype=float) * vt, (x.size - 1,))
+        self._diffusivity = max(np.max(d_n), np.max(d_p))
+        self._current = CHARGE * self._diffusivity * self._density / self._length # A/cm^2
+
+        self._h = np.diff(x) / self._length
+        self._w = np.zeros(x.size)
+        self._w[:-1] += self._h / 2
+        self._w[1:] += self._h / 2
+        self._d_n = d_n / self._diffusivity
+        self._d_p = d_p / self._diffusivity
+        time_scale = self._length ** 2 / self._diffusivity
+        self._tau_n = np.broadcast_to(np.asarray(tau_n, dtype=float) / time_scale, x.shape)
+        self._tau_p = np.broadcast_to(np.asarray(tau_p, dtype=float) / time_scale, x.shape)
+        self._lambda2 = (self.permittivity * EPSILON_NOUGHT * vt) / (CHARGE * self._density * self._length ** 2)
+        self._c = doping / self._density
+        self._ni = self.n_i / self._density
+
+        self._contact = None
+        if contact is not None:
+            position, carrier = contact
+            if carrier not in ('n', 'p'):
+                raise ValueError("The interior contact carrier must be 'n' or 'p'!")
+            node = int(np.argmin(np.abs(x - position)))
+            if node in (0, x.size - 1):
+                raise ValueError("The interior contact must not be at the device ends!")
+            self._contact = (node, carrier)
+
+        # equilibrium contact values, independent of the bias
+        self._psi_0 = np.arcsinh(self._c / (2 * self._ni))
+        self._nodes = np.arange(x.size)
+        self._pattern = None
+        self._equilibrium = None
+
+    # --- discretisation -----------------------------------------------------------
+
+    def _boundary(self, voltages):
+        """Dirichlet values (psi, n, p) at both ends and the interior contact potential"""
+        v_left, v_right, v_contact = (np.asarray(voltages, dtype=float) / self.thermal_voltage)
+        psi = self._psi_0[[0, -1]] + [v_left, v_right]
+        n = self._ni * np.exp(self._psi_0[[0, -1]])
+        p = self._ni * np.exp(-self._psi_0[[0, -1]])
+        return psi, n, p, v_contact
+
+    def _fluxes(self, psi, n, p):
+        """Scaled Scharfetter-Gummel electron and hole fluxes on the intervals"""
+        delta = np.diff(psi)
+        b_plus, b_minus = bernoulli(delta), bernoulli(-delta)
+        a_n, a_p = self._d_n / self._h, self._d_p / self._h
+        j_n = a_n * ((n[1:] * b_plus) - (n[:-1] * b_minus))
+        j_p = a_p * ((p[:-1] * b_plus) - (p[1:] * b_minus))
+        return j_n, j_p, delta, b_plus, b_minus
+
+    def _recombination(self, n, p):
+        """Scaled SRH rate and its derivatives with respect to n and p"""
+        ni = self._ni
+        denominator = (self._tau_p * (n + ni)) + (self._tau_n * (p + ni))
+        excess = (n * p) - (ni * ni)
+        rate = excess / denominator
+        return rate, ((p * denominator) - (excess * self._tau_p)) / denominator ** 2, \
+            ((n * denominator) - (excess * self._tau_n)) / denominator ** 2
+
+    def _poisson(self, psi, n, p):
+        """Scaled Poisson residual at the interior nodes"""
+        field = np.diff(psi) / self._h
+        return (self._lambda2 * np.diff(field)) + (self._w[1:-1] * (p - n + self._c)[1:-1])
+
+    def _residual(self, psi, n, p, voltages):
+        """Residuals of the coupled system, arranged as (3, N)"""
+        psi_b, n_b, p_b, v_contact = self._boundary(voltages)
+        j_n, j_p = self._fluxes(psi, n, p)[:2]
+        rate = self._recombination(n, p)[0]
+
+        f = np.zeros((3, psi.size))
+        f[0, 1:-1] = self._poisson(psi, n, p)
+        f[1, :-1] += j_n
+        f[1, 1:] -= j_n
+        f[1] -= self._w * rate
+        f[2, :-1] += j_p
+        f[2, 1:] -= j_p
+        f[2] += self._w * rate
+        f[0, [0, -1]] = psi[[0, -1]] - psi_b
+        f[1, [0, -1]] = n[[0, -1]] - n_b
+        f[2, [0, -1]] = p[[0, -1]] - p_b
+        if self._contact is not None:
+            node, carrier = self._contact
+            if carrier == 'p':
+                f[2, node] = p[node] - (self._ni * np.exp(v_contact - psi[node]))
+            else:
+                f[1, node] = n[node] - (self._ni * np.exp(psi[node] - v_contact))
+        return f
+
+    def _jacobian_blocks(self, psi, n, p, v_contact):
+        """Jacobian entries as (equation, row nodes, unknown, column nodes, values)
+        blocks, with the n and p columns scaled by n and p (unknowns dpsi, dn/n, dp/p).
+        Rows of the contact conditions come last, replacing the assembled rows."""
+        _, _, delta, b_plus, b_minus = self._fluxes(psi, n, p)
+        db_plus, db_minus = bernoulli_derivative(delta), bernoulli_derivative(-delta)
+        a_n, a_p = self._d_n / self._h, self._d_p / self._h
+        _, dr_dn, dr_dp = self._recombination(n, p)
+        nodes, inner = self._nodes, self._nodes[1:-1]
+        left, right = nodes[:-1], nodes[1:]
+        inv_h = self._lambda2 / self._h
+        w = self._w
+
+        # derivatives of each interval flux with respect to its four node unknowns
+        gn_psi = a_n * ((n[1:] * db_plus) + (n[:-1] * db_minus))
+        gp_psi = a_p * ((p[:-1] * db_plus) + (p[1:] * db_minus))
+        flux_n = [(0, left, -gn_psi), (0, right, gn_psi),
+                  (1, left, -a_n * b_minus * n[:-1]), (1, right, a_n * b_plus * n[1:])]
+        flux_p = [(0, left, -gp_psi), (0, right, gp_psi),
+                  (2, left, a_p * b_plus * p[:-1]), (2, right, -a_p * b_minus * p[1:])]
+
+        blocks = [(0, inner, 0, inner - 1, inv_h[:-1]),
+                  (0, inner, 0, inner, -(inv_h[:-1] + inv_h[1:])),
+                  (0, inner, 0, inner + 1, inv_h[1:]),
+                  (0, inner, 1, inner, -w[1:-1] * n[1:-1]),
+                  (0, inner, 2, inner, w[1:-1] * p[1:-1])]
+        # continuity: +flux of the interval right of a node, -flux of the one left of it
+        for equation, flux in ((1, flux_n), (2, flux_p)):
+            for unknown, col_nodes, value in flux:
+                blocks.append((equation, left, unknown, col_nodes, value))
+                blocks.append((equation, right, unknown, col_nodes, -value))
+        blocks += [(1, nodes, 1, nodes, -w * dr_dn * n),
+                   (1, nodes, 2, nodes, -w * dr_dp * p),
+                   (2, nodes, 1, nodes, w * dr_dn * n),
+                   (2, nodes, 2, nodes, w * dr_dp * p)]
+
+        ends = self._nodes[[0, -1]]
+        contacts = [(0, ends, 0, ends, np.ones(2)),
+                    (1, ends, 1, ends, n[[0, -1]]),
+                    (2, ends, 2, ends, p[[0, -1]])]
+        if self._contact is not None:
+            node, carrier = self._contact
+            at = self._nodes[[node]]
+            if carrier == 'p':
+                contacts += [(2, at, 2, at, p[[node]]),
+                             (2, at, 0, at, self._ni * np.exp(v_contact - psi[[node]]))]
+            else:
+                contacts += [(1, at, 1, at, n[[node]]),
+                             (1, at, 0, at, -self._ni * np.exp(psi[[node]] - v_contact))]
+        return blocks, contacts
+
+    def _jacobian_pattern(self, blocks, contacts):
+        """Positions of the Jacobian entries in LAPACK/scipy.sparse.dia band storage
+        and the mask of the assembled entries kept, built once per device"""
+        if self._pattern is None:
+            size = 3 * self.mesh.size
+            rows = np.concatenate([(3 * block[1]) + block[0] for block in blocks])
+            cols = np.concatenate([(3 * block[3]) + block[2] for block in blocks])
+            fixed_rows = np.concatenate([(3 * block[1]) + block[0] for block in contacts])
+            fixed_cols = np.concatenate([(3 * block[3]) + block[2] for block in contacts])
+            keep = ~np.isin(rows, fixed_rows)
+            rows = np.concatenate([rows[keep], fixed_rows])
+            cols = np.concatenate([cols[keep], fixed_cols])
+            self._pattern = (keep, rows, ((_BANDWIDTH + rows - cols) * size) + cols, rows == cols)
+        return self._pattern
+
+    def _system(self, psi, n, p, voltages):
+        """Row-equilibrated residual and banded Jacobian of the coupled system"""
+        v_contact = self._boundary(voltages)[3]
+        blocks, contacts = self._jacobian_blocks(psi, n, p, v_contact)
+        keep, rows, band_index, diagonal = self._jacobian_pattern(blocks, contacts)
+        values = np.concatenate([np.concatenate([block[4] for block in blocks])[keep]]
+                                + [block[4] for block in contacts])
+        # scale every row by its diagonal: the continuity rows of minority carriers are
+        # many orders of magnitude smaller than the others
+        size = 3 * psi.size
+        scale = 1 / np.abs(np.bincount(rows[diagonal], weights=values[diagonal], minlength=size))
+        band = np.bincount(band_index, weights=values * scale[rows],
+                           minlength=((2 * _BANDWIDTH) + 1) * size).reshape(-1, size)
+        residual = self._residual(psi, n, p, voltages).T.ravel() * scale
+        return residual, band
+
+    def jacobian(self,
+                 state: dict,
+                 v_left: float=0.0,
+                 v_right: float=0.0,
+                 v_contact: float=0.0):
+        """Row-equilibrated Jacobian of the coupled system at a solution
+
+        Parameters
+        ----------
+        state : dict
+            solution returned by solve
+        v_left, v_right, v_contact : float, optional
+            contact voltages, V, by default 0.0
+
+        Returns
+        -------
+        scipy.sparse.dia_matrix
+            3N x 3N banded Jacobian, unknowns (psi, n, p) interleaved per node, the n
+            and p columns scaled by the densities
+        """
+        import scipy.sparse
+        psi, n, p = self._scaled(state)
+        band = self._system(psi, n, p, (v_left, v_right, v_contact))[1]
+        offsets = np.arange(_BANDWIDTH, -_BANDWIDTH - 1, -1)
+        return scipy.sparse.dia_matrix((band, offsets), shape=(band.shape[1], band.shape[1]))
+
+    # --- iterations ---------------------------------------------------------------
+
+    def _update_densities(self, density, relative):
+        """density * (1 + r), taken as density * e^r for decreases so it stays positive"""
+        return np.where(relative >= 0, density * (1 + relative), np.maximum(density * np.exp(np.minimum(relative, 0.0)), 1.0e-300))
+
+    def _newton_step(self, psi, n, p, voltages):
+        import scipy.linalg
+        residual, band = self._system(psi, n, p, voltages)
+        step = -scipy.linalg.solve_banded((_BANDWIDTH, _BANDWIDTH), band, residual,
+                                          overwrite_ab=True, overwrite_b=True, check_finite=False)
+        step = step.reshape(-1, 3).T
+        size = np.max(np.abs(step))
+        # shorten the whole step if the potential would move too far
+        step *= min(1.0, _MAX_POTENTIAL_STEP / max(np.max(np.abs(step[0])), 1.0e-300))
+        psi = psi + step[0]
+        n = self._update_densities(n, step[1])
+        p = self._update_densities(p, step[2])
+        return psi, n, p, size
+
+    def _tridiagonal_solve(self, lower, diagonal, upper, rhs):
+        import scipy.linalg
+        bands = np.zeros((3, rhs.size))
+        bands[0, 1:] = upper
+        bands[1] = diagonal
+        bands[2, :-1] = lower
+        return scipy.linalg.solve_banded((1, 1), bands, rhs)
+
+    def _gummel_step(self, psi, n, p, voltages, poisson_iterations=20):
+        """One Gummel iteration, returns the new state and the largest potential change"""
+        psi_b, n_b, p_b, v_contact = self._boundary(voltages)
+        ni = self._ni
+        phi_n = psi - np.log(n / ni)
+        phi_p = psi + np.log(p / ni)
+        psi_old = psi
+
+        # nonlinear Poisson with frozen quasi-Fermi potentials
+        inv_h = self._lambda2 / self._h
+        for _ in range(poisson_iterations):
+            n = ni * np.exp(psi - phi_n)
+            p = ni * np.exp(phi_p - psi)
+            rhs = np.zeros(psi.size)
+            rhs[1:-1] = -self._poisson(psi, n, p)
+            rhs[[0, -1]] = psi_b - psi[[0, -1]]
+            diagonal = np.ones(psi.size)
+            diagonal[1:-1] = -(inv_h[:-1] + inv_h[1:]) - (self._w[1:-1] * (n + p)[1:-1])
+            lower = np.concatenate([inv_h[:-1], [0.0]])
+            upper = np.concatenate([[0.0], inv_h[1:]])
+            d_psi = np.clip(self._tridiagonal_solve(lower, diagonal, upper, rhs),
+                            -_MAX_POTENTIAL_STEP, _MAX_POTENTIAL_STEP)
+            psi = psi + d_psi
+            if np.max(np.abs(d_psi)) < 1.0e-10:
+                break
+        n = ni * np.exp(psi - phi_n)
+        p = ni * np.exp(phi_p - psi)
+
+        # continuity equations, linear in n (p) with the SRH denominator frozen
+        delta = np.diff(psi)
+        b_plus, b_minus = bernoulli(delta), bernoulli(-delta)
+        a_n, a_p = self._d_n / self._h, self._d_p / self._h
+        denominator = (self._tau_p * (n + ni)) + (self._tau_n * (p + ni))
+        w_d = self._w / denominator
+
+        diagonal = np.zeros(psi.size)
+        diagonal[:-1] -= a_n * b_minus
+        diagonal[1:] -= a_n * b_plus
+        diagonal -= w_d * p
+        lower, upper = a_n * b_minus, a_n * b_plus
+        rhs = -w_d * ni * ni
+        n = self._dirichlet_solve(lower, diagonal, upper, rhs, n_b, 'n', psi, v_contact)
+
+        diagonal = np.zeros(psi.size)
+        diagonal[:-1] += a_p * b_plus
+        diagonal[1:] += a_p * b_minus
+        diagonal += w_d * n
+        lower, upper = -a_p * b_plus, -a_p * b_minus
+        rhs = w_d * ni * ni
+        p = self._dirichlet_solve(lower, diagonal, upper, rhs, p_b, 'p', psi, v_contact)
+        return psi, n, p, np.max(np.abs(psi - psi_old))
+
+    def _dirichlet_solve(self, lower, diagonal, upper, rhs, boundary, carrier, psi, v_contact):
+        """Tridiagonal continuity solve with the contact rows replaced by Dirichlet rows;
+        lower[i] couples node i+1 to node i, upper[i] node i to node i+1"""
+        lower[-1], upper[0] = 0.0, 0.0
+        diagonal[[0, -1]] = 1.0
+        rhs[[0, -1]] = boundary
+        if self._contact is not None and self._contact[1] == carrier:
+            node = self._contact[0]
+            lower[node - 1], upper[node], diagonal[node] = 0.0, 0.0, 1.0
+            sign = -1 if carrier == 'p' else 1
+            rhs[node] = self._ni * np.exp(sign * (psi[node] - v_contact))
+        return np.maximum(self._tridiagonal_solve(lower, diagonal, upper, rhs), 1.0e-300)
+
+    # --- public interface ---------------------------------------------------------
+
+    def equilibrium(self)-> dict:
+        """Zero-bias solution, computed once"""
+        if self._equilibrium is None:
+            self._equilibrium = self.solve(0.0)
+        return self._equilibrium
+
+    def solve(self,
+              v_left: float=0.0,
+              v_right: float=0.0,
+              v_contact: float=0.0,
+              initial: dict=None,
+              method: str='newton',
+              gummel_iterations: int=3,
+              tol: float=1.0e-9,
+              max_iter: int=100)-> dict:
+        """Steady state at one bias point
+
+        Parameters
+        ----------
+        v_left : float, optional
+            voltage of the contact at x_0, V, by default 0.0
+        v_right : float, optional
+            voltage of the contact at x_N-1, V, by default 0.0
+        v_contact : float, optional
+            voltage of the interior contact, V, by default 0.0
+        initial : dict, optional
+            earlier solution (e.g. the previous bias step) to start from, by default
+            None: the contact voltages are ramped up from equilibrium() by adaptive
+            continuation (as in sweep())
+        method : str, optional
+            'newton' or 'gummel', by default 'newton'
+        gummel_iterations : int, optional
+            Gummel iterations run before Newton when starting from the local
+            charge-neutral potential (the equilibrium solution), by default 3
+        tol : float, optional
+            largest scaled update (potential in kT/q, relative density change) at
+            convergence, by default 1.0e-9
+        max_iter : int, optional
+            maximum number of iterations, by default 100
+
+        Returns
+        -------
+        dict
+            "Potential" (V), "Electron Density", "Hole Density" (cm^-3) at the nodes,
+            "Electron Current Density", "Hole Current Density", "Current Density"
+            (A/cm^2, positive along +x) on the intervals, "Terminal Current Density"
+            (A/cm^2 flowing into the device at the left, right and interior contacts),
+            "Converged" and "Iterations"
+
+        Raises
+        ------
+        ValueError
+            for an unknown method
+        """
+        if method not in ('newton', 'gummel'):
+            raise ValueError(f"method must be 'newton' or 'gummel', not '{method}'!")
+        voltages = (v_left, v_right, v_contact)
+        if initial is None and np.any(voltages):
+            result = self._continuation(np.array([voltages], dtype=float), None, None, method,
+                                        gummel_iterations, tol, max_iter)
+            return self._result(*self._unpack(result.x[0]), voltages, bool(result.converged[0]),
+                                int(result.iterations[0]))
+        state = None if initial is None else self._scaled(initial)
+        return self._result(*self._solve(voltages, state, method, gummel_iterations, tol, max_iter))
+
+    def _solve(self, voltages, state, method, gummel_iterations, tol, max_iter):
+        """Iterates from a scaled (psi, n, p) state, or the charge-neutral one if None"""
+        if state is None:
+            psi = self._psi_0.copy()
+            psi[0] += voltages[0] / self.thermal_voltage
+            psi[-1] += voltages[1] / self.thermal_voltage
+            n = self._ni * np.exp(self._psi_0)
+            p = self._ni * np.exp(-self._psi_0)
+            warmup = gummel_iterations
+        else:
+            psi, n, p = state
+            warmup = 0
+
+        iterations, converged = 0, False
+        with np.errstate(over='ignore', under='ignore', invalid='ignore', divide='ignore'):
+            if method == 'newton':
+                for _ in range(min(warmup, max_iter)):
+                    psi, n, p, change = self._gummel_step(psi, n, p, voltages)
+                    iterations += 1
+                    if change < tol:
+                        break
+            while iterations < max_iter and not converged:
+                step = None
+                if method == 'newton':
+                    step = self._newton_step(psi, n, p, voltages)
+                    # a Newton step that blew up is replaced by a Gummel step from the same state
+                    if not all(np.all(np.isfinite(value)) for value in step):
+                        step = None
+                if step is None:
+                    step = self._gummel_step(psi, n, p, voltages)
+                psi, n, p, change = step
+                iterations += 1
+                converged = bool(change < tol)
+                if not np.isfinite(change):
+                    break
+        return psi, n, p, voltages, converged, iterations
+
+    def sweep(self,
+              v_left: npt.ArrayLike=0.0,
+              v_right: npt.ArrayLike=0.0,
+              v_contact: npt.ArrayLike=0.0,
+              cache: SolutionCache=None,
+              max_step: float=None,
+              method: str='newton',
+              tol: float=1.0e-9,
+              max_iter: int=50)-> dict:
+        """Steady states along a bias sweep by adaptive continuation
+
+        The contact voltages are broadcast into a 1-D path of bias points, entered
+        from the equilibrium solution. Each point starts from the potential and the
+        logarithms of the densities extrapolated from the last two solutions. The
+        bias step is halved wherever the solver does not converge within max_iter.
+        Solutions are reused from the cache when the same device is swept again, or
+        when a refined sweep falls between earlier points.
+
+        Parameters
+        ----------
+        v_left : npt.ArrayLike, optional
+            voltages of the contact at x_0, V, by default 0.0
+        v_right : npt.ArrayLike, optional
+            voltages of the contact at x_N-1, V, by default 0.0
+        v_contact : npt.ArrayLike, optional
+            voltages of the interior contact, V, by default 0.0
+        cache : SolutionCache, optional
+            cache of converged states, by default None
+        max_step : float, optional
+            largest step of the contact voltages (Euclidean norm), V, by default None
+            (unlimited)
+        method : str, optional
+            'newton' or 'gummel', by default 'newton'
+        tol : float, optional
+            convergence tolerance as in solve(), by default 1.0e-9
+        max_iter : int, optional
+            iterations after which a step counts as failed and is halved,
+            by default 50
+
+        Returns
+        -------
+        dict
+            same keys as solve(), stacked along the sweep axis
+
+        Raises
+        ------
+        ValueError
+            for an unknown method
+        """
+        if method not in ('newton', 'gummel'):
+            raise ValueError(f"method must be 'newton' or 'gummel', not '{method}'!")
+        bias = np.stack(np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float))
+                                              for v in (v_left, v_right, v_contact))), axis=-1)
+        result = self._continuation(bias, cache, max_step, method, 3, tol, max_iter)
+        points = [self._result(*self._unpack(x), tuple(voltages), converged, iterations)
+                  for x, voltages, converged, iterations in zip(result.x, bias, result.converged, result.iterations)]
+        return {key : np.stack([point[key] for point in points]) for key in points[0]}
+
+    def _continuation(self, bias, cache, max_step, method, gummel_iterations, tol, max_iter)-> NewtonResult:
+        """continuation_sweep over (N, 3) contact voltages, starting from equilibrium"""
+        def solve(voltages, x0):
+            state = None if x0 is None else self._unpack(x0)
+            psi, n, p, _, converged, iterations = self._solve(tuple(voltages), state, method, gummel_iterations,
+                                                              tol, max_iter)
+            with np.errstate(all='ignore'):
+                residual = np.max(np.abs(self._residual(psi, n, p, tuple(voltages))))
+            return NewtonResult(x=self._pack(psi, n, p), residual=residual, converged=np.bool_(converged),
+                                iterations=np.int_(iterations))
+
+        x0 = self._pack(*self._scaled(self.equilibrium()))
+        return continuation_sweep(solve, bias, x0=x0, cache=cache, device=self, temperature=self.temp,
+                                  max_step=max_step)
+
+    def _pack(self, psi, n, p)-> np.ndarray:
+        """State vector (psi, ln n, ln p), in which extrapolated densities stay positive"""
+        with np.errstate(all='ignore'):
+            return np.concatenate([psi, np.log(n), np.log(p)])
+
+    def _unpack(self, x: np.ndarray)-> tuple:
+        size = self._psi_0.size
+        return x[:size], np.exp(x[size:2 * size]), np.exp(x[2 * size:])
+
+    def _scaled(self, state: dict)-> tuple:
+        return (state["Potential"] / self.thermal_voltage,
+                state["Electron Density"] / self._density,
+                state["Hole Density"] / self._density)
+
+    def _result(self, psi, n, p, voltages, converged, iterations)-> dict:
+        j_n, j_p = self._fluxes(psi, n, p)[:2]
+        rate = self._recombination(n, p)[0]
+        terminal = [j_n[0] + j_p[0], -(j_n[-1] + j_p[-1])]
+        if self._contact is not None:
+            node, carrier = self._contact
+            # carriers injected at the node leave through the neighbouring intervals
+            if carrier == 'p':
+                terminal.append(j_p[node] - j_p[node - 1] + (self._w[node] * rate[node]))
+            else:
+                terminal.append(j_n[node] - j_n[node - 1] - (self._w[node] * rate[node]))
+        return {"Potential" : psi * self.thermal_voltage,
+                "Electron Density" : n * self._density,
+                "Hole Density" : p * self._density,
+                "Electron Current Density" : j_n * self._current,
+                "Hole Current Density" : j_p * self._current,
+                "Current Density" : (j_n + j_p) * self._current,
+                "Terminal Current Density" : np.array(terminal) * self._current,
+                "Converged" : converged,
+                "Iterations" : iterations}
@@ -3,8 +3,11 @@ module docstring for carrier equilibrium density
 '''
 
 from numpy import exp,sqrt,pi
-from semicpy.constants.constants import value
-from semicpy.math.functions import fdint_approx
+from semicpy.constants import codata
+from semicpy.math.functions import fdint_approx, generalized_fermi_dirac_integral
+
+BOLTZMANN = codata.BOLTZMANN_CONSTANT_IN_EV_PER_K
+HBAR = codata.REDUCED_PLANCK_CONSTANT_IN_EV_S
 
 def find_n0(n_c=0,conduction_band_energy=0,fermi_energy=0,temp=0):
     '''
@@ -26,7 +29,7 @@ def find_n0(n_c=0,conduction_band_energy=0,fermi_energy=0,temp=0):
 
     n0 = n_c*exp(-(conduction_band_energy-fermi_energy)/(k_b*temp))
     '''
-    kb_t = value('Boltzmann constant in eV/K') * temp
+    kb_t = BOLTZMANN * temp
     n_0 = n_c*exp(-(conduction_band_energy-fermi_energy)/kb_t)
 
     return n_0
@@ -46,8 +49,8 @@ def find_nc(mass_c=0,temp=0):
 
     n_c = 2*[mass_c*k_b*temp/(2pi*hbar^2)]^(3/2)
     '''
-    kb_t = value('Boltzmann constant in eV/K') * temp
-    h_bar = value('reduced Planck constant in eV s')
+    kb_t = BOLTZMANN * temp
+    h_bar = HBAR
     n_c = 2*((mass_c*kb_t/(2*pi*(h_bar**2)))**(3/2))
 
     return n_c
@@ -70,7 +73,7 @@ def find_p0(n_v=0,valence_band_energy=0,fermi_energy=0,temp=0):
     p0 = n_v*exp(valence_band_energy-fermi_energy/k_b*temp)
     '''
 
-    kb_t = value('Boltzmann constant in eV/K') * temp
+    kb_t = BOLTZMANN * temp
     p_0 = n_v*exp((valence_band_energy-fermi_energy)/kb_t)
 
     return p_0
@@ -91,8 +94,8 @@ def find_nv(mass_v=0,temp=0):
     n_v = 2*[mass_v*k_b*temp/(2pi*hbar^2)]^(3/2)
     '''
 
-    kb_t = value('Boltzmann constant in eV/K') * temp
-    h_bar = value('reduced Planck constant in eV s')
+    kb_t = BOLTZMANN * temp
+    h_bar = HBAR
 
     n_v = 2*(mass_v*kb_t/(2*pi*(h_bar**2)))**(3/2)
 
@@ -129,7 +132,7 @@ def n0_from_ni(n_i=0,fermi_energy=0,in_fermi_level=0,temp=1):
 
     n0 = ni*exp((Ef-Efi)/kbT)
     '''
-    kb_t = value('Boltzmann constant in eV/K') * temp
+    kb_t = BOLTZMANN * temp
     exponential = exp((fermi_energy-in_fermi_level)/kb_t)
     n_0 = n_i*exponential
     
@@ -150,7 +153,7 @@ def p0_from_ni(n_i=0,fermi_energy=0,in_fermi_level=0,temp=1):
 
     p0 = ni*exp((Efi-Ef)/kbT)
     '''
-    kb_t = value('Boltzmann constant in eV/K') * temp
+    kb_t = BOLTZMANN * temp
     exponential = exp((in_fermi_level-fermi_energy)/kb_t)
     p_0 = n_i*exponential
 
@@ -183,3 +186,42 @@ def n0_approx(n_c=0,eta=0):
     n_0 = n_c*fdint_approx(eta)
 
     return n_0
+
+def n0_non_parabolic(n_c=0,eta=0,alpha=0,temp=300):
+    '''
+    Function to find the equilibrium electron density of a
+    non-parabolic (Kane) conduction band, E(1+alpha*E) = h_bar^2 k^2/2m,
+    as needed for narrow-gap materials such as InSb and HgCdTe.
+
+    n_c: The thermal effective density of states in the conduction band.
+
+    eta: (Ef - Ec)/kT, scalar or array (e.g. one value per mesh node)
+
+    alpha: non-parabolicity in 1/eV
+
+    temp: Temperature in Kelvin
+
+    n0 = n_c*F_1/2(eta, alpha*k_b*temp)
+    '''
+    n_0 = n_c*generalized_fermi_dirac_integral(0.5, eta, alpha*BOLTZMANN*temp)
+
+    return n_0
+
+def p0_non_parabolic(n_v=0,eta=0,alpha=0,temp=300):
+    '''
+    Function to find the equilibrium hole density of a
+    non-parabolic (Kane) valence band.
+
+    n_v: The thermal effective density of states in the valence band.
+
+    eta: (Ev - Ef)/kT, scalar or array
+
+    alpha: non-parabolicity in 1/eV
+
+    temp: Temperature in Kelvin
+
+    p0 = n_v*F_1/2(eta, alpha*k_b*temp)
+    '''
+    p_0 = n_v*generalized_fermi_dirac_integral(0.5, eta, alpha*BOLTZMANN*temp)
+
+    return p_0
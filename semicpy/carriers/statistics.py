@@ -0,0 +1,232 @@
+"""
+Carrier densities over whole band profiles.
+
+A CarrierStatistics object is bound to a material and a temperature, so kT and the
+effective densities of states are worked out once. It then maps arrays of band
+edges E_C(x), E_V(x) and Fermi (or quasi-Fermi) levels to n(x) and p(x) with
+Boltzmann, Blakemore or full Fermi-Dirac statistics
+
+    n = N_C F(eta_n),  eta_n = (E_Fn - E_C) / kT
+    p = N_V F(eta_p),  eta_p = (E_V - E_Fp) / kT
+
+with F(eta) = e^eta, 1 / (e^-eta + 0.27) or F_1/2(eta). Results (and optionally
+dn/dE_Fn, dp/dE_Fp for Newton solvers) are written into caller-supplied buffers,
+so a solver loop reuses the same memory on every iteration.
+
+Example
+-------
+>>> stats = CarrierStatistics(Si(), temp=300.0)
+>>> n, p = np.empty(mesh), np.empty(mesh)
+>>> for _ in range(iterations):
+...     stats.densities(e_c, e_v, e_f, out=(n, p))
+"""
+import numpy as np
+import numpy.typing as npt
+from semicpy.constants import codata
+from semicpy.math.functions import fermi_dirac_integral
+from semicpy.materials.temperature import TemperatureModel, effective_dos
+
+BOLTZMANN = codata.BOLTZMANN_CONSTANT_IN_EV_PER_K
+
+STATISTICS = ('boltzmann', 'blakemore', 'fermi-dirac')
+
+# Blakemore's approximation F_1/2(eta) ~ 1 / (e^-eta + 0.27)
+_BLAKEMORE = 0.27
+
+def _band_dos(material, temp: float, name: str, attribute: str):
+    if isinstance(material, TemperatureModel) and material.effective_dos_300 is not None:
+        return getattr(material, name)(temp)
+    return effective_dos(temp, getattr(material, attribute))
+
+class CarrierStatistics:
+    """Electron and hole densities of one material at one temperature
+
+    Parameters
+    ----------
+    material : Semiconductor, optional
+        material giving the effective densities of states (its cdos/vdos models,
+        or its 300 K values scaled as T^3/2), by default None
+    temp : float, optional
+        temperature, K, by default None (the material's abstemp, else 300)
+    n_c : npt.ArrayLike, optional
+        conduction band effective density of states, cm^-3, overrides the material
+    n_v : npt.ArrayLike, optional
+        valence band effective density of states, cm^-3, overrides the material
+    statistics : str, optional
+        'boltzmann', 'blakemore' or 'fermi-dirac', by default 'fermi-dirac'
+
+    Raises
+    ------
+    ValueError
+        for unknown statistics, or if neither a material nor n_c and n_v are given
+    """
+    def __init__(self,
+                 material=None,
+                 temp: float=None,
+                 n_c: npt.ArrayLike=None,
+                 n_v: npt.ArrayLike=None,
+                 statistics: str='fermi-dirac')-> None:
+        if statistics not in STATISTICS:
+            raise ValueError(f"statistics must be one of {STATISTICS}, not '{statistics}'!")
+        if material is None and (n_c is None or n_v is None):
+            raise ValueError("Either a material or both n_c and n_v are needed!")
+        if temp is None:
+            temp = 300.0 if material is None else material.abstemp
+        self.material = material
+        self.temp = temp
+        self.statistics = statistics
+        self.kb_t = BOLTZMANN * temp
+        self.n_c = _band_dos(material, temp, 'cdos', 'conductionDensityOfStates') if n_c is None else n_c
+        self.n_v = _band_dos(material, temp, 'vdos', 'valenceDensityOfStates') if n_v is None else n_v
+
+    def _buffer(self, out, *arrays):
+        if out is None:
+            return np.empty(np.broadcast(*arrays).shape)
+        return out
+
+    def _band_density(self,
+                      eta: np.ndarray,
+                      dos,
+                      slope: np.ndarray)-> np.ndarray:
+        """dos * F(eta) in place of eta, and d/deta of it into slope"""
+        if self.statistics == 'boltzmann':
+            np.exp(eta, out=eta)
+            eta *= dos
+            if slope is not None:
+                np.copyto(slope, eta)
+        elif self.statistics == 'blakemore':
+            np.negative(eta, out=eta)
+            np.exp(eta, out=eta)
+            eta += _BLAKEMORE
+            np.reciprocal(eta, out=eta)
+            if slope is not None:
+                # dF/deta = F (1 - 0.27 F)
+                np.multiply(eta, -_BLAKEMORE, out=slope)
+                slope += 1
+                slope *= eta
+                slope *= dos
+            eta *= dos
+        else:
+            # F_1/2 and F_-1/2 are evaluated straight into the buffers (with temporaries
+            # for the pieces of the piecewise evaluation only)
+            if slope is not None:
+                fermi_dirac_integral(-0.5, eta, out=slope)
+                slope *= dos
+            fermi_dirac_integral(0.5, eta, out=eta)
+            eta *= dos
+        return eta
+
+    def electron_density(self,
+                         conduction_band_energy: npt.ArrayLike,
+                         fermi_energy: npt.ArrayLike,
+                         out: np.ndarray=None,
+                         slope: np.ndarray=None)-> np.ndarray:
+        """Electron density n(x)
+
+        Parameters
+        ----------
+        conduction_band_energy : npt.ArrayLike
+            conduction band edge E_C(x), eV
+        fermi_energy : npt.ArrayLike
+            Fermi level or electron quasi-Fermi level E_Fn(x), eV
+        out : np.ndarray, optional
+            float buffer of the broadcast shape receiving n, cm^-3, by default None
+            (allocated)
+        slope : np.ndarray, optional
+            float buffer receiving dn/dE_Fn (= -dn/dE_C), cm^-3 eV^-1, by default
+            None (not computed)
+
+        Returns
+        -------
+        np.ndarray
+            n, cm^-3 (out if given)
+        """
+        out = self._buffer(out, conduction_band_energy, fermi_energy)
+        np.subtract(fermi_energy, conduction_band_energy, out=out)
+        out /= self.kb_t
+        self._band_density(out, self.n_c, slope)
+        if slope is not None:
+            slope /= self.kb_t
+        return out
+
+    def hole_density(self,
+                     valence_band_energy: npt.ArrayLike,
+                     fermi_energy: npt.ArrayLike,
+                     out: np.ndarray=None,
+                     slope: np.ndarray=None)-> np.ndarray:
+        """Hole density p(x)
+
+        Parameters
+        ----------
+        valence_band_energy : npt.ArrayLike
+            valence band edge E_V(x), eV
+        fermi_energy : npt.ArrayLike
+            Fermi level or hole quasi-Fermi level E_Fp(x), eV
+        out : np.ndarray, optional
+            float buffer of the broadcast shape receiving p, cm^-3, by default None
+            (allocated)
+        slope : np.ndarray, optional
+            float buffer receiving dp/dE_Fp (= -dp/dE_V, negative), cm^-3 eV^-1, by
+            default None (not computed)
+
+        Returns
+        -------
+        np.ndarray
+            p, cm^-3 (out if given)
+        """
+        out = self._buffer(out, valence_band_energy, fermi_energy)
+        np.subtract(valence_band_energy, fermi_energy, out=out)
+        out /= self.kb_t
+        self._band_density(out, self.n_v, slope)
+        if slope is not None:
+            slope /= -self.kb_t
+        return out
+
+    def densities(self,
+                  conduction_band_energy: npt.ArrayLike,
+                  valence_band_energy: npt.ArrayLike,
+                  fermi_energy: npt.ArrayLike=None,
+                  electron_fermi_energy: npt.ArrayLike=None,
+                  hole_fermi_energy: npt.ArrayLike=None,
+                  out: tuple=None)-> tuple:
+        """Electron and hole densities of a band profile
+
+        Parameters
+        ----------
+        conduction_band_energy : npt.ArrayLike
+            conduction band edge E_C(x), eV
+        valence_band_energy : npt.ArrayLike
+            valence band edge E_V(x), eV
+        fermi_energy : npt.ArrayLike, optional
+            equilibrium Fermi level, eV, used where a quasi-Fermi level is not given
+        electron_fermi_energy : npt.ArrayLike, optional
+            electron quasi-Fermi level E_Fn(x), eV, by default None
+        hole_fermi_energy : npt.ArrayLike, optional
+            hole quasi-Fermi level E_Fp(x), eV, by default None
+        out : tuple, optional
+            (n, p) buffers, by default None (allocated)
+
+        Returns
+        -------
+        tuple
+            (n, p), cm^-3
+
+        Raises
+        ------
+        ValueError
+            if a Fermi level is missing for one of the carriers
+        """
+        electron_fermi_energy = fermi_energy if electron_fermi_energy is None else electron_fermi_energy
+        hole_fermi_energy = fermi_energy if hole_fermi_energy is None else hole_fermi_energy
+        if electron_fermi_energy is None or hole_fermi_energy is None:
+            raise ValueError("Either fermi_energy or both quasi-Fermi levels are needed!")
+        n_out, p_out = (None, None) if out is None else out
+        return (self.electron_density(conduction_band_energy, electron_fermi_energy, out=n_out),
+                self.hole_density(valence_band_energy, hole_fermi_energy, out=p_out))
+
+    def intrinsic_level(self,
+                        conduction_band_energy: npt.ArrayLike,
+                        valence_band_energy: npt.ArrayLike)-> np.ndarray:
+        """Intrinsic Fermi level (E_C + E_V)/2 + (kT/2) ln(N_V/N_C) (nondegenerate), eV"""
+        return (((np.asarray(conduction_band_energy) + valence_band_energy) / 2)
+                + ((self.kb_t / 2) * np.log(self.n_v / self.n_c)))
@@ -1,7 +1,8 @@
 """
 CV Measurements
+
+pandas is imported inside the functions that read measurement files.
 """
-import pandas as pd
 
 
 '''
@@ -30,6 +31,7 @@ def corr_id(file=None,sheetname=None,i_d = None,i_g=None,i_sub=None):
         DESCRIPTION.
 
     """
+    import pandas as pd
     if(file.endswith('.csv')):
         data = pd.read_csv(file)
     elif(file.endswith(('.xls','.xlsx'))):
@@ -69,6 +71,7 @@ def norm_cgc(file=None,sheetname=None,cgc=None,c_min=None,area=None):
     None.
 
     """
+    import pandas as pd
     if(file.endswith('.csv')):
         data = pd.read_csv(file)
     elif(file.endswith(('.xls','.xlsx'))):
@@ -0,0 +1,751 @@
+"""
+2018 CODATA recommended values of the fundamental physical constants
+
+Generated from codata_2018.txt by generate_codata.py, do not edit by hand.
+Every constant is a plain module-level float in SI units (or the unit named by
+the quantity, e.g. BOLTZMANN_CONSTANT_IN_EV_PER_K). Units, uncertainties and the
+CODATA quantity names are looked up with unit(), uncertainty() and quantity_name();
+quantity() attaches the unit as a pint Quantity, importing pint only then.
+"""
+
+ALPHA_PARTICLE_ELECTRON_MASS_RATIO = 7294.29954142
+ALPHA_PARTICLE_MASS = 6.6446573357e-27
+ALPHA_PARTICLE_MASS_ENERGY_EQUIVALENT = 5.9719201914e-10
+ALPHA_PARTICLE_MASS_ENERGY_EQUIVALENT_IN_MEV = 3727.3794066
+ALPHA_PARTICLE_MASS_IN_U = 4.001506179127
+ALPHA_PARTICLE_MOLAR_MASS = 0.0040015061777
+ALPHA_PARTICLE_PROTON_MASS_RATIO = 3.97259969009
+ALPHA_PARTICLE_RELATIVE_ATOMIC_MASS = 4.001506179127
+ANGSTROM_STAR = 1.00001495e-10
+ATOMIC_MASS_CONSTANT = 1.6605390666e-27
+ATOMIC_MASS_CONSTANT_ENERGY_EQUIVALENT = 1.4924180856e-10
+ATOMIC_MASS_CONSTANT_ENERGY_EQUIVALENT_IN_MEV = 931.49410242
+ATOMIC_MASS_UNIT_ELECTRON_VOLT_RELATIONSHIP = 931494102.42
+ATOMIC_MASS_UNIT_HARTREE_RELATIONSHIP = 34231776.874
+ATOMIC_MASS_UNIT_HERTZ_RELATIONSHIP = 2.25234271871e+23
+ATOMIC_MASS_UNIT_INVERSE_METER_RELATIONSHIP = 751300661040000.0
+ATOMIC_MASS_UNIT_JOULE_RELATIONSHIP = 1.4924180856e-10
+ATOMIC_MASS_UNIT_KELVIN_RELATIONSHIP = 10809540191600.0
+ATOMIC_MASS_UNIT_KILOGRAM_RELATIONSHIP = 1.6605390666e-27
+ATOMIC_UNIT_OF_1ST_HYPERPOLARIZABILITY = 3.2063613061e-53
+ATOMIC_UNIT_OF_2ND_HYPERPOLARIZABILITY = 6.2353799905e-65
+ATOMIC_UNIT_OF_ACTION = 1.054571817e-34
+ATOMIC_UNIT_OF_CHARGE = 1.602176634e-19
+ATOMIC_UNIT_OF_CHARGE_DENSITY = 1081202384570.0
+ATOMIC_UNIT_OF_CURRENT = 0.00662361823751
+ATOMIC_UNIT_OF_ELECTRIC_DIPOLE_MOM = 8.4783536255e-30
+ATOMIC_UNIT_OF_ELECTRIC_FIELD = 514220674763.0
+ATOMIC_UNIT_OF_ELECTRIC_FIELD_GRADIENT = 9.7173624292e+21
+ATOMIC_UNIT_OF_ELECTRIC_POLARIZABILITY = 1.64877727436e-41
+ATOMIC_UNIT_OF_ELECTRIC_POTENTIAL = 27.211386245988
+ATOMIC_UNIT_OF_ELECTRIC_QUADRUPOLE_MOM = 4.4865515246e-40
+ATOMIC_UNIT_OF_ENERGY = 4.3597447222071e-18
+ATOMIC_UNIT_OF_FORCE = 8.2387234983e-08
+ATOMIC_UNIT_OF_LENGTH = 5.29177210903e-11
+ATOMIC_UNIT_OF_MAG_DIPOLE_MOM = 1.85480201566e-23
+ATOMIC_UNIT_OF_MAG_FLUX_DENSITY = 235051.756758
+ATOMIC_UNIT_OF_MAGNETIZABILITY = 7.8910366008e-29
+ATOMIC_UNIT_OF_MASS = 9.1093837015e-31
+ATOMIC_UNIT_OF_MOMENTUM = 1.9928519141e-24
+ATOMIC_UNIT_OF_PERMITTIVITY = 1.11265005545e-10
+ATOMIC_UNIT_OF_TIME = 2.4188843265857e-17
+ATOMIC_UNIT_OF_VELOCITY = 2187691.26364
+AVOGADRO_CONSTANT = 6.02214076e+23
+BOHR_MAGNETON = 9.2740100783e-24
+BOHR_MAGNETON_IN_EV_PER_T = 5.788381806e-05
+BOHR_MAGNETON_IN_HZ_PER_T = 13996244936.1
+BOHR_MAGNETON_IN_INVERSE_METER_PER_TESLA = 46.686447783
+BOHR_MAGNETON_IN_K_PER_T = 0.67171381563
+BOHR_RADIUS = 5.29177210903e-11
+BOLTZMANN_CONSTANT = 1.380649e-23
+BOLTZMANN_CONSTANT_IN_EV_PER_K = 8.617333262e-05
+BOLTZMANN_CONSTANT_IN_HZ_PER_K = 20836619120.0
+BOLTZMANN_CONSTANT_IN_INVERSE_METER_PER_KELVIN = 69.50348004
+CHARACTERISTIC_IMPEDANCE_OF_VACUUM = 376.730313668
+CLASSICAL_ELECTRON_RADIUS = 2.8179403262e-15
+COMPTON_WAVELENGTH = 2.42631023867e-12
+CONDUCTANCE_QUANTUM = 7.748091729e-05
+CONVENTIONAL_VALUE_OF_AMPERE_90 = 1.00000008887
+CONVENTIONAL_VALUE_OF_COULOMB_90 = 1.00000008887
+CONVENTIONAL_VALUE_OF_FARAD_90 = 0.9999999822
+CONVENTIONAL_VALUE_OF_HENRY_90 = 1.00000001779
+CONVENTIONAL_VALUE_OF_JOSEPHSON_CONSTANT = 483597900000000.0
+CONVENTIONAL_VALUE_OF_OHM_90 = 1.00000001779
+CONVENTIONAL_VALUE_OF_VOLT_90 = 1.00000010666
+CONVENTIONAL_VALUE_OF_VON_KLITZING_CONSTANT = 25812.807
+CONVENTIONAL_VALUE_OF_WATT_90 = 1.00000019553
+COPPER_X_UNIT = 1.00207697e-13
+DEUTERON_ELECTRON_MAG_MOM_RATIO = -0.0004664345551
+DEUTERON_ELECTRON_MASS_RATIO = 3670.48296788
+DEUTERON_G_FACTOR = 0.8574382338
+DEUTERON_MAG_MOM = 4.330735094e-27
+DEUTERON_MAG_MOM_TO_BOHR_MAGNETON_RATIO = 0.000466975457
+DEUTERON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO = 0.8574382338
+DEUTERON_MASS = 3.3435837724e-27
+DEUTERON_MASS_ENERGY_EQUIVALENT = 3.00506323102e-10
+DEUTERON_MASS_ENERGY_EQUIVALENT_IN_MEV = 1875.61294257
+DEUTERON_MASS_IN_U = 2.013553212745
+DEUTERON_MOLAR_MASS = 0.00201355321205
+DEUTERON_NEUTRON_MAG_MOM_RATIO = -0.44820653
+DEUTERON_PROTON_MAG_MOM_RATIO = 0.30701220939
+DEUTERON_PROTON_MASS_RATIO = 1.99900750139
+DEUTERON_RELATIVE_ATOMIC_MASS = 2.013553212745
+DEUTERON_RMS_CHARGE_RADIUS = 2.12799e-15
+ELECTRON_CHARGE_TO_MASS_QUOTIENT = -175882001076.0
+ELECTRON_DEUTERON_MAG_MOM_RATIO = -2143.9234915
+ELECTRON_DEUTERON_MASS_RATIO = 0.0002724437107462
+ELECTRON_G_FACTOR = -2.00231930436256
+ELECTRON_GYROMAG_RATIO = 176085963023.0
+ELECTRON_GYROMAG_RATIO_IN_MHZ_PER_T = 28024.9514242
+ELECTRON_HELION_MASS_RATIO = 0.0001819543074573
+ELECTRON_MAG_MOM = -9.2847647043e-24
+ELECTRON_MAG_MOM_ANOMALY = 0.00115965218128
+ELECTRON_MAG_MOM_TO_BOHR_MAGNETON_RATIO = -1.00115965218128
+ELECTRON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO = -1838.28197188
+ELECTRON_MASS = 9.1093837015e-31
+ELECTRON_MASS_ENERGY_EQUIVALENT = 8.1871057769e-14
+ELECTRON_MASS_ENERGY_EQUIVALENT_IN_MEV = 0.51099895
+ELECTRON_MASS_IN_U = 0.000548579909065
+ELECTRON_MOLAR_MASS = 5.4857990888e-07
+ELECTRON_MUON_MAG_MOM_RATIO = 206.7669883
+ELECTRON_MUON_MASS_RATIO = 0.00483633169
+ELECTRON_NEUTRON_MAG_MOM_RATIO = 960.9205
+ELECTRON_NEUTRON_MASS_RATIO = 0.00054386734424
+ELECTRON_PROTON_MAG_MOM_RATIO = -658.21068789
+ELECTRON_PROTON_MASS_RATIO = 0.000544617021487
+ELECTRON_RELATIVE_ATOMIC_MASS = 0.000548579909065
+ELECTRON_TAU_MASS_RATIO = 0.000287585
+ELECTRON_TO_ALPHA_PARTICLE_MASS_RATIO = 0.0001370933554787
+ELECTRON_TO_SHIELDED_HELION_MAG_MOM_RATIO = 864.058257
+ELECTRON_TO_SHIELDED_PROTON_MAG_MOM_RATIO = -658.2275971
+ELECTRON_TRITON_MASS_RATIO = 0.0001819200062251
+ELECTRON_VOLT = 1.602176634e-19
+ELECTRON_VOLT_ATOMIC_MASS_UNIT_RELATIONSHIP = 1.07354410233e-09
+ELECTRON_VOLT_HARTREE_RELATIONSHIP = 0.036749322175655
+ELECTRON_VOLT_HERTZ_RELATIONSHIP = 241798924200000.0
+ELECTRON_VOLT_INVERSE_METER_RELATIONSHIP = 806554.3937
+ELECTRON_VOLT_JOULE_RELATIONSHIP = 1.602176634e-19
+ELECTRON_VOLT_KELVIN_RELATIONSHIP = 11604.51812
+ELECTRON_VOLT_KILOGRAM_RELATIONSHIP = 1.782661921e-36
+ELEMENTARY_CHARGE = 1.602176634e-19
+ELEMENTARY_CHARGE_OVER_H_BAR = 1519267447000000.0
+FARADAY_CONSTANT = 96485.33212
+FERMI_COUPLING_CONSTANT = 1.1663787e-05
+FINE_STRUCTURE_CONSTANT = 0.0072973525693
+FIRST_RADIATION_CONSTANT = 3.741771852e-16
+FIRST_RADIATION_CONSTANT_FOR_SPECTRAL_RADIANCE = 1.191042972e-16
+HARTREE_ATOMIC_MASS_UNIT_RELATIONSHIP = 2.92126232205e-08
+HARTREE_ELECTRON_VOLT_RELATIONSHIP = 27.211386245988
+HARTREE_ENERGY = 4.3597447222071e-18
+HARTREE_ENERGY_IN_EV = 27.211386245988
+HARTREE_HERTZ_RELATIONSHIP = 6579683920502000.0
+HARTREE_INVERSE_METER_RELATIONSHIP = 21947463.13632
+HARTREE_JOULE_RELATIONSHIP = 4.3597447222071e-18
+HARTREE_KELVIN_RELATIONSHIP = 315775.02480407
+HARTREE_KILOGRAM_RELATIONSHIP = 4.8508702095432e-35
+HELION_ELECTRON_MASS_RATIO = 5495.88528007
+HELION_G_FACTOR = -4.255250615
+HELION_MAG_MOM = -1.074617532e-26
+HELION_MAG_MOM_TO_BOHR_MAGNETON_RATIO = -0.001158740958
+HELION_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO = -2.127625307
+HELION_MASS = 5.0064127796e-27
+HELION_MASS_ENERGY_EQUIVALENT = 4.4995394125e-10
+HELION_MASS_ENERGY_EQUIVALENT_IN_MEV = 2808.39160743
+HELION_MASS_IN_U = 3.014932247175
+HELION_MOLAR_MASS = 0.00301493224613
+HELION_PROTON_MASS_RATIO = 2.99315267167
+HELION_RELATIVE_ATOMIC_MASS = 3.014932247175
+HELION_SHIELDING_SHIFT = 5.996743e-05
+HERTZ_ATOMIC_MASS_UNIT_RELATIONSHIP = 4.4398216652e-24
+HERTZ_ELECTRON_VOLT_RELATIONSHIP = 4.135667696e-15
+HERTZ_HARTREE_RELATIONSHIP = 1.519829846057e-16
+HERTZ_INVERSE_METER_RELATIONSHIP = 3.335640951e-09
+HERTZ_JOULE_RELATIONSHIP = 6.62607015e-34
+HERTZ_KELVIN_RELATIONSHIP = 4.799243073e-11
+HERTZ_KILOGRAM_RELATIONSHIP = 7.372497323e-51
+HYPERFINE_TRANSITION_FREQUENCY_OF_CS_133 = 9192631770.0
+INVERSE_FINE_STRUCTURE_CONSTANT = 137.035999084
+INVERSE_METER_ATOMIC_MASS_UNIT_RELATIONSHIP = 1.3310250501e-15
+INVERSE_METER_ELECTRON_VOLT_RELATIONSHIP = 1.239841984e-06
+INVERSE_METER_HARTREE_RELATIONSHIP = 4.556335252912e-08
+INVERSE_METER_HERTZ_RELATIONSHIP = 299792458.0
+INVERSE_METER_JOULE_RELATIONSHIP = 1.986445857e-25
+INVERSE_METER_KELVIN_RELATIONSHIP = 0.01438776877
+INVERSE_METER_KILOGRAM_RELATIONSHIP = 2.210219094e-42
+INVERSE_OF_CONDUCTANCE_QUANTUM = 12906.40372
+JOSEPHSON_CONSTANT = 483597848400000.0
+JOULE_ATOMIC_MASS_UNIT_RELATIONSHIP = 6700535256.5
+JOULE_ELECTRON_VOLT_RELATIONSHIP = 6.241509074e+18
+JOULE_HARTREE_RELATIONSHIP = 2.2937122783963e+17
+JOULE_HERTZ_RELATIONSHIP = 1.509190179e+33
+JOULE_INVERSE_METER_RELATIONSHIP = 5.034116567e+24
+JOULE_KELVIN_RELATIONSHIP = 7.242970516e+22
+JOULE_KILOGRAM_RELATIONSHIP = 1.112650056e-17
+KELVIN_ATOMIC_MASS_UNIT_RELATIONSHIP = 9.2510873014e-14
+KELVIN_ELECTRON_VOLT_RELATIONSHIP = 8.617333262e-05
+KELVIN_HARTREE_RELATIONSHIP = 3.1668115634556e-06
+KELVIN_HERTZ_RELATIONSHIP = 20836619120.0
+KELVIN_INVERSE_METER_RELATIONSHIP = 69.50348004
+KELVIN_JOULE_RELATIONSHIP = 1.380649e-23
+KELVIN_KILOGRAM_RELATIONSHIP = 1.536179187e-40
+KILOGRAM_ATOMIC_MASS_UNIT_RELATIONSHIP = 6.0221407621e+26
+KILOGRAM_ELECTRON_VOLT_RELATIONSHIP = 5.609588603e+35
+KILOGRAM_HARTREE_RELATIONSHIP = 2.0614857887409e+34
+KILOGRAM_HERTZ_RELATIONSHIP = 1.356392489e+50
+KILOGRAM_INVERSE_METER_RELATIONSHIP = 4.524438335e+41
+KILOGRAM_JOULE_RELATIONSHIP = 8.987551787e+16
+KILOGRAM_KELVIN_RELATIONSHIP = 6.50965726e+39
+LATTICE_PARAMETER_OF_SILICON = 5.431020511e-10
+LATTICE_SPACING_OF_IDEAL_SI_220 = 1.920155716e-10
+LOSCHMIDT_CONSTANT_273_15_K_100_KPA = 2.651645804e+25
+LOSCHMIDT_CONSTANT_273_15_K_101_325_KPA = 2.686780111e+25
+LUMINOUS_EFFICACY = 683.0
+MAG_FLUX_QUANTUM = 2.067833848e-15
+MOLAR_GAS_CONSTANT = 8.314462618
+MOLAR_MASS_CONSTANT = 0.00099999999965
+MOLAR_MASS_OF_CARBON_12 = 0.0119999999958
+MOLAR_PLANCK_CONSTANT = 3.990312712e-10
+MOLAR_VOLUME_OF_IDEAL_GAS_273_15_K_100_KPA = 0.02271095464
+MOLAR_VOLUME_OF_IDEAL_GAS_273_15_K_101_325_KPA = 0.02241396954
+MOLAR_VOLUME_OF_SILICON = 1.205883199e-05
+MOLYBDENUM_X_UNIT = 1.00209952e-13
+MUON_COMPTON_WAVELENGTH = 1.17344411e-14
+MUON_ELECTRON_MASS_RATIO = 206.768283
+MUON_G_FACTOR = -2.0023318418
+MUON_MAG_MOM = -4.4904483e-26
+MUON_MAG_MOM_ANOMALY = 0.00116592089
+MUON_MAG_MOM_TO_BOHR_MAGNETON_RATIO = -0.00484197047
+MUON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO = -8.89059703
+MUON_MASS = 1.883531627e-28
+MUON_MASS_ENERGY_EQUIVALENT = 1.692833804e-11
+MUON_MASS_ENERGY_EQUIVALENT_IN_MEV = 105.6583755
+MUON_MASS_IN_U = 0.1134289259
+MUON_MOLAR_MASS = 0.0001134289259
+MUON_NEUTRON_MASS_RATIO = 0.112454517
+MUON_PROTON_MAG_MOM_RATIO = -3.183345142
+MUON_PROTON_MASS_RATIO = 0.1126095264
+MUON_TAU_MASS_RATIO = 0.0594635
+NATURAL_UNIT_OF_ACTION = 1.054571817e-34
+NATURAL_UNIT_OF_ACTION_IN_EV_S = 6.582119569e-16
+NATURAL_UNIT_OF_ENERGY = 8.1871057769e-14
+NATURAL_UNIT_OF_ENERGY_IN_MEV = 0.51099895
+NATURAL_UNIT_OF_LENGTH = 3.8615926796e-13
+NATURAL_UNIT_OF_MASS = 9.1093837015e-31
+NATURAL_UNIT_OF_MOMENTUM = 2.73092453075e-22
+NATURAL_UNIT_OF_MOMENTUM_IN_MEV_PER_C = 0.51099895
+NATURAL_UNIT_OF_TIME = 1.28808866819e-21
+NATURAL_UNIT_OF_VELOCITY = 299792458.0
+NEUTRON_COMPTON_WAVELENGTH = 1.31959090581e-15
+NEUTRON_ELECTRON_MAG_MOM_RATIO = 0.00104066882
+NEUTRON_ELECTRON_MASS_RATIO = 1838.68366173
+NEUTRON_G_FACTOR = -3.82608545
+NEUTRON_GYROMAG_RATIO = 183247171.0
+NEUTRON_GYROMAG_RATIO_IN_MHZ_PER_T = 29.1646931
+NEUTRON_MAG_MOM = -9.6623651e-27
+NEUTRON_MAG_MOM_TO_BOHR_MAGNETON_RATIO = -0.00104187563
+NEUTRON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO = -1.91304273
+NEUTRON_MASS = 1.67492749804e-27
+NEUTRON_MASS_ENERGY_EQUIVALENT = 1.50534976287e-10
+NEUTRON_MASS_ENERGY_EQUIVALENT_IN_MEV = 939.56542052
+NEUTRON_MASS_IN_U = 1.00866491595
+NEUTRON_MOLAR_MASS = 0.0010086649156
+NEUTRON_MUON_MASS_RATIO = 8.89248406
+NEUTRON_PROTON_MAG_MOM_RATIO = -0.68497934
+NEUTRON_PROTON_MASS_DIFFERENCE = 2.30557435e-30
+NEUTRON_PROTON_MASS_DIFFERENCE_ENERGY_EQUIVALENT = 2.07214689e-13
+NEUTRON_PROTON_MASS_DIFFERENCE_ENERGY_EQUIVALENT_IN_MEV = 1.29333236
+NEUTRON_PROTON_MASS_DIFFERENCE_IN_U = 0.00138844933
+NEUTRON_PROTON_MASS_RATIO = 1.00137841931
+NEUTRON_RELATIVE_ATOMIC_MASS = 1.00866491595
+NEUTRON_TAU_MASS_RATIO = 0.528779
+NEUTRON_TO_SHIELDED_PROTON_MAG_MOM_RATIO = -0.68499694
+NEWTONIAN_CONSTANT_OF_GRAVITATION = 6.6743e-11
+NEWTONIAN_CONSTANT_OF_GRAVITATION_OVER_H_BAR_C = 6.70883e-39
+NUCLEAR_MAGNETON = 5.0507837461e-27
+NUCLEAR_MAGNETON_IN_EV_PER_T = 3.15245125844e-08
+NUCLEAR_MAGNETON_IN_INVERSE_METER_PER_TESLA = 0.0254262341353
+NUCLEAR_MAGNETON_IN_K_PER_T = 0.00036582677756
+NUCLEAR_MAGNETON_IN_MHZ_PER_T = 7.6225932291
+PLANCK_CONSTANT = 6.62607015e-34
+PLANCK_CONSTANT_IN_EV_PER_HZ = 4.135667696e-15
+PLANCK_LENGTH = 1.616255e-35
+PLANCK_MASS = 2.176434e-08
+PLANCK_MASS_ENERGY_EQUIVALENT_IN_GEV = 1.22089e+19
+PLANCK_TEMPERATURE = 1.416784e+32
+PLANCK_TIME = 5.391247e-44
+PROTON_CHARGE_TO_MASS_QUOTIENT = 95788331.56
+PROTON_COMPTON_WAVELENGTH = 1.32140985539e-15
+PROTON_ELECTRON_MASS_RATIO = 1836.15267343
+PROTON_G_FACTOR = 5.5856946893
+PROTON_GYROMAG_RATIO = 267522187.44
+PROTON_GYROMAG_RATIO_IN_MHZ_PER_T = 42.577478518
+PROTON_MAG_MOM = 1.41060679736e-26
+PROTON_MAG_MOM_TO_BOHR_MAGNETON_RATIO = 0.0015210322023
+PROTON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO = 2.79284734463
+PROTON_MAG_SHIELDING_CORRECTION = 2.5689e-05
+PROTON_MASS = 1.67262192369e-27
+PROTON_MASS_ENERGY_EQUIVALENT = 1.50327761598e-10
+PROTON_MASS_ENERGY_EQUIVALENT_IN_MEV = 938.27208816
+PROTON_MASS_IN_U = 1.007276466621
+PROTON_MOLAR_MASS = 0.00100727646627
+PROTON_MUON_MASS_RATIO = 8.88024337
+PROTON_NEUTRON_MAG_MOM_RATIO = -1.45989805
+PROTON_NEUTRON_MASS_RATIO = 0.99862347812
+PROTON_RELATIVE_ATOMIC_MASS = 1.007276466621
+PROTON_RMS_CHARGE_RADIUS = 8.414e-16
+PROTON_TAU_MASS_RATIO = 0.528051
+QUANTUM_OF_CIRCULATION = 0.00036369475516
+QUANTUM_OF_CIRCULATION_TIMES_2 = 0.00072738951032
+REDUCED_COMPTON_WAVELENGTH = 3.8615926796e-13
+REDUCED_MUON_COMPTON_WAVELENGTH = 1.867594306e-15
+REDUCED_NEUTRON_COMPTON_WAVELENGTH = 2.1001941552e-16
+REDUCED_PLANCK_CONSTANT = 1.054571817e-34
+REDUCED_PLANCK_CONSTANT_IN_EV_S = 6.582119569e-16
+REDUCED_PLANCK_CONSTANT_TIMES_C_IN_MEV_FM = 197.3269804
+REDUCED_PROTON_COMPTON_WAVELENGTH = 2.10308910336e-16
+REDUCED_TAU_COMPTON_WAVELENGTH = 1.110538e-16
+RYDBERG_CONSTANT = 10973731.56816
+RYDBERG_CONSTANT_TIMES_C_IN_HZ = 3289841960250800.0
+RYDBERG_CONSTANT_TIMES_HC_IN_EV = 13.605693122994
+RYDBERG_CONSTANT_TIMES_HC_IN_J = 2.1798723611035e-18
+SACKUR_TETRODE_CONSTANT_1_K_100_KPA = -1.15170753706
+SACKUR_TETRODE_CONSTANT_1_K_101_325_KPA = -1.16487052358
+SECOND_RADIATION_CONSTANT = 0.01438776877
+SHIELDED_HELION_GYROMAG_RATIO = 203789456.9
+SHIELDED_HELION_GYROMAG_RATIO_IN_MHZ_PER_T = 32.43409942
+SHIELDED_HELION_MAG_MOM = -1.07455309e-26
+SHIELDED_HELION_MAG_MOM_TO_BOHR_MAGNETON_RATIO = -0.001158671471
+SHIELDED_HELION_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO = -2.127497719
+SHIELDED_HELION_TO_PROTON_MAG_MOM_RATIO = -0.7617665618
+SHIELDED_HELION_TO_SHIELDED_PROTON_MAG_MOM_RATIO = -0.7617861313
+SHIELDED_PROTON_GYROMAG_RATIO = 267515315.1
+SHIELDED_PROTON_GYROMAG_RATIO_IN_MHZ_PER_T = 42.57638474
+SHIELDED_PROTON_MAG_MOM = 1.41057056e-26
+SHIELDED_PROTON_MAG_MOM_TO_BOHR_MAGNETON_RATIO = 0.001520993128
+SHIELDED_PROTON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO = 2.792775599
+SHIELDING_DIFFERENCE_OF_D_AND_P_IN_HD = 2.02e-08
+SHIELDING_DIFFERENCE_OF_T_AND_P_IN_HT = 2.414e-08
+SPEED_OF_LIGHT_IN_VACUUM = 299792458.0
+STANDARD_ACCELERATION_OF_GRAVITY = 9.80665
+STANDARD_ATMOSPHERE = 101325.0
+STANDARD_STATE_PRESSURE = 100000.0
+STEFAN_BOLTZMANN_CONSTANT = 5.670374419e-08
+TAU_COMPTON_WAVELENGTH = 6.97771e-16
+TAU_ELECTRON_MASS_RATIO = 3477.23
+TAU_ENERGY_EQUIVALENT = 1776.86
+TAU_MASS = 3.16754e-27
+TAU_MASS_ENERGY_EQUIVALENT = 2.84684e-10
+TAU_MASS_IN_U = 1.90754
+TAU_MOLAR_MASS = 0.00190754
+TAU_MUON_MASS_RATIO = 16.817
+TAU_NEUTRON_MASS_RATIO = 1.89115
+TAU_PROTON_MASS_RATIO = 1.89376
+THOMSON_CROSS_SECTION = 6.6524587321e-29
+TRITON_ELECTRON_MASS_RATIO = 5496.92153573
+TRITON_G_FACTOR = 5.957924931
+TRITON_MAG_MOM = 1.5046095202e-26
+TRITON_MAG_MOM_TO_BOHR_MAGNETON_RATIO = 0.0016223936651
+TRITON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO = 2.9789624656
+TRITON_MASS = 5.0073567446e-27
+TRITON_MASS_ENERGY_EQUIVALENT = 4.500387806e-10
+TRITON_MASS_ENERGY_EQUIVALENT_IN_MEV = 2808.92113298
+TRITON_MASS_IN_U = 3.01550071621
+TRITON_MOLAR_MASS = 0.00301550071517
+TRITON_PROTON_MASS_RATIO = 2.99371703414
+TRITON_RELATIVE_ATOMIC_MASS = 3.01550071621
+TRITON_TO_PROTON_MAG_MOM_RATIO = 1.0666399191
+UNIFIED_ATOMIC_MASS_UNIT = 1.6605390666e-27
+VACUUM_ELECTRIC_PERMITTIVITY = 8.8541878128e-12
+VACUUM_MAG_PERMEABILITY = 1.25663706212e-06
+VON_KLITZING_CONSTANT = 25812.80745
+WEAK_MIXING_ANGLE = 0.2229
+WIEN_FREQUENCY_DISPLACEMENT_LAW_CONSTANT = 58789257570.0
+WIEN_WAVELENGTH_DISPLACEMENT_LAW_CONSTANT = 0.002897771955
+W_TO_Z_MASS_RATIO = 0.88153
+
+# name -> (CODATA quantity, standard uncertainty, unit)
+_METADATA = {
+    'ALPHA_PARTICLE_ELECTRON_MASS_RATIO' : ('alpha particle-electron mass ratio', 2.4e-07, ''),
+    'ALPHA_PARTICLE_MASS' : ('alpha particle mass', 2e-36, 'kg'),
+    'ALPHA_PARTICLE_MASS_ENERGY_EQUIVALENT' : ('alpha particle mass energy equivalent', 1.8e-19, 'J'),
+    'ALPHA_PARTICLE_MASS_ENERGY_EQUIVALENT_IN_MEV' : ('alpha particle mass energy equivalent in MeV', 1.1e-06, 'MeV'),
+    'ALPHA_PARTICLE_MASS_IN_U' : ('alpha particle mass in u', 6.3e-11, 'u'),
+    'ALPHA_PARTICLE_MOLAR_MASS' : ('alpha particle molar mass', 1.2e-12, 'kg * mol ** -1'),
+    'ALPHA_PARTICLE_PROTON_MASS_RATIO' : ('alpha particle-proton mass ratio', 2.2e-10, ''),
+    'ALPHA_PARTICLE_RELATIVE_ATOMIC_MASS' : ('alpha particle relative atomic mass', 6.3e-11, ''),
+    'ANGSTROM_STAR' : ('Angstrom star', 9e-17, 'm'),
+    'ATOMIC_MASS_CONSTANT' : ('atomic mass constant', 5e-37, 'kg'),
+    'ATOMIC_MASS_CONSTANT_ENERGY_EQUIVALENT' : ('atomic mass constant energy equivalent', 4.5e-20, 'J'),
+    'ATOMIC_MASS_CONSTANT_ENERGY_EQUIVALENT_IN_MEV' : ('atomic mass constant energy equivalent in MeV', 2.8e-07, 'MeV'),
+    'ATOMIC_MASS_UNIT_ELECTRON_VOLT_RELATIONSHIP' : ('atomic mass unit-electron volt relationship', 0.28, 'eV'),
+    'ATOMIC_MASS_UNIT_HARTREE_RELATIONSHIP' : ('atomic mass unit-hartree relationship', 0.01, 'E_h'),
+    'ATOMIC_MASS_UNIT_HERTZ_RELATIONSHIP' : ('atomic mass unit-hertz relationship', 68000000000000.0, 'Hz'),
+    'ATOMIC_MASS_UNIT_INVERSE_METER_RELATIONSHIP' : ('atomic mass unit-inverse meter relationship', 230000.0, 'm ** -1'),
+    'ATOMIC_MASS_UNIT_JOULE_RELATIONSHIP' : ('atomic mass unit-joule relationship', 4.5e-20, 'J'),
+    'ATOMIC_MASS_UNIT_KELVIN_RELATIONSHIP' : ('atomic mass unit-kelvin relationship', 3300.0, 'K'),
+    'ATOMIC_MASS_UNIT_KILOGRAM_RELATIONSHIP' : ('atomic mass unit-kilogram relationship', 5e-37, 'kg'),
+    'ATOMIC_UNIT_OF_1ST_HYPERPOLARIZABILITY' : ('atomic unit of 1st hyperpolarizability', 1.5e-62, 'C ** 3 * m ** 3 * J ** -2'),
+    'ATOMIC_UNIT_OF_2ND_HYPERPOLARIZABILITY' : ('atomic unit of 2nd hyperpolarizability', 3.8e-74, 'C ** 4 * m ** 4 * J ** -3'),
+    'ATOMIC_UNIT_OF_ACTION' : ('atomic unit of action', 0.0, 'J * s'),
+    'ATOMIC_UNIT_OF_CHARGE' : ('atomic unit of charge', 0.0, 'C'),
+    'ATOMIC_UNIT_OF_CHARGE_DENSITY' : ('atomic unit of charge density', 490.0, 'C * m ** -3'),
+    'ATOMIC_UNIT_OF_CURRENT' : ('atomic unit of current', 1.3e-14, 'A'),
+    'ATOMIC_UNIT_OF_ELECTRIC_DIPOLE_MOM' : ('atomic unit of electric dipole mom.', 1.3e-39, 'C * m'),
+    'ATOMIC_UNIT_OF_ELECTRIC_FIELD' : ('atomic unit of electric field', 78.0, 'V * m ** -1'),
+    'ATOMIC_UNIT_OF_ELECTRIC_FIELD_GRADIENT' : ('atomic unit of electric field gradient', 2900000000000.0, 'V * m ** -2'),
+    'ATOMIC_UNIT_OF_ELECTRIC_POLARIZABILITY' : ('atomic unit of electric polarizability', 5e-51, 'C ** 2 * m ** 2 * J ** -1'),
+    'ATOMIC_UNIT_OF_ELECTRIC_POTENTIAL' : ('atomic unit of electric potential', 5.3e-11, 'V'),
+    'ATOMIC_UNIT_OF_ELECTRIC_QUADRUPOLE_MOM' : ('atomic unit of electric quadrupole mom.', 1.4e-49, 'C * m ** 2'),
+    'ATOMIC_UNIT_OF_ENERGY' : ('atomic unit of energy', 8.5e-30, 'J'),
+    'ATOMIC_UNIT_OF_FORCE' : ('atomic unit of force', 1.2e-17, 'N'),
+    'ATOMIC_UNIT_OF_LENGTH' : ('atomic unit of length', 8e-21, 'm'),
+    'ATOMIC_UNIT_OF_MAG_DIPOLE_MOM' : ('atomic unit of mag. dipole mom.', 5.6e-33, 'J * T ** -1'),
+    'ATOMIC_UNIT_OF_MAG_FLUX_DENSITY' : ('atomic unit of mag. flux density', 7.1e-05, 'T'),
+    'ATOMIC_UNIT_OF_MAGNETIZABILITY' : ('atomic unit of magnetizability', 4.8e-38, 'J * T ** -2'),
+    'ATOMIC_UNIT_OF_MASS' : ('atomic unit of mass', 2.8e-40, 'kg'),
+    'ATOMIC_UNIT_OF_MOMENTUM' : ('atomic unit of momentum', 3e-34, 'kg * m * s ** -1'),
+    'ATOMIC_UNIT_OF_PERMITTIVITY' : ('atomic unit of permittivity', 1.7e-20, 'F * m ** -1'),
+    'ATOMIC_UNIT_OF_TIME' : ('atomic unit of time', 4.7e-29, 's'),
+    'ATOMIC_UNIT_OF_VELOCITY' : ('atomic unit of velocity', 0.00033, 'm * s ** -1'),
+    'AVOGADRO_CONSTANT' : ('Avogadro constant', 0.0, 'mol ** -1'),
+    'BOHR_MAGNETON' : ('Bohr magneton', 2.8e-33, 'J * T ** -1'),
+    'BOHR_MAGNETON_IN_EV_PER_T' : ('Bohr magneton in eV/T', 1.7e-14, 'eV * T ** -1'),
+    'BOHR_MAGNETON_IN_HZ_PER_T' : ('Bohr magneton in Hz/T', 4.2, 'Hz * T ** -1'),
+    'BOHR_MAGNETON_IN_INVERSE_METER_PER_TESLA' : ('Bohr magneton in inverse meter per tesla', 1.4e-08, 'm ** -1 * T ** -1'),
+    'BOHR_MAGNETON_IN_K_PER_T' : ('Bohr magneton in K/T', 2e-10, 'K * T ** -1'),
+    'BOHR_RADIUS' : ('Bohr radius', 8e-21, 'm'),
+    'BOLTZMANN_CONSTANT' : ('Boltzmann constant', 0.0, 'J * K ** -1'),
+    'BOLTZMANN_CONSTANT_IN_EV_PER_K' : ('Boltzmann constant in eV/K', 0.0, 'eV * K ** -1'),
+    'BOLTZMANN_CONSTANT_IN_HZ_PER_K' : ('Boltzmann constant in Hz/K', 0.0, 'Hz * K ** -1'),
+    'BOLTZMANN_CONSTANT_IN_INVERSE_METER_PER_KELVIN' : ('Boltzmann constant in inverse meter per kelvin', 0.0, 'm ** -1 * K ** -1'),
+    'CHARACTERISTIC_IMPEDANCE_OF_VACUUM' : ('characteristic impedance of vacuum', 5.7e-08, 'ohm'),
+    'CLASSICAL_ELECTRON_RADIUS' : ('classical electron radius', 1.3e-24, 'm'),
+    'COMPTON_WAVELENGTH' : ('Compton wavelength', 7.3e-22, 'm'),
+    'CONDUCTANCE_QUANTUM' : ('conductance quantum', 0.0, 'S'),
+    'CONVENTIONAL_VALUE_OF_AMPERE_90' : ('conventional value of ampere-90', 0.0, 'A'),
+    'CONVENTIONAL_VALUE_OF_COULOMB_90' : ('conventional value of coulomb-90', 0.0, 'C'),
+    'CONVENTIONAL_VALUE_OF_FARAD_90' : ('conventional value of farad-90', 0.0, 'F'),
+    'CONVENTIONAL_VALUE_OF_HENRY_90' : ('conventional value of henry-90', 0.0, 'H'),
+    'CONVENTIONAL_VALUE_OF_JOSEPHSON_CONSTANT' : ('conventional value of Josephson constant', 0.0, 'Hz * V ** -1'),
+    'CONVENTIONAL_VALUE_OF_OHM_90' : ('conventional value of ohm-90', 0.0, 'ohm'),
+    'CONVENTIONAL_VALUE_OF_VOLT_90' : ('conventional value of volt-90', 0.0, 'V'),
+    'CONVENTIONAL_VALUE_OF_VON_KLITZING_CONSTANT' : ('conventional value of von Klitzing constant', 0.0, 'ohm'),
+    'CONVENTIONAL_VALUE_OF_WATT_90' : ('conventional value of watt-90', 0.0, 'W'),
+    'COPPER_X_UNIT' : ('Copper x unit', 2.8e-20, 'm'),
+    'DEUTERON_ELECTRON_MAG_MOM_RATIO' : ('deuteron-electron mag. mom. ratio', 1.2e-12, ''),
+    'DEUTERON_ELECTRON_MASS_RATIO' : ('deuteron-electron mass ratio', 1.3e-07, ''),
+    'DEUTERON_G_FACTOR' : ('deuteron g factor', 2.2e-09, ''),
+    'DEUTERON_MAG_MOM' : ('deuteron mag. mom.', 1.1e-35, 'J * T ** -1'),
+    'DEUTERON_MAG_MOM_TO_BOHR_MAGNETON_RATIO' : ('deuteron mag. mom. to Bohr magneton ratio', 1.2e-12, ''),
+    'DEUTERON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO' : ('deuteron mag. mom. to nuclear magneton ratio', 2.2e-09, ''),
+    'DEUTERON_MASS' : ('deuteron mass', 1e-36, 'kg'),
+    'DEUTERON_MASS_ENERGY_EQUIVALENT' : ('deuteron mass energy equivalent', 9.1e-20, 'J'),
+    'DEUTERON_MASS_ENERGY_EQUIVALENT_IN_MEV' : ('deuteron mass energy equivalent in MeV', 5.7e-07, 'MeV'),
+    'DEUTERON_MASS_IN_U' : ('deuteron mass in u', 4e-11, 'u'),
+    'DEUTERON_MOLAR_MASS' : ('deuteron molar mass', 6.1e-13, 'kg * mol ** -1'),
+    'DEUTERON_NEUTRON_MAG_MOM_RATIO' : ('deuteron-neutron mag. mom. ratio', 1.1e-07, ''),
+    'DEUTERON_PROTON_MAG_MOM_RATIO' : ('deuteron-proton mag. mom. ratio', 7.9e-10, ''),
+    'DEUTERON_PROTON_MASS_RATIO' : ('deuteron-proton mass ratio', 1.1e-10, ''),
+    'DEUTERON_RELATIVE_ATOMIC_MASS' : ('deuteron relative atomic mass', 4e-11, ''),
+    'DEUTERON_RMS_CHARGE_RADIUS' : ('deuteron rms charge radius', 7.4e-19, 'm'),
+    'ELECTRON_CHARGE_TO_MASS_QUOTIENT' : ('electron charge to mass quotient', 53.0, 'C * kg ** -1'),
+    'ELECTRON_DEUTERON_MAG_MOM_RATIO' : ('electron-deuteron mag. mom. ratio', 5.6e-06, ''),
+    'ELECTRON_DEUTERON_MASS_RATIO' : ('electron-deuteron mass ratio', 9.6e-15, ''),
+    'ELECTRON_G_FACTOR' : ('electron g factor', 3.5e-13, ''),
+    'ELECTRON_GYROMAG_RATIO' : ('electron gyromag. ratio', 53.0, 's ** -1 * T ** -1'),
+    'ELECTRON_GYROMAG_RATIO_IN_MHZ_PER_T' : ('electron gyromag. ratio in MHz/T', 8.5e-06, 'MHz * T ** -1'),
+    'ELECTRON_HELION_MASS_RATIO' : ('electron-helion mass ratio', 7.9e-15, ''),
+    'ELECTRON_MAG_MOM' : ('electron mag. mom.', 2.8e-33, 'J * T ** -1'),
+    'ELECTRON_MAG_MOM_ANOMALY' : ('electron mag. mom. anomaly', 1.8e-13, ''),
+    'ELECTRON_MAG_MOM_TO_BOHR_MAGNETON_RATIO' : ('electron mag. mom. to Bohr magneton ratio', 1.8e-13, ''),
+    'ELECTRON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO' : ('electron mag. mom. to nuclear magneton ratio', 1.1e-07, ''),
+    'ELECTRON_MASS' : ('electron mass', 2.8e-40, 'kg'),
+    'ELECTRON_MASS_ENERGY_EQUIVALENT' : ('electron mass energy equivalent', 2.5e-23, 'J'),
+    'ELECTRON_MASS_ENERGY_EQUIVALENT_IN_MEV' : ('electron mass energy equivalent in MeV', 1.5e-10, 'MeV'),
+    'ELECTRON_MASS_IN_U' : ('electron mass in u', 1.6e-14, 'u'),
+    'ELECTRON_MOLAR_MASS' : ('electron molar mass', 1.7e-16, 'kg * mol ** -1'),
+    'ELECTRON_MUON_MAG_MOM_RATIO' : ('electron-muon mag. mom. ratio', 4.6e-06, ''),
+    'ELECTRON_MUON_MASS_RATIO' : ('electron-muon mass ratio', 1.1e-10, ''),
+    'ELECTRON_NEUTRON_MAG_MOM_RATIO' : ('electron-neutron mag. mom. ratio', 0.00023, ''),
+    'ELECTRON_NEUTRON_MASS_RATIO' : ('electron-neutron mass ratio', 2.6e-13, ''),
+    'ELECTRON_PROTON_MAG_MOM_RATIO' : ('electron-proton mag. mom. ratio', 2e-07, ''),
+    'ELECTRON_PROTON_MASS_RATIO' : ('electron-proton mass ratio', 3.3e-14, ''),
+    'ELECTRON_RELATIVE_ATOMIC_MASS' : ('electron relative atomic mass', 1.6e-14, ''),
+    'ELECTRON_TAU_MASS_RATIO' : ('electron-tau mass ratio', 1.9e-08, ''),
+    'ELECTRON_TO_ALPHA_PARTICLE_MASS_RATIO' : ('electron to alpha particle mass ratio', 4.5e-15, ''),
+    'ELECTRON_TO_SHIELDED_HELION_MAG_MOM_RATIO' : ('electron to shielded helion mag. mom. ratio', 1e-05, ''),
+    'ELECTRON_TO_SHIELDED_PROTON_MAG_MOM_RATIO' : ('electron to shielded proton mag. mom. ratio', 7.2e-06, ''),
+    'ELECTRON_TRITON_MASS_RATIO' : ('electron-triton mass ratio', 9e-15, ''),
+    'ELECTRON_VOLT' : ('electron volt', 0.0, 'J'),
+    'ELECTRON_VOLT_ATOMIC_MASS_UNIT_RELATIONSHIP' : ('electron volt-atomic mass unit relationship', 3.2e-19, 'u'),
+    'ELECTRON_VOLT_HARTREE_RELATIONSHIP' : ('electron volt-hartree relationship', 7.1e-14, 'E_h'),
+    'ELECTRON_VOLT_HERTZ_RELATIONSHIP' : ('electron volt-hertz relationship', 0.0, 'Hz'),
+    'ELECTRON_VOLT_INVERSE_METER_RELATIONSHIP' : ('electron volt-inverse meter relationship', 0.0, 'm ** -1'),
+    'ELECTRON_VOLT_JOULE_RELATIONSHIP' : ('electron volt-joule relationship', 0.0, 'J'),
+    'ELECTRON_VOLT_KELVIN_RELATIONSHIP' : ('electron volt-kelvin relationship', 0.0, 'K'),
+    'ELECTRON_VOLT_KILOGRAM_RELATIONSHIP' : ('electron volt-kilogram relationship', 0.0, 'kg'),
+    'ELEMENTARY_CHARGE' : ('elementary charge', 0.0, 'C'),
+    'ELEMENTARY_CHARGE_OVER_H_BAR' : ('elementary charge over h-bar', 0.0, 'A * J ** -1'),
+    'FARADAY_CONSTANT' : ('Faraday constant', 0.0, 'C * mol ** -1'),
+    'FERMI_COUPLING_CONSTANT' : ('Fermi coupling constant', 6e-12, 'GeV ** -2'),
+    'FINE_STRUCTURE_CONSTANT' : ('fine-structure constant', 1.1e-12, ''),
+    'FIRST_RADIATION_CONSTANT' : ('first radiation constant', 0.0, 'W * m ** 2'),
+    'FIRST_RADIATION_CONSTANT_FOR_SPECTRAL_RADIANCE' : ('first radiation constant for spectral radiance', 0.0, 'W * m ** 2 * sr ** -1'),
+    'HARTREE_ATOMIC_MASS_UNIT_RELATIONSHIP' : ('hartree-atomic mass unit relationship', 8.8e-18, 'u'),
+    'HARTREE_ELECTRON_VOLT_RELATIONSHIP' : ('hartree-electron volt relationship', 5.3e-11, 'eV'),
+    'HARTREE_ENERGY' : ('Hartree energy', 8.5e-30, 'J'),
+    'HARTREE_ENERGY_IN_EV' : ('Hartree energy in eV', 5.3e-11, 'eV'),
+    'HARTREE_HERTZ_RELATIONSHIP' : ('hartree-hertz relationship', 13000.0, 'Hz'),
+    'HARTREE_INVERSE_METER_RELATIONSHIP' : ('hartree-inverse meter relationship', 4.3e-05, 'm ** -1'),
+    'HARTREE_JOULE_RELATIONSHIP' : ('hartree-joule relationship', 8.5e-30, 'J'),
+    'HARTREE_KELVIN_RELATIONSHIP' : ('hartree-kelvin relationship', 6.1e-07, 'K'),
+    'HARTREE_KILOGRAM_RELATIONSHIP' : ('hartree-kilogram relationship', 9.4e-47, 'kg'),
+    'HELION_ELECTRON_MASS_RATIO' : ('helion-electron mass ratio', 2.4e-07, ''),
+    'HELION_G_FACTOR' : ('helion g factor', 5e-08, ''),
+    'HELION_MAG_MOM' : ('helion mag. mom.', 1.3e-34, 'J * T ** -1'),
+    'HELION_MAG_MOM_TO_BOHR_MAGNETON_RATIO' : ('helion mag. mom. to Bohr magneton ratio', 1.4e-11, ''),
+    'HELION_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO' : ('helion mag. mom. to nuclear magneton ratio', 2.5e-08, ''),
+    'HELION_MASS' : ('helion mass', 1.5e-36, 'kg'),
+    'HELION_MASS_ENERGY_EQUIVALENT' : ('helion mass energy equivalent', 1.4e-19, 'J'),
+    'HELION_MASS_ENERGY_EQUIVALENT_IN_MEV' : ('helion mass energy equivalent in MeV', 8.5e-07, 'MeV'),
+    'HELION_MASS_IN_U' : ('helion mass in u', 9.7e-11, 'u'),
+    'HELION_MOLAR_MASS' : ('helion molar mass', 9.1e-13, 'kg * mol ** -1'),
+    'HELION_PROTON_MASS_RATIO' : ('helion-proton mass ratio', 1.3e-10, ''),
+    'HELION_RELATIVE_ATOMIC_MASS' : ('helion relative atomic mass', 9.7e-11, ''),
+    'HELION_SHIELDING_SHIFT' : ('helion shielding shift', 1e-10, ''),
+    'HERTZ_ATOMIC_MASS_UNIT_RELATIONSHIP' : ('hertz-atomic mass unit relationship', 1.3e-33, 'u'),
+    'HERTZ_ELECTRON_VOLT_RELATIONSHIP' : ('hertz-electron volt relationship', 0.0, 'eV'),
+    'HERTZ_HARTREE_RELATIONSHIP' : ('hertz-hartree relationship', 2.9e-28, 'E_h'),
+    'HERTZ_INVERSE_METER_RELATIONSHIP' : ('hertz-inverse meter relationship', 0.0, 'm ** -1'),
+    'HERTZ_JOULE_RELATIONSHIP' : ('hertz-joule relationship', 0.0, 'J'),
+    'HERTZ_KELVIN_RELATIONSHIP' : ('hertz-kelvin relationship', 0.0, 'K'),
+    'HERTZ_KILOGRAM_RELATIONSHIP' : ('hertz-kilogram relationship', 0.0, 'kg'),
+    'HYPERFINE_TRANSITION_FREQUENCY_OF_CS_133' : ('hyperfine transition frequency of Cs-133', 0.0, 'Hz'),
+    'INVERSE_FINE_STRUCTURE_CONSTANT' : ('inverse fine-structure constant', 2.1e-08, ''),
+    'INVERSE_METER_ATOMIC_MASS_UNIT_RELATIONSHIP' : ('inverse meter-atomic mass unit relationship', 4e-25, 'u'),
+    'INVERSE_METER_ELECTRON_VOLT_RELATIONSHIP' : ('inverse meter-electron volt relationship', 0.0, 'eV'),
+    'INVERSE_METER_HARTREE_RELATIONSHIP' : ('inverse meter-hartree relationship', 8.8e-20, 'E_h'),
+    'INVERSE_METER_HERTZ_RELATIONSHIP' : ('inverse meter-hertz relationship', 0.0, 'Hz'),
+    'INVERSE_METER_JOULE_RELATIONSHIP' : ('inverse meter-joule relationship', 0.0, 'J'),
+    'INVERSE_METER_KELVIN_RELATIONSHIP' : ('inverse meter-kelvin relationship', 0.0, 'K'),
+    'INVERSE_METER_KILOGRAM_RELATIONSHIP' : ('inverse meter-kilogram relationship', 0.0, 'kg'),
+    'INVERSE_OF_CONDUCTANCE_QUANTUM' : ('inverse of conductance quantum', 0.0, 'ohm'),
+    'JOSEPHSON_CONSTANT' : ('Josephson constant', 0.0, 'Hz * V ** -1'),
+    'JOULE_ATOMIC_MASS_UNIT_RELATIONSHIP' : ('joule-atomic mass unit relationship', 2.0, 'u'),
+    'JOULE_ELECTRON_VOLT_RELATIONSHIP' : ('joule-electron volt relationship', 0.0, 'eV'),
+    'JOULE_HARTREE_RELATIONSHIP' : ('joule-hartree relationship', 450000.0, 'E_h'),
+    'JOULE_HERTZ_RELATIONSHIP' : ('joule-hertz relationship', 0.0, 'Hz'),
+    'JOULE_INVERSE_METER_RELATIONSHIP' : ('joule-inverse meter relationship', 0.0, 'm ** -1'),
+    'JOULE_KELVIN_RELATIONSHIP' : ('joule-kelvin relationship', 0.0, 'K'),
+    'JOULE_KILOGRAM_RELATIONSHIP' : ('joule-kilogram relationship', 0.0, 'kg'),
+    'KELVIN_ATOMIC_MASS_UNIT_RELATIONSHIP' : ('kelvin-atomic mass unit relationship', 2.8e-23, 'u'),
+    'KELVIN_ELECTRON_VOLT_RELATIONSHIP' : ('kelvin-electron volt relationship', 0.0, 'eV'),
+    'KELVIN_HARTREE_RELATIONSHIP' : ('kelvin-hartree relationship', 6.1e-18, 'E_h'),
+    'KELVIN_HERTZ_RELATIONSHIP' : ('kelvin-hertz relationship', 0.0, 'Hz'),
+    'KELVIN_INVERSE_METER_RELATIONSHIP' : ('kelvin-inverse meter relationship', 0.0, 'm ** -1'),
+    'KELVIN_JOULE_RELATIONSHIP' : ('kelvin-joule relationship', 0.0, 'J'),
+    'KELVIN_KILOGRAM_RELATIONSHIP' : ('kelvin-kilogram relationship', 0.0, 'kg'),
+    'KILOGRAM_ATOMIC_MASS_UNIT_RELATIONSHIP' : ('kilogram-atomic mass unit relationship', 1.8e+17, 'u'),
+    'KILOGRAM_ELECTRON_VOLT_RELATIONSHIP' : ('kilogram-electron volt relationship', 0.0, 'eV'),
+    'KILOGRAM_HARTREE_RELATIONSHIP' : ('kilogram-hartree relationship', 4e+22, 'E_h'),
+    'KILOGRAM_HERTZ_RELATIONSHIP' : ('kilogram-hertz relationship', 0.0, 'Hz'),
+    'KILOGRAM_INVERSE_METER_RELATIONSHIP' : ('kilogram-inverse meter relationship', 0.0, 'm ** -1'),
+    'KILOGRAM_JOULE_RELATIONSHIP' : ('kilogram-joule relationship', 0.0, 'J'),
+    'KILOGRAM_KELVIN_RELATIONSHIP' : ('kilogram-kelvin relationship', 0.0, 'K'),
+    'LATTICE_PARAMETER_OF_SILICON' : ('lattice parameter of silicon', 8.9e-18, 'm'),
+    'LATTICE_SPACING_OF_IDEAL_SI_220' : ('lattice spacing of ideal Si (220)', 3.2e-18, 'm'),
+    'LOSCHMIDT_CONSTANT_273_15_K_100_KPA' : ('Loschmidt constant (273.15 K, 100 kPa)', 0.0, 'm ** -3'),
+    'LOSCHMIDT_CONSTANT_273_15_K_101_325_KPA' : ('Loschmidt constant (273.15 K, 101.325 kPa)', 0.0, 'm ** -3'),
+    'LUMINOUS_EFFICACY' : ('luminous efficacy', 0.0, 'lm * W ** -1'),
+    'MAG_FLUX_QUANTUM' : ('mag. flux quantum', 0.0, 'Wb'),
+    'MOLAR_GAS_CONSTANT' : ('molar gas constant', 0.0, 'J * mol ** -1 * K ** -1'),
+    'MOLAR_MASS_CONSTANT' : ('molar mass constant', 3e-13, 'kg * mol ** -1'),
+    'MOLAR_MASS_OF_CARBON_12' : ('molar mass of carbon-12', 3.6e-12, 'kg * mol ** -1'),
+    'MOLAR_PLANCK_CONSTANT' : ('molar Planck constant', 0.0, 'J * Hz ** -1 * mol ** -1'),
+    'MOLAR_VOLUME_OF_IDEAL_GAS_273_15_K_100_KPA' : ('molar volume of ideal gas (273.15 K, 100 kPa)', 0.0, 'm ** 3 * mol ** -1'),
+    'MOLAR_VOLUME_OF_IDEAL_GAS_273_15_K_101_325_KPA' : ('molar volume of ideal gas (273.15 K, 101.325 kPa)', 0.0, 'm ** 3 * mol ** -1'),
+    'MOLAR_VOLUME_OF_SILICON' : ('molar volume of silicon', 6e-13, 'm ** 3 * mol ** -1'),
+    'MOLYBDENUM_X_UNIT' : ('Molybdenum x unit', 5.3e-20, 'm'),
+    'MUON_COMPTON_WAVELENGTH' : ('muon Compton wavelength', 2.6e-22, 'm'),
+    'MUON_ELECTRON_MASS_RATIO' : ('muon-electron mass ratio', 4.6e-06, ''),
+    'MUON_G_FACTOR' : ('muon g factor', 1.3e-09, ''),
+    'MUON_MAG_MOM' : ('muon mag. mom.', 1e-33, 'J * T ** -1'),
+    'MUON_MAG_MOM_ANOMALY' : ('muon mag. mom. anomaly', 6.3e-10, ''),
+    'MUON_MAG_MOM_TO_BOHR_MAGNETON_RATIO' : ('muon mag. mom. to Bohr magneton ratio', 1.1e-10, ''),
+    'MUON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO' : ('muon mag. mom. to nuclear magneton ratio', 2e-07, ''),
+    'MUON_MASS' : ('muon mass', 4.2e-36, 'kg'),
+    'MUON_MASS_ENERGY_EQUIVALENT' : ('muon mass energy equivalent', 3.8e-19, 'J'),
+    'MUON_MASS_ENERGY_EQUIVALENT_IN_MEV' : ('muon mass energy equivalent in MeV', 2.3e-06, 'MeV'),
+    'MUON_MASS_IN_U' : ('muon mass in u', 2.5e-09, 'u'),
+    'MUON_MOLAR_MASS' : ('muon molar mass', 2.5e-12, 'kg * mol ** -1'),
+    'MUON_NEUTRON_MASS_RATIO' : ('muon-neutron mass ratio', 2.5e-09, ''),
+    'MUON_PROTON_MAG_MOM_RATIO' : ('muon-proton mag. mom. ratio', 7.1e-08, ''),
+    'MUON_PROTON_MASS_RATIO' : ('muon-proton mass ratio', 2.5e-09, ''),
+    'MUON_TAU_MASS_RATIO' : ('muon-tau mass ratio', 4e-06, ''),
+    'NATURAL_UNIT_OF_ACTION' : ('natural unit of action', 0.0, 'J * s'),
+    'NATURAL_UNIT_OF_ACTION_IN_EV_S' : ('natural unit of action in eV s', 0.0, 'eV * s'),
+    'NATURAL_UNIT_OF_ENERGY' : ('natural unit of energy', 2.5e-23, 'J'),
+    'NATURAL_UNIT_OF_ENERGY_IN_MEV' : ('natural unit of energy in MeV', 1.5e-10, 'MeV'),
+    'NATURAL_UNIT_OF_LENGTH' : ('natural unit of length', 1.2e-22, 'm'),
+    'NATURAL_UNIT_OF_MASS' : ('natural unit of mass', 2.8e-40, 'kg'),
+    'NATURAL_UNIT_OF_MOMENTUM' : ('natural unit of momentum', 8.2e-32, 'kg * m * s ** -1'),
+    'NATURAL_UNIT_OF_MOMENTUM_IN_MEV_PER_C' : ('natural unit of momentum in MeV/c', 1.5e-10, 'MeV/c'),
+    'NATURAL_UNIT_OF_TIME' : ('natural unit of time', 3.9e-31, 's'),
+    'NATURAL_UNIT_OF_VELOCITY' : ('natural unit of velocity', 0.0, 'm * s ** -1'),
+    'NEUTRON_COMPTON_WAVELENGTH' : ('neutron Compton wavelength', 7.5e-25, 'm'),
+    'NEUTRON_ELECTRON_MAG_MOM_RATIO' : ('neutron-electron mag. mom. ratio', 2.5e-10, ''),
+    'NEUTRON_ELECTRON_MASS_RATIO' : ('neutron-electron mass ratio', 8.9e-07, ''),
+    'NEUTRON_G_FACTOR' : ('neutron g factor', 9e-07, ''),
+    'NEUTRON_GYROMAG_RATIO' : ('neutron gyromag. ratio', 43.0, 's ** -1 * T ** -1'),
+    'NEUTRON_GYROMAG_RATIO_IN_MHZ_PER_T' : ('neutron gyromag. ratio in MHz/T', 6.9e-06, 'MHz * T ** -1'),
+    'NEUTRON_MAG_MOM' : ('neutron mag. mom.', 2.3e-33, 'J * T ** -1'),
+    'NEUTRON_MAG_MOM_TO_BOHR_MAGNETON_RATIO' : ('neutron mag. mom. to Bohr magneton ratio', 2.5e-10, ''),
+    'NEUTRON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO' : ('neutron mag. mom. to nuclear magneton ratio', 4.5e-07, ''),
+    'NEUTRON_MASS' : ('neutron mass', 9.5e-37, 'kg'),
+    'NEUTRON_MASS_ENERGY_EQUIVALENT' : ('neutron mass energy equivalent', 8.6e-20, 'J'),
+    'NEUTRON_MASS_ENERGY_EQUIVALENT_IN_MEV' : ('neutron mass energy equivalent in MeV', 5.4e-07, 'MeV'),
+    'NEUTRON_MASS_IN_U' : ('neutron mass in u', 4.9e-10, 'u'),
+    'NEUTRON_MOLAR_MASS' : ('neutron molar mass', 5.7e-13, 'kg * mol ** -1'),
+    'NEUTRON_MUON_MASS_RATIO' : ('neutron-muon mass ratio', 2e-07, ''),
+    'NEUTRON_PROTON_MAG_MOM_RATIO' : ('neutron-proton mag. mom. ratio', 1.6e-07, ''),
+    'NEUTRON_PROTON_MASS_DIFFERENCE' : ('neutron-proton mass difference', 8.2e-37, 'kg'),
+    'NEUTRON_PROTON_MASS_DIFFERENCE_ENERGY_EQUIVALENT' : ('neutron-proton mass difference energy equivalent', 7.4e-20, 'J'),
+    'NEUTRON_PROTON_MASS_DIFFERENCE_ENERGY_EQUIVALENT_IN_MEV' : ('neutron-proton mass difference energy equivalent in MeV', 4.6e-07, 'MeV'),
+    'NEUTRON_PROTON_MASS_DIFFERENCE_IN_U' : ('neutron-proton mass difference in u', 4.9e-10, 'u'),
+    'NEUTRON_PROTON_MASS_RATIO' : ('neutron-proton mass ratio', 4.9e-10, ''),
+    'NEUTRON_RELATIVE_ATOMIC_MASS' : ('neutron relative atomic mass', 4.9e-10, ''),
+    'NEUTRON_TAU_MASS_RATIO' : ('neutron-tau mass ratio', 3.6e-05, ''),
+    'NEUTRON_TO_SHIELDED_PROTON_MAG_MOM_RATIO' : ('neutron to shielded proton mag. mom. ratio', 1.6e-07, ''),
+    'NEWTONIAN_CONSTANT_OF_GRAVITATION' : ('Newtonian constant of gravitation', 1.5e-15, 'm ** 3 * kg ** -1 * s ** -2'),
+    'NEWTONIAN_CONSTANT_OF_GRAVITATION_OVER_H_BAR_C' : ('Newtonian constant of gravitation over h-bar c', 1.5e-43, '(GeV/c ** 2) ** -2'),
+    'NUCLEAR_MAGNETON' : ('nuclear magneton', 1.5e-36, 'J * T ** -1'),
+    'NUCLEAR_MAGNETON_IN_EV_PER_T' : ('nuclear magneton in eV/T', 9.6e-18, 'eV * T ** -1'),
+    'NUCLEAR_MAGNETON_IN_INVERSE_METER_PER_TESLA' : ('nuclear magneton in inverse meter per tesla', 7.8e-12, 'm ** -1 * T ** -1'),
+    'NUCLEAR_MAGNETON_IN_K_PER_T' : ('nuclear magneton in K/T', 1.1e-13, 'K * T ** -1'),
+    'NUCLEAR_MAGNETON_IN_MHZ_PER_T' : ('nuclear magneton in MHz/T', 2.3e-09, 'MHz * T ** -1'),
+    'PLANCK_CONSTANT' : ('Planck constant', 0.0, 'J * Hz ** -1'),
+    'PLANCK_CONSTANT_IN_EV_PER_HZ' : ('Planck constant in eV/Hz', 0.0, 'eV * Hz ** -1'),
+    'PLANCK_LENGTH' : ('Planck length', 1.8e-40, 'm'),
+    'PLANCK_MASS' : ('Planck mass', 2.4e-13, 'kg'),
+    'PLANCK_MASS_ENERGY_EQUIVALENT_IN_GEV' : ('Planck mass energy equivalent in GeV', 140000000000000.0, 'GeV'),
+    'PLANCK_TEMPERATURE' : ('Planck temperature', 1.6e+27, 'K'),
+    'PLANCK_TIME' : ('Planck time', 6e-49, 's'),
+    'PROTON_CHARGE_TO_MASS_QUOTIENT' : ('proton charge to mass quotient', 0.029, 'C * kg ** -1'),
+    'PROTON_COMPTON_WAVELENGTH' : ('proton Compton wavelength', 4e-25, 'm'),
+    'PROTON_ELECTRON_MASS_RATIO' : ('proton-electron mass ratio', 1.1e-07, ''),
+    'PROTON_G_FACTOR' : ('proton g factor', 1.6e-09, ''),
+    'PROTON_GYROMAG_RATIO' : ('proton gyromag. ratio', 0.11, 's ** -1 * T ** -1'),
+    'PROTON_GYROMAG_RATIO_IN_MHZ_PER_T' : ('proton gyromag. ratio in MHz/T', 1.8e-08, 'MHz * T ** -1'),
+    'PROTON_MAG_MOM' : ('proton mag. mom.', 6e-36, 'J * T ** -1'),
+    'PROTON_MAG_MOM_TO_BOHR_MAGNETON_RATIO' : ('proton mag. mom. to Bohr magneton ratio', 4.6e-13, ''),
+    'PROTON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO' : ('proton mag. mom. to nuclear magneton ratio', 8.2e-10, ''),
+    'PROTON_MAG_SHIELDING_CORRECTION' : ('proton mag. shielding correction', 1.1e-08, ''),
+    'PROTON_MASS' : ('proton mass', 5.1e-37, 'kg'),
+    'PROTON_MASS_ENERGY_EQUIVALENT' : ('proton mass energy equivalent', 4.6e-20, 'J'),
+    'PROTON_MASS_ENERGY_EQUIVALENT_IN_MEV' : ('proton mass energy equivalent in MeV', 2.9e-07, 'MeV'),
+    'PROTON_MASS_IN_U' : ('proton mass in u', 5.3e-11, 'u'),
+    'PROTON_MOLAR_MASS' : ('proton molar mass', 3.1e-13, 'kg * mol ** -1'),
+    'PROTON_MUON_MASS_RATIO' : ('proton-muon mass ratio', 2e-07, ''),
+    'PROTON_NEUTRON_MAG_MOM_RATIO' : ('proton-neutron mag. mom. ratio', 3.4e-07, ''),
+    'PROTON_NEUTRON_MASS_RATIO' : ('proton-neutron mass ratio', 4.9e-10, ''),
+    'PROTON_RELATIVE_ATOMIC_MASS' : ('proton relative atomic mass', 5.3e-11, ''),
+    'PROTON_RMS_CHARGE_RADIUS' : ('proton rms charge radius', 1.9e-18, 'm'),
+    'PROTON_TAU_MASS_RATIO' : ('proton-tau mass ratio', 3.6e-05, ''),
+    'QUANTUM_OF_CIRCULATION' : ('quantum of circulation', 1.1e-13, 'm ** 2 * s ** -1'),
+    'QUANTUM_OF_CIRCULATION_TIMES_2' : ('quantum of circulation times 2', 2.2e-13, 'm ** 2 * s ** -1'),
+    'REDUCED_COMPTON_WAVELENGTH' : ('reduced Compton wavelength', 1.2e-22, 'm'),
+    'REDUCED_MUON_COMPTON_WAVELENGTH' : ('reduced muon Compton wavelength', 4.2e-23, 'm'),
+    'REDUCED_NEUTRON_COMPTON_WAVELENGTH' : ('reduced neutron Compton wavelength', 1.2e-25, 'm'),
+    'REDUCED_PLANCK_CONSTANT' : ('reduced Planck constant', 0.0, 'J * s'),
+    'REDUCED_PLANCK_CONSTANT_IN_EV_S' : ('reduced Planck constant in eV s', 0.0, 'eV * s'),
+    'REDUCED_PLANCK_CONSTANT_TIMES_C_IN_MEV_FM' : ('reduced Planck constant times c in MeV fm', 0.0, 'MeV * fm'),
+    'REDUCED_PROTON_COMPTON_WAVELENGTH' : ('reduced proton Compton wavelength', 6.4e-26, 'm'),
+    'REDUCED_TAU_COMPTON_WAVELENGTH' : ('reduced tau Compton wavelength', 7.5e-21, 'm'),
+    'RYDBERG_CONSTANT' : ('Rydberg constant', 2.1e-05, 'm ** -1'),
+    'RYDBERG_CONSTANT_TIMES_C_IN_HZ' : ('Rydberg constant times c in Hz', 6400.0, 'Hz'),
+    'RYDBERG_CONSTANT_TIMES_HC_IN_EV' : ('Rydberg constant times hc in eV', 2.6e-11, 'eV'),
+    'RYDBERG_CONSTANT_TIMES_HC_IN_J' : ('Rydberg constant times hc in J', 4.2e-30, 'J'),
+    'SACKUR_TETRODE_CONSTANT_1_K_100_KPA' : ('Sackur-Tetrode constant (1 K, 100 kPa)', 4.5e-10, ''),
+    'SACKUR_TETRODE_CONSTANT_1_K_101_325_KPA' : ('Sackur-Tetrode constant (1 K, 101.325 kPa)', 4.5e-10, ''),
+    'SECOND_RADIATION_CONSTANT' : ('second radiation constant', 0.0, 'm * K'),
+    'SHIELDED_HELION_GYROMAG_RATIO' : ('shielded helion gyromag. ratio', 2.4, 's ** -1 * T ** -1'),
+    'SHIELDED_HELION_GYROMAG_RATIO_IN_MHZ_PER_T' : ('shielded helion gyromag. ratio in MHz/T', 3.8e-07, 'MHz * T ** -1'),
+    'SHIELDED_HELION_MAG_MOM' : ('shielded helion mag. mom.', 1.3e-34, 'J * T ** -1'),
+    'SHIELDED_HELION_MAG_MOM_TO_BOHR_MAGNETON_RATIO' : ('shielded helion mag. mom. to Bohr magneton ratio', 1.4e-11, ''),
+    'SHIELDED_HELION_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO' : ('shielded helion mag. mom. to nuclear magneton ratio', 2.5e-08, ''),
+    'SHIELDED_HELION_TO_PROTON_MAG_MOM_RATIO' : ('shielded helion to proton mag. mom. ratio', 8.9e-09, ''),
+    'SHIELDED_HELION_TO_SHIELDED_PROTON_MAG_MOM_RATIO' : ('shielded helion to shielded proton mag. mom. ratio', 3.3e-09, ''),
+    'SHIELDED_PROTON_GYROMAG_RATIO' : ('shielded proton gyromag. ratio', 2.9, 's ** -1 * T ** -1'),
+    'SHIELDED_PROTON_GYROMAG_RATIO_IN_MHZ_PER_T' : ('shielded proton gyromag. ratio in MHz/T', 4.6e-07, 'MHz * T ** -1'),
+    'SHIELDED_PROTON_MAG_MOM' : ('shielded proton mag. mom.', 1.5e-34, 'J * T ** -1'),
+    'SHIELDED_PROTON_MAG_MOM_TO_BOHR_MAGNETON_RATIO' : ('shielded proton mag. mom. to Bohr magneton ratio', 1.7e-11, ''),
+    'SHIELDED_PROTON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO' : ('shielded proton mag. mom. to nuclear magneton ratio', 3e-08, ''),
+    'SHIELDING_DIFFERENCE_OF_D_AND_P_IN_HD' : ('shielding difference of d and p in HD', 2e-11, ''),
+    'SHIELDING_DIFFERENCE_OF_T_AND_P_IN_HT' : ('shielding difference of t and p in HT', 2e-11, ''),
+    'SPEED_OF_LIGHT_IN_VACUUM' : ('speed of light in vacuum', 0.0, 'm * s ** -1'),
+    'STANDARD_ACCELERATION_OF_GRAVITY' : ('standard acceleration of gravity', 0.0, 'm * s ** -2'),
+    'STANDARD_ATMOSPHERE' : ('standard atmosphere', 0.0, 'Pa'),
+    'STANDARD_STATE_PRESSURE' : ('standard-state pressure', 0.0, 'Pa'),
+    'STEFAN_BOLTZMANN_CONSTANT' : ('Stefan-Boltzmann constant', 0.0, 'W * m ** -2 * K ** -4'),
+    'TAU_COMPTON_WAVELENGTH' : ('tau Compton wavelength', 4.7e-20, 'm'),
+    'TAU_ELECTRON_MASS_RATIO' : ('tau-electron mass ratio', 0.23, ''),
+    'TAU_ENERGY_EQUIVALENT' : ('tau energy equivalent', 0.12, 'MeV'),
+    'TAU_MASS' : ('tau mass', 2.1e-31, 'kg'),
+    'TAU_MASS_ENERGY_EQUIVALENT' : ('tau mass energy equivalent', 1.9e-14, 'J'),
+    'TAU_MASS_IN_U' : ('tau mass in u', 0.00013, 'u'),
+    'TAU_MOLAR_MASS' : ('tau molar mass', 1.3e-07, 'kg * mol ** -1'),
+    'TAU_MUON_MASS_RATIO' : ('tau-muon mass ratio', 0.0011, ''),
+    'TAU_NEUTRON_MASS_RATIO' : ('tau-neutron mass ratio', 0.00013, ''),
+    'TAU_PROTON_MASS_RATIO' : ('tau-proton mass ratio', 0.00013, ''),
+    'THOMSON_CROSS_SECTION' : ('Thomson cross section', 6e-38, 'm ** 2'),
+    'TRITON_ELECTRON_MASS_RATIO' : ('triton-electron mass ratio', 2.7e-07, ''),
+    'TRITON_G_FACTOR' : ('triton g factor', 1.2e-08, ''),
+    'TRITON_MAG_MOM' : ('triton mag. mom.', 3e-35, 'J * T ** -1'),
+    'TRITON_MAG_MOM_TO_BOHR_MAGNETON_RATIO' : ('triton mag. mom. to Bohr magneton ratio', 3.2e-12, ''),
+    'TRITON_MAG_MOM_TO_NUCLEAR_MAGNETON_RATIO' : ('triton mag. mom. to nuclear magneton ratio', 5.9e-09, ''),
+    'TRITON_MASS' : ('triton mass', 1.5e-36, 'kg'),
+    'TRITON_MASS_ENERGY_EQUIVALENT' : ('triton mass energy equivalent', 1.4e-19, 'J'),
+    'TRITON_MASS_ENERGY_EQUIVALENT_IN_MEV' : ('triton mass energy equivalent in MeV', 8.5e-07, 'MeV'),
+    'TRITON_MASS_IN_U' : ('triton mass in u', 1.2e-10, 'u'),
+    'TRITON_MOLAR_MASS' : ('triton molar mass', 9.2e-13, 'kg * mol ** -1'),
+    'TRITON_PROTON_MASS_RATIO' : ('triton-proton mass ratio', 1.5e-10, ''),
+    'TRITON_RELATIVE_ATOMIC_MASS' : ('triton relative atomic mass', 1.2e-10, ''),
+    'TRITON_TO_PROTON_MAG_MOM_RATIO' : ('triton to proton mag. mom. ratio', 2.1e-09, ''),
+    'UNIFIED_ATOMIC_MASS_UNIT' : ('unified atomic mass unit', 5e-37, 'kg'),
+    'VACUUM_ELECTRIC_PERMITTIVITY' : ('vacuum electric permittivity', 1.3e-21, 'F * m ** -1'),
+    'VACUUM_MAG_PERMEABILITY' : ('vacuum mag. permeability', 1.9e-16, 'N * A ** -2'),
+    'VON_KLITZING_CONSTANT' : ('von Klitzing constant', 0.0, 'ohm'),
+    'WEAK_MIXING_ANGLE' : ('weak mixing angle', 0.0003, ''),
+    'WIEN_FREQUENCY_DISPLACEMENT_LAW_CONSTANT' : ('Wien frequency displacement law constant', 0.0, 'Hz * K ** -1'),
+    'WIEN_WAVELENGTH_DISPLACEMENT_LAW_CONSTANT' : ('Wien wavelength displacement law constant', 0.0, 'm * K'),
+    'W_TO_Z_MASS_RATIO' : ('W to Z mass ratio', 0.00017, ''),
+}
+
+def _entry(name: str)-> tuple:
+    try:
+        return _METADATA[name]
+    except KeyError:
+        raise KeyError(f"{name} is not a CODATA 2018 constant!") from None
+
+def quantity_name(name: str)-> str:
+    """CODATA quantity name of a constant, e.g. 'Boltzmann constant in eV/K'"""
+    return _entry(name)[0]
+
+def uncertainty(name: str)-> float:
+    """Standard uncertainty of a constant, 0.0 for exact values"""
+    return _entry(name)[1]
+
+def unit(name: str)-> str:
+    """Unit of a constant as a pint-parsable string, '' for dimensionless ones"""
+    return _entry(name)[2]
+
+def quantity(name: str):
+    """Constant as a pint Quantity (imports pint)"""
+    from semicpy.constants.constants import unit_registry
+    ureg = unit_registry()
+    return globals()[name] * ureg(unit(name) or 'dimensionless')
+
+def find(search_term: str)-> list:
+    """Names of the constants whose CODATA quantity name contains search_term"""
+    term = search_term.lower()
+    return [name for name, entry in _METADATA.items() if term in entry[0].lower()]
@@ -21,50 +21,92 @@ fundamental constants.
 Errors will be corrected on a more frequent basis.
 """
 
-from pint import UnitRegistry
-
-ureg = UnitRegistry(system = 'SI')
-
+import functools
+import warnings
+from semicpy.constants import codata
 
+# named constants, as [value, unit]. Values are the module-level floats of codata.py
+# (generated from codata_2018.txt); hot code should import those directly.
 constants = {
-            "Speed of light in vacuum" : [299792548, format(ureg.meter/ureg.second,'~')],
-            "Planck constant in J s" : [6.62607015e-34, format(ureg.J * ureg.second, '~')],
-            "Planck constant in eV s" : [4.135667696e-15, format(ureg.eV * ureg.second, '~')],
-            "Reduced Planck constant in J s" : [1.054571817e-34, format(ureg.J * ureg.second, '~')],
-            "Reduced Planck constant in eV s" : [6.582119569e-16, format(ureg.eV * ureg.second, '~')],
-            "Elementary charge" : [1.602176634e-19, format(ureg.C,'~')],
-            "Vacuum magnetic permeability" : [1.25663706212e-6, format(ureg.H / ureg.meter, '~')],
-            "Vacuum electric permittivity" : [8.8541878128e-12, format(ureg.F / ureg.meter, '~')],
-            "Boltzmann constant in eV/K" : [8.617333262e-5, format(ureg.eV / ureg.K, '~')],
-            "Boltzmann constant in J/K" : [1.380649e-23, format(ureg.J / ureg.K, '~')],
-            "Atomic mass constant" : [1.66053906660e-27, format(ureg.kg,'~')],
-            "Fine structure constant" : [7.2973525693e-3, format(ureg.dimensionless,'~')],
-            "Electron mass" : [9.1093837015e-31, format(ureg.kg,'~')],
-            "Stefan-Boltzmann constant" : [5.670374419e-8, format(ureg.W/((ureg.meter**2) * (ureg.K**4)),'~')],
-            "Rydberg constant" : [10973731.568160, format(ureg.meter**-1,'~')],
-            "Rydberg constant times hc in eV" : [13.605693122994, format(ureg.eV,'~')],
-            "Rydberg constant times hc in J" : [2.1798723611035e-18, format(ureg.J,'~')],
-            "Rydberg constant times c in Hz" : [3.2898419602508e+15, format(ureg.Hz,'~')],
-            "Compton wavelength" : [2.42631023867e-12, format(ureg.meter,'~')],
-            "Classical electron wavelength" : [2.8179403262e-15, format(ureg.meter,'~')],
-            "Characteristic impedance of vacuum" : [376.730313668, format(ureg.ohm,'~')],
-            "Bohr radius" : [5.29177210903e-11, format(ureg.meter,'~')],
-            "Electron volt in J" : [1.602176634e-19, format(ureg.J,'~')],
-            "Proton mass" : [1.67262192369e-27, format(ureg.kg,'~')],
-            "Neutron mass" : [1.67492749804e-27, format(ureg.kg,'~')], 
+            "Speed of light in vacuum" : [codata.SPEED_OF_LIGHT_IN_VACUUM, 'm / s'],
+            "Planck constant in J s" : [codata.PLANCK_CONSTANT, 'J * s'],
+            "Planck constant in eV s" : [codata.PLANCK_CONSTANT_IN_EV_PER_HZ, 'eV * s'],
+            "Reduced Planck constant in J s" : [codata.REDUCED_PLANCK_CONSTANT, 'J * s'],
+            "Reduced Planck constant in eV s" : [codata.REDUCED_PLANCK_CONSTANT_IN_EV_S, 'eV * s'],
+            "Elementary charge" : [codata.ELEMENTARY_CHARGE, 'C'],
+            "Vacuum magnetic permeability" : [codata.VACUUM_MAG_PERMEABILITY, 'H / m'],
+            "Vacuum electric permittivity" : [codata.VACUUM_ELECTRIC_PERMITTIVITY, 'F / m'],
+            "Boltzmann constant in eV/K" : [codata.BOLTZMANN_CONSTANT_IN_EV_PER_K, 'eV / K'],
+            "Boltzmann constant in J/K" : [codata.BOLTZMANN_CONSTANT, 'J / K'],
+            "Atomic mass constant" : [codata.ATOMIC_MASS_CONSTANT, 'kg'],
+            "Fine structure constant" : [codata.FINE_STRUCTURE_CONSTANT, ''],
+            "Electron mass" : [codata.ELECTRON_MASS, 'kg'],
+            "Stefan-Boltzmann constant" : [codata.STEFAN_BOLTZMANN_CONSTANT, 'W / K ** 4 / m ** 2'],
+            "Rydberg constant" : [codata.RYDBERG_CONSTANT, '1 / m'],
+            "Rydberg constant times hc in eV" : [codata.RYDBERG_CONSTANT_TIMES_HC_IN_EV, 'eV'],
+            "Rydberg constant times hc in J" : [codata.RYDBERG_CONSTANT_TIMES_HC_IN_J, 'J'],
+            "Rydberg constant times c in Hz" : [codata.RYDBERG_CONSTANT_TIMES_C_IN_HZ, 'Hz'],
+            "Compton wavelength" : [codata.COMPTON_WAVELENGTH, 'm'],
+            "Classical electron radius" : [codata.CLASSICAL_ELECTRON_RADIUS, 'm'],
+            "Characteristic impedance of vacuum" : [codata.CHARACTERISTIC_IMPEDANCE_OF_VACUUM, 'Ω'],
+            "Bohr radius" : [codata.BOHR_RADIUS, 'm'],
+            "Electron volt in J" : [codata.ELECTRON_VOLT, 'J'],
+            "Proton mass" : [codata.PROTON_MASS, 'kg'],
+            "Neutron mass" : [codata.NEUTRON_MASS, 'kg'],
+}
+
+# former keys of the constants dictionary, mapped to their current names
+deprecated_keys = {
+            "Classical electron wavelength" : "Classical electron radius",
 }
 
+@functools.lru_cache(maxsize=None)
+def unit_registry():
+   """
+   Shared pint UnitRegistry, created on first use so that importing the
+   constants does not import pint
+   """
+   from pint import UnitRegistry
+   return UnitRegistry(system = 'SI')
+
+def __getattr__(name):
+   # module attribute 'ureg' kept for backwards compatibility, built lazily
+   if name == 'ureg':
+      return unit_registry()
+   raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _lookup(key):
+   """
+   [value, unit] of a constant. Keys are matched case-insensitively against the
+   constants dictionary and its deprecated keys, then against the CODATA
+   quantity names of codata.py
+   """
+   if key in constants:
+      return constants[key]
+   folded = key.lower()
+   for old, new in deprecated_keys.items():
+      if old.lower() == folded:
+         warnings.warn(f"'{old}' is deprecated, use '{new}'.", DeprecationWarning, stacklevel=3)
+         return constants[new]
+   for name, entry in constants.items():
+      if name.lower() == folded:
+         return entry
+   for name in codata.find(key):
+      if codata.quantity_name(name).lower() == folded:
+         return [getattr(codata, name), codata.unit(name)]
+   raise KeyError(f"'{key}' is not a known constant! Use find_constants() to search.")
+
 def value(key):
    """
    Value of constants given by key
    """
-   return constants[key][0]
+   return _lookup(key)[0]
 
 def units(key):
    """
    Unit of constants given by key
    """
-   return constants[key][1]
+   return _lookup(key)[1]
 
 def list_constants():
    """
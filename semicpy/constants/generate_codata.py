@@ -0,0 +1,129 @@
+"""
+Generates codata.py from the NIST listing codata_2018.txt
+
+Every constant of the listing becomes a module-level float named after its CODATA
+quantity, e.g. 'Boltzmann constant in eV/K' -> BOLTZMANN_CONSTANT_IN_EV_PER_K, so
+the values are bound once at import instead of looked up by string on every call.
+Units are kept as plain strings next to the values and only turned into pint
+quantities on request.
+
+Run from the repository root after updating the listing:
+
+    python -m semicpy.constants.generate_codata
+"""
+import os
+import re
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LISTING = os.path.join(HERE, 'codata_2018.txt')
+OUTPUT = os.path.join(HERE, 'codata.py')
+
+# fixed-width columns of the NIST listing
+_QUANTITY = slice(0, 60)
+_VALUE = slice(60, 85)
+_UNCERTAINTY = slice(85, 110)
+_UNIT = slice(110, None)
+
+def attribute_name(quantity: str)-> str:
+    """Python identifier of a CODATA quantity, e.g. 'vacuum mag. permeability'
+    -> VACUUM_MAG_PERMEABILITY, 'Boltzmann constant in eV/K' ->
+    BOLTZMANN_CONSTANT_IN_EV_PER_K"""
+    name = re.sub(r'[^0-9a-zA-Z]+', '_', quantity.replace('/', ' per '))
+    name = name.strip('_').upper()
+    return '_' + name if name[0].isdigit() else name
+
+def parse_number(text: str)-> float:
+    """Float of a listing value such as '1.054 571 817... e-34'"""
+    return float(text.replace(' ', '').replace('...', ''))
+
+def pint_unit(text: str)-> str:
+    """pint expression of a listing unit, e.g. 'J K^-1' -> 'J * K ** -1'"""
+    return ' * '.join(token.replace('^', ' ** ') for token in text.split())
+
+def read_listing(path: str=LISTING)-> list:
+    """(name, quantity, value, uncertainty, unit) of every constant in the listing"""
+    with open(path, encoding='utf-8') as file:
+        lines = file.read().splitlines()
+    start = next(i for i, line in enumerate(lines) if line.startswith('-----')) + 1
+
+    entries = []
+    for line in lines[start:]:
+        if not line.strip():
+            continue
+        quantity = line[_QUANTITY].strip()
+        uncertainty = line[_UNCERTAINTY].strip()
+        entries.append((attribute_name(quantity),
+                        quantity,
+                        parse_number(line[_VALUE]),
+                        0.0 if uncertainty == '(exact)' else parse_number(uncertainty),
+                        pint_unit(line[_UNIT])))
+
+    names = [entry[0] for entry in entries]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise ValueError(f"CODATA quantities map to the same name: {sorted(duplicates)}")
+    return entries
+
+_HEADER = '''"""
+2018 CODATA recommended values of the fundamental physical constants
+
+Generated from codata_2018.txt by generate_codata.py, do not edit by hand.
+Every constant is a plain module-level float in SI units (or the unit named by
+the quantity, e.g. BOLTZMANN_CONSTANT_IN_EV_PER_K). Units, uncertainties and the
+CODATA quantity names are looked up with unit(), uncertainty() and quantity_name();
+quantity() attaches the unit as a pint Quantity, importing pint only then.
+"""
+
+'''
+
+_FOOTER = '''
+def _entry(name: str)-> tuple:
+    try:
+        return _METADATA[name]
+    except KeyError:
+        raise KeyError(f"{name} is not a CODATA 2018 constant!") from None
+
+def quantity_name(name: str)-> str:
+    """CODATA quantity name of a constant, e.g. 'Boltzmann constant in eV/K'"""
+    return _entry(name)[0]
+
+def uncertainty(name: str)-> float:
+    """Standard uncertainty of a constant, 0.0 for exact values"""
+    return _entry(name)[1]
+
+def unit(name: str)-> str:
+    """Unit of a constant as a pint-parsable string, '' for dimensionless ones"""
+    return _entry(name)[2]
+
+def quantity(name: str):
+    """Constant as a pint Quantity (imports pint)"""
+    from semicpy.constants.constants import unit_registry
+    ureg = unit_registry()
+    return globals()[name] * ureg(unit(name) or 'dimensionless')
+
+def find(search_term: str)-> list:
+    """Names of the constants whose CODATA quantity name contains search_term"""
+    term = search_term.lower()
+    return [name for name, entry in _METADATA.items() if term in entry[0].lower()]
+'''
+
+def render(entries: list)-> str:
+    """Source code of the generated module"""
+    lines = [_HEADER.rstrip('\n') + '\n']
+    lines += [f'{name} = {value!r}' for name, _, value, _, _ in entries]
+    lines.append('')
+    lines.append('# name -> (CODATA quantity, standard uncertainty, unit)')
+    lines.append('_METADATA = {')
+    lines += [f'    {name!r} : ({quantity!r}, {error!r}, {unit!r}),'
+              for name, quantity, _, error, unit in entries]
+    lines.append('}')
+    return '\n'.join(lines) + '\n' + _FOOTER
+
+def main()-> None:
+    entries = read_listing()
+    with open(OUTPUT, 'w', encoding='utf-8') as file:
+        file.write(render(entries))
+    print(f"Wrote {len(entries)} constants to {OUTPUT}")
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,23 @@
 """
 Module docstring
 """
+import functools
 import numpy as np
-from scipy.misc import derivative
+import numpy.typing as npt
 from semicpy.constants.constants import value
+from semicpy.math.solvers import damped_newton, warm_start_sweep, continuation_sweep, pn_junction_limit, critical_voltage, NewtonResult, SolutionCache
+from semicpy.temperature_cache import TemperatureCache, temperature_dependent
 
 BOLTZMANN = value('Boltzmann constant in J/K')
 CHARGE = value('Elementary charge')
 
-class Diode:
-    """Diode class description"""
+class Diode(TemperatureCache):
+    """Diode class description
+
+    Cached temperature-adjusted terms (see TemperatureCache): thermal voltage,
+    saturation and recombination currents, knee current, breakdown voltage,
+    parasitic resistance, junction potential and zero-bias capacitance.
+    """
     def __init__(self,
                  area: float=1.0,
                  temp: float=300.15,
@@ -133,7 +141,19 @@ class Diode:
         self.low_level_rev_breakdown_knee_current = ibvl
         self.knee_current = ikf
         self.ikf_temp_coeff = tikf
-    
+
+    @temperature_dependent
+    def thermal_voltage(self)-> float:
+        """Thermal voltage kT/q at the analysis temperature
+
+        Returns
+        -------
+        float
+            thermal voltage, V
+        """
+        return BOLTZMANN * self.temperature / CHARGE
+
+    @temperature_dependent
     def saturation_current(self)-> float:
         """_summary_
 
@@ -142,10 +162,11 @@ class Diode:
         float
             _description_
         """
-        vt = BOLTZMANN * self.temperature / CHARGE
+        vt = self.thermal_voltage()
         t_tnom = self.temperature / self.nominal_temperature
         return self.sat_current * np.exp((t_tnom - 1) * self.energy_gap / (self.emission_coeff * vt)) * (t_tnom**(self.sat_current_temp_exp/self.emission_coeff))
 
+    @temperature_dependent
     def recombination_current_parameter(self)-> float:
         """_summary_
 
@@ -154,10 +175,11 @@ class Diode:
         float
             _description_
         """
-        vt = BOLTZMANN * self.temperature / CHARGE
+        vt = self.thermal_voltage()
         t_tnom = self.temperature / self.nominal_temperature
         return self.recombination_current_param * np.exp((t_tnom - 1) * self.energy_gap / (self.isr_emission_coeff * vt)) * (t_tnom**(self.sat_current_temp_exp/self.isr_emission_coeff))
 
+    @temperature_dependent
     def high_injection_knee_current(self)-> float:
         """_summary_
 
@@ -168,6 +190,7 @@ class Diode:
         """
         return self.knee_current * (1 + (self.ikf_temp_coeff * (self.temperature - self.nominal_temperature)))
 
+    @temperature_dependent
     def reverse_breakdown_voltage(self)-> float:
         """_summary_
 
@@ -179,6 +202,7 @@ class Diode:
         t_tnom = self.temperature - self.nominal_temperature
         return self.rev_breakdown_voltage * (1 + (self.bv_temp_coeff_lin * t_tnom) + (self.bv_temp_coeff_quad * (t_tnom ** 2)))
     
+    @temperature_dependent
     def parasitic_resistance(self)-> float:
         """_summary_
 
@@ -190,6 +214,7 @@ class Diode:
         t_tnom = self.temperature - self.nominal_temperature
         return self.ohmic_resistance * (1 + (self.rs_temp_coeff_lin * t_tnom) + (self.rs_temp_coeff_quad * (t_tnom ** 2)))
     
+    @temperature_dependent
     def junction_potential(self)-> float:
         """_summary_
 
@@ -199,9 +224,10 @@ class Diode:
             _description_
         """
         t_tnom = self.temperature / self.nominal_temperature
-        vt = BOLTZMANN * self.temperature / CHARGE
+        vt = self.thermal_voltage()
         return self.junction_pot * t_tnom - (3 * vt * np.log(t_tnom)) - (self.__eg(self.nominal_temperature)*t_tnom) + self.__eg(self.temperature)
     
+    @temperature_dependent
     def zero_bias_junction_capacitance(self)-> float:
         """_summary_
 
@@ -211,7 +237,7 @@ class Diode:
             _description_
         """
         t_tnom = self.temperature - self.nominal_temperature
-        return self.zero_bias_junction_cap * (1 + (self.grading_coeff * ((0.0004 * t_tnom) + (1 - (self.junction_potential(self.nominal_temperature) / self.junction_pot)))))
+        return self.zero_bias_junction_cap * (1 + (self.grading_coeff * ((0.0004 * t_tnom) + (1 - (self.junction_potential() / self.junction_pot)))))
 
     def __eg(self,
              temp: float=0.0)-> float:
@@ -230,12 +256,12 @@ class Diode:
         float
             _description_
         """
-        if self.energy_gap == 1.11:
-            return 1.16 - ((7.02e-4 * (temp ** 2)) / (1108 + temp))
-        elif self.energy_gap == 0.67:
-            return 0.742 - (((4.8e-4) * (temp ** 2)) / (235 + temp))
-        else:
+        silicon = np.equal(self.energy_gap, 1.11)
+        germanium = np.equal(self.energy_gap, 0.67)
+        if not np.all(silicon | germanium):
             raise NotImplementedError("bandgap for SBD is not yet implemented!")
+        return np.where(silicon, 1.16 - ((7.02e-4 * (temp ** 2)) / (1108 + temp)),
+                        0.742 - (((4.8e-4) * (temp ** 2)) / (235 + temp)))[()]
 
     def diode_current(self,
                       vd: float=0.0)-> float:
@@ -267,7 +293,24 @@ class Diode:
         float
             _description_
         """
-        return (self.normal_current(vd) * self.high_injection_factor()) + (self.recombination_current(vd) * self.generation_factor(vd))
+        return (self.normal_current(vd) * self.high_injection_factor(vd)) + (self.recombination_current(vd) * self.generation_factor(vd))
+
+    def forward_conductance(self,
+                            vd: float=0.0)-> float:
+        """Closed-form derivative of forward_current with respect to the diode voltage
+
+        Parameters
+        ----------
+        vd : float, optional
+            diode voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dIfwd/dVd, S
+        """
+        return (self.normal_conductance(vd) * self.high_injection_factor(vd)) + (self.normal_current(vd) * self.high_injection_factor_derivative(vd)) \
+               + (self.recombination_conductance(vd) * self.generation_factor(vd)) + (self.recombination_current(vd) * self.generation_factor_derivative(vd))
 
     def reverse_current(self,
                         vd: float=0.0)-> float:
@@ -283,11 +326,32 @@ class Diode:
         float
             _description_
         """
-        vt = BOLTZMANN * self.temperature / CHARGE
+        vt = self.thermal_voltage()
         irev_h = self.rev_breakdown_current * np.exp(-(vd + self.reverse_breakdown_voltage()) / (self.rev_breakdown_IF * vt))
         irev_l = self.low_level_rev_breakdown_knee_current * np.exp(-(vd + self.reverse_breakdown_voltage()) / (self.low_level_rev_breakdown_IF * vt))
         return irev_h + irev_l
 
+    def reverse_conductance(self,
+                            vd: float=0.0)-> float:
+        """Closed-form derivative of reverse_current with respect to the diode voltage
+
+        Parameters
+        ----------
+        vd : float, optional
+            diode voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dIrev/dVd, S
+        """
+        vt = self.thermal_voltage()
+        nbv_vt = self.rev_breakdown_IF * vt
+        nbvl_vt = self.low_level_rev_breakdown_IF * vt
+        irev_h = self.rev_breakdown_current * np.exp(-(vd + self.reverse_breakdown_voltage()) / nbv_vt)
+        irev_l = self.low_level_rev_breakdown_knee_current * np.exp(-(vd + self.reverse_breakdown_voltage()) / nbvl_vt)
+        return -(irev_h / nbv_vt) - (irev_l / nbvl_vt)
+
     def normal_current(self,
                        vd: float=0.0)-> float:
         """_summary_
@@ -302,9 +366,26 @@ class Diode:
         float
             _description_
         """
-        vt = BOLTZMANN * self.temperature / CHARGE
+        vt = self.thermal_voltage()
         return self.saturation_current() * (np.exp(vd / (self.emission_coeff * vt)) - 1)
 
+    def normal_conductance(self,
+                           vd: float=0.0)-> float:
+        """Closed-form derivative of normal_current with respect to the diode voltage
+
+        Parameters
+        ----------
+        vd : float, optional
+            diode voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dInrm/dVd, S
+        """
+        n_vt = self.emission_coeff * self.thermal_voltage()
+        return self.saturation_current() * np.exp(vd / n_vt) / n_vt
+
     def high_injection_factor(self,
                               vd: float=0.0)-> float:
         """_summary_
@@ -320,10 +401,28 @@ class Diode:
             _description_
         """
         ikf = self.high_injection_knee_current()
-        if ikf > 0:
-            return np.sqrt(ikf / (ikf + self.normal_current(vd)))
-        else:
-            return 1.0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            kinj = np.sqrt(ikf / (ikf + self.normal_current(vd)))
+        return np.where((ikf > 0) & np.isfinite(ikf), kinj, 1.0)[()]
+
+    def high_injection_factor_derivative(self,
+                                         vd: float=0.0)-> float:
+        """Closed-form derivative of high_injection_factor with respect to the diode voltage
+
+        Parameters
+        ----------
+        vd : float, optional
+            diode voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dKinj/dVd, V^-1
+        """
+        ikf = self.high_injection_knee_current()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dkinj = -0.5 * self.high_injection_factor(vd) * self.normal_conductance(vd) / (ikf + self.normal_current(vd))
+        return np.where((ikf > 0) & np.isfinite(ikf), dkinj, 0.0)[()]
 
     def recombination_current(self,
                               vd: float=0.0)-> float:
@@ -339,9 +438,26 @@ class Diode:
         float
             _description_
         """
-        vt = BOLTZMANN * self.temperature / CHARGE
+        vt = self.thermal_voltage()
         return self.recombination_current_parameter() * (np.exp(vd / (self.isr_emission_coeff * vt)) - 1)
 
+    def recombination_conductance(self,
+                                  vd: float=0.0)-> float:
+        """Closed-form derivative of recombination_current with respect to the diode voltage
+
+        Parameters
+        ----------
+        vd : float, optional
+            diode voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dIrec/dVd, S
+        """
+        nr_vt = self.isr_emission_coeff * self.thermal_voltage()
+        return self.recombination_current_parameter() * np.exp(vd / nr_vt) / nr_vt
+
     def generation_factor(self,
                           vd: float=0.0)-> float:
         """_summary_
@@ -359,6 +475,24 @@ class Diode:
         vj = self.junction_potential()
         return (((1 - (vd / vj)) ** 2) + 0.005) ** (self.grading_coeff / 2)
 
+    def generation_factor_derivative(self,
+                                     vd: float=0.0)-> float:
+        """Closed-form derivative of generation_factor with respect to the diode voltage
+
+        Parameters
+        ----------
+        vd : float, optional
+            diode voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dKgen/dVd, V^-1
+        """
+        vj = self.junction_potential()
+        m = self.grading_coeff
+        return -(m / vj) * (1 - (vd / vj)) * ((((1 - (vd / vj)) ** 2) + 0.005) ** ((m / 2) - 1))
+
     def diode_capacitance(self,
                           vd: float=0.0)-> float:
         """_summary_
@@ -393,20 +527,36 @@ class Diode:
 
     def dc_conductance(self,
                        vd: float=0.0)-> float:
-        """_summary_
+        """Small-signal conductance of the forward (charge-storing) current, evaluated
+        in closed form and vectorized over vd.
 
         Parameters
         ----------
         vd : float, optional
-            _description_, by default 0.0
+            diode voltage, by default 0.0 V
 
         Returns
         -------
         float
-            _description_
+            area * dIfwd/dVd, S
         """
-        dqdv = derivative(self.forward_current, vd, dx=1.0e-6)
-        return self.area * dqdv
+        return self.area * self.forward_conductance(vd)
+
+    def diode_conductance(self,
+                          vd: float=0.0)-> float:
+        """Small-signal conductance of the total diode current, including reverse breakdown
+
+        Parameters
+        ----------
+        vd : float, optional
+            diode voltage, by default 0.0 V
+
+        Returns
+        -------
+        float
+            dId/dVd, S
+        """
+        return self.area * (self.forward_conductance(vd) - self.reverse_conductance(vd))
 
     def junction_capacitance(self,
                              vd: float=0.0)-> float:
@@ -427,12 +577,11 @@ class Diode:
         fc = self.forward_capacitance
         m = self.grading_coeff
 
-        if vd <= (fc * vj):
-            return cjo * ((1 - (vd / vj)) ** -m)
-        else:
-            f2 = (1 - fc) ** (1 + m)
-            f3 = 1 - (fc * (1 + m))
-            return (cjo / f2) * (f3 + (m * vd / vj))
+        f2 = (1 - fc) ** (1 + m)
+        f3 = 1 - (fc * (1 + m))
+        reverse = cjo * ((1 - (np.minimum(vd, fc * vj) / vj)) ** -m)
+        forward = (cjo / f2) * (f3 + (m * vd / vj))
+        return np.where(vd <= (fc * vj), reverse, forward)[()]
 
     def parasitic_thermal_noise(self)-> float:
         """Parasitic resistance thermal noise per unit bandwidth. Bandwidth is assumed to be 1.0 Hz.
@@ -463,3 +612,137 @@ class Diode:
         """
         return (2 * CHARGE * self.diode_current(vd)) + (self.flicker_noise_coeff * self.diode_current(vd) / freq)
 
+    def _solve_operating_point(self,
+                               v: npt.ArrayLike,
+                               x0: np.ndarray=None,
+                               ftol: float=1.0e-9,
+                               max_iter: int=100)-> NewtonResult:
+        """Damped Newton solve of vd + (Rs/area)*Id(vd) = v for the junction voltage vd."""
+        v = np.asarray(v, dtype=float)
+        rs = self.parasitic_resistance() / self.area
+        n_vt = self.emission_coeff * self.thermal_voltage()
+        v_crit = critical_voltage(n_vt, self.area * self.saturation_current())
+        bv = self.reverse_breakdown_voltage()
+        nbv_vt = self.rev_breakdown_IF * self.thermal_voltage()
+        bv_crit = critical_voltage(nbv_vt, self.area * self.rev_breakdown_current)
+
+        def system(x):
+            vd = x[..., 0]
+            residual = vd + (rs * self.diode_current(vd)) - v
+            jacobian = 1 + (rs * self.diode_conductance(vd))
+            return residual[..., None], jacobian[..., None, None]
+
+        def limit(x_new, x_old):
+            x_new = pn_junction_limit(x_new, x_old, n_vt, v_crit)
+            if np.isfinite(bv):
+                # the breakdown branch is a forward junction in -(vd + bv)
+                x_new = -pn_junction_limit(-(x_new + bv), -(x_old + bv), nbv_vt, bv_crit) - bv
+            return x_new
+
+        if x0 is None:
+            x0 = np.clip(v, -bv - bv_crit, v_crit)[..., None]
+        x0 = np.broadcast_to(x0, v.shape + (1,))
+
+        return damped_newton(system, x0, limit=limit, ftol=ftol, max_iter=max_iter)
+
+    def _operating_point_results(self,
+                                 result: NewtonResult)-> dict:
+        vd = result.x[..., 0][()]
+        return {"Diode Voltage" : vd,
+                "Diode Current" : self.diode_current(vd),
+                "Converged" : result.converged[()],
+                "Iterations" : result.iterations[()]}
+
+    def operating_point(self,
+                        v: npt.ArrayLike=0.0,
+                        x0: npt.ArrayLike=None,
+                        ftol: float=1.0e-9,
+                        max_iter: int=100)-> dict:
+        """DC operating point of the diode in series with its parasitic resistance.
+
+        Solves vd + (Rs/area)*Id(vd) = v for every applied voltage in one vectorized
+        damped Newton solve, with the analytic diode conductance as Jacobian and SPICE
+        junction voltage limiting.
+
+        Parameters
+        ----------
+        v : npt.ArrayLike, optional
+            voltages applied across the external terminals, by default 0.0 V
+        x0 : npt.ArrayLike, optional
+            initial guess of the junction voltages, by default None (v clipped to the
+            critical voltages of the forward and breakdown branches)
+        ftol : float, optional
+            residual tolerance, by default 1.0e-9 V
+        max_iter : int, optional
+            maximum number of Newton iterations, by default 100
+
+        Returns
+        -------
+        dict
+            arrays keyed by "Diode Voltage" (intrinsic junction voltage), "Diode Current",
+            "Converged" and "Iterations"
+        """
+        if x0 is not None:
+            x0 = np.asarray(x0, dtype=float)[..., None]
+        return self._operating_point_results(self._solve_operating_point(v, x0, ftol, max_iter))
+
+    def operating_point_sweep(self,
+                              v: npt.ArrayLike,
+                              ftol: float=1.0e-9,
+                              max_iter: int=100)-> dict:
+        """DC operating points along a bias sweep, each step warm-started from the
+        solution of the previous one.
+
+        Parameters
+        ----------
+        v : npt.ArrayLike
+            applied voltages, swept along the first axis (further axes are solved
+            together at each step), V
+        ftol : float, optional
+            residual tolerance, by default 1.0e-9 V
+        max_iter : int, optional
+            maximum number of Newton iterations per step, by default 100
+
+        Returns
+        -------
+        dict
+            same keys as operating_point(), stacked along the sweep axis
+        """
+        solve = functools.partial(self._solve_operating_point, ftol=ftol, max_iter=max_iter)
+        return self._operating_point_results(warm_start_sweep(solve, np.asarray(v, dtype=float)))
+
+    def operating_point_continuation(self,
+                                     v: npt.ArrayLike,
+                                     cache: SolutionCache=None,
+                                     max_step: float=None,
+                                     ftol: float=1.0e-9,
+                                     max_iter: int=100)-> dict:
+        """DC operating points along a bias sweep by adaptive continuation.
+
+        Each point starts from a guess extrapolated from the last two solutions. The
+        bias step is halved wherever Newton fails to converge. Solutions are reused
+        from the cache when the same diode is swept again at the same temperature.
+
+        Parameters
+        ----------
+        v : npt.ArrayLike
+            1-D array of applied voltages, V
+        cache : SolutionCache, optional
+            cache of converged operating points, by default None
+        max_step : float, optional
+            largest voltage step, by default None (unlimited)
+        ftol : float, optional
+            residual tolerance, by default 1.0e-9 V
+        max_iter : int, optional
+            maximum number of Newton iterations per step, by default 100
+
+        Returns
+        -------
+        dict
+            same keys as operating_point(), stacked along the sweep axis
+        """
+        solve = functools.partial(self._solve_operating_point, ftol=ftol, max_iter=max_iter)
+        return self._operating_point_results(continuation_sweep(solve, np.asarray(v, dtype=float),
+                                                                cache=cache, device=self,
+                                                                temperature=self.temperature, max_step=max_step))
+
@@ -1,13 +1,59 @@
 """JFET Class Module"""
+import functools
 import numpy as np
+import numpy.typing as npt
 from semicpy.constants.constants import value
+from semicpy.temperature_cache import TemperatureCache, temperature_dependent
+from semicpy.math.solvers import damped_newton, warm_start_sweep, NewtonResult
 
 CHARGE = value('Elementary charge')
 BOLTZMANN = value('Boltzmann constant in J/K')
 TNOM = 300.15 #27 deg Celsius in Kelvin
 
-class JFET:
+def _normal_mode_drain_current(vgst: npt.ArrayLike,
+                               vds: npt.ArrayLike,
+                               beta: float,
+                               lamda: float)-> tuple:
+    """Vectorized normal-mode (vds >= 0) drain current and its partial derivatives.
+
+    Parameters
+    ----------
+    vgst : npt.ArrayLike
+        gate overdrive vgs - vto, V
+    vds : npt.ArrayLike
+        drain-source voltage, V
+    beta : float
+        transconductance coefficient, A/V^2
+    lamda : float
+        channel-length modulation, V^-1
+
+    Returns
+    -------
+    tuple
+        (id, did/dvgst, did/dvds) with cutoff, linear and saturation regions selected
+        by masks
+    """
+    clm = 1 + (lamda * vds)
+    linear = vds <= vgst
+    on = vgst > 0
+
+    i_lin = beta * vds * ((2 * vgst) - vds) * clm
+    i_sat = beta * (vgst ** 2) * clm
+    g_lin = 2 * beta * vds * clm
+    g_sat = 2 * beta * vgst * clm
+    gds_lin = (2 * beta * (vgst - vds) * clm) + (beta * vds * ((2 * vgst) - vds) * lamda)
+    gds_sat = beta * (vgst ** 2) * lamda
+
+    i_d = np.where(on, np.where(linear, i_lin, i_sat), 0.0)
+    gm = np.where(on, np.where(linear, g_lin, g_sat), 0.0)
+    gds = np.where(on, np.where(linear, gds_lin, gds_sat), 0.0)
+    return i_d, gm, gds
+
+class JFET(TemperatureCache):
     """JFET Class
+
+    Cached temperature-adjusted terms (see TemperatureCache): thermal voltage,
+    vto, beta, i_s, isr, pb, cgs and cgd.
     """
     def __init__(self,
                  temp: float=0.0,
@@ -103,7 +149,18 @@ class JFET:
         self.threshold_voltage = vto
         self.vto_temp_coeff = vtotc
         self.sat_current_temp_coeff = xti
-    
+
+    @temperature_dependent
+    def thermal_voltage(self)-> float:
+        """Thermal voltage kT/q at the analysis temperature
+
+        Returns
+        -------
+        float
+            thermal voltage, V
+        """
+        return BOLTZMANN * self.temperature / CHARGE
+
     def gate_current(self,
                      area: float=0.0,
                      vgs: float=0.0,
@@ -173,7 +230,7 @@ class JFET:
         float
             _description_
         """
-        vt = BOLTZMANN * self.temperature / CHARGE
+        vt = self.thermal_voltage()
 
         i_n = self.gate_pn_sat_current * (np.exp(voltage / (self.gate_pn_emission_coeff * vt) - 1))
         return i_n
@@ -192,7 +249,7 @@ class JFET:
         float
             _description_
         """
-        vt = BOLTZMANN * self.temperature / CHARGE
+        vt = self.thermal_voltage()
 
         ir = self.gate_pn_rec_current_param * (np.exp(voltage / (self.emission_coeff_isr * vt)) - 1)
         return ir
@@ -298,6 +355,9 @@ class JFET:
         For p-channel JFET, the polarities of Vgs,Vds, and Vgd must be reversed. The direction of
         i_drain must also be reversed.
 
+        Vectorized over the bias arguments. In inverted mode (vds < 0) the drain and source
+        exchange roles, i.e. i_drain(vgs, vds) = -i_drain(vgd, -vds).
+
         Parameters
         ----------
         vgs : float, optional
@@ -312,20 +372,149 @@ class JFET:
         float
             _description_
         """
-        if vds >= 0.0:
-            if (vgs-self.threshold_voltage) <= 0.0:
-                return 0
-            elif 0 < vds <= (vgs - self.threshold_voltage):
-                return self.transconductance_coeff * vds * ((2 * (vgs - self.threshold_voltage)) - vds) * (1 + (self.ch_len_modulation * vds))
-            elif 0 < (vgs - self.threshold_voltage) < vds:
-                return self.transconductance_coeff * ((vgs - self.threshold_voltage) ** 2) * (1 + (self.ch_len_modulation * vds))
-        else: 
-            if (vgd-self.threshold_voltage) <= 0.0:
-                return 0
-            elif 0 < -vds <= (vgd - self.threshold_voltage):
-                return self.transconductance_coeff * vds * ((2 * (vgd - self.threshold_voltage)) - vds) * (1 + (self.ch_len_modulation * vds))
-            elif 0 < (vgd-self.threshold_voltage) < -vds:
-                return -self.transconductance_coeff * ((vgd - self.threshold_voltage) ** 2) * (1 + (self.ch_len_modulation * vds))
+        return self.i_drain_conductances(vgs, vds, vgd)[0]
+
+    def i_drain_conductances(self,
+                             vgs: float=0.0,
+                             vds: float=0.0,
+                             vgd: float=None)-> tuple:
+        """i_drain() with its closed-form transconductance and output conductance.
+
+        Parameters
+        ----------
+        vgs : float, optional
+            gate-source voltage, by default 0.0 V
+        vds : float, optional
+            drain-source voltage, by default 0.0 V
+        vgd : float, optional
+            gate-drain voltage, by default None (vgs - vds)
+
+        Returns
+        -------
+        tuple
+            (i_drain, gm = di/dvgs, gds = di/dvds), A and S
+        """
+        vgs = np.asarray(vgs, dtype=float)
+        vds = np.asarray(vds, dtype=float)
+        vgd = (vgs - vds) if vgd is None else np.asarray(vgd, dtype=float)
+        vto = self.threshold_voltage
+        beta = self.transconductance_coeff
+        lamda = self.ch_len_modulation
+
+        i_n, gm_n, gds_n = _normal_mode_drain_current(vgs - vto, vds, beta, lamda)
+        i_i, gm_i, gds_i = _normal_mode_drain_current(vgd - vto, -vds, beta, lamda)
+
+        normal = vds >= 0.0
+        i_d = np.where(normal, i_n, -i_i)
+        gm = np.where(normal, gm_n, -gm_i)
+        gds = np.where(normal, gds_n, gm_i + gds_i)
+        return i_d[()], gm[()], gds[()]
+
+    def _solve_operating_point(self,
+                               vgs: npt.ArrayLike,
+                               vds: npt.ArrayLike,
+                               area: float=1.0,
+                               x0: np.ndarray=None,
+                               ftol: float=1.0e-9,
+                               max_iter: int=100)-> NewtonResult:
+        """Damped Newton solve for the intrinsic (vgs, vds) behind the source and drain
+        resistances, with residuals vgs + rs*id - VGS and vds + (rs + rd)*id - VDS."""
+        vgs, vds = np.broadcast_arrays(np.asarray(vgs, dtype=float), np.asarray(vds, dtype=float))
+        rs = self.source_ohmic_resist / area
+        rsd = (self.source_ohmic_resist + self.drain_ohmic_resist) / area
+
+        def system(x):
+            vgs_i, vds_i = x[..., 0], x[..., 1]
+            i_d, gm, gds = self.i_drain_conductances(vgs_i, vds_i)
+            i_d, gm, gds = area * i_d, area * gm, area * gds
+            residual = np.stack([vgs_i + (rs * i_d) - vgs, vds_i + (rsd * i_d) - vds], axis=-1)
+            jacobian = np.stack([np.stack([1 + (rs * gm), rs * gds], axis=-1),
+                                 np.stack([rsd * gm, 1 + (rsd * gds)], axis=-1)], axis=-2)
+            return residual, jacobian
+
+        if x0 is None:
+            x0 = np.stack([vgs, vds], axis=-1)
+        x0 = np.broadcast_to(x0, vgs.shape + (2,))
+
+        return damped_newton(system, x0, ftol=ftol, max_iter=max_iter)
+
+    def _operating_point_results(self,
+                                 result: NewtonResult,
+                                 area: float)-> dict:
+        vgs_i, vds_i = result.x[..., 0][()], result.x[..., 1][()]
+        return {"Gate-Source Voltage" : vgs_i,
+                "Drain-Source Voltage" : vds_i,
+                "Drain Current" : area * self.i_drain(vgs_i, vds_i, vgs_i - vds_i),
+                "Converged" : result.converged[()],
+                "Iterations" : result.iterations[()]}
+
+    def operating_point(self,
+                        vgs: npt.ArrayLike=0.0,
+                        vds: npt.ArrayLike=0.0,
+                        area: float=1.0,
+                        x0: npt.ArrayLike=None,
+                        ftol: float=1.0e-9,
+                        max_iter: int=100)-> dict:
+        """DC operating point of the JFET including its source and drain resistances.
+
+        All bias points are solved in one vectorized damped Newton solve with the analytic
+        gm and gds as Jacobian. The gate junction current is neglected in the resistive
+        drops, which holds while the gate junctions are not forward biased.
+
+        Parameters
+        ----------
+        vgs : npt.ArrayLike, optional
+            external gate-source voltages, by default 0.0 V
+        vds : npt.ArrayLike, optional
+            external drain-source voltages, broadcast against vgs, by default 0.0 V
+        area : float, optional
+            device area factor, by default 1.0
+        x0 : npt.ArrayLike, optional
+            initial guess of the intrinsic (vgs, vds) pairs, shape (..., 2),
+            by default None (external voltages)
+        ftol : float, optional
+            residual tolerance, by default 1.0e-9 V
+        max_iter : int, optional
+            maximum number of Newton iterations, by default 100
+
+        Returns
+        -------
+        dict
+            arrays keyed by "Gate-Source Voltage", "Drain-Source Voltage" (intrinsic),
+            "Drain Current", "Converged" and "Iterations"
+        """
+        return self._operating_point_results(self._solve_operating_point(vgs, vds, area, x0, ftol, max_iter), area)
+
+    def operating_point_sweep(self,
+                              vgs: npt.ArrayLike,
+                              vds: npt.ArrayLike,
+                              area: float=1.0,
+                              ftol: float=1.0e-9,
+                              max_iter: int=100)-> dict:
+        """DC operating points along a bias sweep, each step warm-started from the
+        solution of the previous one.
+
+        Parameters
+        ----------
+        vgs : npt.ArrayLike
+            external gate-source voltages, swept along the first axis, V
+        vds : npt.ArrayLike
+            external drain-source voltages, broadcast against vgs, V
+        area : float, optional
+            device area factor, by default 1.0
+        ftol : float, optional
+            residual tolerance, by default 1.0e-9 V
+        max_iter : int, optional
+            maximum number of Newton iterations per step, by default 100
+
+        Returns
+        -------
+        dict
+            same keys as operating_point(), stacked along the sweep axis
+        """
+        vgs, vds = np.broadcast_arrays(np.asarray(vgs, dtype=float), np.asarray(vds, dtype=float))
+        solve = functools.partial(self._solve_operating_point, area=area, ftol=ftol, max_iter=max_iter)
+        return self._operating_point_results(warm_start_sweep(solve, vgs, vds), area)
     
     def gate_source_depletion_capacitance(self,
                                           area: float=0.0,
@@ -373,6 +562,7 @@ class JFET:
             cgd = area * self.zero_bias_gate_drain_pn_cap * ((1 - self.fwd_bias_depl_cap_coeff) ** -(1+self.gate_pn_grading_coeff)) * (1 - self.fwd_bias_depl_cap_coeff * (1 + self.gate_pn_grading_coeff) + self.gate_pn_grading_coeff * (vgd/self.gate_pn_potential))
         return cgd
     
+    @temperature_dependent
     def vto(self,
             temp: float=298.15,
             tnom: float=TNOM)-> float:
@@ -392,6 +582,7 @@ class JFET:
         """
         return self.threshold_voltage + self.vto_temp_coeff * (temp - tnom)
     
+    @temperature_dependent
     def beta(self,
              temp: float=298.15,
              tnom: float=TNOM)-> float:
@@ -411,6 +602,7 @@ class JFET:
         """
         return self.transconductance_coeff * (1.01**(self.beta_exp_temp_coeff*(temp-tnom)))
     
+    @temperature_dependent
     def i_s(self,
             temp: float=298.15,
             tnom: float=TNOM,
@@ -434,6 +626,7 @@ class JFET:
         vt = BOLTZMANN * temp / CHARGE
         return self.gate_pn_sat_current * np.exp((temp/tnom - 1) * eg / (self.gate_pn_emission_coeff * vt)) * ((temp/tnom)**(self.sat_current_temp_coeff/self.gate_pn_emission_coeff))
 
+    @temperature_dependent
     def isr(self,
             temp: float=298.15,
             tnom: float=TNOM,
@@ -482,6 +675,7 @@ class JFET:
         eg = A + (B * temp) - (C * (temp**2))
         return eg
     
+    @temperature_dependent
     def pb(self,
            temp: float=298.15,
            tnom: float=TNOM)-> float:
@@ -503,6 +697,7 @@ class JFET:
         pb = self.gate_pn_potential * (temp/tnom) - (3 * vt * np.log(temp/tnom)) - (self.__eg(tnom) * temp/tnom) + self.__eg(temp)
         return pb
     
+    @temperature_dependent
     def cgs(self,
             temp: float=298.15,
             tnom: float=TNOM)-> float:
@@ -527,6 +722,7 @@ class JFET:
 
         return cgs * (1 + m * ((0.0004 * tdiff) + (1-self.pb(temp)/pb)))
 
+    @temperature_dependent
     def cgd(self,
             temp: float=298.15,
             tnom: float=TNOM)-> float:
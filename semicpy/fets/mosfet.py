@@ -1,10 +1,21 @@
 from semicpy.constants.constants import value
 import numpy as np
+import numpy.typing as npt
+
+# operating region codes returned by MOSFET.operating_regions()
+CUTOFF = 0
+LINEAR = 1
+SATURATION = 2
+REGION_NAMES = ("Cut off", "Linear", "Saturation")
+
+EPSILON_NOUGHT = value("Vacuum electric permittivity")
+ELEMENTARY_CHARGE = value("Elementary charge")
 
 class MOSFET:
     """
     Class describing MOSFET based on LEVEL 1-3,6 parameters from ngspice
     """
+    polarity = 1
     def __init__(self,
                  length: float=1.0e-4,
                  width: float=1.0e-4,
@@ -242,7 +253,6 @@ class MOSFET:
         float
             _description_
         """
-        EPSILON_NOUGHT = value("Vacuum electric permittivity")
 
         t_ox = self.oxide_thickness if t_ox is None else t_ox
 
@@ -546,8 +556,120 @@ class MOSFET:
         f_T = g_m / (2 * np.pi * (c_gs + c_gd))
         return f_T
 
+    def _normalized_bias(self,
+                         v_gs: npt.ArrayLike,
+                         v_ds: npt.ArrayLike,
+                         v_t: npt.ArrayLike=None,
+                         grid: bool=False)-> tuple:
+        """Gate overdrive and drain-source voltage in n-channel normal-mode convention.
+
+        The polarity is folded in (PMOS voltages are negated) and for v_ds < 0 drain and
+        source are exchanged, so the region formulas only need v_ds >= 0.
+
+        Returns
+        -------
+        tuple
+            (overdrive, |v_ds|, inverted-mode mask)
+        """
+        if grid:
+            v_gs, v_ds = np.meshgrid(np.ravel(v_gs), np.ravel(v_ds), indexing='ij')
+        v_t = self.zero_bias_threshold_voltage if v_t is None else v_t
+        v_gs = self.polarity * np.asarray(v_gs, dtype=float)
+        v_ds = self.polarity * np.asarray(v_ds, dtype=float)
+        v_t = self.polarity * np.asarray(v_t, dtype=float)
+
+        inverted = v_ds < 0.0
+        v_ov = np.where(inverted, v_gs - v_ds, v_gs) - v_t
+        return v_ov, np.abs(v_ds), inverted
+
+    def operating_regions(self,
+                          v_gs: npt.ArrayLike,
+                          v_ds: npt.ArrayLike,
+                          v_t: npt.ArrayLike=None,
+                          grid: bool=False)-> np.ndarray:
+        """Operating region of every bias point as a compact integer code.
+
+        Parameters
+        ----------
+        v_gs : npt.ArrayLike
+            gate-source voltages, V
+        v_ds : npt.ArrayLike
+            drain-source voltages, broadcast against v_gs, V
+        v_t : npt.ArrayLike, optional
+            threshold voltage, by default None (zero-bias threshold voltage)
+        grid : bool, optional
+            if True, v_gs and v_ds are 1-D axes evaluated on their meshgrid with shape
+            (len(v_gs), len(v_ds)), by default False
+
+        Returns
+        -------
+        np.ndarray
+            int8 array of CUTOFF (0), LINEAR (1) or SATURATION (2). The linear/saturation
+            boundary v_ds = v_gs - v_t is counted as saturation.
+        """
+        v_ov, v_ds, _ = self._normalized_bias(v_gs, v_ds, v_t, grid)
+        regions = np.where(v_ds < v_ov, LINEAR, SATURATION).astype(np.int8)
+        regions[v_ov <= 0.0] = CUTOFF
+        return regions[()]
+
+    def drain_characteristics(self,
+                              v_gs: npt.ArrayLike,
+                              v_ds: npt.ArrayLike,
+                              v_t: npt.ArrayLike=None,
+                              current_gain: npt.ArrayLike=None,
+                              lamda: npt.ArrayLike=None,
+                              grid: bool=False)-> dict:
+        """Square-law drain current with channel-length modulation over whole bias arrays.
+
+        Regions are selected with masks in a single vectorized pass:
+            cut off     Id = 0
+            linear      Id = K * ((v_gs - v_t) * v_ds - v_ds^2 / 2) * (1 + lamda * v_ds)
+            saturation  Id = K / 2 * (v_gs - v_t)^2 * (1 + lamda * v_ds)
+        which is continuous across the linear/saturation boundary. For v_ds < 0 drain and
+        source exchange roles, and PMOS voltages and current take the opposite sign.
+
+        Parameters
+        ----------
+        v_gs : npt.ArrayLike
+            gate-source voltages, V
+        v_ds : npt.ArrayLike
+            drain-source voltages, broadcast against v_gs, V
+        v_t : npt.ArrayLike, optional
+            threshold voltage, by default None (zero-bias threshold voltage)
+        current_gain : npt.ArrayLike, optional
+            K = kp * W / L, by default None (from the model parameters)
+        lamda : npt.ArrayLike, optional
+            channel-length modulation, by default None (model parameter)
+        grid : bool, optional
+            if True, v_gs and v_ds are 1-D axes evaluated on their meshgrid with shape
+            (len(v_gs), len(v_ds)), e.g. an Id-Vds family, by default False
+
+        Returns
+        -------
+        dict
+            "Drain Current" array, A, and "Region" int8 code array
+        """
+        k = self.current_gain(None) if current_gain is None else current_gain
+        lamda = self.ch_len_modulation if lamda is None else lamda
+        v_ov, v_ds, inverted = self._normalized_bias(v_gs, v_ds, v_t, grid)
+
+        clm = 1 + (lamda * v_ds)
+        linear = v_ds < v_ov
+        i_lin = k * ((v_ov * v_ds) - ((v_ds ** 2) / 2)) * clm
+        i_sat = 0.5 * k * (v_ov ** 2) * clm
+        on = v_ov > 0.0
+
+        i_d = np.where(on, np.where(linear, i_lin, i_sat), 0.0)
+        i_d = self.polarity * np.where(inverted, -i_d, i_d)
+        regions = np.where(on, np.where(linear, LINEAR, SATURATION), CUTOFF).astype(np.int8)
+
+        return {"Drain Current" : i_d[()],
+                "Region" : regions[()]}
+
 class PMOS(MOSFET):
     """PMOS class"""
+    polarity = -1
+
     def body_effect_parameter(self,
                               concentration: float,
                               c_ox: float)-> float:
@@ -567,7 +689,6 @@ class PMOS(MOSFET):
         float
             _description_
         """
-        ELEMENTARY_CHARGE = value("Elementary charge")
         gamma = -1.0*np.sqrt(2*ELEMENTARY_CHARGE*concentration) / c_ox
         return gamma
     
@@ -575,34 +696,23 @@ class PMOS(MOSFET):
                        v_gs: float,
                        v_ds: float,
                        v_tp: float)-> str:
-        """_summary_
+        """Operating region of a single bias point. See operating_regions() for arrays.
 
         Parameters
         ----------
         v_gs : float
-            _description_
+            gate-source voltage, V
         v_ds : float
-            _description_
+            drain-source voltage, V
         v_tp : float
-            _description_
+            threshold voltage, V
 
         Returns
         -------
         str
-            _description_
+            "Cut off", "Linear" or "Saturation"
         """
-        modes = ["Cut off", "Linear", "Saturation", "Lin/Sat Boundary"]
-
-        volt = v_gs - v_tp
-
-        if v_gs > v_tp:
-            return modes[0] #Cut off mode
-        elif (v_gs < v_tp) and (v_ds < volt):
-            return modes[1]
-        elif (v_gs < v_tp) and (v_ds > volt):
-            return modes[2]
-        elif (v_ds == volt):
-            return modes[3]
+        return REGION_NAMES[self.operating_regions(v_gs, v_ds, v_tp)]
 
     def drain_current(self,
                       mode: str,
@@ -658,6 +768,8 @@ class PMOS(MOSFET):
 
 class NMOS(MOSFET):
     """NMOS class"""
+    polarity = 1
+
     def body_effect_parameter(self,
                               concentration: float,
                               c_ox: float)-> float:
@@ -675,7 +787,6 @@ class NMOS(MOSFET):
         float
             _description_
         """
-        ELEMENTARY_CHARGE = value("Elementary charge")
         gamma = np.sqrt(2*ELEMENTARY_CHARGE*concentration) / c_ox
         return gamma
 
@@ -683,34 +794,23 @@ class NMOS(MOSFET):
                        v_gs: float,
                        v_ds: float,
                        v_tn: float)-> str:
-        """_summary_
+        """Operating region of a single bias point. See operating_regions() for arrays.
 
         Parameters
         ----------
         v_gs : float
-            _description_
+            gate-source voltage, V
         v_ds : float
-            _description_
+            drain-source voltage, V
         v_tn : float
-            _description_
+            threshold voltage, V
 
         Returns
         -------
         str
-            _description_
+            "Cut off", "Linear" or "Saturation"
         """
-        modes = ["Cut off", "Linear", "Saturation", "Lin/Sat Boundary"]
-
-        volt = v_gs - v_tn
-
-        if v_gs < v_tn:
-            return modes[0] #Cut off mode
-        elif (v_gs > v_tn) and (v_ds > volt):
-            return modes[1]
-        elif (v_gs > v_tn) and (v_ds < volt):
-            return modes[2]
-        elif (v_ds == volt):
-            return modes[3]
+        return REGION_NAMES[self.operating_regions(v_gs, v_ds, v_tn)]
 
     def drain_current(self,
                       mode: str,
@@ -2,40 +2,45 @@
 Module docstring for fundamentals.py
 '''
 
-from numpy import pi,sqrt,exp
-from semicpy.constants.constants import value
+from numpy import pi,sqrt,exp,where
+from semicpy.constants import codata
 
+BOLTZMANN = codata.BOLTZMANN_CONSTANT_IN_EV_PER_K
+HBAR = codata.REDUCED_PLANCK_CONSTANT_IN_EV_S
 
-def find_pn(temp=0,bandgap=0,n_a=0,n_d=0):
+
+def find_pn(temp=0,bandgap=0,n_a=0,n_d=0,n_c=None,n_v=None):
     '''
-    Function to find n and p concentrations.
+    Function to find n and p concentrations, assuming full ionization and Boltzmann
+    statistics. Works elementwise on arrays. For incomplete ionization and degenerate
+    doping use carriers.charge_neutrality.
 
     temp : Temperature in Kelvin
 
     bandgap : Bandgap value in eV
 
-    n_i: Intrinsic concentration
-
     n_a: Acceptor concentration
 
-    nd: Donor concentration
+    n_d: Donor concentration
+
+    n_c: Conduction band effective density of states, by default nc_temp(temp)
+
+    n_v: Valence band effective density of states, by default nv_temp(temp)
 
     Returns n and p concentrations as a tuple (n,p)
     '''
     #constants
-    kb_t = value('Boltzmann constant in eV/K') * temp
-    #temp = float(input("Enter temperature (in Kelvin) : "))
-    #bandgap = float(input("Enter bandgap value (in eV) : "))
-    n_c = float(input("Enter n_c (#/cm^3) : "))
-    n_v = float(input("Enter n_v (#/cm^3) : "))
+    kb_t = BOLTZMANN * temp
+    n_c = nc_temp(temp) if n_c is None else n_c
+    n_v = nv_temp(temp) if n_v is None else n_v
     n_i = sqrt(n_c * n_v)*exp(-bandgap/(2*kb_t))
 
-    if n_a > n_d:
-        p_type = ((n_a-n_d) + sqrt((n_a-n_d)**2 + 4*(n_i**2))) / 2.0
-        n_type = (n_i**2)/p_type
-    if n_d > n_a:
-        n_type = ((n_d-n_a) + sqrt((n_d-n_a)**2 + 4*(n_i**2))) / 2.0
-        p_type = (n_i**2)/n_type
+    # majority carriers from the quadratic, minority ones from the mass action law
+    net = abs(n_d - n_a)
+    majority = (net + sqrt(net**2 + 4*(n_i**2))) / 2.0
+    minority = (n_i**2)/majority
+    n_type = where(n_d >= n_a, majority, minority)[()]
+    p_type = where(n_d >= n_a, minority, majority)[()]
 
     return n_type,p_type
 
@@ -79,7 +84,7 @@ def find_ic(i_sat=0, vbe=0, temp=0):
 
     temp: The temperature in Kelvin
     '''
-    kb_t = value('Boltzmann constant in eV/K') * temp
+    kb_t = BOLTZMANN * temp
     i_c = i_sat * exp((vbe/kb_t)-1)
     return i_c
 
@@ -105,7 +110,7 @@ def find_n0(n_c=0,conduction_band_energy=0,fermi_energy=0,temp=0):
 
     n0 = n_c*exp(-(conduction_band_energy-fermi_energy)/(k_b*temp))
     '''
-    kb_t = value('Boltzmann constant in eV/K') * temp
+    kb_t = BOLTZMANN * temp
     n_0 = n_c*exp(-(conduction_band_energy-fermi_energy)/kb_t)
 
     return n_0
@@ -125,8 +130,8 @@ def find_nc(mass_c=0,temp=0):
 
     n_c = 2*[mass_c*k_b*temp/(2pi*hbar^2)]^(3/2)
     '''
-    kb_t = value('Boltzmann constant in eV/K') * temp
-    h_bar = value('reduced Planck constant in eV s')
+    kb_t = BOLTZMANN * temp
+    h_bar = HBAR
     n_c = 2*((mass_c*kb_t/(2*pi*(h_bar**2)))**(3/2))
 
     return n_c
@@ -149,7 +154,7 @@ def find_p0(n_v=0,valence_band_energy=0,fermi_energy=0,temp=0):
     p0 = n_v*exp(valence_band_energy-fermi_energy/k_b*temp)
     '''
 
-    kb_t = value('Boltzmann constant in eV/K') * temp
+    kb_t = BOLTZMANN * temp
     p_0 = n_v*exp((valence_band_energy-fermi_energy)/kb_t)
 
     return p_0
@@ -170,8 +175,8 @@ def find_nv(mass_v=0,temp=0):
     n_v = 2*[mass_v*k_b*temp/(2pi*hbar^2)]^(3/2)
     '''
 
-    kb_t = value('Boltzmann constant in eV/K') * temp
-    h_bar = value('reduced Planck constant in eV s')
+    kb_t = BOLTZMANN * temp
+    h_bar = HBAR
 
     n_v = 2*(mass_v*kb_t/(2*pi*(h_bar**2)))**(3/2)
 
@@ -1,7 +1,6 @@
 '''Heterostructure modeling'''
 
 import numpy as np
-import matplotlib.pyplot as plt
 from semicpy.math.coordinate import Rectangular2D
 
 VACUUM = Rectangular2D(0,0)
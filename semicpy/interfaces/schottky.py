@@ -1,7 +1,6 @@
 """module docstring for schottky barrier
 """
 from semicpy.math.coordinate import Rectangular2D
-import matplotlib.pyplot as plt
 import numpy as np
 
 VACUUM = Rectangular2D(0,0)
@@ -31,6 +30,7 @@ class SchottkyBarrier(Metal,Semiconductor):
     def model(self):
         """_summary_
         """
+        import matplotlib.pyplot as plt
         x = np.arange(VACUUM.x,10,1)
         y = -x - 1
         mod = plt.Figure()
@@ -7,6 +7,10 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class AlAs(Semiconductor):
-    pass
+class AlAs(TemperatureModel, Semiconductor):
+    __slots__ = ()
+    varshni = (2.24, 7.0e-4, 530.0)
+    effective_dos_300 = (1.5e19, 1.7e19)
+    temperature_range = (0.0, 2013.0)
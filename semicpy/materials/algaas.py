@@ -7,6 +7,9 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class AlGaAs(Semiconductor):
-    pass
+class AlGaAs(Alloy, Semiconductor):
+    """Al_x Ga_1-x As"""
+    __slots__ = ()
+    composition = "Al_x Ga_1-x As"
@@ -7,6 +7,9 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class AlGaAsSb(Semiconductor):
-    pass
+class AlGaAsSb(Alloy, Semiconductor):
+    """Al_x Ga_1-x As_y Sb_1-y"""
+    __slots__ = ()
+    composition = "Al_x Ga_1-x As_y Sb_1-y"
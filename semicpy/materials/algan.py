@@ -7,6 +7,12 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class AlGaN(Semiconductor):
-    pass
+class AlGaN(Alloy, Semiconductor):
+    """Al_x Ga_1-x N"""
+    __slots__ = ()
+    composition = "Al_x Ga_1-x N"
+    formulas = {'EG(eV)' : '3.39+1.81x+1.0x^2',
+                'Lattice(A)' : '3.189-0.077x',
+                'K' : '8.9-0.4x'}
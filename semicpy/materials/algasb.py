@@ -7,6 +7,12 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class AlGaSb(Semiconductor):
-    pass
+class AlGaSb(Alloy, Semiconductor):
+    """Al_x Ga_1-x Sb"""
+    __slots__ = ()
+    composition = "Al_x Ga_1-x Sb"
+    formulas = {'EG(eV)' : '0.7+0.43x+0.47x^2',
+                'Lattice(A)' : '6.09+0.05x',
+                'K' : '15.7-4.7x'}
@@ -0,0 +1,281 @@
+"""
+Composition-dependent properties of ternary and quaternary alloys.
+
+Composition formulas are written as (piecewise) polynomials in x and y, the way they
+appear in material_properties.csv, e.g.
+
+    1.424+1.247x (x<0.45),1.9+0.125x+0.143x^2 (x>0.45)
+    1.35+0.668x-1.068y+0.758x^2+0.078y^2-0.069xy-0.332x^2y+0.03xy^2
+
+Each formula is parsed once into coefficient matrices and evaluated over whole NumPy
+arrays of compositions with np.polynomial, with np.select picking the branch of each
+point. A parenthesised condition "(x<0.45)" or "(0<x<0.3)" restricts a branch,
+any other parenthesised text "(GaSb)" labels a variant of the formula, and
+comma-separated formulas without condition are alternatives (e.g. static and
+high-frequency dielectric constant).
+"""
+import re
+import functools
+import numpy as np
+import numpy.typing as npt
+from semicpy.materials.database import database
+
+_NUMBER = r'\d*\.?\d+(?:[eE][-+]?\d+)?'
+_TERM = re.compile(rf'([-+]?)({_NUMBER})?((?:[xy](?:\^\d+)?)*)')
+_FACTOR = re.compile(r'([xy])(?:\^(\d+))?')
+_RANGE = re.compile(rf'^({_NUMBER})-({_NUMBER})$')
+_CONDITION = re.compile(rf'^(?:({_NUMBER})<=?)?([xy])(<=?|>=?)({_NUMBER})$')
+_PIECE = re.compile(r'^(.*?)(?:\(([^()]*)\))?$')
+
+def _split_top_level(text: str)-> list:
+    """Splits text on the commas outside parentheses"""
+    pieces, depth, start = [], 0, 0
+    for i, char in enumerate(text):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            pieces.append(text[start:i])
+            start = i + 1
+    pieces.append(text[start:])
+    return pieces
+
+def parse_polynomial(text: str)-> np.ndarray:
+    """Coefficient matrix C of a polynomial in x and y, sum C[i, j] * x^i * y^j
+
+    Parameters
+    ----------
+    text : str
+        polynomial such as '5.431+0.20x+0.027x^2' or '1.35+0.668x-0.069xy'. A bare
+        range such as '4.0-4.05' is read as its midpoint.
+
+    Returns
+    -------
+    np.ndarray
+        coefficient matrix for np.polynomial.polynomial.polyval2d
+
+    Raises
+    ------
+    ValueError
+        if text is not a polynomial in x and y
+    """
+    text = text.replace(' ', '').replace('−', '-')
+    value_range = _RANGE.match(text)
+    if value_range:
+        return np.array([[(float(value_range.group(1)) + float(value_range.group(2))) / 2]])
+
+    terms = []
+    position = 0
+    while position < len(text):
+        term = _TERM.match(text, position)
+        sign, coeff, factors = term.groups()
+        if term.end() == position or (coeff is None and not factors) or (position > 0 and not sign):
+            raise ValueError(f"Cannot parse composition formula '{text}'!")
+        powers = [0, 0]
+        for var, power in _FACTOR.findall(factors):
+            powers[var == 'y'] += int(power) if power else 1
+        value = float(coeff) if coeff is not None else 1.0
+        terms.append((-value if sign == '-' else value, powers[0], powers[1]))
+        position = term.end()
+    if not terms:
+        raise ValueError(f"Cannot parse composition formula '{text}'!")
+
+    coefficients = np.zeros((max(t[1] for t in terms) + 1, max(t[2] for t in terms) + 1))
+    for value, i, j in terms:
+        coefficients[i, j] += value
+    return coefficients
+
+def _parse_condition(text: str)-> tuple:
+    """(variable, low, high) of a condition such as 'x<0.45', 'x>0.45' or '0<x<0.3',
+    or None if text is not a condition"""
+    condition = _CONDITION.match(text.replace(' ', ''))
+    if condition is None:
+        return None
+    lower, var, operator, bound = condition.groups()
+    low = float(lower) if lower is not None else -np.inf
+    if operator.startswith('<'):
+        return var, low, float(bound)
+    return var, float(bound), np.inf
+
+class PiecewisePolynomial:
+    """Polynomial in x and y made of branches restricted to composition intervals
+
+    Parameters
+    ----------
+    branches : list
+        (coefficient matrix, condition) pairs, condition being None or
+        (variable, low, high) with inclusive bounds. The first matching branch wins.
+    """
+    def __init__(self,
+                 branches: list)-> None:
+        self.branches = branches
+
+    def _evaluate(self, coefficients, x, y):
+        if coefficients.shape[1] == 1:
+            return np.polynomial.polynomial.polyval(x, coefficients[:, 0])
+        return np.polynomial.polynomial.polyval2d(x, y, coefficients)
+
+    def __call__(self,
+                 x: npt.ArrayLike,
+                 y: npt.ArrayLike=0.0)-> np.ndarray:
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        if len(self.branches) == 1 and self.branches[0][1] is None:
+            return self._evaluate(self.branches[0][0], x, y)[()]
+
+        conditions, values = [], []
+        for coefficients, condition in self.branches:
+            if condition is None:
+                conditions.append(np.ones(x.shape, dtype=bool))
+            else:
+                var, low, high = condition
+                v = x if var == 'x' else y
+                conditions.append((v >= low) & (v <= high))
+            values.append(self._evaluate(coefficients, x, y))
+        return np.select(conditions, values, default=np.nan)[()]
+
+class AlloyFormula:
+    """Compiled composition formula, e.g. one cell of material_properties.csv
+
+    Parameters
+    ----------
+    text : str
+        formula text
+
+    Attributes
+    ----------
+    variants : dict
+        lists of PiecewisePolynomial alternatives keyed by variant label (None for
+        an unlabelled formula)
+    """
+    def __init__(self,
+                 text: str)-> None:
+        self.text = text
+        self.variants = {}
+        pending, branches = [], []
+
+        def close_branches():
+            if branches:
+                pending.append(PiecewisePolynomial(list(branches)))
+                branches.clear()
+
+        for piece in _split_top_level(text):
+            expression, note = _PIECE.match(piece.strip()).groups()
+            condition = _parse_condition(note) if note else None
+            if condition is None or (branches and branches[-1][1] is None):
+                close_branches()
+            branches.append((parse_polynomial(expression), condition))
+            if note is not None and condition is None:
+                close_branches()
+                self.variants[note.strip()] = pending
+                pending = []
+        close_branches()
+        if pending:
+            self.variants[None] = pending
+
+    def __call__(self,
+                 x: npt.ArrayLike,
+                 y: npt.ArrayLike=0.0,
+                 variant: str=None,
+                 index: int=0)-> np.ndarray:
+        """Evaluates the formula over arrays of composition
+
+        Parameters
+        ----------
+        x : npt.ArrayLike
+            first composition fraction
+        y : npt.ArrayLike, optional
+            second composition fraction (quaternaries), by default 0.0
+        variant : str, optional
+            label of the variant, by default None (the unlabelled or the first one)
+        index : int, optional
+            which comma-separated alternative to use, by default 0
+
+        Returns
+        -------
+        np.ndarray
+            property values, NaN outside the composition range of the formula
+        """
+        if variant is None and None not in self.variants:
+            variant = next(iter(self.variants))
+        return self.variants[variant][index](x, y)
+
+@functools.lru_cache(maxsize=None)
+def compile_formula(text: str)-> AlloyFormula:
+    """Parses a composition formula once and returns its compiled form"""
+    return AlloyFormula(text)
+
+class Alloy:
+    """Mixin giving an alloy class its composition-dependent properties.
+
+    Formulas are taken from the alloy's row of material_properties.csv (named by
+    csv_name, by default the class name) and, where that row is empty, from the
+    class's formulas table keyed by CSV header. The class tables hold Vegard/bowing
+    interpolations between the binaries at 300 K unless the class notes otherwise.
+    """
+    __slots__ = ()
+    csv_name = None
+    composition = "x"
+    formulas = {}
+
+    @classmethod
+    def formula(cls,
+                header: str)-> AlloyFormula:
+        """Compiled composition formula of one CSV column
+
+        Parameters
+        ----------
+        header : str
+            CSV column header, e.g. 'EG(eV)', 'Lattice(A)' or 'K'
+
+        Returns
+        -------
+        AlloyFormula
+            compiled formula
+
+        Raises
+        ------
+        NotImplementedError
+            if no composition formula is known for the alloy and property
+        """
+        name = cls.csv_name or cls.__name__
+        db = database()
+        text = db.raw(name, header) if name in db else ''
+        if not re.search(r'[xy]', text):
+            text = cls.formulas.get(header, '')
+        if not text:
+            raise NotImplementedError(f"No {header} composition formula for {cls.__name__}!")
+        return compile_formula(text)
+
+    @classmethod
+    def bandgap(cls,
+                x: npt.ArrayLike,
+                y: npt.ArrayLike=0.0,
+                **kwargs)-> np.ndarray:
+        """Bandgap over arrays of composition, eV"""
+        return cls.formula('EG(eV)')(x, y, **kwargs)
+
+    @classmethod
+    def lattice_constant(cls,
+                         x: npt.ArrayLike,
+                         y: npt.ArrayLike=0.0,
+                         **kwargs)-> np.ndarray:
+        """Lattice constant over arrays of composition, Angstroms"""
+        return cls.formula('Lattice(A)')(x, y, **kwargs)
+
+    @classmethod
+    def dielectric_constant(cls,
+                            x: npt.ArrayLike,
+                            y: npt.ArrayLike=0.0,
+                            **kwargs)-> np.ndarray:
+        """Static dielectric constant over arrays of composition (index=1 selects
+        the high-frequency value where the formula gives one)"""
+        return cls.formula('K')(x, y, **kwargs)
+
+    @classmethod
+    def electron_affinity(cls,
+                          x: npt.ArrayLike,
+                          y: npt.ArrayLike=0.0,
+                          **kwargs)-> np.ndarray:
+        """Electron affinity over arrays of composition, eV"""
+        return cls.formula('X(eV)')(x, y, **kwargs)
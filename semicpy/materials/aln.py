@@ -7,10 +7,16 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class AlN(Semiconductor):
+class AlN(TemperatureModel, Semiconductor):
     """
     """
+    __slots__ = ()
+    varshni = (6.25, 1.799e-3, 1462.0)
+    effective_dos_300 = (6.3e18, 4.8e20)
+    temperature_range = (0.0, 3023.0)
+
     def lattice_parameter(self,
                           temp: float=None)-> tuple:
         """_summary_
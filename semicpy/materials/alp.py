@@ -7,6 +7,9 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class AlP(Semiconductor):
-    pass
+class AlP(TemperatureModel, Semiconductor):
+    __slots__ = ()
+    varshni = (2.52, 3.18e-4, 588.0)
+    temperature_range = (0.0, 2273.0)
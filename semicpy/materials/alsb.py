@@ -7,6 +7,9 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class AlSb(Semiconductor):
-    pass
+class AlSb(TemperatureModel, Semiconductor):
+    __slots__ = ()
+    varshni = (1.696, 3.9e-4, 140.0)
+    temperature_range = (0.0, 1353.0)
@@ -7,6 +7,9 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class CdMnTe(Semiconductor):
-    pass
+class CdMnTe(Alloy, Semiconductor):
+    """Cd_1-x Mn_x Te"""
+    __slots__ = ()
+    composition = "Cd_1-x Mn_x Te"
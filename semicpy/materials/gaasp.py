@@ -7,6 +7,12 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class GaAsP(Semiconductor):
-    pass
+class GaAsP(Alloy, Semiconductor):
+    """GaAs_1-x P_x"""
+    __slots__ = ()
+    composition = "GaAs_1-x P_x"
+    formulas = {'EG(eV)' : '1.424+1.150x+0.176x^2',
+                'Lattice(A)' : '5.6533-0.1981x',
+                'K' : '13.1-2.0x'}
@@ -6,7 +6,10 @@ Created on Wed Jul  6 18:39:11 2022
 Description:
 """
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
 
-class GaAsSb(Semiconductor):
-    pass
\ No newline at end of file
+class GaAsSb(Alloy, Semiconductor):
+    """GaAs_1-x Sb_x"""
+    __slots__ = ()
+    composition = "GaAs_1-x Sb_x"
@@ -7,6 +7,12 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class GaInAs(Semiconductor):
-    pass
+class GaInAs(Alloy, Semiconductor):
+    """Ga_x In_1-x As"""
+    __slots__ = ()
+    composition = "Ga_x In_1-x As"
+    formulas = {'EG(eV)' : '0.36+0.593x+0.477x^2',
+                'Lattice(A)' : '6.06-0.41x',
+                'K' : '14.6-1.4x'}
@@ -7,6 +7,9 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class GaInAsP(Semiconductor):
-    pass
+class GaInAsP(Alloy, Semiconductor):
+    """Ga_x In_1-x As_y P_1-y"""
+    __slots__ = ()
+    composition = "Ga_x In_1-x As_y P_1-y"
@@ -7,6 +7,9 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class GaInAsSb(Semiconductor):
-    pass
\ No newline at end of file
+class GaInAsSb(Alloy, Semiconductor):
+    """Ga_1-x In_x As_y Sb_1-y, lattice-matched to GaSb or InAs (variant)"""
+    __slots__ = ()
+    composition = "Ga_1-x In_x As_y Sb_1-y, lattice-matched to GaSb or InAs (variant)"
@@ -7,6 +7,12 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class GaInN(Semiconductor):
-    pass
+class GaInN(Alloy, Semiconductor):
+    """Ga_x In_1-x N"""
+    __slots__ = ()
+    composition = "Ga_x In_1-x N"
+    formulas = {'EG(eV)' : '0.7+1.29x+1.4x^2',
+                'Lattice(A)' : '3.533-0.344x',
+                'K' : '15.3-6.4x'}
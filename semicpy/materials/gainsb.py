@@ -7,6 +7,9 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class GaInSb(Semiconductor):
-    pass
\ No newline at end of file
+class GaInSb(Alloy, Semiconductor):
+    """Ga_x In_1-x Sb"""
+    __slots__ = ()
+    composition = "Ga_x In_1-x Sb"
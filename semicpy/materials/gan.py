@@ -7,6 +7,10 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class GaN(Semiconductor):
-    pass
+class GaN(TemperatureModel, Semiconductor):
+    __slots__ = ()
+    varshni = (3.51, 9.09e-4, 830.0)
+    effective_dos_300 = (2.3e18, 4.6e19)
+    temperature_range = (0.0, 2803.0)
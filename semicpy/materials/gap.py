@@ -7,6 +7,10 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class GaP(Semiconductor):
-    pass
+class GaP(TemperatureModel, Semiconductor):
+    __slots__ = ()
+    varshni = (2.35, 5.771e-4, 372.0)
+    effective_dos_300 = (1.8e19, 1.9e19)
+    temperature_range = (0.0, 1740.0)
@@ -7,6 +7,10 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class GaSb(Semiconductor):
-    pass
+class GaSb(TemperatureModel, Semiconductor):
+    __slots__ = ()
+    varshni = (0.812, 4.17e-4, 140.0)
+    effective_dos_300 = (2.1e17, 1.8e19)
+    temperature_range = (0.0, 985.0)
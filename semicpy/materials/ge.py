@@ -7,8 +7,12 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class Ge(Semiconductor):
+class Ge(TemperatureModel, Semiconductor):
     """
     """
-    pass
+    __slots__ = ()
+    varshni = (0.7437, 4.774e-4, 235.0)
+    effective_dos_300 = (1.04e19, 6.0e18)
+    temperature_range = (0.0, 1211.0)
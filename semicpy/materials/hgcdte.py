@@ -7,6 +7,18 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class HgGeTe(Semiconductor):
-    pass
+class HgCdTe(Alloy, Semiconductor):
+    """Hg_1-x Cd_x Te
+
+    Bandgap from the Hansen relation at 300 K.
+    """
+    __slots__ = ()
+    composition = "Hg_1-x Cd_x Te"
+    formulas = {'EG(eV)' : '-0.1415+1.609x-0.81x^2+0.832x^3',
+                'Lattice(A)' : '6.461+0.020x',
+                'K' : '20.5-15.6x+5.7x^2'}
+
+# keeps the original (misspelled) class name importable
+HgGeTe = HgCdTe
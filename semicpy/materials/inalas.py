@@ -7,6 +7,12 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class InAlAs(Semiconductor):
-    pass
+class InAlAs(Alloy, Semiconductor):
+    """In_x Al_1-x As"""
+    __slots__ = ()
+    composition = "In_x Al_1-x As"
+    formulas = {'EG(eV)' : '2.16-2.5x+0.7x^2',
+                'Lattice(A)' : '5.66+0.40x',
+                'K' : '10.9+3.7x'}
@@ -7,6 +7,10 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class InAs(Semiconductor):
-    pass
+class InAs(TemperatureModel, Semiconductor):
+    __slots__ = ()
+    varshni = (0.417, 2.76e-4, 93.0)
+    effective_dos_300 = (8.7e16, 6.6e18)
+    temperature_range = (0.0, 1216.0)
@@ -6,6 +6,9 @@ Created on Wed Jul  6 19:04:51 2022
 Description:
 """
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class InAsSb(Semiconductor):
-    pass
\ No newline at end of file
+class InAsSb(Alloy, Semiconductor):
+    """InAs_1-x Sb_x"""
+    __slots__ = ()
+    composition = "InAs_1-x Sb_x"
@@ -7,6 +7,9 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class InN(Semiconductor):
-    pass
+class InN(TemperatureModel, Semiconductor):
+    __slots__ = ()
+    varshni = (0.78, 2.45e-4, 624.0)
+    temperature_range = (0.0, 1023.0)
@@ -7,6 +7,10 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class InP(Semiconductor):
-    pass
+class InP(TemperatureModel, Semiconductor):
+    __slots__ = ()
+    varshni = (1.4236, 3.63e-4, 162.0)
+    effective_dos_300 = (5.7e17, 1.1e19)
+    temperature_range = (0.0, 1343.0)
@@ -7,6 +7,10 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel
 
-class InSb(Semiconductor):
-    pass
+class InSb(TemperatureModel, Semiconductor):
+    __slots__ = ()
+    varshni = (0.235, 3.2e-4, 170.0)
+    effective_dos_300 = (4.2e16, 7.3e18)
+    temperature_range = (0.0, 798.0)
@@ -8,4 +8,4 @@ Description:
 from semicpy.materials.semiconductor import Semiconductor
 
 class MgO(Semiconductor):
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
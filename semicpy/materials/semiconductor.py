@@ -9,7 +9,9 @@
 # 10/19/2021 - Added more functionality
 ##########################################
 
+import numbers
 import operator
+import numpy as np
 
 CRYSTAL_ORIENTATION = ['Simple Cubic','Face-centered Cubic', #1
                        'Body-centered Cubic', 'Simple Tetragonal', #3
@@ -30,10 +32,75 @@ GROUP = ['I','II','III','IV','V','VI','VII','VIII',
 """
 CREATE YOUR OWN SEMICONDUCTOR
 """
+# attribute -> (constructor keyword, kind, bound), validated once at construction.
+# kind is 'str', 'real' or 'container' (a real or a list/dict/tuple of values),
+# bound is None, 'nonnegative' or 'positive'.
+FIELDS = {'group' : ('group', 'str', None),
+          'crystalStructure' : ('structure', 'str', None),
+          'crystalOrientation' : ('orientation', 'str', None),
+          'abstemp' : ('temp', 'real', 'nonnegative'), #Kelvin
+          'density' : ('density', 'real', 'positive'), #g cm^-3
+          'bandGap' : ('bandGap', 'real', 'nonnegative'), #eV
+          'gapType' : ('gapType', 'str', None), #Direct/Indirect
+          'debyeTemp' : ('debyeTemp', 'real', 'nonnegative'), #Kelvin
+          'intrinsicDebyeLength' : ('debyeLength', 'real', 'nonnegative'), #microns
+          'electronAffinity' : ('affinity', 'real', 'nonnegative'), #eV
+          'dielectricConstant' : ('dielectric', 'container', 'nonnegative'), #Epsilon_R a.k.a K (Kappa)
+          'latticeConstant' : ('lattice', 'container', 'positive'), #Angstroms
+          'intrinsicCarrierConcentration' : ('carrierConcentration', 'real', 'nonnegative'), #cm^-3
+          'conductionDensityOfStates' : ('densityOfStatesC', 'real', 'nonnegative'), #cm^-3
+          'valenceDensityOfStates' : ('densityOfStatesV', 'real', 'nonnegative'), #cm^-3
+          'intrinsicResistivity' : ('resistivity', 'real', 'nonnegative'), #Ohm-cm
+          'opticalPhononEnergy' : ('phononEnergy', 'real', 'nonnegative'), #eV
+          'electronDriftMobility' : ('driftMobE', 'real', 'nonnegative'), #cm^2 V^-1 s^-1
+          'holeDriftMobility' : ('driftMobH', 'real', 'nonnegative'), #cm^2 V^-1 s^-1
+          'approxBreakdownField' : ('breakdownField', 'real', 'nonnegative'), #V cm^-1
+          'thermalConductivity' : ('conductivityTh', 'real', 'nonnegative'), #W cm^-1 degC^-1
+          'thermalDiffusivity' : ('diffusivityTh', 'real', 'nonnegative'), #cm^2 s^-1
+          'linearThermalExpansion' : ('expansionThLin', 'real', 'nonnegative'), #degC^-1
+          'refractionIndex' : ('refraction', 'real', 'nonnegative'),
+          'augerRecombinationCoefficientN' : ('recombinationAugerN', 'real', 'nonnegative'), #cm^6 s^-1
+          'augerRecombinationCoefficientP' : ('recombinationAugerP', 'real', 'nonnegative'), #cm^6 s^-1
+          'compositionX' : ('x', 'real', 'nonnegative'), #mole fraction
+          'compositionY' : ('y', 'real', 'nonnegative')} #mole fraction
+
+def _validate(name: str, value):
+    """Checks one field value against FIELDS and returns it"""
+    _, kind, bound = FIELDS[name]
+    if kind == 'str':
+        if type(value) is not str and not isinstance(value, str):
+            raise TypeError(f"{name} must be str type!")
+        return value
+    if type(value) is not float and type(value) is not int:
+        if kind == 'container' and isinstance(value, (list, dict, tuple)):
+            return value
+        if not isinstance(value, numbers.Real) or isinstance(value, bool):
+            allowed = "int or float, list, dict or tuple" if kind == 'container' else "int or float"
+            raise TypeError(f"{name} must be {allowed}!")
+    if bound == 'positive':
+        if not value > 0:
+            raise ValueError(f"{name} must be non-zero and positive!")
+    elif bound == 'nonnegative' and not value >= 0:
+        raise ValueError(f"{name} must be greater than or equal to 0!")
+    return value
+
+_FIELD_VALUES = operator.attrgetter(*FIELDS)
+
+# one row per material for whole-mesh work; container fields keep their first value
+MATERIAL_DTYPE = np.dtype([(name, 'U32' if kind == 'str' else float)
+                           for name, (_, kind, _) in FIELDS.items()])
+
 class Semiconductor:
     """
     Material Properties and Object Parameters for a Custom Semiconductor
+
+    An immutable record: every field is validated once here, the attributes are
+    __slots__ and cannot be reassigned. Variants (another temperature, another
+    composition) are made with replace(), which only validates the changed fields.
+    Many materials at once are handled as a structured array, see material_array.
     """
+    __slots__ = tuple(FIELDS)
+
     def __init__(self,
                  group: str="IV",
                  structure: str="Diamond",
@@ -60,445 +127,167 @@ class Semiconductor:
                  expansionThLin: float=2.6e-6,
                  refraction: float=3.42,
                  recombinationAugerN: float=1.1e-30,
-                 recombinationAugerP: float=3e-31):
-        """_summary_
+                 recombinationAugerP: float=3e-31,
+                 x: float=0.0,
+                 y: float=0.0):
+        """Validated material record
 
         Parameters
         ----------
         group : str, optional
-            _description_, by default "IV"
+            periodic table group, by default "IV"
         structure : str, optional
-            _description_, by default "Diamond"
+            crystal structure, by default "Diamond"
         orientation : str, optional
-            _description_, by default "FCC"
+            crystal orientation, by default "FCC"
         temp : float or int, optional
-            _description_, by default 300
+            absolute temperature, K, by default 300
         density : float or int, optional
-            _description_, by default 2.33
+            density, g cm^-3, by default 2.33
         bandGap : float or int, optional
-            _description_, by default 1.11
+            bandgap, eV, by default 1.11
         gapType : str, optional
-            _description_, by default 'Indirect'
+            'Direct' or 'Indirect', by default 'Indirect'
         debyeTemp : float or int, optional
-            _description_, by default 640
+            Debye temperature, K, by default 640
         debyeLength : float or int, optional
-            _description_, by default 2.0
+            intrinsic Debye length, microns, by default 2.0
         affinity : float or int, optional
-            _description_, by default 4.05
+            electron affinity, eV, by default 4.05
         dielectric : float or list or dict, optional
-            _description_, by default 11.8
+            relative dielectric constant(s), by default 11.8
         lattice : float or list or dict or tuple, optional
-            _description_, by default 5.43
+            lattice constant(s), Angstroms, by default 5.43
         carrierConcentration : float, optional
-            _description_, by default 1e10
+            intrinsic carrier concentration, cm^-3, by default 1e10
         densityOfStatesC : float, optional
-            _description_, by default 3.2e19
+            conduction band effective density of states, cm^-3, by default 3.2e19
         densityOfStatesV : float, optional
-            _description_, by default 1.8e19
+            valence band effective density of states, cm^-3, by default 1.8e19
         resistivity : float, optional
-            _description_, by default 3.2e5
+            intrinsic resistivity, Ohm-cm, by default 3.2e5
         phononEnergy : float, optional
-            _description_, by default 63e-3
+            optical phonon energy, eV, by default 63e-3
         driftMobE : float, optional
-            _description_, by default 1.4e3
+            electron drift mobility, cm^2 V^-1 s^-1, by default 1.4e3
         driftMobH : float, optional
-            _description_, by default 0.45e3
+            hole drift mobility, cm^2 V^-1 s^-1, by default 0.45e3
         breakdownField : float, optional
-            _description_, by default 3e5
+            approximate breakdown field, V cm^-1, by default 3e5
         conductivityTh : float, optional
-            _description_, by default 1.3
+            thermal conductivity, W cm^-1 degC^-1, by default 1.3
         diffusivityTh : float, optional
-            _description_, by default 0.8
+            thermal diffusivity, cm^2 s^-1, by default 0.8
         expansionThLin : float, optional
-            _description_, by default 2.6e-6
+            linear thermal expansion coefficient, degC^-1, by default 2.6e-6
         refraction : float, optional
-            _description_, by default 3.42
+            refractive index, by default 3.42
         recombinationAugerN : float, optional
-            _description_, by default 1.1e-30
+            Auger recombination coefficient of electrons, cm^6 s^-1, by default 1.1e-30
         recombinationAugerP : float, optional
-            _description_, by default 3e-31
+            Auger recombination coefficient of holes, cm^6 s^-1, by default 3e-31
+        x : float, optional
+            first composition fraction of an alloy, by default 0.0
+        y : float, optional
+            second composition fraction of a quaternary alloy, by default 0.0
+
+        Raises
+        ------
+        TypeError
+            if a field has the wrong type
+        ValueError
+            if a field is out of range
         """
-        
-        self.group = group #Group Number
-        self.crystalStructure = structure #crystal structure
-        self.crystalOrientation = orientation #crystal orientation
-        self.abstemp = temp #Kelvin
-        self.density = density #g cm^-3
-        self.bandGap = bandGap #eV
-        self.gapType = gapType #Direct/Indirect
-        self.debyeTemp = debyeTemp #Kelvin
-        self.intrinsicDebyeLength = debyeLength #microns
-        self.electronAffinity = affinity #eV
-        self.dielectricConstant = dielectric #Epsilon_R a.k.a K (Kappa)
-        self.latticeConstant = lattice #Angstroms
-        self.intrinsicCarrierConcentration = carrierConcentration #cm^-3
-        self.conductionDensityOfStates = densityOfStatesC #cm^-3
-        self.valenceDensityOfStates = densityOfStatesV #cm^-3
-        self.intrinsicResistivity = resistivity #Ohm-cm
-        self.opticalPhononEnergy = phononEnergy #eV
-        self.electronDriftMobility = driftMobE #cm^2 V^-1 s^-1
-        self.holeDriftMobility = driftMobH #cm^2 V^-1 s^-1
-        self.approxBreakdownField = breakdownField #V cm^-1
-        self.thermalConductivity = conductivityTh #W cm^-1 degC^-1
-        self.thermalDiffusivity = diffusivityTh #cm^2 s^-1
-        self.linearThermalExpansion = expansionThLin #degC^-1
-        self.refractionIndex = refraction
-        self.augerRecombinationCoefficientN = recombinationAugerN #cm^6 s^-1
-        self.augerRecombinationCoefficientP = recombinationAugerP #cm^6 s^-1
-
-    group = property(operator.attrgetter('_group'))
-    
-    @property
-    def group(self):
-        return self._group
-
-    @group.setter
-    def group(self,s):
-        if type(s) != str:
-            raise Exception("group must be str type!")
-        self._group = s
-    
-    crystalStructure = property(operator.attrgetter('_crystalStructure'))
-
-    @property
-    def crystalStructure(self):
-        return self._crystalStructure
-
-    @crystalStructure.setter
-    def crystalStructure(self,s):
-        if type(s) != str:
-            raise Exception("crystalStructure must be str type!")
-        self._crystalStructure = s
-    
-    crystalOrientation = property(operator.attrgetter('_crytalOrientation'))
-
-    @property
-    def crystalOrientation(self):
-        return self._crystalOrientation
-    
-    @crystalOrientation.setter
-    def crystalOrientation(self,s):
-        if type(s) != str:
-            raise Exception("crystalOrientation must be str type!")
-        self._crystalOrientation = s
-
-    abstemp = property(operator.attrgetter('_abstemp'))
-
-    @property
-    def abstemp(self):
-        return self._abstemp
-    
-    @abstemp.setter
-    def abstemp(self,temp):
-        if type(temp) != int and type(temp) != float:
-            raise Exception("abstemp must be int or float types!")
-        elif temp < 0:
-            raise Exception("abstemp must be greater than or equal to 0!")
-        self._abstemp = temp
-    
-    density = property(operator.attrgetter('_density'))
-
-    @property
-    def density(self):
-        return self._density
-    
-    @density.setter
-    def density(self,value):
-        if type(value) != int and type(value) != float:
-            raise Exception("density must be int or float types!")
-        elif value <= 0:
-            raise Exception("density must be non-zero and positive!")
-        self._density = value
-    
-    bandGap = property(operator.attrgetter('_bandGap'))
-
-    @property
-    def bandGap(self):
-        return self._bandGap
-    
-    @bandGap.setter
-    def bandGap(self,value):
-        if type(value) != int and type(value) != float:
-            raise Exception("bandGap must be int or float")
-        if value < 0:
-            raise Exception("bandGap must be greater than or equal to 0!")
-        self._bandGap = value
-
-    gapType = property(operator.attrgetter('_gapType'))
-
-    @property
-    def gapType(self):
-        return self._gapType
-    
-    @gapType.setter
-    def gapType(self,s):
-        if type(s) != str:
-            raise Exception("x must be str type")
-        self._gapType = s
-    
-    debyeTemp = property(operator.attrgetter('_debyeTemp'))
-
-    @property
-    def debyeTemp(self):
-        return self._debyeTemp
-    
-    @debyeTemp.setter
-    def debyeTemp(self,value):
-        if type(value) != int and type(value) != float:
-            raise Exception("debyeTemp must be int or float")
-        if value < 0:
-            raise Exception("debyeTemp must be greater than or equal to 0!")
-        self._debyeTemp = value
-    
-    intrinsicDebyeLength = property(operator.attrgetter('_intrinsicDebyeLength'))
-
-    @property
-    def intrinsicDebyeLength(self):
-        return self._intrinsicDebyeLength
-    
-    @intrinsicDebyeLength.setter
-    def intrinsicDebyeLength(self,value):
-        if type(value) != int and type(value) != float:
-            raise Exception("intrinsicDebyeLength must be int or float")
-        if value < 0:
-            raise Exception("intrinsicDebyeLength must be greater than or equal to 0!")
-        self._intrinsicDebyeLength = value
-    
-    electronAffinity = property(operator.attrgetter('_electronAffinity'))
-
-    @property
-    def electronAffinity(self):
-        return self._electronAffinity
-    
-    @electronAffinity.setter
-    def electronAffinity(self,value):
-        if type(value) != int and type(value) != float:
-            raise Exception("electronAffinity must be int or float")
-        if value < 0:
-            raise Exception("electronAffinity must be greater than or equal to 0!")
-        self._electronAffinity = value
-    
-    dielectricConstant = property(operator.attrgetter('_dielectricConstant'))
-
-    @property
-    def dielectricConstant(self):
-        return self._dielectricConstant
-    
-    @dielectricConstant.setter
-    def dielectricConstant(self,value):
-        if type(value) != float and type(value) != list and type(value) != dict:
-            raise Exception("dielectricConstant must be float,list, or dict")
-        if value < 0:
-            raise Exception("dielectricConstant must be greater than or equal to 0!")
-        self._dielectricConstant = value
-    
-    latticeConstant = property(operator.attrgetter('_latticeConstant'))
-
-    @property
-    def latticeConstant(self):
-        return self._latticeConstant
-    
-    @latticeConstant.setter
-    def latticeConstant(self,value):
-        if type(value) != float and type(value) != list and type(value) != dict and type(value) != tuple:
-            raise Exception("latticeConstant must be float,list, dict, or tuple!")
-        if value <= 0:
-            raise Exception("latticeConstant must be greater than 0!")
-        self._latticeConstant = value
-    
-    intrinsicCarrierConcentration = property(operator.attrgetter('_intrinsicCarrierConcentration'))
-
-    @property
-    def intrinsicCarrierConcentration(self):
-        return self._intrinsicCarrierConcentration
-    
-    @intrinsicCarrierConcentration.setter
-    def intrinsicCarrierConcentration(self,value):
-        if type(value) != float:
-            raise Exception("intrinsicCarrierConcentration must be float")
-        if value < 0:
-            raise Exception("intrinsicCarrierConcentration must be greater than or equal to 0!")
-        self._intrinsicCarrierConcentration = value
-    
-    conductionDensityOfStates = property(operator.attrgetter('_conductionDensityOfStates'))
-
-    @property
-    def conductionDensityOfStates(self):
-        return self._conductionDensityOfStates
-    
-    @conductionDensityOfStates.setter
-    def conductionDensityOfStates(self,value):
-        if type(value) != float:
-            raise Exception("conductionDensityOfStates must be float")
-        if value < 0:
-            raise Exception("conductionDensityOfStates must be greater than or equal to 0!")
-        self._conductionDensityOfStates = value
-    
-    valenceDensityOfStates = property(operator.attrgetter('_valenceDensityOfStates'))
-
-    @property
-    def valenceDensityOfStates(self):
-        return self._valenceDensityOfStates
-    
-    @valenceDensityOfStates.setter
-    def valenceDensityOfStates(self,value):
-        if type(value) != float:
-            raise Exception("valenceDensityOfStates must be float")
-        if value < 0:
-            raise Exception("valenceDensityOfStates must be greater than or equal to 0!")
-        self._valenceDensityOfStates = value
-    
-    intrinsicResistivity = property(operator.attrgetter('_intrinsicResistivity'))
-
-    @property
-    def intrinsicResistivity(self):
-        return self._intrinsicResistivity
-    
-    @intrinsicResistivity.setter
-    def intrinsicResistivity(self,value):
-        if type(value) != float:
-            raise Exception("intrinsicResistivity must be float")
-        if value < 0:
-            raise Exception("intrinsicResistivity must be greater than or equal to 0!")
-        self._intrinsicResistivity = value
-    
-    opticalPhononEnergy = property(operator.attrgetter('_opticalPhononEnergy'))
-
-    @property
-    def opticalPhononEnergy(self):
-        return self._opticalPhononEnergy
-    
-    @opticalPhononEnergy.setter
-    def opticalPhononEnergy(self,value):
-        if type(value) != float:
-            raise Exception("opticalPhononEnergy must be float")
-        if value < 0:
-            raise Exception("opticalPhononEnergy must be greater than or equal to 0!")
-        self._opticalPhononEnergy = value
-    
-    electronDriftMobility = property(operator.attrgetter('_electronDriftMobility'))
-
-    @property
-    def electronDriftMobility(self):
-        return self._electronDriftMobility
-    
-    @electronDriftMobility.setter
-    def electronDriftMobility(self,value):
-        if type(value) != float:
-            raise Exception("electronDriftMobility must be float")
-        if value < 0:
-            raise Exception("electronDriftMobility must be greater than or equal to 0!")
-        self._electronDriftMobility = value
-    
-    holeDriftMobility = property(operator.attrgetter('_holeDriftMobility'))
-
-    @property
-    def holeDriftMobility(self):
-        return self._holeDriftMobility
-    
-    @holeDriftMobility.setter
-    def holeDriftMobility(self,value):
-        if type(value) != float:
-            raise Exception("holeDriftMobility must be float")
-        if value < 0:
-            raise Exception("holeDriftMobility must be greater than or equal to 0!")
-        self._holeDriftMobility = value
-    
-    approxBreakdownField = property(operator.attrgetter('_approxBreakdownField'))
-
-    @property
-    def approxBreakdownField(self):
-        return self._approxBreakdownField
-    
-    @approxBreakdownField.setter
-    def approxBreakdownField(self,value):
-        if type(value) != float:
-            raise Exception("approxBreakdownField must be float")
-        if value < 0:
-            raise Exception("approxBreakdownField must be greater than or equal to 0!")
-        self._approxBreakdownField = value
-    
-    thermalConductivity = property(operator.attrgetter('_thermalConductivity'))
-
-    @property
-    def thermalConductivity(self):
-        return self._thermalConductivity
-    
-    @thermalConductivity.setter
-    def thermalConductivity(self,value):
-        if type(value) != float:
-            raise Exception("thermalConductivity must be float")
-        if value < 0:
-            raise Exception("thermalConductivity must be greater than or equal to 0!")
-        self._thermalConductivity = value
-    
-    thermalDiffusivity = property(operator.attrgetter('_thermalDiffusivity'))
-
-    @property
-    def thermalDiffusivity(self):
-        return self._thermalDiffusivity
-    
-    @thermalDiffusivity.setter
-    def thermalDiffusivity(self,value):
-        if type(value) != float:
-            raise Exception("thermalDiffusivity must be float")
-        if value < 0:
-            raise Exception("thermalDiffusivity must be greater than or equal to 0!")
-        self._thermalDiffusivity = value
-
-    linearThermalExpansion = property(operator.attrgetter('_linearThermalExpansion'))
-
-    @property
-    def linearThermalExpansion(self):
-        return self._linearThermalExpansion
-    
-    @linearThermalExpansion.setter
-    def linearThermalExpansion(self,value):
-        if type(value) != float:
-            raise Exception("linearThermalExpansion must be float")
-        if value < 0:
-            raise Exception("linearThermalExpansion must be greater than or equal to 0!")
-        self._linearThermalExpansion = value
-    
-    refractionIndex = property(operator.attrgetter('_refractionIndex'))
-
-    @property
-    def refractionIndex(self):
-        return self._refractionIndex
-    
-    @refractionIndex.setter
-    def refractionIndex(self,value):
-        if type(value) != float:
-            raise Exception("refractionIndex must be float")
-        if value < 0:
-            raise Exception("refractionIndex must be greater than or equal to 0!")
-        self._refractionIndex = value
-    
-    augerRecombinationCoefficientN = property(operator.attrgetter('_augerRecombinationCoefficientN'))
-
-    @property
-    def augerRecombinationCoefficientN(self):
-        return self._augerRecombinationCoefficientN
-    
-    @augerRecombinationCoefficientN.setter
-    def augerRecombinationCoefficientN(self,value):
-        if type(value) != float:
-            raise Exception("augerRecombinationCoefficientN must be float")
-        if value < 0:
-            raise Exception("augerRecombinationCoefficientN must be greater than or equal to 0!")
-        self._augerRecombinationCoefficientN = value
-    
-    augerRecombinationCoefficientP = property(operator.attrgetter('_augerRecombinationCoefficientP'))
-
-    @property
-    def augerRecombinationCoefficientP(self):
-        return self._augerRecombinationCoefficientP
-    
-    @augerRecombinationCoefficientP.setter
-    def augerRecombinationCoefficientP(self,value):
-        if type(value) != float:
-            raise Exception("augerRecombinationCoefficientP must be float")
-        if value < 0:
-            raise Exception("augerRecombinationCoefficientP must be greater than or equal to 0!")
-        self._augerRecombinationCoefficientP = value
+        arguments = locals()
+        for (name, (keyword, _, _)), setter in zip(FIELDS.items(), _SLOT_SETTERS):
+            setter(self, _validate(name, arguments[keyword]))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable, use replace({name}=...) to make a variant!")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable!")
+
+    def replace(self, **changes)-> 'Semiconductor':
+        """Copy of the record with some fields changed, e.g. replace(abstemp=350.0)
 
+        Only the changed fields are validated.
+
+        Parameters
+        ----------
+        **changes
+            new values keyed by attribute name
+
+        Returns
+        -------
+        Semiconductor
+            new record of the same class
+
+        Raises
+        ------
+        AttributeError
+            if a name is not a field of the record
+        """
+        unknown = set(changes) - FIELDS.keys()
+        if unknown:
+            raise AttributeError(f"{sorted(unknown)} are not fields of {type(self).__name__}!")
+        new = object.__new__(type(self))
+        new.__setstate__(_FIELD_VALUES(self))
+        for name, value in changes.items():
+            object.__setattr__(new, name, _validate(name, value))
+        return new
+
+    def to_record(self)-> np.void:
+        """Record of the material as one row of MATERIAL_DTYPE"""
+        return material_array([self])[0]
+
+    @classmethod
+    def from_record(cls, record: np.void)-> 'Semiconductor':
+        """Material from one row of a MATERIAL_DTYPE array (validated)"""
+        return cls(**{keyword : record[name].item() for name, (keyword, _, _) in FIELDS.items()})
+
+    def __getstate__(self):
+        return _FIELD_VALUES(self)
+
+    def __setstate__(self, state):
+        for setter, value in zip(_SLOT_SETTERS, state):
+            setter(self, value)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.__getstate__() == other.__getstate__()
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+# slot descriptors in FIELDS order, bypassing the immutable __setattr__
+_SLOT_SETTERS = [Semiconductor.__dict__[name].__set__ for name in FIELDS]
+
+def _scalar(value):
+    if isinstance(value, dict):
+        value = next(iter(value.values()), np.nan)
+    elif isinstance(value, (list, tuple)):
+        value = value[0] if value else np.nan
+    return value
+
+def material_array(materials: list)-> np.ndarray:
+    """Structured array of many materials, one MATERIAL_DTYPE row each
+
+    Parameters
+    ----------
+    materials : list
+        Semiconductor records
+
+    Returns
+    -------
+    np.ndarray
+        structured array, e.g. material_array(regions)['bandGap'] is the bandgap of
+        every region. Fields holding several values (e.g. a wurtzite lattice tuple)
+        keep their first one.
+    """
+    return np.array([tuple(_scalar(getattr(material, name)) for name in FIELDS) for material in materials],
+                    dtype=MATERIAL_DTYPE)
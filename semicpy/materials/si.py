@@ -5,92 +5,18 @@ Created on Sun Jun  5 23:11:01 2022
 
 Description:
 """
-from semicpy.constants.constants import value
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.temperature import TemperatureModel, check_temperature
 import numpy as np
+import numpy.typing as npt
 
-BOLTZMANN = value("Boltzmann constant in eV/K")
-
-class Si(Semiconductor):
+class Si(TemperatureModel, Semiconductor):
     """
     """
-    def bandgap_temp_dependence(self,
-                                temperature: float=None)-> float:
-        """_summary_
-
-        Parameters
-        ----------
-        temperature : float
-            _description_, by default None
-
-        Returns
-        -------
-        float
-            _description_
-        """
-        eg_0 = 1.17
-        temp = self.abstemp if temperature is None else temperature
-        return eg_0 - ((4.73e-4 * temp ** 2) / (temp + 636))
-
-    def intrinsic_carrier_concentration(self,
-                                        temperature: float=None)-> float:
-        """_summary_
-
-        Parameters
-        ----------
-        temperature : float, optional
-            _description_, by default None
-
-        Returns
-        -------
-        float
-            _description_
-        """
-        temp = self.abstemp if temperature is None else temperature
-        eg = self.bandgap_temp_dependence(temp)
-        two_kb_t = 2 * BOLTZMANN * temp
-        nc = self.cdos(temp)
-        nv = self.vdos(temp)
-
-        return np.sqrt(nc * nv) * np.exp(-eg / two_kb_t)
-
-    def cdos(self,
-             temperature: float=None)-> float:
-        """_summary_
-
-        Parameters
-        ----------
-        temperature : float, optional
-            _description_, by default None
-
-        Returns
-        -------
-        float
-            _description_
-        """
-        temp = self.abstemp if temperature is None else temperature
-        nc = 6.2e15 * temp ** (3/2) if self.conductionDensityOfStates is None else self.conductionDensityOfStates
-
-        return nc
-    
-    def vdos(self,
-             temperature: float=None)-> float:
-        """_summary_
-
-        Parameters
-        ----------
-        temperature : float, optional
-            _description_, by default None
-
-        Returns
-        -------
-        float
-            _description_
-        """
-        temp = self.abstemp if temperature is None else temperature
-        nv = 3.5e15 * temp ** (3/2) if self.valenceDensityOfStates is None else self.valenceDensityOfStates
-
-        return nv
+    __slots__ = ()
+    varshni = (1.17, 4.73e-4, 636.0)
+    effective_dos_300 = (3.22e19, 1.82e19)
+    temperature_range = (0.0, 1687.0)
 
     def bandgap_pressure_dependence(self,
                                     pressure: float=0.0)-> float:
@@ -111,48 +37,42 @@ class Si(Semiconductor):
         return eg_0 - (1.4e-3 * pressure)
     
     def infrared_refractive_index(self,
-                                  temp: float=None)-> float:
+                                  temp: npt.ArrayLike=None)-> np.ndarray:
         """
         Calculates the refractive index based on temperature. This equation only works
-        on temperature ranges between 77K and 400K.
+        on temperature ranges between 77K and 400K, other temperatures give NaN and a
+        TemperatureRangeWarning.
 
         Parameters
         ----------
-        temp : float, optional
+        temp : npt.ArrayLike, optional
             temperature in Kelvin, by default None
 
         Returns
         -------
-        float
+        np.ndarray
             The refractive index
-
-        Raises
-        ------
-        ValueError
-            Temperature is outside of range specified
         """
-        temperature = self.abstemp if temp is None else temp
+        temperature, valid = check_temperature(self.abstemp if temp is None else temp, (77.0, 400.0),
+                                               "Si infrared refractive index")
 
-        if 77 < temperature < 400:
-            return 3.38 * (1 + (3.9e-5 * temperature))
-        else:
-            raise ValueError("Temperature outside of specified range (77 < temperature < 400)!")
+        return np.where(valid, 3.38 * (1 + (3.9e-5 * temperature)), np.nan)[()]
     
     def lattice_parameter(self,
-                          temp: float=None)-> float:
-        """_summary_
+                          temp: npt.ArrayLike=None)-> np.ndarray:
+        """Lattice parameter over an array of temperatures
 
         Parameters
         ----------
-        temp : float, optional
+        temp : npt.ArrayLike, optional
             temperature in degrees C, by default None
 
         Returns
         -------
-        float
-            _description_
+        np.ndarray
+            lattice parameter, Angstroms
         """
-        temperature = (self.abstemp - 273.15) if temp is None else temp
+        temperature = (self.abstemp - 273.15) if temp is None else np.asarray(temp, dtype=float)
         a0 = 5.4304 #Angstroms
         
         return a0 + (1.8138e-5 * temperature) + (1.542e-9 * (temperature ** 2))
\ No newline at end of file
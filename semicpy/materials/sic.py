@@ -10,4 +10,4 @@ from semicpy.materials.semiconductor import Semiconductor
 class SiC(Semiconductor):
     """
     """
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
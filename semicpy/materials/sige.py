@@ -7,6 +7,9 @@ Description:
 """
 
 from semicpy.materials.semiconductor import Semiconductor
+from semicpy.materials.alloys import Alloy
 
-class SiGe(Semiconductor):
-    pass
+class SiGe(Alloy, Semiconductor):
+    """Si_1-x Ge_x"""
+    __slots__ = ()
+    composition = "Si_1-x Ge_x"
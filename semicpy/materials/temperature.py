@@ -0,0 +1,254 @@
+"""
+Temperature dependence of the band parameters of binary semiconductors.
+
+Every model takes arrays of temperature and returns arrays of the same shape, so
+e.g. n_i(T) over a 10^6-point thermal map is a handful of NumPy passes. Points
+outside the validity range of a model are returned as NaN and reported with a
+single TemperatureRangeWarning per call instead of raising, so one bad point does
+not abort the evaluation of a whole grid.
+
+The models are
+
+    E_g(T) = E_g(0) - alpha T^2 / (T + beta)        (Varshni)
+    N_C,V(T) = N_C,V(300 K) (T / 300 K)^3/2
+    n_i(T) = sqrt(N_C N_V) exp(-E_g / 2kT)
+
+with the parameters kept as class attributes of the materials (see
+TemperatureModel). N_C(300 K) and N_V(300 K) are the material's
+densityOfStatesC and densityOfStatesV, which default to the class values.
+"""
+import inspect
+import warnings
+import numpy as np
+import numpy.typing as npt
+from semicpy.constants import codata
+
+BOLTZMANN = codata.BOLTZMANN_CONSTANT_IN_EV_PER_K
+
+class TemperatureRangeWarning(UserWarning):
+    """A temperature model was evaluated outside its validity range"""
+
+def check_temperature(temp: npt.ArrayLike,
+                      temperature_range: tuple,
+                      quantity: str,
+                      stacklevel: int=2)-> tuple:
+    """Validity mask of an array of temperatures
+
+    Parameters
+    ----------
+    temp : npt.ArrayLike
+        temperatures, K
+    temperature_range : tuple
+        inclusive (low, high) validity range, K
+    quantity : str
+        name of the model, used in the warning
+    stacklevel : int, optional
+        stack level of the warning relative to the caller, by default 2
+
+    Returns
+    -------
+    tuple
+        (temperatures as a float array, boolean mask of the valid points)
+    """
+    temp = np.asarray(temp, dtype=float)
+    low, high = temperature_range
+    valid = (temp >= low) & (temp <= high)
+    if not valid.all():
+        invalid = valid.size - np.count_nonzero(valid)
+        warnings.warn(f"{quantity}: {invalid} of {valid.size} temperatures outside the "
+                      f"validity range {low} K to {high} K, returned as NaN",
+                      TemperatureRangeWarning, stacklevel=stacklevel + 1)
+    return temp, valid
+
+def varshni_bandgap(temp: npt.ArrayLike,
+                    eg_0: float,
+                    alpha: float,
+                    beta: float)-> np.ndarray:
+    """Varshni bandgap E_g(0) - alpha T^2 / (T + beta)
+
+    Parameters
+    ----------
+    temp : npt.ArrayLike
+        temperature, K
+    eg_0 : float
+        bandgap at 0 K, eV
+    alpha : float
+        Varshni alpha, eV/K
+    beta : float
+        Varshni beta, K
+
+    Returns
+    -------
+    np.ndarray
+        bandgap, eV
+    """
+    temp = np.asarray(temp, dtype=float)
+    return eg_0 - ((alpha * temp * temp) / (temp + beta))
+
+def effective_dos(temp: npt.ArrayLike,
+                  dos_300: float)-> np.ndarray:
+    """Effective density of states scaled from its 300 K value as T^3/2
+
+    Parameters
+    ----------
+    temp : npt.ArrayLike
+        temperature, K
+    dos_300 : float
+        effective density of states at 300 K, cm^-3
+
+    Returns
+    -------
+    np.ndarray
+        effective density of states, cm^-3
+    """
+    reduced = np.asarray(temp, dtype=float) / 300.0
+    return dos_300 * reduced * np.sqrt(reduced)
+
+def intrinsic_concentration(temp: npt.ArrayLike,
+                            bandgap: npt.ArrayLike,
+                            n_c: npt.ArrayLike,
+                            n_v: npt.ArrayLike)-> np.ndarray:
+    """Intrinsic carrier concentration sqrt(N_C N_V) exp(-E_g / 2kT)
+
+    Parameters
+    ----------
+    temp : npt.ArrayLike
+        temperature, K
+    bandgap : npt.ArrayLike
+        bandgap, eV
+    n_c : npt.ArrayLike
+        conduction band effective density of states, cm^-3
+    n_v : npt.ArrayLike
+        valence band effective density of states, cm^-3
+
+    Returns
+    -------
+    np.ndarray
+        intrinsic carrier concentration, cm^-3 (0 at T = 0)
+    """
+    with np.errstate(divide='ignore'):
+        return np.sqrt(n_c * n_v) * np.exp(-bandgap / ((2 * BOLTZMANN) * np.asarray(temp, dtype=float)))
+
+class TemperatureModel:
+    """Mixin giving a binary semiconductor its array temperature dependence.
+
+    Subclasses set
+
+    varshni : tuple
+        (E_g(0) eV, alpha eV/K, beta K)
+    effective_dos_300 : tuple
+        default (N_C, N_V) at 300 K, cm^-3. densityOfStatesC and densityOfStatesV
+        passed to the constructor take their place.
+    temperature_range : tuple
+        inclusive validity range of the models, K
+
+    Every method takes a temperature array (by default the material's abstemp) and
+    returns NaN, with a TemperatureRangeWarning, outside temperature_range.
+    """
+    __slots__ = ()
+    varshni = None
+    effective_dos_300 = None
+    temperature_range = (0.0, np.inf)
+
+    def __init__(self, *args, **kwargs):
+        if self.effective_dos_300 is not None:
+            given = list(inspect.signature(super().__init__).parameters)[:len(args)] if args else ()
+            for name, value in zip(('densityOfStatesC', 'densityOfStatesV'), self.effective_dos_300):
+                if name not in given:
+                    kwargs.setdefault(name, value)
+        super().__init__(*args, **kwargs)
+
+    def _effective_dos_300(self)-> tuple:
+        """(N_C, N_V) at 300 K of this material, cm^-3"""
+        self._model('effective_dos_300')
+        return self.conductionDensityOfStates, self.valenceDensityOfStates
+
+    def _model(self,
+               name: str)-> tuple:
+        parameters = getattr(type(self), name)
+        if parameters is None:
+            raise NotImplementedError(f"No {name} temperature model for {type(self).__name__}!")
+        return parameters
+
+    def _temperature(self,
+                     temperature: npt.ArrayLike,
+                     quantity: str)-> tuple:
+        temp = self.abstemp if temperature is None else temperature
+        return check_temperature(temp, self.temperature_range, f"{type(self).__name__} {quantity}", stacklevel=3)
+
+    def bandgap_temp_dependence(self,
+                                temperature: npt.ArrayLike=None)-> np.ndarray:
+        """Varshni bandgap over an array of temperatures
+
+        Parameters
+        ----------
+        temperature : npt.ArrayLike, optional
+            temperature, K, by default None (abstemp)
+
+        Returns
+        -------
+        np.ndarray
+            bandgap, eV
+        """
+        eg_0, alpha, beta = self._model('varshni')
+        temp, valid = self._temperature(temperature, 'bandgap')
+        return np.where(valid, varshni_bandgap(temp, eg_0, alpha, beta), np.nan)[()]
+
+    def cdos(self,
+             temperature: npt.ArrayLike=None)-> np.ndarray:
+        """Conduction band effective density of states over an array of temperatures
+
+        Parameters
+        ----------
+        temperature : npt.ArrayLike, optional
+            temperature, K, by default None (abstemp)
+
+        Returns
+        -------
+        np.ndarray
+            N_C, cm^-3
+        """
+        n_c, _ = self._effective_dos_300()
+        temp, valid = self._temperature(temperature, 'conduction band DOS')
+        return np.where(valid, effective_dos(temp, n_c), np.nan)[()]
+
+    def vdos(self,
+             temperature: npt.ArrayLike=None)-> np.ndarray:
+        """Valence band effective density of states over an array of temperatures
+
+        Parameters
+        ----------
+        temperature : npt.ArrayLike, optional
+            temperature, K, by default None (abstemp)
+
+        Returns
+        -------
+        np.ndarray
+            N_V, cm^-3
+        """
+        _, n_v = self._effective_dos_300()
+        temp, valid = self._temperature(temperature, 'valence band DOS')
+        return np.where(valid, effective_dos(temp, n_v), np.nan)[()]
+
+    def intrinsic_carrier_concentration(self,
+                                        temperature: npt.ArrayLike=None)-> np.ndarray:
+        """Intrinsic carrier concentration over an array of temperatures
+
+        Parameters
+        ----------
+        temperature : npt.ArrayLike, optional
+            temperature, K, by default None (abstemp)
+
+        Returns
+        -------
+        np.ndarray
+            n_i, cm^-3
+        """
+        eg_0, alpha, beta = self._model('varshni')
+        n_c, n_v = self._effective_dos_300()
+        temp, valid = self._temperature(temperature, 'intrinsic carrier concentration')
+        # sqrt(N_C N_V) scales as T^3/2 as well, so only one power of T is taken
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            n_i = effective_dos(temp, np.sqrt(n_c * n_v)) * np.exp(-varshni_bandgap(temp, eg_0, alpha, beta)
+                                                                   / ((2 * BOLTZMANN) * temp))
+        return np.where(valid, n_i, np.nan)[()]
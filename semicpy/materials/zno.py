@@ -9,4 +9,4 @@ Description:
 from semicpy.materials.semiconductor import Semiconductor
 
 class ZnO(Semiconductor):
-    pass
+    __slots__ = ()
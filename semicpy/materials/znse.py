@@ -9,4 +9,4 @@ Description:
 from semicpy.materials.semiconductor import Semiconductor
 
 class ZnSe(Semiconductor):
-    pass
+    __slots__ = ()
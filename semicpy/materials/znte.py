@@ -9,4 +9,4 @@ Description: Zinc Telluride
 from semicpy.materials.semiconductor import Semiconductor
 
 class ZnTe(Semiconductor):
-    pass
+    __slots__ = ()
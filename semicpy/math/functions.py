@@ -1,9 +1,55 @@
 '''
 module docstring for special functions
+
+The Fermi-Dirac integrals are normalized as
+
+    F_j(eta) = 1 / Gamma(j + 1) * integral_0^inf t^j / (1 + exp(t - eta)) dt
+
+extended to -2 < j <= -1 by dF_j/deta = F_(j-1). fermi_dirac_integral evaluates
+them over whole arrays of eta for any real order j > -2: a truncated series for
+eta < -2, piecewise Chebyshev tables on [-2, 42] and the Sommerfeld expansion
+above. The tables are built once per order from a fixed-node Gauss quadrature
+and cached. Checked against that
+quadrature, the series, fermi_dirac_int (adaptive scipy quadrature, kept as the
+slow reference) and the closed form of F_1, the relative error is below 5e-15 for
+-3/2 <= j <= 11/2. It grows to 5e-14 as j approaches -2, and above 11/2 the truncated
+Sommerfeld expansion limits it.
+
+generalized_fermi_dirac_integral adds the Kane non-parabolicity beta = alpha kT,
+
+    F_j(eta, beta) = 1 / Gamma(j + 1) * integral_0^inf [x (1 + beta x)]^j (1 + 2 beta x)
+                     / (1 + exp(x - eta)) dx,
+
+as one product of the Fermi function at fixed quadrature nodes with weights cached
+per (order, beta).
+
+inverse_fermi_dirac_integral inverts F_j (j > -1) over arrays: an interpolated
+table of eta against ln F_j gives a starting point within ~1e-5, and Newton steps
+on ln F_j(eta) = ln(value), with the derivative F_(j-1), refine it.
 '''
+import math
+import functools
 import numpy as np
-from scipy.integrate import quad
-from scipy.special import gamma
+import numpy.typing as npt
+
+# Fermi-Dirac integral engine: series below, Sommerfeld expansion above the tables
+_FD_SERIES_MAX = -2.0
+_FD_TABLE_MAX = 42.0
+_FD_TABLE_WIDTH = 1.0
+_FD_TABLE_DEGREE = 16
+_FD_PANEL_WIDTH = 4.0
+_FD_PANELS = 21
+_FD_SERIES_TERMS = 20
+# starting-point table of the inverse
+_FD_INVERSE_GRID = (-30.0, 120.0, 15001)
+# 2 * (1 - 2^(1-2k)) * zeta(2k), k = 1..10
+_FD_SOMMERFELD = tuple(2 * (1 - 2.0 ** (1 - (2 * k))) * zeta for k, zeta in
+                       enumerate((np.pi ** 2 / 6, np.pi ** 4 / 90, np.pi ** 6 / 945,
+                                  np.pi ** 8 / 9450, np.pi ** 10 / 93555,
+                                  691 * np.pi ** 12 / 638512875, 2 * np.pi ** 14 / 18243225,
+                                  3617 * np.pi ** 16 / 325641566250,
+                                  43867 * np.pi ** 18 / 38979295480125,
+                                  174611 * np.pi ** 20 / 1531329465290625), start=1))
 
 def fdint_approx(eta=0)-> float:
     """Function to find the approximate Fermi-Dirac Integral of
@@ -26,7 +72,9 @@ def fdint_approx(eta=0)-> float:
 def fermi_dirac_int(order=0.5,
                     eta=0.0)-> float:
     """
-    Fermi-Dirac integral
+    Fermi-Dirac integral by adaptive quadrature of one scalar eta.
+
+    Slow reference for fermi_dirac_integral, which should be used for arrays.
 
     Parameters
     ----------
@@ -40,6 +88,9 @@ def fermi_dirac_int(order=0.5,
     Fermi-Dirac integral result
 
     """
+    from scipy.integrate import quad
+    from scipy.special import gamma
+
     reciprocal_gamma = 1 / gamma(order + 1)
     intgrl = quad(lambda t: ((t ** order) / (1 + np.exp(t - eta))),a=0,b=np.inf,epsabs=1e-300,epsrel=1e-8,limit=100)
     return reciprocal_gamma * intgrl[0]
@@ -47,6 +98,8 @@ def fermi_dirac_int(order=0.5,
 def ifdint_approx(eta=0)-> float:
     """The Inverse Fermi-Dirac Integral of Order 1/2 approximation.
 
+    Only accurate over a narrow range, see inverse_fermi_dirac_integral.
+
     Parameters
     ----------
     eta : int, optional
@@ -59,3 +112,270 @@ def ifdint_approx(eta=0)-> float:
     """
     ifd = np.log(eta) + ((3.53553e-1) * eta) - (4.95009e-3 * (eta ** 2)) + (1.48386e-4 * (eta ** 3)) - (4.42563e-6 * (eta ** 4))
     return ifd
+
+def _gauss_jacobi(n: int, beta: float)-> tuple:
+    """Gauss-Jacobi nodes and weights on [-1, 1] for the weight (1 + x)^beta (Golub-Welsch)"""
+    k = np.arange(1, n, dtype=float)
+    s = (2 * k) + beta
+    diagonal = np.empty(n)
+    diagonal[0] = beta / (beta + 2)
+    diagonal[1:] = (beta ** 2) / (s * (s + 2))
+    off_diagonal = np.sqrt(4 * (k ** 2) * ((k + beta) ** 2) / ((s ** 2) * (s + 1) * (s - 1)))
+    x, vectors = np.linalg.eigh(np.diag(diagonal) + np.diag(off_diagonal, 1) + np.diag(off_diagonal, -1))
+    return x, (vectors[0] ** 2) * (2 ** (beta + 1)) / (beta + 1)
+
+@functools.lru_cache(maxsize=None)
+def _fd_quadrature_nodes(order: float, panels: int=_FD_PANELS, n: int=20)-> tuple:
+    """Nodes t and weights w with sum(w * g(t)) = integral_0^(4 panels) t^order g(t) dt / Gamma(order + 1)
+    for smooth g: Gauss-Jacobi on the first panel (absorbing t^order), Gauss-Legendre on the
+    others. Panels are 4 wide, so the Fermi function of any eta up to 40 below the end of the
+    last panel is resolved to machine precision with n >= 16 nodes per panel."""
+    edges = np.arange(panels) * _FD_PANEL_WIDTH
+    x, w = _gauss_jacobi(n, order)
+    nodes = [edges[0] + (_FD_PANEL_WIDTH * (x + 1) / 2)]
+    weights = [w * ((_FD_PANEL_WIDTH / 2) ** (order + 1))]
+    x, w = np.polynomial.legendre.leggauss(n)
+    for start in edges[1:]:
+        t = start + (_FD_PANEL_WIDTH * (x + 1) / 2)
+        nodes.append(t)
+        weights.append(w * (_FD_PANEL_WIDTH / 2) * (t ** order))
+    return np.concatenate(nodes), np.concatenate(weights) / math.gamma(order + 1)
+
+def _fd_quadrature(order: float, eta: np.ndarray)-> np.ndarray:
+    if order < -1:
+        # F_j = dF_(j+1)/deta, the eta-derivative of the Fermi function being f (1 - f)
+        t, w = _fd_quadrature_nodes(order + 1)
+        with np.errstate(over='ignore'):
+            fermi = 1 / (1 + np.exp(t - eta[..., None]))
+        return (fermi * (1 - fermi)) @ w
+    t, w = _fd_quadrature_nodes(order)
+    with np.errstate(over='ignore'):
+        return (1 / (1 + np.exp(t - eta[..., None]))) @ w
+
+@functools.lru_cache(maxsize=None)
+def _fd_table(order: float)-> np.ndarray:
+    """Chebyshev coefficients of F_order / F_0 on the unit intervals of [-2, 42], one row each"""
+    n = _FD_TABLE_DEGREE + 1
+    starts = np.arange(_FD_SERIES_MAX, _FD_TABLE_MAX, _FD_TABLE_WIDTH)
+    theta = np.pi * (np.arange(n) + 0.5) / n
+    eta = starts[:, None] + (_FD_TABLE_WIDTH * (np.cos(theta) + 1) / 2)
+    # interpolation at the Chebyshev nodes: discrete cosine transform of the values
+    # tabulated relative to F_0 = ln(1 + e^eta), so the tables keep relative precision
+    values = _fd_quadrature(order, eta) / np.logaddexp(0.0, eta)
+    coefficients = values @ np.cos(np.outer(theta, np.arange(n))) * (2 / n)
+    coefficients[:, 0] /= 2
+    return coefficients
+
+def _fd_series(order: float, eta: np.ndarray)-> np.ndarray:
+    z = np.exp(eta)
+    power = z.copy()
+    total = z.copy()
+    for k in range(2, _FD_SERIES_TERMS + 1):
+        power *= z
+        total += (power if k % 2 else -power) / (k ** (order + 1))
+    return total
+
+def _fd_sommerfeld(order: float, eta: np.ndarray)-> np.ndarray:
+    coefficients = [1.0]
+    falling = 1.0
+    for k, coeff in enumerate(_FD_SOMMERFELD, start=1):
+        falling *= (order + 3 - (2 * k)) * (order + 2 - (2 * k))
+        coefficients.append(coeff * falling)
+    total = np.polynomial.polynomial.polyval(1 / (eta ** 2), coefficients)
+    # reflection term cos(pi j) F_j(-eta), below 1e-18 of the result past the tables
+    reflection = np.cos(np.pi * order) * np.exp(-eta)
+    return ((eta ** (order + 1)) / math.gamma(order + 2) * total) + reflection
+
+def _chebyshev_rows(table: np.ndarray, index: np.ndarray, x: np.ndarray)-> np.ndarray:
+    """Clenshaw evaluation at every x of the Chebyshev series in row index of table"""
+    columns = np.ascontiguousarray(table.T)
+    two_x = 2 * x
+    b1 = np.zeros_like(x)
+    b2 = np.zeros_like(x)
+    for c in columns[:0:-1]:
+        b = two_x * b1
+        b -= b2
+        b += c.take(index)
+        b1, b2 = b, b1
+    b1 *= x
+    b1 -= b2
+    b1 += columns[0].take(index)
+    return b1
+
+def fermi_dirac_integral(order: float=0.5,
+                         eta: npt.ArrayLike=0.0,
+                         out: np.ndarray=None)-> np.ndarray:
+    """Fermi-Dirac integral F_order(eta) over arrays of eta
+
+    Parameters
+    ----------
+    order : float, optional
+        order j of the integral, any real j > -2, by default 0.5. Orders below -1
+        are defined by dF_j/deta = F_(j-1).
+    eta : npt.ArrayLike, optional
+        reduced Fermi energy (E_F - E_C) / kT, by default 0.0
+    out : np.ndarray, optional
+        float buffer of the shape of eta receiving the result, may be eta itself,
+        by default None (allocated). The piecewise evaluation still uses temporaries
+        the size of each piece.
+
+    Returns
+    -------
+    np.ndarray
+        F_order(eta), relative error below 5e-15 for -3/2 <= j <= 11/2 (out if given)
+
+    Raises
+    ------
+    ValueError
+        if order <= -2
+    """
+    eta = np.asarray(eta, dtype=float)
+    if order <= -2:
+        raise ValueError("The Fermi-Dirac integral is only defined here for orders > -2!")
+    result = np.empty(eta.shape) if out is None else out
+    if order == -1:
+        np.clip(eta, -700, None, out=result)
+        np.negative(result, out=result)
+        np.exp(result, out=result)
+        result += 1
+        np.reciprocal(result, out=result)
+        return result[()] if out is None else result
+    if order == 0:
+        np.logaddexp(0.0, eta, out=result)
+        return result[()] if out is None else result
+
+    order = float(order)
+    # the pieces are disjoint, so result may share its memory with eta
+    low = eta < _FD_SERIES_MAX
+    high = eta >= _FD_TABLE_MAX
+    middle = (eta >= _FD_SERIES_MAX) & (eta < _FD_TABLE_MAX)
+    result[~(low | high | middle)] = np.nan
+    if np.any(low):
+        result[low] = _fd_series(order, eta[low])
+    if np.any(high):
+        result[high] = _fd_sommerfeld(order, eta[high])
+    if np.any(middle):
+        eta_middle = eta[middle]
+        position = (eta_middle - _FD_SERIES_MAX) / _FD_TABLE_WIDTH
+        table = _fd_table(order)
+        index = np.minimum(position.astype(int), len(table) - 1)
+        ratio = _chebyshev_rows(table, index, (2 * (position - index)) - 1)
+        result[middle] = ratio * np.logaddexp(0.0, eta_middle)
+    return result[()] if out is None else result
+
+@functools.lru_cache(maxsize=None)
+def _fd_inverse_table(order: float)-> tuple:
+    """ln F_order and eta on an even eta grid, for interpolating the inverse"""
+    eta = np.linspace(*_FD_INVERSE_GRID)
+    return np.log(fermi_dirac_integral(order, eta)), eta
+
+def inverse_fermi_dirac_integral(order: float=0.5,
+                                 value: npt.ArrayLike=1.0,
+                                 newton_steps: int=2)-> np.ndarray:
+    """Reduced Fermi energy eta with F_order(eta) = value, over arrays of value
+
+    Parameters
+    ----------
+    order : float, optional
+        order j > -1 of the Fermi-Dirac integral, by default 0.5 (e.g. value = n / N_C)
+    value : npt.ArrayLike, optional
+        values of F_order, > 0, by default 1.0
+    newton_steps : int, optional
+        Newton refinements of the interpolated starting point, by default 2
+        (relative error of F_order(eta) below 1e-14 for -50 <= eta <= 100)
+
+    Returns
+    -------
+    np.ndarray
+        eta, NaN where value <= 0
+
+    Raises
+    ------
+    ValueError
+        if order <= -1 (F_order is then not invertible over all eta)
+    """
+    if order <= -1:
+        raise ValueError("Only Fermi-Dirac integrals of order > -1 can be inverted!")
+    order = float(order)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_value = np.log(np.asarray(value, dtype=float))
+        log_table, eta_table = _fd_inverse_table(order)
+        eta = np.interp(log_value, log_table, eta_table)
+        # outside the table: nondegenerate limit F = e^eta, degenerate limit F = eta^(j+1) / Gamma(j+2)
+        eta = np.where(log_value < log_table[0], log_value, eta)
+        degenerate = (math.lgamma(order + 2) + log_value) / (order + 1)
+        eta = np.where(log_value > log_table[-1], np.exp(degenerate), eta)
+        for _ in range(newton_steps):
+            value_eta = fermi_dirac_integral(order, eta)
+            eta = eta - ((np.log(value_eta) - log_value) * value_eta / fermi_dirac_integral(order - 1, eta))
+    return eta[()]
+
+# largest eta spread of a chunk evaluated with one shared exponent shift
+_FD_SHIFT_SPAN = 600.0
+
+@functools.lru_cache(maxsize=64)
+def _generalized_fd_nodes(order: float, beta: float, panels: int)-> tuple:
+    """Quadrature nodes of F_order(eta, beta), the non-parabolic factor folded into the weights"""
+    t, w = _fd_quadrature_nodes(order, panels, 16)
+    return t, w * ((1 + (beta * t)) ** order) * (1 + (2 * beta * t))
+
+def generalized_fermi_dirac_integral(order: float=0.5,
+                                     eta: npt.ArrayLike=0.0,
+                                     beta: float=0.0,
+                                     chunk_size: int=1024)-> np.ndarray:
+    """Generalized Fermi-Dirac integral of a non-parabolic (Kane) band over arrays of eta
+
+    The carrier density of a band with E(1 + alpha E) = hbar^2 k^2 / 2m is
+    N_C * F_1/2(eta, alpha kT), which reduces to N_C * F_1/2(eta) for alpha = 0.
+
+    Parameters
+    ----------
+    order : float, optional
+        order j > -1, by default 0.5
+    eta : npt.ArrayLike, optional
+        reduced Fermi energy (E_F - E_C) / kT, by default 0.0
+    beta : float, optional
+        non-parabolicity alpha * kT (alpha in 1/eV, kT in eV), >= 0, by default 0.0
+    chunk_size : int, optional
+        eta values per matrix product, bounding the memory used, by default 1024
+
+    Returns
+    -------
+    np.ndarray
+        F_order(eta, beta), relative error below 1e-14 for eta > -700 (zero below)
+        and finite for any finite eta
+
+    Raises
+    ------
+    ValueError
+        if order <= -1 or beta < 0
+    """
+    if order <= -1 or beta < 0:
+        raise ValueError("The generalized Fermi-Dirac integral needs order > -1 and beta >= 0!")
+    if beta == 0:
+        return fermi_dirac_integral(order, eta)
+
+    eta = np.asarray(eta, dtype=float)
+    flat = eta.ravel()
+    finite = flat[np.isfinite(flat)]
+    # enough 4-wide panels to reach 40 past the largest eta, in steps of 8 to share the cache
+    needed = math.ceil((max(finite.max(initial=0.0), 0.0) + 40.0) / _FD_PANEL_WIDTH) + 1
+    t, w = _generalized_fd_nodes(float(order), float(beta), 8 * math.ceil(needed / 8))
+
+    # 1 / (1 + e^(t - r) e^(r - eta)) with r the largest eta of the chunk: no exponential
+    # per node and eta, and no overflow while the chunk spans less than _FD_SHIFT_SPAN
+    # (wider or non-finite chunks use the logistic function directly)
+    result = np.empty(flat.shape)
+    with np.errstate(over='ignore', invalid='ignore'):
+        for start in range(0, len(flat), chunk_size):
+            block = flat[start:start + chunk_size]
+            reference = block.max()
+            if reference - block.min() <= _FD_SHIFT_SPAN:
+                fermi = np.multiply.outer(np.exp(reference - block), np.exp(t - reference))
+                fermi += 1
+                np.reciprocal(fermi, out=fermi)
+            else:
+                from scipy.special import expit
+                fermi = expit(np.subtract.outer(block, t))
+            result[start:start + chunk_size] = fermi @ w
+    return result.reshape(eta.shape)[()]
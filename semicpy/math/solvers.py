@@ -0,0 +1,512 @@
+"""Nonlinear solvers module
+
+Batched damped Newton-Raphson iteration for the small nonlinear systems that
+appear in device operating-point problems (one to a few unknown junction voltages
+per bias point), solved for whole arrays of bias points at once, and adaptive bias
+continuation with a cache of converged solutions for sweeps of the larger, mesh-based
+solvers.
+"""
+import weakref
+from dataclasses import dataclass, replace
+import numpy as np
+import numpy.typing as npt
+
+@dataclass
+class NewtonResult:
+    """Result of a batched Newton solve.
+
+    Attributes
+    ----------
+    x : np.ndarray
+        solution, shape (..., n)
+    residual : np.ndarray
+        residual at the solution, shape (..., n)
+    converged : np.ndarray
+        per-point convergence flag, shape (...)
+    iterations : np.ndarray
+        Newton iterations taken by each point, shape (...)
+    """
+    x: np.ndarray
+    residual: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+
+def pn_junction_limit(v_new: np.ndarray,
+                      v_old: np.ndarray,
+                      n_vt: float or np.ndarray,
+                      v_crit: float or np.ndarray)-> np.ndarray:
+    """SPICE pn-junction voltage limiting (pnjlim), vectorized.
+
+    Forward-bias updates above the critical voltage are replaced by a logarithmic step
+    so the junction current grows at most by about the Newton-predicted current, which
+    keeps exp() from overflowing on the first iterations of a strongly driven junction.
+
+    Parameters
+    ----------
+    v_new : np.ndarray
+        junction voltage proposed by the Newton step, V
+    v_old : np.ndarray
+        junction voltage at the previous iterate, V
+    n_vt : float or np.ndarray
+        emission coefficient times thermal voltage, V
+    v_crit : float or np.ndarray
+        critical voltage n*Vt*ln(n*Vt / (sqrt(2)*Is)), V
+
+    Returns
+    -------
+    np.ndarray
+        limited junction voltage, V
+    """
+    v_new = np.asarray(v_new, dtype=float)
+    v_old = np.asarray(v_old, dtype=float)
+    limit = (v_new > v_crit) & (np.abs(v_new - v_old) > (2 * n_vt))
+    arg = 1 + ((v_new - v_old) / n_vt)
+    from_forward = np.where(arg > 0, v_old + (n_vt * np.log(np.maximum(arg, 1e-300))), v_crit)
+    from_reverse = n_vt * np.log(np.maximum(v_new / n_vt, 1e-300))
+    limited = np.where(v_old > 0, from_forward, from_reverse)
+    return np.where(limit, limited, v_new)
+
+def critical_voltage(n_vt: float or np.ndarray,
+                     i_s: float or np.ndarray)-> float or np.ndarray:
+    """Critical junction voltage used by pn_junction_limit
+
+    Parameters
+    ----------
+    n_vt : float or np.ndarray
+        emission coefficient times thermal voltage, V
+    i_s : float or np.ndarray
+        saturation current, A
+
+    Returns
+    -------
+    float or np.ndarray
+        n*Vt*ln(n*Vt / (sqrt(2)*Is)), V
+    """
+    return n_vt * np.log(n_vt / (np.sqrt(2) * i_s))
+
+def _solve_linear(jacobian: np.ndarray,
+                  residual: np.ndarray)-> np.ndarray:
+    """Newton step -J^-1 F for a stack of small systems, falling back to the
+    pseudo-inverse when any Jacobian in the stack is singular."""
+    try:
+        return -np.linalg.solve(jacobian, residual[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        return -np.einsum('...ij,...j->...i', np.linalg.pinv(jacobian), residual)
+
+def damped_newton(system,
+                  x0: np.ndarray,
+                  limit=None,
+                  max_step: float=None,
+                  ftol: float=1.0e-9,
+                  xtol: float=1.0e-12,
+                  max_iter: int=100,
+                  max_halvings: int=10)-> NewtonResult:
+    """Damped Newton-Raphson solve of a stack of independent n-by-n systems F(x) = 0.
+
+    Every point of the stack is iterated in the same vectorized pass. Each Newton step
+    is first passed through the optional limiting function, then clipped to max_step,
+    and finally halved (per point) until the residual norm decreases. Points that have
+    converged are frozen while the others keep iterating. A point whose Newton step is
+    not finite or zero (e.g. a singular Jacobian) while its residual is above ftol
+    cannot move and is frozen as not converged; the step tolerance xtol only applies
+    to finite steps that were taken.
+
+    Parameters
+    ----------
+    system : callable
+        system(x) -> (F, J) with x and F of shape (..., n) and the analytic Jacobian
+        J of shape (..., n, n). It is always called with the full stack.
+    x0 : np.ndarray
+        initial guess, shape (..., n)
+    limit : callable, optional
+        limit(x_new, x_old) -> x_limited applied to each proposed iterate, e.g. built
+        on pn_junction_limit, by default None
+    max_step : float, optional
+        largest allowed change of any unknown per iteration, by default None (unclipped)
+    ftol : float, optional
+        absolute residual tolerance, by default 1.0e-9
+    xtol : float, optional
+        relative step tolerance, by default 1.0e-12
+    max_iter : int, optional
+        maximum number of Newton iterations, by default 100
+    max_halvings : int, optional
+        maximum number of step halvings per iteration, by default 10
+
+    Returns
+    -------
+    NewtonResult
+        solution, residual, per-point convergence flags and iteration counts
+    """
+    x = np.array(x0, dtype=float)
+    iterations = np.zeros(x.shape[:-1], dtype=int)
+
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        residual, jacobian = system(x)
+        norm = np.max(np.abs(residual), axis=-1)
+        converged = norm <= ftol
+        stuck = np.zeros_like(converged)
+
+        for _ in range(max_iter):
+            if np.all(converged | stuck):
+                break
+            dx = _solve_linear(jacobian, np.where(np.isfinite(residual), residual, 0.0))
+            if limit is not None:
+                dx = limit(x + dx, x) - x
+            if max_step is not None:
+                scale = np.minimum(1.0, max_step / np.maximum(np.max(np.abs(dx), axis=-1), 1e-300))
+                dx = dx * scale[..., None]
+            stuck = stuck | (~converged & ~(np.all(np.isfinite(dx), axis=-1) & (np.max(np.abs(dx), axis=-1) > 0)))
+            active = ~converged & ~stuck
+            if not np.any(active):
+                break
+            dx = np.where(active[..., None], dx, 0.0)
+
+            # halve the step of every point whose residual did not decrease
+            for _ in range(max_halvings + 1):
+                trial = x + dx
+                trial_residual, trial_jacobian = system(trial)
+                trial_norm = np.max(np.abs(trial_residual), axis=-1)
+                retry = active & ~(trial_norm < norm) & (np.max(np.abs(dx), axis=-1) > 0)
+                if not np.any(retry):
+                    break
+                dx = np.where(retry[..., None], dx / 2, dx)
+
+            small_step = np.max(np.abs(dx) / (1 + np.abs(x)), axis=-1) <= xtol
+            x = trial
+            residual, jacobian, norm = trial_residual, trial_jacobian, trial_norm
+            iterations = iterations + active
+            converged = converged | (norm <= ftol) | (active & small_step & np.isfinite(norm))
+
+    return NewtonResult(x=x, residual=residual, converged=converged, iterations=iterations)
+
+def warm_start_sweep(solve,
+                     *sweeps: np.ndarray,
+                     x0: np.ndarray=None)-> NewtonResult:
+    """Solves a sweep step by step, starting each step from the previous solution.
+
+    Parameters
+    ----------
+    solve : callable
+        solve(*step, x0=...) -> NewtonResult for one sweep step; x0 is None on the
+        first step
+    *sweeps : np.ndarray
+        swept inputs, iterated together along their first axis
+    x0 : np.ndarray, optional
+        initial guess for the first step, by default None
+
+    Returns
+    -------
+    NewtonResult
+        step results stacked along a new first axis
+    """
+    results = []
+    for step in zip(*sweeps):
+        result = solve(*step, x0=x0)
+        x0 = result.x
+        results.append(result)
+
+    return NewtonResult(x=np.stack([r.x for r in results]),
+                        residual=np.stack([r.residual for r in results]),
+                        converged=np.stack([r.converged for r in results]),
+                        iterations=np.stack([r.iterations for r in results]))
+
+def bracketed_newton(function,
+                     low: np.ndarray,
+                     high: np.ndarray,
+                     x0: np.ndarray=None,
+                     xtol: float=1.0e-12,
+                     max_iter: int=100)-> NewtonResult:
+    """Safeguarded Newton-Raphson solve of a stack of independent scalar equations f(x) = 0.
+
+    Each point keeps a bracket [low, high] with a sign change of f. A point bisects its
+    bracket instead of taking the Newton step when that step would leave the bracket
+    or when the previous step did not at least halve |f|, so every point converges
+    like Newton near its root and can never diverge. Only the points that have not
+    converged yet are evaluated.
+
+    Parameters
+    ----------
+    function : callable
+        function(x, index) -> (f, dfdx), evaluated at the 1-D array x of the points
+        with the given indices into the flattened stack
+    low : np.ndarray
+        lower end of the brackets
+    high : np.ndarray
+        upper end of the brackets, f(low) and f(high) of opposite sign
+    x0 : np.ndarray, optional
+        initial guess, by default None (the midpoints of the brackets). NaN entries
+        are replaced by the midpoints, others are clipped into the brackets.
+    xtol : float, optional
+        absolute tolerance on x, by default 1.0e-12
+    max_iter : int, optional
+        maximum number of iterations, by default 100
+
+    Returns
+    -------
+    NewtonResult
+        solution, residual, per-point convergence flags and iteration counts, all of
+        the broadcast shape of low and high
+    """
+    low, high = np.broadcast_arrays(np.asarray(low, dtype=float), np.asarray(high, dtype=float))
+    shape = low.shape
+    low, high = np.minimum(low, high).ravel(), np.maximum(low, high).ravel()
+    x = (low + high) / 2
+    if x0 is not None:
+        x0 = np.broadcast_to(np.asarray(x0, dtype=float), shape).ravel()
+        x = np.where(np.isnan(x0), x, np.clip(x0, low, high))
+    everything = np.arange(x.size)
+    iterations = np.zeros(x.size, dtype=int)
+    converged = np.zeros(x.size, dtype=bool)
+
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        increasing = function(low, everything)[0] < 0
+        f, dfdx = function(x, everything)
+        previous = np.full(x.size, np.inf)
+        active = everything[f != 0]
+
+        for _ in range(max_iter):
+            if active.size == 0:
+                break
+            x_a, f_a, dfdx_a = x[active], f[active], dfdx[active]
+            # shrink the brackets around the current iterates
+            below = (f_a < 0) == increasing[active]
+            low_a = np.where(below, x_a, low[active])
+            high_a = np.where(below, high[active], x_a)
+
+            newton = x_a - (f_a / dfdx_a)
+            bisect = ~((newton >= low_a) & (newton <= high_a)) | ~(np.abs(f_a) <= previous[active] / 2)
+            x_new = np.where(bisect, (low_a + high_a) / 2, newton)
+            f_new, dfdx_new = function(x_new, active)
+
+            low[active], high[active] = low_a, high_a
+            previous[active] = np.abs(f_a)
+            x[active], f[active], dfdx[active] = x_new, f_new, dfdx_new
+            iterations[active] += 1
+            done = (np.abs(x_new - x_a) <= xtol) | (f_new == 0) | ((high_a - low_a) <= xtol)
+            converged[active[done]] = True
+            active = active[~done]
+
+    converged[f == 0] = True
+    return NewtonResult(x=x.reshape(shape)[()],
+                        residual=f.reshape(shape)[()],
+                        converged=converged.reshape(shape)[()],
+                        iterations=iterations.reshape(shape)[()])
+
+class SolutionCache:
+    """Converged solutions keyed by (device, bias, temperature).
+
+    Solutions are held per device through weak references, so a device that is
+    garbage-collected takes its entries with it. Bias and temperature are rounded
+    to `decimals` digits to form the key, so a repeated sweep hits the cache exactly
+    and a refined sweep finds the neighbouring solutions to interpolate from.
+    A temperature of None is a key of its own, for solvers without a temperature.
+    Only the bias and the temperature are part of the key: call clear() after
+    changing any other parameter of a cached device.
+
+    Parameters
+    ----------
+    decimals : int, optional
+        decimals of the bias (V) and temperature (K) kept in the key, by default 9
+    """
+    def __init__(self,
+                 decimals: int=9)-> None:
+        self.decimals = decimals
+        self._devices = weakref.WeakKeyDictionary()
+
+    def _entries(self, device, temperature)-> dict:
+        temperatures = self._devices.get(device)
+        if temperatures is None:
+            temperatures = self._devices[device] = {}
+        if temperature is not None:
+            temperature = round(float(temperature), self.decimals)
+        return temperatures.setdefault(temperature, {})
+
+    def _key(self, bias: np.ndarray)-> tuple:
+        return tuple(np.round(np.ravel(bias), self.decimals).tolist())
+
+    def get(self,
+            device,
+            bias: npt.ArrayLike,
+            temperature: float)-> NewtonResult:
+        """Cached solution at exactly this bias point, or None"""
+        return self._entries(device, temperature).get(self._key(bias))
+
+    def put(self,
+            device,
+            bias: npt.ArrayLike,
+            temperature: float,
+            result: NewtonResult)-> None:
+        """Stores a converged solution"""
+        self._entries(device, temperature)[self._key(bias)] = result
+
+    def nearest(self,
+                device,
+                bias: npt.ArrayLike,
+                temperature: float,
+                count: int=2)-> list:
+        """Up to count cached (bias, solution) pairs closest to bias, nearest first"""
+        entries = self._entries(device, temperature)
+        if not entries:
+            return []
+        keys = list(entries)
+        distance = np.linalg.norm(np.array(keys) - np.ravel(bias), axis=-1)
+        return [(np.array(keys[i]), entries[keys[i]]) for i in np.argsort(distance)[:count]]
+
+    def clear(self,
+              device=None)-> None:
+        """Discards the solutions of one device, or of all devices"""
+        if device is None:
+            self._devices.clear()
+        else:
+            self._devices.pop(device, None)
+
+    def __len__(self)-> int:
+        return sum(len(entries) for temperatures in self._devices.values() for entries in temperatures.values())
+
+def _secant_predictor(anchors: list,
+                      bias: np.ndarray)-> np.ndarray:
+    """Solution at bias extrapolated linearly along the last two (bias, solution) pairs"""
+    if not anchors:
+        return None
+    bias_1, result_1 = anchors[-1]
+    if len(anchors) == 1:
+        return result_1.x
+    bias_0, result_0 = anchors[-2]
+    chord = bias_1 - bias_0
+    length = np.dot(chord, chord)
+    if length == 0:
+        return result_1.x
+    t = np.dot(bias - bias_1, chord) / length
+    return result_1.x + (t * (result_1.x - result_0.x))
+
+def continuation_sweep(solve,
+                       bias: npt.ArrayLike,
+                       x0: np.ndarray=None,
+                       cache: SolutionCache=None,
+                       device=None,
+                       temperature: float=None,
+                       max_step: float=None,
+                       max_halvings: int=8,
+                       fast_iterations: int=4,
+                       origin: npt.ArrayLike=None)-> NewtonResult:
+    """Solves a bias sweep by adaptive continuation.
+
+    Each bias point is approached from the last converged one. The starting guess is
+    extrapolated along the last two converged solutions (a secant predictor). If a
+    step fails to converge, the bias step is halved and intermediate points are
+    solved first. The step grows again after steps that converge quickly. Converged
+    points, intermediate ones included, go into the optional cache. A point already
+    in the cache is not solved again. A point not in the cache starts from the two
+    nearest cached solutions when they are closer than the last converged point, so
+    a refined sweep interpolates between the earlier solutions. If the first point
+    fails with nothing to continue from, the origin (zero bias) is solved from x0 and
+    the sweep steps out from there, with the same step halving.
+
+    Parameters
+    ----------
+    solve : callable
+        solve(bias, x0) -> NewtonResult for one bias point with scalar converged and
+        iterations. bias is one entry of the sweep, and x0 is None for a cold start.
+    bias : npt.ArrayLike
+        bias points along the first axis, each a scalar or an array of terminal
+        voltages, V
+    x0 : np.ndarray, optional
+        initial guess for the first point, by default None
+    cache : SolutionCache, optional
+        cache of converged solutions, by default None
+    device : object, optional
+        device the cached solutions belong to, required with a cache
+    temperature : float, optional
+        temperature the cached solutions belong to, K, by default None (one
+        shared key for solves without a temperature)
+    max_step : float, optional
+        largest bias step (Euclidean norm over the terminals), by default None
+        (straight to the next point)
+    max_halvings : int, optional
+        step halvings allowed per bias point before it is given up, by default 8
+    fast_iterations : int, optional
+        a step converging in at most this many iterations doubles the step,
+        by default 4
+    origin : npt.ArrayLike, optional
+        bias point that converges from x0 (or a cold start), used to seed the sweep
+        when its first point does not, by default zero bias
+
+    Returns
+    -------
+    NewtonResult
+        per-point results stacked along a new first axis. iterations counts the
+        iterations of the intermediate steps as well and is 0 for cache hits.
+
+    Raises
+    ------
+    ValueError
+        if a cache is given without a device
+    """
+    if cache is not None and device is None:
+        raise ValueError("A device is needed to key the cached solutions!")
+    bias = np.asarray(bias, dtype=float)
+    path = bias.reshape(len(bias), -1)
+    max_step = np.inf if max_step is None else max_step
+    step = max_step
+    origin = np.zeros(path.shape[1]) if origin is None else np.ravel(np.asarray(origin, dtype=float))
+    seeded = False
+    anchors = []
+    results = []
+
+    for target, target_bias in zip(path, bias):
+        if cache is not None:
+            hit = cache.get(device, target, temperature)
+            if hit is not None:
+                anchors = (anchors + [(target, hit)])[-2:]
+                results.append(replace(hit, iterations=np.zeros_like(hit.iterations)))
+                continue
+            neighbours = cache.nearest(device, target, temperature)
+            if neighbours and (not anchors or np.linalg.norm(neighbours[0][0] - target)
+                               < np.linalg.norm(anchors[-1][0] - target)):
+                anchors = neighbours[::-1]
+
+        iterations, halvings = 0, 0
+        while True:
+            if anchors:
+                current = anchors[-1][0]
+                distance = np.linalg.norm(target - current)
+                point = target if distance <= step else current + ((target - current) * (step / distance))
+                guess = _secant_predictor(anchors, point)
+            else:
+                distance, point, guess = np.inf, target, x0
+            at_target = point is target
+            result = solve(target_bias if at_target else point.reshape(target_bias.shape), guess)
+            iterations += result.iterations
+            if result.converged:
+                anchors = (anchors + [(point, result)])[-2:]
+                if cache is not None:
+                    cache.put(device, point, temperature, result)
+                if at_target:
+                    break
+                if result.iterations <= fast_iterations:
+                    step = min(2 * step, max_step)
+            elif not anchors:
+                # nothing to continue from: start over from the solution at the origin
+                if seeded or np.array_equal(target, origin):
+                    break
+                seeded = True
+                seed = solve(origin.reshape(target_bias.shape), x0)
+                iterations += seed.iterations
+                if not seed.converged:
+                    break
+                anchors = [(origin, seed)]
+                if cache is not None:
+                    cache.put(device, origin, temperature, seed)
+            else:
+                halvings += 1
+                if halvings > max_halvings:
+                    break
+                step = min(step, distance) / 2
+        if result.converged and result.iterations <= fast_iterations:
+            step = min(2 * step, max_step)
+        results.append(replace(result, iterations=iterations))
+
+    return NewtonResult(x=np.stack([r.x for r in results]),
+                        residual=np.stack([r.residual for r in results]),
+                        converged=np.stack([r.converged for r in results]),
+                        iterations=np.stack([r.iterations for r in results]))
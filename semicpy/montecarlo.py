@@ -0,0 +1,311 @@
+"""
+Monte-Carlo and corner analysis of the device models.
+
+Sampled model parameters are held column-wise: one NumPy array per parameter, one
+row per sample. A single device instance is built per chunk of samples with each
+varied parameter set to a column shaped to broadcast against the bias arrays, so
+the model methods evaluate every sample and every bias point in one vectorized pass.
+Chunks can be spread over a process pool and written straight to .npy files.
+"""
+import os
+import inspect
+import itertools
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import numpy.typing as npt
+from semicpy.bjt.bjt import BJT
+from semicpy.diodes.diode import Diode
+from semicpy.fets.jfet import JFET
+from semicpy.fets.mosfet import MOSFET
+
+@dataclass
+class Normal:
+    """Normally distributed parameter"""
+    mean : float
+    sigma : float
+
+    def sample(self, rng: np.random.Generator, size: int)-> np.ndarray:
+        return rng.normal(self.mean, self.sigma, size)
+
+@dataclass
+class LogNormal:
+    """Log-normally distributed parameter (e.g. saturation currents).
+    sigma is the standard deviation of ln(parameter)."""
+    median : float
+    sigma : float
+
+    def sample(self, rng: np.random.Generator, size: int)-> np.ndarray:
+        return self.median * np.exp(rng.normal(0.0, self.sigma, size))
+
+@dataclass
+class Uniform:
+    """Uniformly distributed parameter"""
+    low : float
+    high : float
+
+    def sample(self, rng: np.random.Generator, size: int)-> np.ndarray:
+        return rng.uniform(self.low, self.high, size)
+
+def _parameter_names(device_class)-> dict:
+    """Constructor keywords of a device model keyed by their normalized SPICE card
+    name, e.g. 'IS' -> 'i_s', 'VTO' -> 'vto'."""
+    names = inspect.signature(device_class.__init__).parameters
+    return {name.replace('_', '').lower() : name for name in names if name != 'self'}
+
+def _keyword(device_class, name: str)-> str:
+    keywords = _parameter_names(device_class)
+    try:
+        return keywords[name.replace('_', '').lower()]
+    except KeyError:
+        raise KeyError(f"{device_class.__name__} has no model parameter {name}!") from None
+
+class ParameterSamples:
+    """Column-wise store of sampled model parameters.
+
+    Parameters
+    ----------
+    device_class : type
+        device model class, e.g. Diode, BJT, JFET, NMOS
+    columns : dict
+        equal-length 1-D arrays keyed by model parameter name. Names are the SPICE
+        card names or the constructor keywords, case and underscores ignored.
+    """
+    def __init__(self,
+                 device_class,
+                 columns: dict)-> None:
+        self.device_class = device_class
+        self.columns = {_keyword(device_class, name) : np.ravel(np.asarray(col, dtype=float))
+                        for name, col in columns.items()}
+        lengths = {len(col) for col in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All parameter columns must have the same number of samples!")
+
+    @classmethod
+    def from_distributions(cls,
+                           device_class,
+                           distributions: dict,
+                           n: int,
+                           seed: int=None)-> "ParameterSamples":
+        """Draws n independent samples of every parameter.
+
+        Parameters
+        ----------
+        device_class : type
+            device model class
+        distributions : dict
+            Normal, LogNormal or Uniform distributions (or anything with a
+            sample(rng, size) method) keyed by parameter name
+        n : int
+            number of samples
+        seed : int, optional
+            seed of the random generator, by default None
+
+        Returns
+        -------
+        ParameterSamples
+            sampled parameters
+        """
+        rng = np.random.default_rng(seed)
+        return cls(device_class, {name : dist.sample(rng, n) for name, dist in distributions.items()})
+
+    @classmethod
+    def corners(cls,
+                device_class,
+                bounds: dict)-> "ParameterSamples":
+        """Every low/high combination of the given parameters (2^k corners).
+
+        Parameters
+        ----------
+        device_class : type
+            device model class
+        bounds : dict
+            (low, high) pairs keyed by parameter name
+
+        Returns
+        -------
+        ParameterSamples
+            one sample per corner
+        """
+        names = list(bounds)
+        table = np.array(list(itertools.product(*(bounds[name] for name in names))), dtype=float)
+        return cls(device_class, {name : table[:, i] for i, name in enumerate(names)})
+
+    def __len__(self)-> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def chunk(self,
+              start: int,
+              stop: int)-> dict:
+        """Columns of the samples start to stop"""
+        return {name : col[start:stop] for name, col in self.columns.items()}
+
+def build_device(device_class,
+                 nominal: dict,
+                 columns: dict,
+                 bias_ndim: int=0):
+    """Single device instance evaluating a whole chunk of samples at once.
+
+    Parameters
+    ----------
+    device_class : type
+        device model class
+    nominal : dict
+        fixed constructor keywords
+    columns : dict
+        sampled constructor keywords (1-D arrays)
+    bias_ndim : int, optional
+        number of bias dimensions the columns have to broadcast against, by default 0
+
+    Returns
+    -------
+    object
+        device whose varied parameters are arrays of shape (n,) + (1,)*bias_ndim
+    """
+    shape = (-1,) + (1,) * bias_ndim
+    return device_class(**nominal, **{name : col.reshape(shape) for name, col in columns.items()})
+
+def diode_currents(device: Diode, vd: npt.ArrayLike=0.0)-> dict:
+    """Diode current at the junction voltages vd"""
+    return {"Diode Current" : device.diode_current(vd)}
+
+def bjt_currents(device: BJT, vbe: npt.ArrayLike=0.0, vbc: npt.ArrayLike=0.0)-> dict:
+    """Terminal currents at the intrinsic junction voltages vbe, vbc"""
+    ib = device.base_current(vbe, vbc)
+    ic = device.collector_current(vbe, vbc)
+    return {"Base Current" : ib, "Collector Current" : ic, "Emitter Current" : -(ib + ic)}
+
+def jfet_currents(device: JFET, vgs: npt.ArrayLike=0.0, vds: npt.ArrayLike=0.0)-> dict:
+    """Drain current (per unit area) at the intrinsic voltages vgs, vds"""
+    return {"Drain Current" : device.i_drain(vgs, vds, np.subtract(vgs, vds))}
+
+def mosfet_currents(device: MOSFET, vgs: npt.ArrayLike=0.0, vds: npt.ArrayLike=0.0)-> dict:
+    """Square-law drain current with channel-length modulation at vgs, vds"""
+    return {"Drain Current" : device.drain_characteristics(vgs, vds)["Drain Current"]}
+
+EVALUATORS = {Diode : diode_currents,
+              BJT : bjt_currents,
+              JFET : jfet_currents,
+              MOSFET : mosfet_currents}
+
+def default_evaluator(device_class):
+    """Vectorized current evaluator registered for a device class (or its base class)"""
+    for cls in device_class.__mro__:
+        if cls in EVALUATORS:
+            return EVALUATORS[cls]
+    raise TypeError(f"No current evaluator registered for {device_class.__name__}!")
+
+def _evaluate_chunk(device_class, nominal, columns, evaluate, biases)-> dict:
+    bias_ndim = np.broadcast(*biases.values()).nd if biases else 0
+    device = build_device(device_class, nominal, columns, bias_ndim)
+    with np.errstate(over='ignore', invalid='ignore'):
+        results = evaluate(device, **biases)
+    n = len(next(iter(columns.values()))) if columns else 1
+    bias_shape = np.broadcast(*biases.values()).shape if biases else ()
+    return {key : np.broadcast_to(val, (n,) + bias_shape) for key, val in results.items()}
+
+class MonteCarlo:
+    """Vectorized Monte-Carlo / corner runner for the device models.
+
+    Parameters
+    ----------
+    samples : ParameterSamples
+        sampled model parameters
+    nominal : dict, optional
+        fixed constructor keywords of the device, by default None (model defaults)
+    evaluate : callable, optional
+        evaluate(device, **biases) -> dict of arrays, by default the evaluator
+        registered for the device class (Diode, BJT, JFET, MOSFET). Has to be a
+        module-level function when a process pool is used.
+    """
+    def __init__(self,
+                 samples: ParameterSamples,
+                 nominal: dict=None,
+                 evaluate=None)-> None:
+        self.samples = samples
+        self.device_class = samples.device_class
+        self.nominal = {} if nominal is None else {_keyword(self.device_class, k) : v for k, v in nominal.items()}
+        self.evaluate = default_evaluator(self.device_class) if evaluate is None else evaluate
+
+    def _chunks(self, chunk_size: int)-> list:
+        n = len(self.samples)
+        return [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+    def run(self,
+            chunk_size: int=10000,
+            processes: int=None,
+            output: str=None,
+            **biases: npt.ArrayLike)-> dict:
+        """Evaluates the device currents of every sample at every bias point.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            samples evaluated per vectorized pass, by default 10000
+        processes : int, optional
+            size of the process pool the chunks are spread over, by default None
+            (evaluate in this process)
+        output : str, optional
+            directory the results are streamed to chunk by chunk, one <key>.npy file
+            per result, by default None (results kept in memory)
+        **biases : npt.ArrayLike
+            bias arrays passed to the evaluator, e.g. vd=..., or vbe=..., vbc=...
+
+        Returns
+        -------
+        dict
+            arrays of shape (n_samples,) + broadcast bias shape keyed by result name,
+            read-only memory maps of the .npy files when output is given
+        """
+        biases = {name : np.asarray(val, dtype=float) for name, val in biases.items()}
+        chunks = self._chunks(chunk_size)
+        jobs = [(self.device_class, self.nominal, self.samples.chunk(start, stop), self.evaluate, biases)
+                for start, stop in chunks]
+
+        if processes is None:
+            results = (_evaluate_chunk(*job) for job in jobs)
+            return self._collect(chunks, results, output)
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = pool.map(_evaluate_chunk, *zip(*jobs))
+            return self._collect(chunks, results, output)
+
+    def _collect(self, chunks, results, output)-> dict:
+        n = len(self.samples)
+        arrays = {}
+        for (start, stop), chunk in zip(chunks, results):
+            for key, val in chunk.items():
+                if key not in arrays:
+                    shape = (n,) + val.shape[1:]
+                    if output is None:
+                        arrays[key] = np.empty(shape)
+                    else:
+                        os.makedirs(output, exist_ok=True)
+                        arrays[key] = np.lib.format.open_memmap(_output_path(output, key), mode='w+', dtype=float, shape=shape)
+                arrays[key][start:stop] = val
+                if output is not None:
+                    arrays[key].flush()
+
+        if output is None:
+            return arrays
+        paths = {key : _output_path(output, key) for key in arrays}
+        del arrays
+        return {key : np.load(path, mmap_mode='r') for key, path in paths.items()}
+
+def _output_path(output: str, key: str)-> str:
+    return os.path.join(output, key.replace(' ', '_').replace('-', '_').lower() + '.npy')
+
+def load_results(output: str)-> dict:
+    """Opens streamed Monte-Carlo results as read-only memory maps
+
+    Parameters
+    ----------
+    output : str
+        directory passed to MonteCarlo.run
+
+    Returns
+    -------
+    dict
+        memory-mapped arrays keyed by file name without extension
+    """
+    return {os.path.splitext(name)[0] : np.load(os.path.join(output, name), mmap_mode='r')
+            for name in sorted(os.listdir(output)) if name.endswith('.npy')}
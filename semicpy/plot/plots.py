@@ -2,16 +2,32 @@
 module docstring for plottting E-k plots
 """
 
-import seaborn as sns
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
-import plotly.io as pio
+import importlib
 import numpy as np
 from semicpy.carriers.dist_functions import fermi_dirac,maxwell_boltzmann,bose_einstein
 
-pio.renderers.default = 'browser'
+# plotting backends are imported on first use, so importing this module stays cheap
+_BACKENDS = {'sns' : 'seaborn',
+             'plt' : 'matplotlib.pyplot',
+             'go' : 'plotly.graph_objects',
+             'px' : 'plotly.express',
+             'pd' : 'pandas',
+             'pio' : 'plotly.io'}
+
+def __getattr__(name):
+    if name in _BACKENDS:
+        if name in ('go', 'px') and 'pio' not in globals():
+            __getattr__('pio')
+        module = importlib.import_module(_BACKENDS[name])
+        if name == 'pio':
+            module.renderers.default = 'browser'
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _backend(name):
+    """Plotting backend module, imported on first use (plotly with the browser renderer)"""
+    return globals()[name] if name in globals() else __getattr__(name)
 
 def ekplot(energy=0,k=0):
     '''
@@ -50,6 +66,7 @@ def iv_curve(file=None,x=None,y=None,sheetname=None):
     Displays a plot in your browser
 
     '''
+    pd, go, px = _backend('pd'), _backend('go'), _backend('px')
     if (file.endswith('.csv')):
         d = pd.read_csv(file)
     elif(file.endswith(('.xls','.xlsx',))):
@@ -99,6 +116,7 @@ def distribution_function_plot(distribution_function=None,
     None.
 
     '''
+    go, sns, plt = _backend('go'), _backend('sns'), _backend('plt')
     if(distribution_function == 'Fermi-Dirac'):
         x = np.arange(start = (energy-fermi_energy) - 1,
                         stop = (energy-fermi_energy) + 1.1, step=0.1)
@@ -9,11 +9,22 @@
 # 10/28/2021 - Added more functionality
 ##########################################
 
+import importlib
 from semicpy.constants.constants import value
 
-from sympy.physics.quantum.dagger import Dagger
-from sympy.physics.quantum.state import Bra, Ket
-from sympy.physics.quantum.operator import Operator
-from sympy.physics.quantum import InnerProduct, OuterProduct
+# sympy is only imported when one of its quantum objects is first used
+_SYMPY = {'Dagger' : 'sympy.physics.quantum.dagger',
+          'Bra' : 'sympy.physics.quantum.state',
+          'Ket' : 'sympy.physics.quantum.state',
+          'Operator' : 'sympy.physics.quantum.operator',
+          'InnerProduct' : 'sympy.physics.quantum',
+          'OuterProduct' : 'sympy.physics.quantum'}
 
-HBAR = value('reduced Planck constant in J s')
\ No newline at end of file
+def __getattr__(name):
+    if name in _SYMPY:
+        obj = getattr(importlib.import_module(_SYMPY[name]), name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+HBAR = value('Reduced Planck constant in J s')
\ No newline at end of file
@@ -0,0 +1,201 @@
+"""
+Band structures of diamond and zinc-blende crystals.
+
+Three models are available:
+
+* 'sp3s*': the tight-binding model (tight_binding) for the whole Brillouin zone
+* 'kp6': the 6-band Luttinger-Kohn valence bands near Gamma (kp)
+* 'kp8': the 8-band Kane model near Gamma (kp)
+
+The Hamiltonians of all k-points are assembled as one stacked array and
+diagonalized with batched numpy.linalg.eigh, in blocks that bound the memory
+used. Band structures along high-symmetry paths are cached per (material, model,
+path, resolution).
+
+Example
+-------
+>>> bands = band_structure(GaAs(), 'sp3s*', 'L-G-X-U|K-G')
+>>> bands["Energies"][:, 4].min()          # conduction band minimum, eV
+"""
+import functools
+import numpy as np
+import numpy.typing as npt
+from semicpy.structure.tight_binding import SP3S_STAR, sp3s_star_hamiltonian
+from semicpy.structure.kp import KP_PARAMETERS, luttinger_kohn_hamiltonian, kane_hamiltonian
+
+# cubic lattice constants at 300 K, Angstroms
+LATTICE_CONSTANT = {'Si' : 5.431, 'Ge' : 5.658, 'AlP' : 5.4672, 'AlAs' : 5.6611, 'AlSb' : 6.1355,
+                    'GaP' : 5.4505, 'GaAs' : 5.65325, 'GaSb' : 6.0959, 'InP' : 5.8697,
+                    'InAs' : 6.0583, 'InSb' : 6.4794}
+
+# high-symmetry points of the face-centred cubic Brillouin zone, 2 pi / a
+FCC_POINTS = {'G' : (0.0, 0.0, 0.0),
+              'X' : (0.0, 1.0, 0.0),
+              'L' : (0.5, 0.5, 0.5),
+              'W' : (0.5, 1.0, 0.0),
+              'U' : (0.25, 1.0, 0.25),
+              'K' : (0.75, 0.75, 0.0)}
+
+MODELS = ('sp3s*', 'kp6', 'kp8')
+
+# k-points per eigh call
+_BLOCK = 16384
+
+def material_name(material)-> str:
+    """Name of a material given as a string, a material class or an instance"""
+    if isinstance(material, str):
+        return material
+    return material.__name__ if isinstance(material, type) else type(material).__name__
+
+def _hamiltonian(name: str,
+                 model: str):
+    """Hamiltonian of k in 2 pi / a for one material and model"""
+    if model not in MODELS:
+        raise ValueError(f"model must be one of {MODELS}, not '{model}'!")
+    table = SP3S_STAR if model == 'sp3s*' else KP_PARAMETERS
+    if name not in table or name not in LATTICE_CONSTANT:
+        raise NotImplementedError(f"No {model} parameters for {name}!")
+    parameters = table[name]
+    if model == 'sp3s*':
+        return lambda k: sp3s_star_hamiltonian(k, parameters)
+    if model == 'kp8' and parameters.e_p is None:
+        raise NotImplementedError(f"No kp8 parameters (Kane energy) for {name}!")
+    k_unit = 2 * np.pi / (LATTICE_CONSTANT[name] * 1.0e-10)
+    hamiltonian = luttinger_kohn_hamiltonian if model == 'kp6' else kane_hamiltonian
+    return lambda k: hamiltonian(k_unit * np.asarray(k, dtype=float), parameters)
+
+def band_energies(material,
+                  k: npt.ArrayLike,
+                  model: str='sp3s*',
+                  eigenvectors: bool=False)-> np.ndarray or tuple:
+    """Band energies at arbitrary k-points
+
+    Parameters
+    ----------
+    material : str or Semiconductor
+        material, or its name
+    k : npt.ArrayLike
+        wave vectors, shape (..., 3), 2 pi / a
+    model : str, optional
+        'sp3s*', 'kp6' or 'kp8', by default 'sp3s*'
+    eigenvectors : bool, optional
+        if True, the eigenvectors are returned as well, by default False
+
+    Returns
+    -------
+    np.ndarray or tuple
+        energies in ascending order, shape (..., bands), eV, and with eigenvectors
+        the (..., bands, bands) eigenvector matrices as well
+
+    Raises
+    ------
+    ValueError
+        for an unknown model
+    NotImplementedError
+        if the material has no parameters for the model
+    """
+    hamiltonian = _hamiltonian(material_name(material), model)
+    k = np.asarray(k, dtype=float)
+    points = k.reshape(-1, 3)
+    energies, vectors = [], []
+    for start in range(0, max(points.shape[0], 1), _BLOCK):
+        matrices = hamiltonian(points[start:start + _BLOCK])
+        if eigenvectors:
+            values, states = np.linalg.eigh(matrices)
+            vectors.append(states)
+        else:
+            values = np.linalg.eigvalsh(matrices)
+        energies.append(values)
+    energies = np.concatenate(energies)
+    bands = energies.shape[-1]
+    energies = energies.reshape(k.shape[:-1] + (bands,))
+    if eigenvectors:
+        return energies, np.concatenate(vectors).reshape(k.shape[:-1] + (bands, bands))
+    return energies
+
+def high_symmetry_path(path: str='L-G-X-U|K-G',
+                       resolution: int=100)-> dict:
+    """k-points along a path through the high-symmetry points of the fcc zone
+
+    Parameters
+    ----------
+    path : str, optional
+        point labels (see FCC_POINTS) joined by '-' for segments and '|' for
+        jumps, by default 'L-G-X-U|K-G'
+    resolution : int, optional
+        points per 2 pi / a of path length, by default 100
+
+    Returns
+    -------
+    dict
+        "K Points" (N, 3) in 2 pi / a, "Distance" (N,) along the path in 2 pi / a
+        (not advancing over jumps), "Labels" as a list of (distance, label)
+
+    Raises
+    ------
+    ValueError
+        for an unknown point label
+    """
+    points, distance, labels = [], [], []
+    position = 0.0
+    for branch in path.split('|'):
+        names = branch.split('-')
+        unknown = set(names) - set(FCC_POINTS)
+        if unknown:
+            raise ValueError(f"Unknown high-symmetry points {sorted(unknown)}, use {list(FCC_POINTS)}!")
+        corners = np.array([FCC_POINTS[name] for name in names])
+        if labels and labels[-1][0] == position:
+            labels[-1] = (position, f"{labels[-1][1]}|{names[0]}")
+        else:
+            labels.append((position, names[0]))
+        for start, end, name in zip(corners[:-1], corners[1:], names[1:]):
+            length = np.linalg.norm(end - start)
+            count = max(int(np.ceil(length * resolution)), 1)
+            t = np.linspace(0.0, 1.0, count + 1)
+            if points:
+                t = t[1:] if np.array_equal(points[-1][-1], start) else t
+            points.append(start + (t[:, None] * (end - start)))
+            distance.append(position + (t * length))
+            position += length
+            labels.append((position, name))
+    return {"K Points" : np.concatenate(points),
+            "Distance" : np.concatenate(distance),
+            "Labels" : labels}
+
+@functools.lru_cache(maxsize=64)
+def _cached_band_structure(name: str,
+                           model: str,
+                           path: str,
+                           resolution: int)-> dict:
+    result = high_symmetry_path(path, resolution)
+    result["Energies"] = band_energies(name, result["K Points"], model)
+    for key in ("K Points", "Distance", "Energies"):
+        result[key].flags.writeable = False
+    result["Labels"] = tuple(result["Labels"])
+    return result
+
+def band_structure(material,
+                   model: str='sp3s*',
+                   path: str='L-G-X-U|K-G',
+                   resolution: int=100)-> dict:
+    """Band structure along a high-symmetry path, cached per (material, model, path,
+    resolution)
+
+    Parameters
+    ----------
+    material : str or Semiconductor
+        material, or its name
+    model : str, optional
+        'sp3s*', 'kp6' or 'kp8', by default 'sp3s*'
+    path : str, optional
+        path as in high_symmetry_path, by default 'L-G-X-U|K-G'
+    resolution : int, optional
+        points per 2 pi / a of path length, by default 100
+
+    Returns
+    -------
+    dict
+        high_symmetry_path's "K Points", "Distance" and "Labels", and "Energies"
+        (N, bands) in eV. The arrays are shared with the cache and read-only.
+    """
+    return _cached_band_structure(material_name(material), model, path, int(resolution))
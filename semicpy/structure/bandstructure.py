@@ -1,12 +1,24 @@
-'''Module docstring for Bandstructure'''
+'''Parabolic band models
 
-#raise NotImplementedError("Bandstructure has not been implemented yet!")
+Single parabolic bands and multi-valley parabolic E(k) (ParabolicValleys). Full
+band structures from tight-binding and k.p Hamiltonians are in structure.bands.
+'''
 
 from semicpy.constants.constants import value
+from semicpy.constants import codata
 import numpy as np
 import numpy.typing as npt
 
 HBAR = value('Reduced Planck constant in eV s')
+# hbar^2 / 2 m_0, eV m^2
+FREE_ELECTRON_CURVATURE = (codata.REDUCED_PLANCK_CONSTANT ** 2) / (2 * codata.ELECTRON_MASS * codata.ELEMENTARY_CHARGE)
+
+def _quadratic_form(dk: np.ndarray,
+                    mass: np.ndarray)-> np.ndarray:
+    """dk M^-1 dk over the last axis for a 3x3 mass tensor, dk / M * dk elementwise otherwise"""
+    if mass.ndim == 2:
+        return np.einsum('...i,ij,...j->...', dk, np.linalg.inv(mass), dk)
+    return dk / mass * dk
 
 def conduction_band(k: npt.ArrayLike,
                     K_c: npt.ArrayLike,
@@ -24,8 +36,11 @@ def conduction_band(k: npt.ArrayLike,
         _description_
     ec : float, optional
         Lowest energy in the conduction bands, by default 0.0
+
+    A 3x3 M_e (see eff_mass_matrix) is used as a tensor, k - K_c then being wave
+    vectors along the last axis. See ParabolicValleys for many valleys at once.
     """
-    return ec + ((np.square(HBAR) / 2) * (k - K_c) / M_e * (k - K_c))
+    return ec + ((np.square(HBAR) / 2) * _quadratic_form(np.subtract(k, K_c), np.asarray(M_e)))
 
 def valence_band(k: npt.ArrayLike,
                  K_v: npt.ArrayLike,
@@ -43,8 +58,11 @@ def valence_band(k: npt.ArrayLike,
         _description_
     ev : float, optional
         _description_, by default 0.0
+
+    A 3x3 M_h (see eff_mass_matrix) is used as a tensor, k - K_v then being wave
+    vectors along the last axis.
     """
-    return ev - ((np.square(HBAR) / 2) * (k - K_v) / M_h * (k - K_v)) 
+    return ev - ((np.square(HBAR) / 2) * _quadratic_form(np.subtract(k, K_v), np.asarray(M_h)))
 
 def eff_mass_matrix(mxx: float=0.0,
                     mxy: float=0.0,
@@ -79,6 +97,114 @@ def eff_mass_matrix(mxx: float=0.0,
     """
     return np.array([[mxx,mxy,mxz],[mxy,myy,myz],[mxz,myz,mzz]])
 
+class ParabolicValleys:
+    """Parabolic bands of a set of valleys, evaluated together over k-point meshes
+
+        E_v(k) = E_v + s_v (hbar^2 / 2 m_0) (k - K_v) . M_v^-1 . (k - K_v)
+
+    with s_v = +1 for conduction (electron) and -1 for valence (hole) valleys. The
+    inverse mass tensors are formed once. Each quadratic form is expanded into the
+    ten monomials of k (k_i k_j, k_i, 1), so every valley at every k-point comes from
+    one matrix product, taken over blocks of k-points that stay in cache.
+
+    Parameters
+    ----------
+    minima : npt.ArrayLike
+        valley extrema K_v, shape (V, 3), 1/m
+    masses : npt.ArrayLike
+        effective mass tensors in units of m_0, shape (V, 3, 3), or (V, 3) for
+        diagonal tensors, or (V,) for isotropic valleys
+    energies : npt.ArrayLike, optional
+        band edge energies E_v, shape (V,), eV, by default 0.0
+    curvature : npt.ArrayLike, optional
+        s_v, +1 or -1 per valley, by default 1
+
+    Raises
+    ------
+    ValueError
+        if the shapes do not match or a mass tensor is not symmetric
+    """
+    # k-points per block of the monomial matrix
+    block = 32768
+
+    def __init__(self,
+                 minima: npt.ArrayLike,
+                 masses: npt.ArrayLike,
+                 energies: npt.ArrayLike=0.0,
+                 curvature: npt.ArrayLike=1)-> None:
+        minima = np.atleast_2d(np.asarray(minima, dtype=float))
+        masses = np.asarray(masses, dtype=float)
+        valleys = minima.shape[0]
+        if minima.shape != (valleys, 3):
+            raise ValueError("minima must have the shape (V, 3)!")
+        if masses.shape in ((valleys,), (valleys, 3)):
+            masses = masses[..., None] * np.eye(3) if masses.ndim == 2 else masses[:, None, None] * np.eye(3)
+        if masses.shape != (valleys, 3, 3):
+            raise ValueError(f"masses must have the shape ({valleys},), ({valleys}, 3) or ({valleys}, 3, 3)!")
+        if not np.allclose(masses, np.swapaxes(masses, -1, -2)):
+            raise ValueError("Effective mass tensors must be symmetric!")
+        self.minima = minima
+        self.masses = masses
+        self.energies = np.broadcast_to(np.asarray(energies, dtype=float), (valleys,))
+        self.curvature = np.broadcast_to(np.asarray(curvature, dtype=float), (valleys,))
+        # s hbar^2/2m_0 M^-1, eV m^2
+        self.inverse_masses = np.linalg.inv(masses)
+        tensors = (self.curvature * FREE_ELECTRON_CURVATURE)[:, None, None] * self.inverse_masses
+        linear = np.einsum('vij,vj->vi', tensors, minima)
+        self._coefficients = np.concatenate([np.stack([tensors[:, 0, 0], tensors[:, 1, 1], tensors[:, 2, 2],
+                                                       2 * tensors[:, 0, 1], 2 * tensors[:, 0, 2], 2 * tensors[:, 1, 2]]),
+                                             -2 * linear.T,
+                                             (np.einsum('vi,vi->v', linear, minima) + self.energies)[None]])
+
+    def __len__(self)-> int:
+        return self.minima.shape[0]
+
+    def energy(self,
+               k: npt.ArrayLike,
+               out: np.ndarray=None)-> np.ndarray:
+        """Energies of all valleys at the given k-points
+
+        Parameters
+        ----------
+        k : npt.ArrayLike
+            wave vectors, shape (..., 3), 1/m
+        out : np.ndarray, optional
+            C-contiguous float buffer of shape (..., V) to write into, by default None
+
+        Returns
+        -------
+        np.ndarray
+            E_v(k), shape (..., V), eV
+        """
+        k = np.asarray(k, dtype=float)
+        shape = k.shape[:-1] + (len(self),)
+        if out is None:
+            out = np.empty(shape)
+        points = k.reshape(-1, 3)
+        energies = out.reshape(-1, len(self))
+        monomials = np.empty((min(self.block, points.shape[0]), 10))
+        monomials[:, 9] = 1.0
+        for start in range(0, points.shape[0], self.block):
+            chunk = points[start:start + self.block]
+            phi = monomials[:chunk.shape[0]]
+            np.multiply(chunk, chunk, out=phi[:, 0:3])
+            np.multiply(chunk[:, 0], chunk[:, 1], out=phi[:, 3])
+            np.multiply(chunk[:, 0], chunk[:, 2], out=phi[:, 4])
+            np.multiply(chunk[:, 1], chunk[:, 2], out=phi[:, 5])
+            phi[:, 6:9] = chunk
+            np.matmul(phi, self._coefficients, out=energies[start:start + chunk.shape[0]])
+        return out
+
+    def band_edge(self,
+                  k: npt.ArrayLike)-> np.ndarray:
+        """Lowest conduction (or highest valence) valley energy at each k-point, eV
+
+        The minimum over the valleys is taken if all valleys are conduction valleys,
+        otherwise the maximum.
+        """
+        energies = self.energy(k)
+        return energies.min(axis=-1) if np.all(self.curvature > 0) else energies.max(axis=-1)
+
 def conduction_band_DOS(me,
                         mde,
                         E: float=0.0,
@@ -0,0 +1,330 @@
+"""
+Density of states from band energies sampled on a uniform Brillouin-zone mesh.
+
+The energies E_n(k) are given on the periodic mesh k = (i/n_1) b_1 + (j/n_2) b_2 +
+(l/n_3) b_3 of the reciprocal cell (reciprocal_mesh builds it for the fcc
+lattice; band_energies in structure.bands evaluates any model on it). Two
+estimates are available:
+
+* tetrahedron_dos: the linear tetrahedron method. Every mesh cell is split into six
+  tetrahedra, E is interpolated linearly inside each, and the number of states
+  below each bin edge is integrated exactly, so the DOS is the exact bin average
+  of the linearly interpolated bands.
+* gaussian_dos: a histogram of the sampled energies broadened by a Gaussian.
+
+Both work on chunks of the mesh, so memory stays bounded for a 200^3 mesh, and
+return states per eV per unit cell, or per eV and cm^3 given the cell volume. This
+is the form effective_density_of_states and carrier_density take, so a computed
+DOS gives N_C, N_V for carriers.statistics.CarrierStatistics or n(E_F), p(E_F)
+directly.
+"""
+import itertools
+import numpy as np
+import numpy.typing as npt
+from semicpy.constants import codata
+from semicpy.carriers.dist_functions import fermi_dirac
+
+BOLTZMANN = codata.BOLTZMANN_CONSTANT_IN_EV_PER_K
+
+# reciprocal basis of the fcc lattice, 2 pi / a
+FCC_RECIPROCAL_BASIS = np.array([[-1.0, 1.0, 1.0], [1.0, -1.0, 1.0], [1.0, 1.0, -1.0]])
+
+# the six tetrahedra along the main diagonal of a mesh cell, as corner offsets
+_TETRAHEDRA = np.array([[(0, 0, 0), np.eye(3, dtype=int)[p[0]], np.eye(3, dtype=int)[p[0]] + np.eye(3, dtype=int)[p[1]],
+                         (1, 1, 1)] for p in itertools.permutations(range(3))])
+
+def reciprocal_mesh(shape: tuple,
+                    basis: npt.ArrayLike=FCC_RECIPROCAL_BASIS)-> np.ndarray:
+    """Uniform periodic k-point mesh of a reciprocal cell
+
+    Parameters
+    ----------
+    shape : tuple
+        mesh points (n_1, n_2, n_3) along the reciprocal basis vectors
+    basis : npt.ArrayLike, optional
+        reciprocal basis vectors b_1, b_2, b_3 as rows, by default the fcc basis in
+        2 pi / a
+
+    Returns
+    -------
+    np.ndarray
+        k-points, shape (n_1, n_2, n_3, 3), in the units of the basis
+    """
+    fractions = np.meshgrid(*(np.arange(n) / n for n in shape), indexing='ij')
+    return np.stack(fractions, axis=-1) @ np.asarray(basis, dtype=float)
+
+def _energy_edges(energy: npt.ArrayLike)-> tuple:
+    """Bin edges and spacing of a uniform energy grid"""
+    energy = np.asarray(energy, dtype=float)
+    step = energy[1] - energy[0] if energy.size > 1 else 0.0
+    if energy.ndim != 1 or energy.size < 2 or not np.allclose(np.diff(energy), step) or step <= 0:
+        raise ValueError("energy must be a uniform increasing grid of at least 2 points!")
+    return energy[0] + (step * (np.arange(energy.size + 1) - 0.5)), step
+
+def _band_stack(energies: npt.ArrayLike)-> np.ndarray:
+    """Energies as (bands, n_1, n_2, n_3)"""
+    energies = np.asarray(energies, dtype=float)
+    if energies.ndim == 3:
+        return energies[None]
+    if energies.ndim != 4:
+        raise ValueError("energies must have the shape (n_1, n_2, n_3) or (n_1, n_2, n_3, bands)!")
+    return np.moveaxis(energies, -1, 0)
+
+def _normalization(cells: int,
+                   spin_degeneracy: float,
+                   cell_volume: float)-> float:
+    return spin_degeneracy / (cells * (1.0 if cell_volume is None else cell_volume))
+
+def _tetrahedron_corners(band: np.ndarray,
+                         start: int,
+                         stop: int)-> np.ndarray:
+    """Sorted corner energies of the tetrahedra of the mesh cells in rows start:stop"""
+    rows = band[np.arange(start, stop + 1) % band.shape[0]]
+    shifted = {}
+    for dy, dz in itertools.product((0, 1), repeat=2):
+        shifted[dy, dz] = np.roll(rows, (-dy, -dz), axis=(1, 2))
+    corners = np.stack([np.stack([shifted[dy, dz][dx:dx + stop - start] for dx, dy, dz in tetrahedron], axis=-1)
+                        for tetrahedron in _TETRAHEDRA], axis=-2)
+    corners = corners.reshape(-1, 4)
+    corners.sort(axis=-1)
+    return corners
+
+def _region_polynomials(corners: np.ndarray)-> np.ndarray:
+    """Fraction of the states of each tetrahedron below E as cubics in E - e_2, one for
+    each of the regions (e_1, e_2), (e_2, e_3) and (e_3, e_4), shape (T, 3, 4) with the
+    constant term first. Coefficients of empty regions are not finite."""
+    e1, e2, e3, e4 = corners.T
+    d21, d31, d41 = e2 - e1, e3 - e1, e4 - e1
+    d32, d42, d43 = e3 - e2, e4 - e2, e4 - e3
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lower = 1 / (d21 * d31 * d41)
+        middle = 1 / (d31 * d41)
+        upper = 1 / (d41 * d42 * d43)
+        cubic = -(d31 + d42) / (d32 * d42)
+        return np.stack([np.stack([lower * d21 ** 3, 3 * lower * d21 ** 2, 3 * lower * d21, lower], axis=-1),
+                         np.stack([middle * d21 ** 2, 3 * middle * d21, 3 * middle, middle * cubic], axis=-1),
+                         np.stack([1 - (upper * d42 ** 3), 3 * upper * d42 ** 2, -3 * upper * d42, upper], axis=-1)],
+                        axis=1)
+
+def tetrahedron_dos(energies: npt.ArrayLike,
+                    energy: npt.ArrayLike,
+                    spin_degeneracy: float=2.0,
+                    cell_volume: float=None,
+                    chunk: int=2 ** 18)-> np.ndarray:
+    """Density of states by linear tetrahedron integration
+
+    Parameters
+    ----------
+    energies : npt.ArrayLike
+        band energies on the periodic mesh, shape (n_1, n_2, n_3) or
+        (n_1, n_2, n_3, bands), eV
+    energy : npt.ArrayLike
+        uniform energy grid (bin centres), eV
+    spin_degeneracy : float, optional
+        states per band and k-point, by default 2.0
+    cell_volume : float, optional
+        volume of the unit cell, cm^3, by default None (DOS per cell)
+    chunk : int, optional
+        tetrahedra, and (tetrahedron, bin edge) pairs, processed at once, by
+        default 2**18
+
+    Returns
+    -------
+    np.ndarray
+        DOS averaged over each energy bin, states/(eV cell), or states/(eV cm^3)
+        with a cell volume
+
+    Raises
+    ------
+    ValueError
+        if the energy grid is not uniform or the energies are not on a 3-D mesh
+    """
+    edges, step = _energy_edges(energy)
+    bands = _band_stack(energies)
+    n_1, n_2, n_3 = bands.shape[1:]
+    rows = max(1, chunk // (6 * n_2 * n_3))
+    # number of states below every edge: whole tetrahedra plus partially filled ones
+    whole = np.zeros(edges.size + 1)
+    partial = np.zeros(edges.size)
+    for band in bands:
+        for start in range(0, n_1, rows):
+            corners = _tetrahedron_corners(band, start, min(start + rows, n_1))
+            # edges strictly inside each tetrahedron's range, split at e_2 and e_3 (edge j
+            # lies at position j on the grid, so first edge above e_1 and first ones from e_2 on)
+            position = (corners - edges[0]) / step
+            bounds = np.ceil(position)
+            bounds[:, 0] = np.floor(position[:, 0]) + 1
+            bounds = np.clip(bounds, 0, edges.size).astype(int)
+            whole += np.bincount(bounds[:, 3], minlength=edges.size + 1)
+            bounds = np.maximum.accumulate(bounds, axis=-1)
+            counts = np.diff(bounds, axis=-1).ravel()
+            used = np.flatnonzero(counts)
+            if used.size == 0:
+                continue
+            # re-expand each used cubic in the offset m of the edge from the segment's first edge
+            counts = counts[used]
+            start_index = bounds[:, :3].ravel()[used]
+            c0, c1, c2, c3 = _region_polynomials(corners).reshape(-1, 4)[used].T
+            y = edges[start_index] - corners[used // 3, 1]
+            shifted = np.stack([((((c3 * y) + c2) * y) + c1) * y + c0,
+                                ((((3 * c3) * y) + (2 * c2)) * y + c1) * step,
+                                (((3 * c3) * y) + c2) * step ** 2,
+                                c3 * step ** 3])
+            # groups of whole segments with about chunk (tetrahedron, edge) pairs each
+            group = (np.cumsum(counts) - counts) // chunk
+            splits = np.concatenate(([0], np.flatnonzero(np.diff(group)) + 1, [used.size]))
+            for first, last in zip(splits[:-1], splits[1:]):
+                group_counts = counts[first:last]
+                segment = np.repeat(np.arange(first, last), group_counts)
+                m = np.arange(segment.size) - np.repeat(np.cumsum(group_counts) - group_counts, group_counts)
+                k0, k1, k2, k3 = shifted[:, segment]
+                fraction = ((((k3 * m) + k2) * m) + k1) * m + k0
+                partial += np.bincount(start_index[segment] + m, fraction, minlength=edges.size)
+
+    below = np.cumsum(whole)[:edges.size] + partial
+    return np.diff(below) * (_normalization(6 * n_1 * n_2 * n_3, spin_degeneracy, cell_volume) / step)
+
+def gaussian_dos(energies: npt.ArrayLike,
+                 energy: npt.ArrayLike,
+                 sigma: float,
+                 spin_degeneracy: float=2.0,
+                 cell_volume: float=None,
+                 chunk: int=2 ** 20)-> np.ndarray:
+    """Density of states as a Gaussian-broadened histogram
+
+    The energies are binned onto the grid with linear weights and the histogram is
+    convolved with the Gaussian, so sigma should span at least a few grid steps.
+
+    Parameters
+    ----------
+    energies : npt.ArrayLike
+        band energies on the mesh, shape (n_1, n_2, n_3) or (n_1, n_2, n_3, bands), eV
+    energy : npt.ArrayLike
+        uniform energy grid, eV
+    sigma : float
+        standard deviation of the broadening, eV
+    spin_degeneracy : float, optional
+        states per band and k-point, by default 2.0
+    cell_volume : float, optional
+        volume of the unit cell, cm^3, by default None (DOS per cell)
+    chunk : int, optional
+        energies binned at once, by default 2**20
+
+    Returns
+    -------
+    np.ndarray
+        DOS on the grid, states/(eV cell), or states/(eV cm^3) with a cell volume
+
+    Raises
+    ------
+    ValueError
+        if the energy grid is not uniform, sigma is not positive or the energies are
+        not on a 3-D mesh
+    """
+    edges, step = _energy_edges(energy)
+    if not sigma > 0:
+        raise ValueError("sigma must be positive!")
+    bands = _band_stack(energies)
+    energies = bands.ravel()
+    # pad the grid by the kernel width so states just outside it still contribute
+    width = int(np.ceil(5 * sigma / step))
+    origin = edges[0] + (step / 2) - (width * step)
+    size = edges.size - 1 + (2 * width)
+    histogram = np.zeros(size + 1)
+    for start in range(0, energies.size, chunk):
+        position = (energies[start:start + chunk] - origin) / step
+        inside = (position >= 0) & (position < size - 1)
+        position = position[inside]
+        index = np.floor(position).astype(int)
+        fraction = position - index
+        histogram += np.bincount(index, 1 - fraction, minlength=size + 1)
+        histogram += np.bincount(index + 1, fraction, minlength=size + 1)
+    offsets = step * np.arange(-width, width + 1)
+    kernel = np.exp(-0.5 * (offsets / sigma) ** 2) / (np.sqrt(2 * np.pi) * sigma)
+    dos = np.convolve(histogram[:size], kernel, mode='same')[width:size - width]
+    # every k-point carries all of its bands
+    return dos * _normalization(bands[0].size, spin_degeneracy, cell_volume)
+
+def effective_density_of_states(energy: npt.ArrayLike,
+                                dos: npt.ArrayLike,
+                                band_edge: float,
+                                temp: npt.ArrayLike=300.0,
+                                carrier: str='electron')-> np.ndarray:
+    """Effective density of states of a tabulated DOS (Boltzmann limit)
+
+        N_C = int g(E) exp(-(E - E_C) / kT) dE   over the conduction band
+        N_V = int g(E) exp(-(E_V - E) / kT) dE   over the valence band
+
+    Parameters
+    ----------
+    energy : npt.ArrayLike
+        energy grid, eV
+    dos : npt.ArrayLike
+        DOS of the band on the grid, states/(eV cm^3)
+    band_edge : float
+        E_C or E_V, eV
+    temp : npt.ArrayLike, optional
+        temperature, K, by default 300.0
+    carrier : str, optional
+        'electron' (states above band_edge) or 'hole' (below), by default 'electron'
+
+    Returns
+    -------
+    np.ndarray
+        N_C or N_V, cm^-3, of the shape of temp
+
+    Raises
+    ------
+    ValueError
+        for an unknown carrier
+    """
+    if carrier not in ('electron', 'hole'):
+        raise ValueError(f"carrier must be 'electron' or 'hole', not '{carrier}'!")
+    energy = np.asarray(energy, dtype=float)
+    weights = np.asarray(dos, dtype=float) * np.gradient(energy)
+    offset = (energy - band_edge) if carrier == 'electron' else (band_edge - energy)
+    kb_t = BOLTZMANN * np.asarray(temp, dtype=float)[..., None]
+    with np.errstate(over='ignore'):
+        return (np.exp(-offset / kb_t) * np.where(offset >= 0, weights, 0.0)).sum(axis=-1)[()]
+
+def carrier_density(energy: npt.ArrayLike,
+                    dos: npt.ArrayLike,
+                    fermi_energy: npt.ArrayLike,
+                    temp: npt.ArrayLike=300.0,
+                    carrier: str='electron')-> np.ndarray:
+    """Carrier density of a tabulated DOS with Fermi-Dirac statistics
+
+    Parameters
+    ----------
+    energy : npt.ArrayLike
+        energy grid, eV
+    dos : npt.ArrayLike
+        DOS of the band(s) on the grid, states/(eV cm^3)
+    fermi_energy : npt.ArrayLike
+        Fermi levels, eV
+    temp : npt.ArrayLike, optional
+        temperature, K, broadcast against fermi_energy, by default 300.0
+    carrier : str, optional
+        'electron' (occupied states) or 'hole' (empty states), by default 'electron'
+
+    Returns
+    -------
+    np.ndarray
+        n or p, cm^-3, of the broadcast shape of fermi_energy and temp
+
+    Raises
+    ------
+    ValueError
+        for an unknown carrier
+    """
+    if carrier not in ('electron', 'hole'):
+        raise ValueError(f"carrier must be 'electron' or 'hole', not '{carrier}'!")
+    energy = np.asarray(energy, dtype=float)
+    weights = np.asarray(dos, dtype=float) * np.gradient(energy)
+    fermi_energy = np.asarray(fermi_energy, dtype=float)[..., None]
+    temp = np.asarray(temp, dtype=float)[..., None]
+    if carrier == 'electron':
+        occupation = fermi_dirac(energy, fermi_energy, temp)
+    else:
+        occupation = fermi_dirac(fermi_energy, energy, temp)
+    return np.asarray(occupation @ weights)[()]
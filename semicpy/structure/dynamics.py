@@ -6,11 +6,16 @@
 # Changelog: 
 # 4/25/2021 - Started Package
 # 9/09/2021 - Started hole dynamics physics (dynamics.py)
+# 10/18/2026 - Group velocities and inverse mass tensors of gridded E(k) (BandDynamics)
 # 
 ##########################################
+import numpy as np
 from semicpy.constants.constants import value
+from semicpy.structure.bandstructure import FREE_ELECTRON_CURVATURE
 
-HBAR = value('reduced Planck constant in eV s')
+HBAR = value('Reduced Planck constant in eV s')
+
+METHODS = ('central', 'spectral')
 
 def group_velocity(gradient_k=None,E=None):
    '''
@@ -32,6 +37,8 @@ def group_velocity(gradient_k=None,E=None):
    h_bar = h/(2*pi)
 
    group_velocity = (gradient_k * energy)/(h_bar)
+
+   For E(k) sampled on a k-grid see BandDynamics.
    '''
 
    v = (gradient_k*E)/HBAR
@@ -90,4 +97,189 @@ def energy(Eb=None,k=None):
 
    E = Eb*k
    return E
-   
\ No newline at end of file
+   
+def _central_difference(values, axis, periodic):
+   '''
+   First derivative along an axis in grid steps, second order
+   '''
+   if periodic:
+      return (np.roll(values, -1, axis=axis) - np.roll(values, 1, axis=axis)) / 2
+   return np.gradient(values, axis=axis, edge_order=2)
+
+def _second_difference(values, axis, periodic):
+   '''
+   Second derivative along an axis in grid steps, second order
+   '''
+   if periodic:
+      return np.roll(values, -1, axis=axis) - (2 * values) + np.roll(values, 1, axis=axis)
+   return np.gradient(np.gradient(values, axis=axis, edge_order=2), axis=axis, edge_order=2)
+
+def _spectral_frequencies(shape):
+   '''
+   Angular frequencies per grid step of the rfftn axes, for even and for
+   odd derivatives (the latter without the Nyquist mode)
+   '''
+   even, odd = [], []
+   for axis, n in enumerate(shape):
+      w = 2 * np.pi * (np.fft.rfftfreq(n) if axis == len(shape) - 1 else np.fft.fftfreq(n))
+      w = w.reshape([-1 if a == axis else 1 for a in range(len(shape))])
+      even.append(w)
+      odd.append(np.where(np.abs(w) == np.pi, 0.0, w))
+   return even, odd
+
+class BandDynamics:
+   '''
+   Group velocities and inverse effective-mass tensors of bands sampled on a
+   3-D k-grid,
+
+      v = grad_k E / h_bar
+      (1/m*)_ij = (1/h_bar**2) d2E/dk_i dk_j
+
+   The grid points are k = k_0 + i a_1 + j a_2 + l a_3. The derivatives are
+   taken along the grid axes (central differences, or FFTs on a periodic grid)
+   and turned into Cartesian ones with the step vectors a_1, a_2, a_3, so
+   skewed grids such as the fcc reciprocal mesh work as well.
+
+   Results are memoized per band (read-only arrays), so transport and
+   scattering codes can ask for them repeatedly.
+
+   energies : band energies on the grid in eV, shape (n_1, n_2, n_3) for one
+              band or (n_1, n_2, n_3, bands), e.g. band_energies of
+              structure.bands on reciprocal_mesh of structure.density_of_states.
+
+   steps : grid steps in 1/m, three spacings along x, y, z, or the step
+           vectors a_1, a_2, a_3 as the rows of a 3 x 3 matrix (b_j/n_j for a
+           periodic mesh of the reciprocal basis b_j).
+
+   periodic : True if the grid wraps around (a periodic Brillouin-zone mesh),
+              False for a patch of k-space (one-sided differences at its faces).
+
+   method : 'central' (second-order central differences) or 'spectral'
+            (exact for band-limited periodic E(k), but it rings at band
+            crossings of energy-sorted bands).
+   '''
+   def __init__(self, energies, steps, periodic=True, method='central'):
+      if method not in METHODS:
+         raise ValueError(f"method must be one of {METHODS}, not '{method}'!")
+      if method == 'spectral' and not periodic:
+         raise ValueError("Spectral differentiation needs a periodic grid!")
+      energies = np.asarray(energies, dtype=float)
+      if energies.ndim == 3:
+         energies = energies[..., None]
+      if energies.ndim != 4:
+         raise ValueError("energies must have the shape (n_1, n_2, n_3) or (n_1, n_2, n_3, bands)!")
+      steps = np.asarray(steps, dtype=float)
+      steps = np.diag(steps) if steps.shape == (3,) else steps
+      if steps.shape != (3, 3):
+         raise ValueError("steps must be 3 spacings or a 3 x 3 matrix of step vectors!")
+      self.energies = energies
+      self.periodic = periodic
+      self.method = method
+      # derivatives in grid steps d = A grad E, so grad E = A^-1 d
+      self._inverse_steps = np.linalg.inv(steps)
+      self._velocities = {}
+      self._inverse_masses = {}
+
+   @property
+   def bands(self):
+      '''
+      Number of bands on the grid
+      '''
+      return self.energies.shape[-1]
+
+   def _band(self, band):
+      if not -self.bands <= band < self.bands:
+         raise IndexError(f"band {band} is out of range for {self.bands} bands!")
+      return band % self.bands
+
+   def _spectrum(self, band):
+      return np.fft.rfftn(self.energies[..., band], axes=(0, 1, 2))
+
+   def _grid_gradient(self, band):
+      '''
+      dE/di_j in eV per grid step, shape (n_1, n_2, n_3, 3)
+      '''
+      values = self.energies[..., band]
+      if self.method == 'central':
+         return np.stack([_central_difference(values, axis, self.periodic) for axis in range(3)], axis=-1)
+      spectrum = self._spectrum(band)
+      _, odd = _spectral_frequencies(values.shape)
+      return np.stack([np.fft.irfftn(1j * w * spectrum, s=values.shape, axes=(0, 1, 2)) for w in odd], axis=-1)
+
+   def _grid_hessian(self, band):
+      '''
+      d2E/di_a di_b in eV per grid step squared, shape (n_1, n_2, n_3, 3, 3)
+      '''
+      values = self.energies[..., band]
+      hessian = np.empty(values.shape + (3, 3))
+      if self.method == 'central':
+         gradient = self._grid_gradient(band)
+         for a in range(3):
+            hessian[..., a, a] = _second_difference(values, a, self.periodic)
+            for b in range(a + 1, 3):
+               hessian[..., a, b] = hessian[..., b, a] = _central_difference(gradient[..., a], b, self.periodic)
+         return hessian
+      spectrum = self._spectrum(band)
+      even, odd = _spectral_frequencies(values.shape)
+      for a in range(3):
+         hessian[..., a, a] = np.fft.irfftn(-(even[a] ** 2) * spectrum, s=values.shape, axes=(0, 1, 2))
+         for b in range(a + 1, 3):
+            mixed = np.fft.irfftn(-(odd[a] * odd[b]) * spectrum, s=values.shape, axes=(0, 1, 2))
+            hessian[..., a, b] = hessian[..., b, a] = mixed
+      return hessian
+
+   def group_velocity(self, band=0):
+      '''
+      Group velocity grad_k E / h_bar of a band at every grid point.
+
+      band : index of the band
+
+      Returns a read-only array of shape (n_1, n_2, n_3, 3) in m/s.
+      '''
+      band = self._band(band)
+      if band not in self._velocities:
+         velocity = (self._grid_gradient(band) @ self._inverse_steps.T) / HBAR
+         velocity.flags.writeable = False
+         self._velocities[band] = velocity
+      return self._velocities[band]
+
+   def inverse_mass(self, band=0):
+      '''
+      Inverse effective-mass tensor (1/h_bar**2) d2E/dk_i dk_j of a band at
+      every grid point, in units of 1/m_0 (the identity for a free electron,
+      negative definite at a valence band maximum).
+
+      band : index of the band
+
+      Returns a read-only array of shape (n_1, n_2, n_3, 3, 3).
+      '''
+      band = self._band(band)
+      if band not in self._inverse_masses:
+         # m_0/h_bar**2 = 1/(2 hbar**2/2m_0)
+         inverse = self._inverse_steps @ self._grid_hessian(band) @ self._inverse_steps.T
+         inverse /= 2 * FREE_ELECTRON_CURVATURE
+         inverse.flags.writeable = False
+         self._inverse_masses[band] = inverse
+      return self._inverse_masses[band]
+
+   def density_of_states_mass(self, band=0):
+      '''
+      Density-of-states effective mass det(M)**(1/3) = (m1*m2*m3)**(1/3)
+      of a band at every grid point, in units of m_0 (see effective_mass_DOS
+      of structure.bandstructure). Negative for hole-like curvature; inf
+      where the curvature is degenerate (det = 0, e.g. flat directions at
+      saddle points).
+
+      band : index of the band
+
+      Returns an array of shape (n_1, n_2, n_3).
+      '''
+      with np.errstate(divide='ignore'):
+         return np.cbrt(1 / np.linalg.det(self.inverse_mass(band)))
+
+   def clear(self):
+      '''
+      Forget the memoized velocities and mass tensors
+      '''
+      self._velocities.clear()
+      self._inverse_masses.clear()
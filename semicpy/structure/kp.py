@@ -0,0 +1,156 @@
+"""
+Multiband k.p Hamiltonians of diamond and zinc-blende crystals around Gamma.
+
+Both models are written in the Cartesian basis (S, X, Y, Z) x (up, down) of
+Dresselhaus, Kip and Kittel, with the spin-orbit coupling (Delta/3) L.sigma added
+on the p states, so the Gamma point is at E_g (conduction), 0 (heavy and light
+holes) and -Delta (split-off band). With hbar^2/2m_0 = 1, the valence block is
+
+    H_XX = L k_x^2 + M (k_y^2 + k_z^2),   H_XY = N k_x k_y,   ...
+    L = -(gamma_1 + 4 gamma_2),   M = -(gamma_1 - 2 gamma_2),   N = -6 gamma_3
+
+* 6-band (Luttinger-Kohn): heavy, light and split-off holes with the Luttinger
+  parameters gamma_1, gamma_2, gamma_3.
+* 8-band (Kane): adds the conduction band, coupled to the valence bands by
+  <S|p_a|A> = i P k_a with E_P = 2 m_0 P^2 / hbar^2. The valence block then uses
+  the modified parameters gamma_1 - E_P/3E_g and gamma_2,3 - E_P/6E_g. The
+  conduction band keeps (1 + 2F) k^2 from the remote bands.
+
+The models hold near Gamma only, typically within a few percent of the zone.
+Wave vectors are in 1/m, energies in eV.
+"""
+from typing import NamedTuple
+import numpy as np
+import numpy.typing as npt
+from semicpy.structure.bandstructure import FREE_ELECTRON_CURVATURE
+
+class KpParameters(NamedTuple):
+    """Band parameters at Gamma
+
+    eg : float
+        direct bandgap at Gamma, eV
+    delta_so : float
+        spin-orbit splitting, eV
+    gamma_1, gamma_2, gamma_3 : float
+        Luttinger parameters
+    e_p : float
+        Kane energy 2 m_0 P^2 / hbar^2, eV, None where no 8-band model applies
+    f : float
+        remote-band contribution to the conduction band mass
+    """
+    eg: float
+    delta_so: float
+    gamma_1: float
+    gamma_2: float
+    gamma_3: float
+    e_p: float=None
+    f: float=0.0
+
+# Vurgaftman, Meyer and Ram-Mohan, J. Appl. Phys. 89, 5815 (2001), 0 K; Si and Ge
+# (6-band only) from Landolt-Bornstein
+KP_PARAMETERS = {'Si' : KpParameters(4.185, 0.044, 4.285, 0.339, 1.446),
+                 'Ge' : KpParameters(0.898, 0.29, 13.38, 4.24, 5.69),
+                 'AlP' : KpParameters(3.63, 0.07, 3.35, 0.71, 1.23, 17.7, -0.65),
+                 'AlAs' : KpParameters(3.099, 0.28, 3.76, 0.82, 1.42, 21.1, -0.48),
+                 'AlSb' : KpParameters(2.386, 0.676, 5.18, 1.19, 1.97, 18.7, -0.56),
+                 'GaP' : KpParameters(2.886, 0.08, 4.05, 0.49, 2.93, 31.4, -2.04),
+                 'GaAs' : KpParameters(1.519, 0.341, 6.98, 2.06, 2.93, 28.8, -1.94),
+                 'GaSb' : KpParameters(0.812, 0.76, 13.4, 4.7, 6.0, 27.0, -1.63),
+                 'InP' : KpParameters(1.4236, 0.108, 5.08, 1.60, 2.10, 20.7, -1.31),
+                 'InAs' : KpParameters(0.417, 0.39, 20.0, 8.5, 9.2, 21.5, -2.90),
+                 'InSb' : KpParameters(0.235, 0.81, 34.8, 15.5, 16.5, 23.3, -0.23)}
+
+def _levi_civita()-> np.ndarray:
+    epsilon = np.zeros((3, 3, 3))
+    for i, j, k in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+        epsilon[i, j, k], epsilon[i, k, j] = 1.0, -1.0
+    return epsilon
+
+# spin-orbit operator L.sigma on (X, Y, Z) x (up, down), spin-major; eigenvalues 1 (j = 3/2)
+# and -2 (j = 1/2)
+_PAULI = np.array([[[0, 1], [1, 0]], [[0, -1j], [1j, 0]], [[1, 0], [0, -1]]])
+_L_DOT_SIGMA = sum(np.kron(_PAULI[m], -1j * _levi_civita()[m]) for m in range(3))
+
+def _valence_block(k: np.ndarray,
+                   gamma_1: float,
+                   gamma_2: float,
+                   gamma_3: float)-> np.ndarray:
+    """3 x 3 (X, Y, Z) valence Hamiltonian without spin-orbit, eV"""
+    k = k * np.sqrt(FREE_ELECTRON_CURVATURE)
+    l, m, n = -(gamma_1 + (4 * gamma_2)), -(gamma_1 - (2 * gamma_2)), -6 * gamma_3
+    squares = k * k
+    block = np.empty(k.shape[:-1] + (3, 3))
+    for a in range(3):
+        block[..., a, a] = (l * squares[..., a]) + (m * (squares.sum(axis=-1) - squares[..., a]))
+    for a, b in ((0, 1), (0, 2), (1, 2)):
+        block[..., a, b] = block[..., b, a] = n * k[..., a] * k[..., b]
+    return block
+
+def _with_spin(block: np.ndarray)-> np.ndarray:
+    """Spin-major (block, block) Kronecker product with the 2 x 2 identity"""
+    size = block.shape[-1]
+    doubled = np.zeros(block.shape[:-2] + (2 * size, 2 * size), dtype=complex)
+    doubled[..., :size, :size] = block
+    doubled[..., size:, size:] = block
+    return doubled
+
+def luttinger_kohn_hamiltonian(k: npt.ArrayLike,
+                               parameters: KpParameters)-> np.ndarray:
+    """6-band valence Hamiltonians of a stack of wave vectors
+
+    Parameters
+    ----------
+    k : npt.ArrayLike
+        wave vectors, shape (..., 3), 1/m
+    parameters : KpParameters
+        band parameters, e.g. KP_PARAMETERS['GaAs']
+
+    Returns
+    -------
+    np.ndarray
+        Hermitian matrices on (X, Y, Z) x (up, down), shape (..., 6, 6), eV
+    """
+    p = parameters
+    hamiltonian = _with_spin(_valence_block(np.asarray(k, dtype=float), p.gamma_1, p.gamma_2, p.gamma_3))
+    # the j = 3/2 states at 0, j = 1/2 at -Delta
+    hamiltonian += (p.delta_so / 3) * (_L_DOT_SIGMA - np.eye(6))
+    return hamiltonian
+
+def kane_hamiltonian(k: npt.ArrayLike,
+                     parameters: KpParameters)-> np.ndarray:
+    """8-band Hamiltonians of a stack of wave vectors
+
+    Parameters
+    ----------
+    k : npt.ArrayLike
+        wave vectors, shape (..., 3), 1/m
+    parameters : KpParameters
+        band parameters with a Kane energy, e.g. KP_PARAMETERS['GaAs']
+
+    Returns
+    -------
+    np.ndarray
+        Hermitian matrices on (S, X, Y, Z) x (up, down), shape (..., 8, 8), eV
+
+    Raises
+    ------
+    ValueError
+        if the parameters have no Kane energy
+    """
+    p = parameters
+    if p.e_p is None:
+        raise ValueError("The 8-band model needs the Kane energy e_p!")
+    k = np.asarray(k, dtype=float)
+    shape = k.shape[:-1]
+    block = np.zeros(shape + (4, 4), dtype=complex)
+    block[..., 1:, 1:] = _valence_block(k, p.gamma_1 - (p.e_p / (3 * p.eg)),
+                                        p.gamma_2 - (p.e_p / (6 * p.eg)), p.gamma_3 - (p.e_p / (6 * p.eg)))
+    block[..., 0, 0] = p.eg + ((1 + (2 * p.f)) * FREE_ELECTRON_CURVATURE * np.sum(k * k, axis=-1))
+    # P k with P = sqrt(E_P hbar^2 / 2 m_0)
+    coupling = 1j * np.sqrt(p.e_p * FREE_ELECTRON_CURVATURE) * k
+    block[..., 0, 1:] = coupling
+    block[..., 1:, 0] = np.conj(coupling)
+    hamiltonian = _with_spin(block)
+    valence = np.r_[1:4, 5:8]
+    hamiltonian[..., valence[:, None], valence] += (p.delta_so / 3) * (_L_DOT_SIGMA - np.eye(6))
+    return hamiltonian
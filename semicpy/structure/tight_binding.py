@@ -0,0 +1,121 @@
+"""
+Empirical sp3s* tight-binding Hamiltonian of diamond and zinc-blende crystals.
+
+Vogl, Hjalmarson and Dow's nearest-neighbour model (J. Phys. Chem. Solids 44, 365
+(1983)): one s, three p and one excited s* orbital on each of the two atoms of the
+primitive cell, without spin-orbit coupling. With the anion at the origin and its
+four cation neighbours at d_j = (a/4)(+-1, +-1, +-1) (an even number of minus
+signs), the Bloch sums give the phase factors
+
+    g_0(k) = (1/4) sum_j exp(i k.d_j)
+    g_m(k) = (1/4) sum_j sign(d_j,m) exp(i k.d_j),    m = x, y, z
+
+and the 10 x 10 Hamiltonian in the basis (s, p_x, p_y, p_z, s*) of the anion, then
+of the cation, is
+
+    [ diag(E_a)   H_ac    ]      H_ac = [ V_ss g0     V_sp g1     V_sp g2     V_sp g3     0          ]
+    [ H_ac^+     diag(E_c)]             [ -V_ps g1    V_xx g0     V_xy g3     V_xy g2     -V_ps* g1  ]
+                                        [ -V_ps g2    V_xy g3     V_xx g0     V_xy g1     -V_ps* g2  ]
+                                        [ -V_ps g3    V_xy g2     V_xy g1     V_xx g0     -V_ps* g3  ]
+                                        [ 0           V_s*p g1    V_s*p g2    V_s*p g3    0          ]
+
+Wave vectors are in units of 2 pi / a, energies in eV from the top of the valence
+band.
+"""
+from typing import NamedTuple
+import numpy as np
+import numpy.typing as npt
+
+class Sp3sStarParameters(NamedTuple):
+    """Vogl's sp3s* parameters, eV (a = anion, c = cation)"""
+    e_s_a: float
+    e_p_a: float
+    e_s_c: float
+    e_p_c: float
+    e_sstar_a: float
+    e_sstar_c: float
+    v_ss: float
+    v_xx: float
+    v_xy: float
+    v_sa_pc: float
+    v_sc_pa: float
+    v_sstara_pc: float
+    v_pa_sstarc: float
+
+# Vogl, Hjalmarson and Dow (1983), Table I
+SP3S_STAR = {'Si' : Sp3sStarParameters(-4.2000, 1.7150, -4.2000, 1.7150, 6.6850, 6.6850,
+                                       -8.3000, 1.7150, 4.5750, 5.7292, 5.7292, 5.3749, 5.3749),
+             'Ge' : Sp3sStarParameters(-5.8800, 1.6100, -5.8800, 1.6100, 6.3900, 6.3900,
+                                       -6.7800, 1.6100, 4.9000, 5.4649, 5.4649, 5.2191, 5.2191),
+             'AlP' : Sp3sStarParameters(-7.8466, 1.3169, -1.2534, 4.2831, 8.7069, 7.4231,
+                                        -7.4535, 2.3749, 4.8378, 5.2451, 5.2775, 5.2508, 4.6180),
+             'AlAs' : Sp3sStarParameters(-7.5273, 0.9833, -1.1627, 3.5867, 7.4833, 6.7267,
+                                         -6.6642, 1.8780, 4.2919, 5.1106, 5.4965, 4.5216, 4.9950),
+             'GaP' : Sp3sStarParameters(-8.1124, 1.1250, -2.1976, 4.1150, 8.5150, 7.1850,
+                                        -7.4709, 2.1516, 5.1369, 4.2771, 6.3190, 4.6541, 5.0950),
+             'GaAs' : Sp3sStarParameters(-8.3431, 1.0414, -2.6569, 3.6686, 8.5914, 6.7386,
+                                         -6.4513, 1.9546, 5.0779, 4.4800, 5.7839, 4.8422, 4.8077),
+             'GaSb' : Sp3sStarParameters(-7.3207, 0.8554, -3.8993, 2.9146, 6.6354, 5.9846,
+                                         -6.1567, 1.5789, 4.1285, 4.9601, 4.6675, 4.9895, 4.2180),
+             'InP' : Sp3sStarParameters(-8.5274, 0.8735, -1.4826, 4.0465, 8.2635, 7.0665,
+                                        -5.3614, 1.8801, 4.2324, 2.2265, 5.5825, 3.4623, 4.4814),
+             'InAs' : Sp3sStarParameters(-9.5381, 0.9099, -2.7219, 3.7201, 7.4099, 6.7401,
+                                         -5.6052, 1.8398, 4.4693, 3.0354, 5.4389, 3.3744, 3.9097)}
+
+# anion-centred nearest-neighbour directions, in units of a/4
+_NEIGHBOURS = np.array([[1, 1, 1], [1, -1, -1], [-1, 1, -1], [-1, -1, 1]], dtype=float)
+
+def phase_factors(k: npt.ArrayLike)-> np.ndarray:
+    """Nearest-neighbour phase factors g_0, g_x, g_y, g_z
+
+    Parameters
+    ----------
+    k : npt.ArrayLike
+        wave vectors, shape (..., 3), 2 pi / a
+
+    Returns
+    -------
+    np.ndarray
+        complex array of shape (4, ...)
+    """
+    k = np.asarray(k, dtype=float)
+    phases = np.exp((0.5j * np.pi) * (k @ _NEIGHBOURS.T)) / 4 # (..., 4 neighbours)
+    signs = np.vstack([np.ones(4), _NEIGHBOURS.T]) # (g, neighbour)
+    return np.moveaxis(phases @ signs.T, -1, 0)
+
+def sp3s_star_hamiltonian(k: npt.ArrayLike,
+                          parameters: Sp3sStarParameters)-> np.ndarray:
+    """sp3s* Hamiltonians of a stack of wave vectors
+
+    Parameters
+    ----------
+    k : npt.ArrayLike
+        wave vectors, shape (..., 3), 2 pi / a
+    parameters : Sp3sStarParameters
+        tight-binding parameters, e.g. SP3S_STAR['GaAs']
+
+    Returns
+    -------
+    np.ndarray
+        Hermitian matrices, shape (..., 10, 10), eV
+    """
+    p = parameters
+    g = phase_factors(k)
+    hamiltonian = np.zeros(g.shape[1:] + (10, 10), dtype=complex)
+    diagonal = [p.e_s_a, p.e_p_a, p.e_p_a, p.e_p_a, p.e_sstar_a,
+                p.e_s_c, p.e_p_c, p.e_p_c, p.e_p_c, p.e_sstar_c]
+    hamiltonian[..., np.arange(10), np.arange(10)] = diagonal
+
+    coupling = hamiltonian[..., :5, 5:]
+    coupling[..., 0, 0] = p.v_ss * g[0]
+    for m in range(1, 4):
+        coupling[..., 0, m] = p.v_sa_pc * g[m]
+        coupling[..., m, 0] = -p.v_sc_pa * g[m]
+        coupling[..., 4, m] = p.v_sstara_pc * g[m]
+        coupling[..., m, 4] = -p.v_pa_sstarc * g[m]
+        coupling[..., m, m] = p.v_xx * g[0]
+    # p_x p_y couples through g_z, p_x p_z through g_y and p_y p_z through g_x
+    for i, j, m in ((1, 2, 3), (1, 3, 2), (2, 3, 1)):
+        coupling[..., i, j] = coupling[..., j, i] = p.v_xy * g[m]
+    hamiltonian[..., 5:, :5] = np.conj(np.swapaxes(coupling, -1, -2))
+    return hamiltonian
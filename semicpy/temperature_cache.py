@@ -0,0 +1,89 @@
+"""
+Temperature-adjusted parameter cache for the SPICE-style device models.
+
+Temperature dependent model terms (saturation currents, betas, junction potentials,
+zero-bias capacitances, ...) only depend on the analysis temperature and the model
+card. Methods decorated with temperature_dependent are evaluated once and stored in a
+per-instance parameter set, which is invalidated whenever the temperature or any
+other model parameter is assigned.
+"""
+import functools
+
+_CACHE_ATTRIBUTE = '_temperature_parameters'
+
+def temperature_dependent(method):
+    """Decorator caching a temperature-only model method in the instance's
+    temperature-adjusted parameter set.
+
+    Calls are keyed by the method name and its arguments. Calls with unhashable
+    arguments (e.g. NumPy arrays) are evaluated without caching.
+
+    Parameters
+    ----------
+    method : callable
+        model method depending only on the temperature and the model parameters
+
+    Returns
+    -------
+    callable
+        cached method
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def cached(self, *args, **kwargs):
+        key = (name, args, tuple(kwargs.items())) if (args or kwargs) else name
+        params = self.__dict__.get(_CACHE_ATTRIBUTE)
+        if params is None:
+            params = {}
+            object.__setattr__(self, _CACHE_ATTRIBUTE, params)
+        try:
+            return params[key]
+        except KeyError:
+            result = params[key] = method(self, *args, **kwargs)
+            return result
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+    cached.temperature_dependent = True
+    return cached
+
+class TemperatureCache:
+    """Mixin giving a device model a temperature-adjusted parameter set.
+
+    Temperature-only terms are computed once, on first use, and held in the set
+    until the temperature or a model parameter changes. Assigning any public
+    attribute clears the set, so the next evaluation recomputes it with the new
+    values; mutating a parameter array in place needs clear_temperature_cache.
+    Device models list the methods they cache in their class docstring.
+    """
+    def __setattr__(self, name, value):
+        if not name.startswith('_'):
+            object.__setattr__(self, _CACHE_ATTRIBUTE, {})
+        object.__setattr__(self, name, value)
+
+    def clear_temperature_cache(self)-> None:
+        """Discards the temperature-adjusted parameter set.
+
+        Only needed after mutating a model parameter in place (e.g. an element of a
+        parameter array), since assignments invalidate the set automatically.
+        """
+        object.__setattr__(self, _CACHE_ATTRIBUTE, {})
+
+    def temperature_parameters(self)-> dict:
+        """Temperature-adjusted parameter set of the model.
+
+        Evaluates every argument-free temperature_dependent method of the model
+        (each at most once until the next invalidation).
+
+        Returns
+        -------
+        dict
+            cached values keyed by method name
+        """
+        for name in dir(type(self)):
+            attribute = getattr(type(self), name)
+            if getattr(attribute, 'temperature_dependent', False):
+                getattr(self, name)()
+        params = self.__dict__.get(_CACHE_ATTRIBUTE, {})
+        return {key : val for key, val in params.items() if isinstance(key, str)}